@@ -8,6 +8,24 @@ from .trade_plan_schemas import TradeEvaluationResultOut
 
 TimeframeUnit = Literal["second", "minute", "hour", "day", "week", "month"]
 BotBacktestInstrument = Literal["MNQ", "MES", "NQ", "ES"]
+BotBacktestSweepRankMetric = Literal[
+    "net_pnl",
+    "profit_factor",
+    "expectancy",
+    "win_rate",
+    "max_drawdown_dollars",
+    "max_drawdown_percent",
+]
+MAX_BACKTEST_SWEEP_AXIS_VALUES = 64
+BotBacktestResultSection = Literal[
+    "equity_curve",
+    "drawdown_series",
+    "trades",
+    "daily_results",
+    "monthly_results",
+]
+BotBacktestJobKind = Literal["backtest", "sweep", "walk_forward"]
+BotBacktestJobStatus = Literal["queued", "running", "succeeded", "failed", "cancelled"]
 MAX_BOT_CONTRACT_QUANTITY = 10_000
 BotExecutionMode = Literal["dry_run", "live"]
 BotRunStatus = Literal["running", "stopped", "blocked", "error"]
@@ -611,9 +629,157 @@ class BotBacktestOut(BaseModel):
     config_snapshot: dict[str, Any]
     assumptions: BotBacktestAssumptionsOut
     metrics: BotBacktestMetricsOut
-    equity_curve: list[BotBacktestEquityPointOut]
-    drawdown_series: list[BotBacktestDrawdownPointOut]
-    daily_results: list[BotBacktestPeriodOut]
-    monthly_results: list[BotBacktestPeriodOut]
-    trades: list[BotBacktestTradeOut]
+    equity_curve: list[BotBacktestEquityPointOut] = Field(default_factory=list)
+    drawdown_series: list[BotBacktestDrawdownPointOut] = Field(default_factory=list)
+    daily_results: list[BotBacktestPeriodOut] = Field(default_factory=list)
+    monthly_results: list[BotBacktestPeriodOut] = Field(default_factory=list)
+    trades: list[BotBacktestTradeOut] = Field(default_factory=list)
     warnings: list[str]
+    walk_forward: "BotBacktestWalkForwardOut | None" = None
+    # Series sections left out by an ``include`` filter, as opposed to empty.
+    omitted_sections: list[BotBacktestResultSection] = Field(default_factory=list)
+
+
+class BotBacktestSweepIn(BotBacktestIn):
+    fast_periods: list[int] = Field(default_factory=list, max_length=MAX_BACKTEST_SWEEP_AXIS_VALUES)
+    slow_periods: list[int] = Field(default_factory=list, max_length=MAX_BACKTEST_SWEEP_AXIS_VALUES)
+    strategy_param_grid: dict[str, list[str | int | float | bool]] = Field(
+        default_factory=dict,
+        max_length=16,
+    )
+    rank_by: BotBacktestSweepRankMetric = "net_pnl"
+
+    @field_validator("fast_periods", "slow_periods")
+    @classmethod
+    def validate_periods(cls, value: list[int]) -> list[int]:
+        if any(int(period) <= 0 for period in value):
+            raise ValueError("sweep periods must be positive integers")
+        return list(dict.fromkeys(int(period) for period in value))
+
+    @field_validator("strategy_param_grid")
+    @classmethod
+    def validate_strategy_param_grid(
+        cls,
+        value: dict[str, list[str | int | float | bool]],
+    ) -> dict[str, list[str | int | float | bool]]:
+        for name, candidates in value.items():
+            if not str(name).strip():
+                raise ValueError("strategy_param_grid keys must be non-empty")
+            if not candidates:
+                raise ValueError(f"strategy_param_grid.{name} must list at least one value")
+            if len(candidates) > MAX_BACKTEST_SWEEP_AXIS_VALUES:
+                raise ValueError(
+                    f"strategy_param_grid.{name} allows at most "
+                    f"{MAX_BACKTEST_SWEEP_AXIS_VALUES} values"
+                )
+        return value
+
+
+class BotBacktestSweepMetricsOut(BaseModel):
+    trade_count: int
+    win_rate: float
+    gross_pnl: float
+    net_pnl: float
+    total_commission: float
+    profit_factor: float | None = None
+    expectancy: float
+    max_drawdown_dollars: float
+    max_drawdown_percent: float
+    exposure_percent: float
+
+
+class BotBacktestSweepCombinationOut(BaseModel):
+    index: int = Field(ge=0)
+    rank: int | None = Field(default=None, ge=1)
+    fast_period: int
+    slow_period: int
+    strategy_params: dict[str, Any]
+    input_fingerprint: str | None = None
+    metrics: BotBacktestSweepMetricsOut | None = None
+    error: str | None = None
+
+
+class BotBacktestSweepOut(BaseModel):
+    id: int
+    bot_config_id: int | None = None
+    engine_version: str
+    created_at: datetime
+    range: BotBacktestRangeOut
+    rank_by: BotBacktestSweepRankMetric
+    combination_count: int = Field(ge=1)
+    failed_count: int = Field(ge=0)
+    config_snapshot: dict[str, Any]
+    assumptions: BotBacktestAssumptionsOut
+    results: list[BotBacktestSweepCombinationOut]
+
+
+class BotBacktestWalkForwardIn(BotBacktestSweepIn):
+    in_sample_bars: int = Field(ge=2)
+    out_of_sample_bars: int = Field(ge=2)
+
+
+class BotBacktestWalkForwardSegmentOut(BaseModel):
+    start: datetime
+    end: datetime
+    bar_count: int = Field(ge=0)
+
+
+class BotBacktestWalkForwardFoldOut(BaseModel):
+    index: int = Field(ge=0)
+    in_sample: BotBacktestWalkForwardSegmentOut
+    out_of_sample: BotBacktestWalkForwardSegmentOut
+    selected: BotBacktestSweepCombinationOut | None = None
+    out_of_sample_metrics: BotBacktestSweepMetricsOut | None = None
+    error: str | None = None
+
+
+class BotBacktestWalkForwardOut(BaseModel):
+    in_sample_bars: int
+    out_of_sample_bars: int
+    rank_by: BotBacktestSweepRankMetric
+    combination_count: int = Field(ge=1)
+    fold_rule: str
+    folds: list[BotBacktestWalkForwardFoldOut]
+
+
+BotBacktestOut.model_rebuild()
+
+BOT_BACKTEST_JOB_REQUEST_MODELS: dict[str, type[BotBacktestIn]] = {
+    "backtest": BotBacktestIn,
+    "sweep": BotBacktestSweepIn,
+    "walk_forward": BotBacktestWalkForwardIn,
+}
+
+
+class BotBacktestJobIn(BaseModel):
+    kind: BotBacktestJobKind = "backtest"
+    request: dict[str, Any] = Field(default_factory=dict)
+
+    @model_validator(mode="after")
+    def validate_request(self) -> "BotBacktestJobIn":
+        # Store the normalized body so the queued job replays exactly what the
+        # synchronous endpoint for ``kind`` would have accepted.
+        model = BOT_BACKTEST_JOB_REQUEST_MODELS[self.kind].model_validate(self.request)
+        self.request = model.model_dump(mode="json")
+        return self
+
+
+class BotBacktestJobErrorOut(BaseModel):
+    status: int
+    detail: Any
+
+
+class BotBacktestJobOut(BaseModel):
+    id: int
+    bot_config_id: int
+    kind: BotBacktestJobKind
+    status: BotBacktestJobStatus
+    progress: dict[str, Any] | None = None
+    attempt_count: int = Field(ge=0)
+    cancel_requested: bool
+    error: BotBacktestJobErrorOut | None = None
+    bot_backtest_id: int | None = None
+    bot_backtest_sweep_id: int | None = None
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
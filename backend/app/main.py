@@ -4,6 +4,7 @@ import json
 import logging
 import os
 import re
+from collections.abc import Callable
 from contextlib import asynccontextmanager
 from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal, ROUND_HALF_UP
@@ -35,6 +36,7 @@ from .auth import (
     reset_authenticated_user,
 )
 from .db import (
+    DATABASE_URL,
     SessionLocal,
     get_db,
     guard_against_local_database_url,
@@ -75,6 +77,12 @@ from .bot_schemas import (
     BotActivityOut,
     BotBacktestIn,
     BotBacktestOut,
+    BotBacktestSweepIn,
+    BotBacktestSweepOut,
+    BotBacktestJobIn,
+    BotBacktestJobOut,
+    BOT_BACKTEST_JOB_REQUEST_MODELS,
+    BotBacktestWalkForwardIn,
     BotConfigCreateIn,
     BotConfigListOut,
     BotConfigOut,
@@ -94,7 +102,18 @@ from .metrics_schemas import (
     SummaryMetricsOut,
     SymbolPnlOut,
 )
-from .models import Account, Expense, ExpenseSuppression, Payout, ProjectXMarketCandle, ProjectXTradeEvent, Trade
+from .models import (
+    Account,
+    BotBacktest,
+    BotBacktestJob,
+    BotBacktestSweep,
+    Expense,
+    ExpenseSuppression,
+    Payout,
+    ProjectXMarketCandle,
+    ProjectXTradeEvent,
+    Trade,
+)
 from .payout_schemas import PayoutCreateIn, PayoutListOut, PayoutOut, PayoutTotalsOut, PayoutUpdateIn
 from .projectx_schemas import (
     AuthMeOut,
@@ -111,6 +130,8 @@ from .projectx_schemas import (
     ProjectXAccountLastTradeOut,
     ProjectXPnlCalendarDayOut,
     ProjectXTradeOut,
+    ProjectXAccountTradeRefreshOut,
+    ProjectXBulkTradeRefreshOut,
     ProjectXTradeRefreshOut,
     ProjectXTradeSummaryOut,
     ProjectXTradeSummaryWithPointBasesOut,
@@ -197,6 +218,7 @@ from .services.projectx_client import (
     ProjectXClientError,
     projectx_error_reason_code,
 )
+from .services.projectx_account_refresher import ProjectXAccountRefresher
 from .services.projectx_order_book import ProjectXOrderBookRegistry
 from .services.instruments import POINTS_BASIS_SYMBOLS, normalize_points_basis
 from .services.projectx_trades import (
@@ -205,6 +227,7 @@ from .services.projectx_trades import (
     get_trade_event_pnl_calendar,
     list_trade_events,
     refresh_account_trades,
+    refresh_accounts_trades,
     serialize_trade_event,
     summarize_trade_events,
     summarize_trade_events_with_point_bases,
@@ -251,12 +274,59 @@ from .services.bot_backtesting import (
     InsufficientBacktestDataError,
     MalformedBacktestDataError,
     UnsupportedBacktestStrategyError,
+    RESULT_COLUMN_SECTIONS,
+    bot_backtest_result,
     create_bot_backtest,
     databento_backtest_history_available,
+    get_bot_backtest,
     legacy_projectx_backtest_fixtures_enabled,
     serialize_bot_backtest,
 )
+from .services.bot_backtest_sweeps import (
+    create_bot_backtest_sweep,
+    get_bot_backtest_sweep,
+    serialize_bot_backtest_sweep,
+)
+from .services.bot_backtest_jobs import (
+    BotBacktestJobCheckpointer,
+    claim_bot_backtest_job,
+    complete_bot_backtest_job,
+    finish_bot_backtest_job,
+    get_bot_backtest_job,
+    heartbeat_bot_backtest_jobs,
+    next_queued_bot_backtest_job,
+    release_bot_backtest_job,
+    request_bot_backtest_job_cancellation,
+    requeue_stale_bot_backtest_jobs,
+    serialize_bot_backtest_job,
+    submit_bot_backtest_job,
+)
+from .services.bot_backtest_executor import (
+    BacktestProcessPool,
+    BotBacktestReplayRequest,
+    add_replayed_bot_backtest,
+    run_bot_backtest_job,
+    worker_processes_share_database,
+)
+from .services.bot_backtest_walk_forward import create_bot_backtest_walk_forward
 from .services.bot_serialization import serialize_supported_bot_configs
+from .services.arrow_responses import (
+    MARKET_CANDLE_ARROW_SCHEMA,
+    PNL_CALENDAR_ARROW_SCHEMA,
+    arrow_stream_response,
+    market_candle_record_batch,
+    mmap_candle_record_batch,
+    pnl_calendar_record_batch,
+    records_record_batch,
+    result_columns_record_batch,
+    wants_arrow_stream,
+)
+from .services.bot_backtest_columns import decode_result_column_arrays
+from .services.databento_chart_candles import (
+    DatabentoChartHistory,
+    load_databento_chart_history,
+    merge_chart_tail,
+)
 from .services.trade_plan_evaluator import MarketContext, TradePlan, TradePlanEvaluator
 
 logger = logging.getLogger(__name__)
@@ -266,29 +336,46 @@ _REQUEST_ID_PATTERN = re.compile(r"[A-Za-z0-9][A-Za-z0-9._:/-]{0,127}")
 _NEW_YORK_TZ = ZoneInfo("America/New_York")
 _PRACTICE_ERROR_DETAIL = "practice_accounts_are_free"
 _PAID_ACCOUNT_TYPES_FOR_150K = {"no_activation", "standard"}
-_REQUIRED_SCHEMA_MIGRATION = "20260729_add_expense_suppressions.sql"
-_REQUIRED_SCHEMA_BASELINE = "schema-20260729-v5"
+_REQUIRED_SCHEMA_MIGRATION = "20261019_add_bot_backtest_result_columns.sql"
+_REQUIRED_SCHEMA_BASELINE = "schema-20261019-v8"
 _TRADE_IMPORT_PREVIEW_CLEANUP_INTERVAL_SECONDS = 15 * 60
+_BACKTEST_JOB_POLL_SECONDS = 2.0
 _streaming_runtime = None
 _order_book_registry = ProjectXOrderBookRegistry()
+_account_refresher = ProjectXAccountRefresher(
+    lambda user_id: _refresh_projectx_accounts_in_background(user_id)
+)
 _backtest_capacity_lock = Lock()
 _backtest_active_total = 0
 _backtest_active_by_user: dict[str, "_BacktestCapacityLease"] = {}
+_backtest_process_pool_lock = Lock()
+_backtest_job_lock = Lock()
+_backtest_job_leases: dict[int, "_BacktestCapacityLease"] = {}
+_backtest_jobs_shutting_down = Event()
+_backtest_process_pool_instance: BacktestProcessPool | None = None
 _ALLOWED_ORIGINS = [
     origin.strip()
     for origin in os.getenv("ALLOWED_ORIGINS", "http://localhost:5173").split(",")
     if origin.strip()
 ]
 _ALLOW_ORIGIN_REGEX = os.getenv("ALLOWED_ORIGIN_REGEX", _LOCAL_ORIGIN_REGEX)
-_EXPOSE_HEADERS = "Server-Timing, X-Server-Time-Ms, X-Request-ID, Content-Length"
+_EXPOSE_HEADERS = (
+    "Server-Timing, X-Server-Time-Ms, X-Request-ID, Content-Length, X-Candle-Bucket-Factor"
+)
 _ALLOW_ORIGIN_PATTERN = re.compile(_ALLOW_ORIGIN_REGEX) if _ALLOW_ORIGIN_REGEX else None
 
 
 class _BacktestCapacityLease:
-    def __init__(self, user_id: str):
+    def __init__(self, user_id: str, *, supersedable: bool = True):
         self.user_id = user_id
+        # Interactive runs are superseded by the user's next Run; queued jobs
+        # were submitted to outlive their request and are only cancelled
+        # explicitly.
+        self.supersedable = supersedable
         self.released = False
         self.cancel_event = Event()
+        # Extra global slots held for sweep worker processes beyond the first.
+        self.worker_slots = 0
 
     def cancel(self) -> None:
         self.cancel_event.set()
@@ -296,12 +383,30 @@ class _BacktestCapacityLease:
     def is_cancelled(self) -> bool:
         return self.cancel_event.is_set()
 
+    def reserve_workers(self, requested: int) -> int:
+        """Hold one global slot per sweep worker; returns the workers granted.
+
+        The lease's own slot covers the first worker. Extra workers only take
+        slots that are free right now, so a sweep never waits for capacity.
+        """
+
+        global _backtest_active_total
+        global_limit = _backtest_capacity_limit("BACKTEST_MAX_CONCURRENT_GLOBAL", 2)
+        with _backtest_capacity_lock:
+            if self.released:
+                return 1
+            wanted = max(0, int(requested) - 1 - self.worker_slots)
+            extra = max(0, min(wanted, global_limit - _backtest_active_total))
+            self.worker_slots += extra
+            _backtest_active_total += extra
+            return 1 + self.worker_slots
+
     def _release_locked(self) -> None:
         global _backtest_active_total
         if self.released:
             return
         self.released = True
-        _backtest_active_total = max(0, _backtest_active_total - 1)
+        _backtest_active_total = max(0, _backtest_active_total - 1 - self.worker_slots)
         if _backtest_active_by_user.get(self.user_id) is self:
             _backtest_active_by_user.pop(self.user_id, None)
 
@@ -327,6 +432,12 @@ def _acquire_backtest_capacity(user_id: str) -> _BacktestCapacityLease:
     _backtest_capacity_limit("BACKTEST_MAX_CONCURRENT_PER_USER", 1)
     with _backtest_capacity_lock:
         existing = _backtest_active_by_user.get(user_id)
+        if existing is not None and not existing.supersedable:
+            raise HTTPException(
+                status_code=429,
+                detail="backtest_capacity_exhausted",
+                headers={"Retry-After": "5"},
+            )
         if existing is not None:
             # A newer Run supersedes this user's older worker. Release its
             # accounting immediately; cooperative checks stop it before it can
@@ -345,6 +456,53 @@ def _acquire_backtest_capacity(user_id: str) -> _BacktestCapacityLease:
     return lease
 
 
+def _try_acquire_backtest_job_capacity(user_id: str) -> _BacktestCapacityLease | None:
+    """Reserve a slot for a queued job without superseding anything."""
+
+    global _backtest_active_total
+    global_limit = _backtest_capacity_limit("BACKTEST_MAX_CONCURRENT_GLOBAL", 2)
+    with _backtest_capacity_lock:
+        if _backtest_active_total >= global_limit or user_id in _backtest_active_by_user:
+            return None
+        lease = _BacktestCapacityLease(user_id, supersedable=False)
+        _backtest_active_total += 1
+        _backtest_active_by_user[user_id] = lease
+    return lease
+
+
+def _backtest_executor_mode() -> str:
+    mode = os.getenv("TOPSIGNAL_BACKTEST_EXECUTOR", "process").strip().lower()
+    if mode not in {"process", "thread"}:
+        raise RuntimeError("TOPSIGNAL_BACKTEST_EXECUTOR must be 'process' or 'thread'")
+    return mode
+
+
+def _backtest_process_pool() -> BacktestProcessPool | None:
+    """Return the warm replay pool, or ``None`` when replays run in-process.
+
+    The pool holds one worker per global capacity slot; capacity leases are
+    still acquired before a job is handed to it.
+    """
+
+    global _backtest_process_pool_instance
+    if _backtest_executor_mode() != "process" or not worker_processes_share_database(DATABASE_URL):
+        return None
+    with _backtest_process_pool_lock:
+        if _backtest_process_pool_instance is None:
+            _backtest_process_pool_instance = BacktestProcessPool(
+                _backtest_capacity_limit("BACKTEST_MAX_CONCURRENT_GLOBAL", 2)
+            )
+        return _backtest_process_pool_instance
+
+
+def _shutdown_backtest_process_pool() -> None:
+    global _backtest_process_pool_instance
+    with _backtest_process_pool_lock:
+        pool, _backtest_process_pool_instance = _backtest_process_pool_instance, None
+    if pool is not None:
+        pool.shutdown()
+
+
 def _run_trade_import_preview_cleanup() -> None:
     with SessionLocal() as db:
         cleanup_trade_import_previews(db)
@@ -369,19 +527,188 @@ async def _trade_import_preview_cleanup_loop() -> None:
             _log_trade_import_preview_cleanup_failure(exc)
 
 
+def _service_running_backtest_jobs() -> None:
+    """Heartbeat this process's jobs, relay cancel requests, recover stale jobs."""
+
+    with _backtest_job_lock:
+        running = dict(_backtest_job_leases)
+    with SessionLocal() as db:
+        for job_id in heartbeat_bot_backtest_jobs(db, running):
+            running[job_id].cancel()
+        requeue_stale_bot_backtest_jobs(db)
+
+
+def _claim_next_backtest_job() -> tuple[int, _BacktestCapacityLease] | None:
+    with SessionLocal() as db:
+        while True:
+            with _backtest_capacity_lock:
+                busy_users = set(_backtest_active_by_user)
+            row = next_queued_bot_backtest_job(db, skip_user_ids=busy_users)
+            if row is None:
+                return None
+            job_id = int(row.id)
+            lease = _try_acquire_backtest_job_capacity(str(row.user_id))
+            if lease is None:
+                return None
+            if claim_bot_backtest_job(db, job_id):
+                with _backtest_job_lock:
+                    _backtest_job_leases[job_id] = lease
+                return job_id, lease
+            # Another scheduler claimed it first; look for the next one.
+            lease.release()
+
+
+def _run_backtest_job(job_id: int, capacity_lease: _BacktestCapacityLease) -> None:
+    checkpointer = BotBacktestJobCheckpointer(SessionLocal, job_id)
+    attempt_count: int | None = None
+    outcome: dict[str, object] | None
+    try:
+        with SessionLocal() as db:
+            try:
+                row = db.get(BotBacktestJob, job_id)
+                if row is None:
+                    raise LookupError("bot_backtest_job_not_found")
+                attempt_count = int(row.attempt_count)
+                produced = _execute_backtest_job(db, row, capacity_lease, checkpointer)
+                # The result row commits together with the job's completion,
+                # and only while this attempt still owns the job, so a job
+                # re-queued as stale never ends up with a second row.
+                if not complete_bot_backtest_job(db, job_id, attempt_count=attempt_count, **produced):
+                    db.rollback()
+                    return
+                db.commit()
+                outcome = None
+            except Exception:
+                db.rollback()
+                raise
+    except Exception as exc:
+        if _backtest_jobs_shutting_down.is_set():
+            outcome = {"status": "queued"}
+        elif isinstance(exc, BacktestSupersededError) and capacity_lease.is_cancelled():
+            outcome = {"status": "cancelled"}
+        else:
+            error = _backtest_stream_error(exc)
+            if int(error["status"]) >= 500:
+                logger.warning(
+                    "backtest_job_failed",
+                    extra={"job_id": job_id, "error_type": type(exc).__name__},
+                )
+            outcome = {
+                "status": "failed",
+                "error_status": int(error["status"]),
+                "error_detail": str(error["detail"]),
+            }
+    finally:
+        with _backtest_job_lock:
+            _backtest_job_leases.pop(job_id, None)
+        capacity_lease.release()
+    if outcome is None:
+        return
+    with SessionLocal() as db:
+        if outcome["status"] == "queued":
+            release_bot_backtest_job(db, job_id, attempt_count=attempt_count)
+        else:
+            finish_bot_backtest_job(db, job_id, attempt_count=attempt_count, **outcome)  # type: ignore[arg-type]
+
+
+def _execute_backtest_job(
+    db: Session,
+    row: BotBacktestJob,
+    capacity_lease: _BacktestCapacityLease,
+    checkpointer: BotBacktestJobCheckpointer,
+) -> dict[str, int]:
+    user_id = str(row.user_id)
+    bot_config_id = int(row.bot_config_id)
+    payload = BOT_BACKTEST_JOB_REQUEST_MODELS[row.kind].model_validate(row.request_payload)
+    if row.kind == "sweep":
+        sweep = create_bot_backtest_sweep(
+            db,
+            user_id=user_id,
+            bot_config_id=bot_config_id,
+            payload=payload,
+            progress_callback=checkpointer,
+            cancellation_callback=capacity_lease.is_cancelled,
+            worker_capacity=capacity_lease.reserve_workers,
+            process_pool=_backtest_process_pool(),
+        )
+        if capacity_lease.is_cancelled():
+            raise BacktestSupersededError("backtest_superseded_by_newer_run")
+        return {"bot_backtest_sweep_id": int(sweep.id)}
+    if row.kind == "walk_forward":
+        backtest = create_bot_backtest_walk_forward(
+            db,
+            user_id=user_id,
+            bot_config_id=bot_config_id,
+            payload=payload,
+            progress_callback=checkpointer,
+            cancellation_callback=capacity_lease.is_cancelled,
+            worker_capacity=capacity_lease.reserve_workers,
+            process_pool=_backtest_process_pool(),
+        )
+        if capacity_lease.is_cancelled():
+            raise BacktestSupersededError("backtest_superseded_by_newer_run")
+        return {"bot_backtest_id": int(backtest.id)}
+    backtest = _run_bot_backtest(
+        db,
+        user_id=user_id,
+        bot_config_id=bot_config_id,
+        payload=payload,
+        capacity_lease=capacity_lease,
+        progress_callback=checkpointer,
+    )
+    return {"bot_backtest_id": int(backtest.id)}
+
+
+async def _backtest_job_scheduler_loop() -> None:
+    while True:
+        await asyncio.sleep(_BACKTEST_JOB_POLL_SECONDS)
+        try:
+            await asyncio.to_thread(_service_running_backtest_jobs)
+            while (claimed := await asyncio.to_thread(_claim_next_backtest_job)) is not None:
+                # Job threads are not awaited: like streamed runs, a replay is
+                # stopped only through its capacity lease.
+                asyncio.get_running_loop().run_in_executor(None, _run_backtest_job, *claimed)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.warning(
+                "backtest_job_scheduler_failed",
+                extra={"error_type": type(exc).__name__},
+            )
+
+
+def _stop_backtest_jobs() -> None:
+    """Stop this process's jobs; they return to the queue for the next scheduler."""
+
+    _backtest_jobs_shutting_down.set()
+    with _backtest_job_lock:
+        leases = list(_backtest_job_leases.values())
+    for lease in leases:
+        lease.cancel()
+
+
 @asynccontextmanager
 async def app_lifespan(_: FastAPI):
     _validate_runtime_security_configuration()
     _backtest_capacity_limit("BACKTEST_MAX_CONCURRENT_GLOBAL", 2)
     _backtest_capacity_limit("BACKTEST_MAX_CONCURRENT_PER_USER", 1)
+    _backtest_executor_mode()
     guard_against_local_database_url()
     log_runtime_connection_targets()
     init_db()
+    backtest_pool = _backtest_process_pool()
+    if backtest_pool is not None:
+        await asyncio.to_thread(backtest_pool.start)
     try:
         _run_trade_import_preview_cleanup()
     except Exception as exc:
         _log_trade_import_preview_cleanup_failure(exc)
     cleanup_task = asyncio.create_task(_trade_import_preview_cleanup_loop())
+    job_scheduler_task = (
+        asyncio.create_task(_backtest_job_scheduler_loop())
+        if _read_bool_env("TOPSIGNAL_BACKTEST_JOB_SCHEDULER_ENABLED", True)
+        else None
+    )
     try:
         _start_streaming_runtime_if_enabled()
         yield
@@ -391,8 +718,17 @@ async def app_lifespan(_: FastAPI):
             await cleanup_task
         except asyncio.CancelledError:
             pass
+        if job_scheduler_task is not None:
+            job_scheduler_task.cancel()
+            try:
+                await job_scheduler_task
+            except asyncio.CancelledError:
+                pass
+        _stop_backtest_jobs()
         await _order_book_registry.close()
+        _account_refresher.close()
         _stop_streaming_runtime()
+        await asyncio.to_thread(_shutdown_backtest_process_pool)
 
 
 app = FastAPI(title="TopSignal API", lifespan=app_lifespan)
@@ -509,6 +845,8 @@ def readiness(db: Session = Depends(get_db)):
         table_names = set(schema.get_table_names())
         required_tables = {
             "accounts",
+            "bot_backtest_jobs",
+            "bot_backtest_sweeps",
             "bot_backtests",
             "bot_configs",
             "bot_order_attempts",
@@ -1411,12 +1749,16 @@ def list_projectx_accounts(
     include_archived: bool = False,
     only_active_accounts: bool | None = None,
     refresh_provider: bool = True,
+    background_refresh: bool | None = None,
+    response: Response = None,
     db: Session = Depends(get_db),
 ):
     user_id = get_authenticated_user_id()
     if only_active_accounts is not None:
         show_inactive = not only_active_accounts
         show_missing = not only_active_accounts
+    if background_refresh is None:
+        background_refresh = _read_bool_env("PROJECTX_ACCOUNT_BACKGROUND_REFRESH", False)
 
     rows = get_projectx_account_rows(db, user_id=user_id)
     # `refresh_provider=True` is an explicit request to contact ProjectX even
@@ -1424,31 +1766,27 @@ def list_projectx_accounts(
     # that request would make first-time ProjectX discovery impossible and
     # could let callers mistake a cache-only response for a successful refresh.
     provider_sync_required = refresh_provider
+    if (
+        refresh_provider
+        and background_refresh
+        and _has_returnable_projectx_cache(
+            rows,
+            show_inactive=show_inactive,
+            show_missing=show_missing,
+            include_archived=include_archived,
+        )
+    ):
+        # Serve the persisted snapshot now and revalidate it off the request;
+        # subscribers of /api/accounts/stream hear about the result.
+        provider_sync_required = False
+        refresh_state = _account_refresher.request_refresh(user_id)
+        if response is not None:
+            response.headers["X-Provider-Refresh"] = refresh_state
     provider_accounts: list[dict[str, object]] = []
     provider_error: ProjectXClientError | HTTPException | None = None
     if provider_sync_required:
         try:
-            client = _projectx_client_for_user(db, user_id=user_id)
-            provider_accounts = client.list_accounts(only_active_accounts=False)
-            provider_refreshed_at = datetime.now(timezone.utc)
-            sync_projectx_accounts(
-                db,
-                provider_accounts,
-                user_id=user_id,
-                now_utc=provider_refreshed_at,
-                missing_buffer=timedelta(
-                    seconds=_read_int_env("PROJECTX_ACCOUNT_MISSING_BUFFER_SECONDS", 300),
-                ),
-            )
-            db.commit()
-            logger.info(
-                "projectx_account_sync_succeeded",
-                extra={
-                    "provider_sync_status": "provider_fresh",
-                    "provider_account_count": len(provider_accounts),
-                    "last_successful_refresh_at": provider_refreshed_at.isoformat(),
-                },
-            )
+            provider_accounts = _sync_projectx_account_snapshot(db, user_id=user_id)
         except ProjectXClientError as exc:
             db.rollback()
             provider_error = exc
@@ -1461,16 +1799,11 @@ def list_projectx_accounts(
     provider_error_code: str | None = None
     provider_error_message: str | None = None
     if provider_error is not None:
-        has_returnable_projectx_cache = any(
-            row.trade_data_source == TRADE_DATA_SOURCE_PROJECTX
-            and account_id_from_external_id(row.external_id) is not None
-            and should_include_account(
-                row,
-                show_inactive=show_inactive,
-                show_missing=show_missing,
-                include_archived=include_archived,
-            )
-            for row in rows
+        has_returnable_projectx_cache = _has_returnable_projectx_cache(
+            rows,
+            show_inactive=show_inactive,
+            show_missing=show_missing,
+            include_archived=include_archived,
         )
         provider_error_code, provider_error_message = _projectx_sync_failure_metadata(
             provider_error,
@@ -1560,6 +1893,135 @@ def list_projectx_accounts(
     return payload
 
 
+@app.get("/api/accounts/stream")
+async def stream_projectx_account_refreshes(request: Request):
+    """Push background account refresh results for the current user."""
+
+    user_id = get_authenticated_user_id()
+    subscription = _account_refresher.subscribe(user_id)
+
+    async def events():
+        try:
+            yield ": connected\n\n"
+            while True:
+                if await request.is_disconnected():
+                    break
+                try:
+                    event = await asyncio.wait_for(subscription.queue.get(), timeout=15.0)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield _serialize_sse_event(event)
+        finally:
+            subscription.close()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
+def _sync_projectx_account_snapshot(db: Session, *, user_id: str) -> list[dict[str, object]]:
+    client = _projectx_client_for_user(db, user_id=user_id)
+    provider_accounts = client.list_accounts(only_active_accounts=False)
+    provider_refreshed_at = datetime.now(timezone.utc)
+    sync_projectx_accounts(
+        db,
+        provider_accounts,
+        user_id=user_id,
+        now_utc=provider_refreshed_at,
+        missing_buffer=timedelta(
+            seconds=_read_int_env("PROJECTX_ACCOUNT_MISSING_BUFFER_SECONDS", 300),
+        ),
+    )
+    db.commit()
+    logger.info(
+        "projectx_account_sync_succeeded",
+        extra={
+            "provider_sync_status": "provider_fresh",
+            "provider_account_count": len(provider_accounts),
+            "last_successful_refresh_at": provider_refreshed_at.isoformat(),
+        },
+    )
+    return provider_accounts
+
+
+def _refresh_projectx_accounts_in_background(user_id: str) -> dict[str, object]:
+    with SessionLocal() as db:
+        before = _projectx_account_change_keys(get_projectx_account_rows(db, user_id=user_id))
+        try:
+            _sync_projectx_account_snapshot(db, user_id=user_id)
+        except (ProjectXClientError, HTTPException) as exc:
+            db.rollback()
+            code, message = _projectx_sync_failure_metadata(exc)
+            logger.warning(
+                code,
+                extra={
+                    "reason_code": code,
+                    "provider_sync_status": "background_refresh_failed",
+                    "status_code": exc.status_code,
+                },
+            )
+            return {"event": "accounts_refresh_failed", "data": {"code": code, "message": message}}
+        after = _projectx_account_change_keys(get_projectx_account_rows(db, user_id=user_id))
+    changed_account_ids = sorted(
+        account_id
+        for account_id in before.keys() | after.keys()
+        if before.get(account_id) != after.get(account_id)
+    )
+    return {
+        "event": "accounts_refreshed",
+        "data": {
+            "refreshed_at": datetime.now(timezone.utc),
+            "changed_account_ids": changed_account_ids,
+        },
+    }
+
+
+def _projectx_account_change_keys(rows: list[Account]) -> dict[int, tuple[object, ...]]:
+    """Fields a provider refresh can change, keyed by account id."""
+
+    keys: dict[int, tuple[object, ...]] = {}
+    for row in rows:
+        account_id = account_id_from_external_id(row.external_id)
+        if account_id is None or row.trade_data_source != TRADE_DATA_SOURCE_PROJECTX:
+            continue
+        keys[account_id] = (
+            row.name,
+            row.balance,
+            row.account_state,
+            row.can_trade,
+            row.is_visible,
+            row.is_main,
+            row.archived_at,
+        )
+    return keys
+
+
+def _has_returnable_projectx_cache(
+    rows: list[Account],
+    *,
+    show_inactive: bool,
+    show_missing: bool,
+    include_archived: bool,
+) -> bool:
+    return any(
+        row.trade_data_source == TRADE_DATA_SOURCE_PROJECTX
+        and account_id_from_external_id(row.external_id) is not None
+        and should_include_account(
+            row,
+            show_inactive=show_inactive,
+            show_missing=show_missing,
+            include_archived=include_archived,
+        )
+        for row in rows
+    )
+
+
 def _trade_data_source_conflict_detail(
     exc: AccountTradeDataSourceConflictError,
 ) -> dict[str, object]:
@@ -1996,6 +2458,9 @@ def get_projectx_market_candles(
     include_partial_bar: bool = False,
     refresh: bool = False,
     repair: bool = False,
+    max_points: int | None = Query(default=None, ge=2, le=20000),
+    request: Request = None,  # type: ignore[assignment]
+    response: Response = None,  # type: ignore[assignment]
     db: Session = Depends(get_db),
 ):
     """Serve candles from the per-user cache, fetching from ProjectX when needed.
@@ -2003,14 +2468,165 @@ def get_projectx_market_candles(
     `refresh` forces a full re-fetch and prunes cached rows the provider no longer
     returns. Open-session holes are repaired automatically. `repair` remains an
     explicit full-window merge for callers that want to revalidate every row.
+    `max_points` returns the whole Databento-cached part of the window, and the
+    provider tail after it, merged into at most that many min/max-preserving
+    bars instead of the newest `limit`. How many source bars each returned bar
+    merges is reported in `X-Candle-Bucket-Factor` (Arrow: `bucket_factor`).
+    `Accept: application/vnd.apache.arrow.stream` returns the rows as an Arrow
+    IPC stream; cached history is written straight from its mmap columns.
     """
     user_id = get_authenticated_user_id()
     end_utc = _as_utc(end) if end is not None else datetime.now(timezone.utc)
     start_utc = _as_utc(start) if start is not None else end_utc - timedelta(days=5)
     requested_symbol = symbol.strip() if isinstance(symbol, str) and symbol.strip() else None
-    session_symbol = requested_symbol or contract_id
     _validate_time_range(start=start_utc, end=end_utc)
 
+    provider_options = {
+        "user_id": user_id,
+        "contract_id": contract_id,
+        "requested_symbol": requested_symbol,
+        "live": live,
+        "end_utc": end_utc,
+        "unit": unit,
+        "unit_number": unit_number,
+        "limit": limit,
+        "include_partial_bar": include_partial_bar,
+        "refresh": refresh,
+        "repair": repair,
+    }
+    # Closed history for cached roots comes from the local Databento mmap
+    # cache; the provider only fills the tail after the cache ends.
+    history = load_databento_chart_history(
+        user_id=user_id,
+        contract_id=contract_id,
+        symbol=requested_symbol,
+        live=live,
+        start=start_utc,
+        end=end_utc,
+        unit=unit,
+        unit_number=unit_number,
+        limit=limit,
+        max_points=max_points,
+    )
+    arrow = wants_arrow_stream(request)
+    arrow_options = {
+        "contract_id": contract_id,
+        "live": live,
+        "unit": unit,
+        "unit_number": unit_number,
+    }
+    if history is None:
+        rows = _load_projectx_market_candles(db, start_utc=start_utc, **provider_options)
+        if arrow:
+            return _market_candles_arrow_response(None, rows, **arrow_options)
+        return rows
+    if end_utc <= history.covered_until:
+        return _market_candles_response(
+            history, [], arrow=arrow, response=response, **arrow_options
+        )
+    try:
+        tail = _load_projectx_market_candles(
+            db, start_utc=history.covered_until, **provider_options
+        )
+    except HTTPException:
+        if not len(history):
+            raise
+        logger.warning(
+            "projectx_candle_tail_unavailable contract_id=%s covered_until=%s",
+            contract_id,
+            history.covered_until.isoformat(),
+            exc_info=True,
+        )
+        tail = []
+    last_history_timestamp = history.last_timestamp
+    tail_rows = [
+        row
+        for row in tail
+        if last_history_timestamp is None
+        or _as_utc(row["timestamp"]) > last_history_timestamp
+    ]
+    if max_points is not None:
+        history, tail_rows = merge_chart_tail(history, tail_rows, max_points=max_points)
+    elif len(history) + len(tail_rows) > limit:
+        history = history.newest(limit - len(tail_rows))
+        tail_rows = tail_rows[-limit:]
+    return _market_candles_response(
+        history, tail_rows, arrow=arrow, response=response, **arrow_options
+    )
+
+
+def _market_candles_response(
+    history: DatabentoChartHistory,
+    rows: list[dict],
+    *,
+    arrow: bool,
+    response: Response | None,
+    contract_id: str,
+    live: bool,
+    unit: str,
+    unit_number: int,
+) -> Response | list[dict]:
+    if arrow:
+        return _market_candles_arrow_response(
+            history,
+            rows,
+            contract_id=contract_id,
+            live=live,
+            unit=unit,
+            unit_number=unit_number,
+        )
+    if response is not None:
+        response.headers["X-Candle-Bucket-Factor"] = str(history.bucket_factor)
+    return [*history.rows, *rows]
+
+
+def _market_candles_arrow_response(
+    history: DatabentoChartHistory | None,
+    rows: list[dict],
+    *,
+    contract_id: str,
+    live: bool,
+    unit: str,
+    unit_number: int,
+) -> Response:
+    batches = []
+    if history is not None:
+        batches.append(mmap_candle_record_batch(history.columns))
+    batches.append(market_candle_record_batch(rows))
+    symbol = history.symbol if history is not None else None
+    if symbol is None and rows:
+        symbol = rows[-1].get("symbol")
+    return arrow_stream_response(
+        MARKET_CANDLE_ARROW_SCHEMA,
+        batches,
+        metadata={
+            "contract_id": contract_id,
+            "symbol": symbol,
+            "live": str(bool(live)).lower(),
+            "unit": unit,
+            "unit_number": unit_number,
+            "bucket_factor": history.bucket_factor if history is not None else 1,
+        },
+    )
+
+
+def _load_projectx_market_candles(
+    db: Session,
+    *,
+    user_id: str,
+    contract_id: str,
+    requested_symbol: str | None,
+    live: bool,
+    start_utc: datetime,
+    end_utc: datetime,
+    unit: str,
+    unit_number: int,
+    limit: int,
+    include_partial_bar: bool,
+    refresh: bool,
+    repair: bool,
+) -> list[dict]:
+    session_symbol = requested_symbol or contract_id
     fallback_candles = []
     try:
         cached_candles = list_market_candles(
@@ -2585,29 +3201,13 @@ def create_trading_bot_backtest(
         )
     capacity_lease = _acquire_backtest_capacity(user_id)
     try:
-        config = get_bot_config(db, user_id=user_id, bot_config_id=bot_config_id)
-        if config is None:
-            raise LookupError("bot_config_not_found")
-        use_legacy_sqlite_fixture = (
-            legacy_projectx_backtest_fixtures_enabled(db)
-            and not databento_backtest_history_available(db, config=config)
-        )
-        client = (
-            _projectx_client_for_user(db, user_id=user_id)
-            if str(payload.strategy_type or config.strategy_type) == "topbot_adaptive"
-            and use_legacy_sqlite_fixture
-            else None
-        )
-        row = create_bot_backtest(
+        row = _run_bot_backtest(
             db,
             user_id=user_id,
             bot_config_id=bot_config_id,
             payload=payload,
-            client=client,
-            cancellation_callback=capacity_lease.is_cancelled,
+            capacity_lease=capacity_lease,
         )
-        if capacity_lease.is_cancelled():
-            raise BacktestSupersededError("backtest_superseded_by_newer_run")
         db.commit()
     except ProjectXClientError as exc:
         db.rollback()
@@ -2635,17 +3235,129 @@ def create_trading_bot_backtest(
     return serialize_bot_backtest(row)
 
 
-def _stream_trading_bot_backtest(
-    request: Request,
+def _run_bot_backtest(
+    db: Session,
     *,
     user_id: str,
     bot_config_id: int,
     payload: BotBacktestIn,
-) -> StreamingResponse:
-    """Run a backtest off the event loop and stream replay progress to the caller."""
+    capacity_lease: _BacktestCapacityLease,
+    progress_callback: Callable[[dict[str, object]], None] | None = None,
+) -> BotBacktest:
+    """Replay one backtest in a warm worker process, or inline for fixtures.
 
-    async def events():
-        loop = asyncio.get_running_loop()
+    Either way the row is only added to ``db``; the caller commits it.
+    """
+
+    config = get_bot_config(db, user_id=user_id, bot_config_id=bot_config_id)
+    if config is None:
+        raise LookupError("bot_config_not_found")
+    use_legacy_sqlite_fixture = (
+        legacy_projectx_backtest_fixtures_enabled(db)
+        and not databento_backtest_history_available(db, config=config)
+    )
+    pool = None if use_legacy_sqlite_fixture else _backtest_process_pool()
+    if pool is not None:
+        values = pool.run(
+            run_bot_backtest_job,
+            BotBacktestReplayRequest(
+                user_id=user_id,
+                bot_config_id=bot_config_id,
+                payload=payload,
+            ),
+            progress_callback=progress_callback,
+            cancellation_callback=capacity_lease.is_cancelled,
+        )
+        # The worker only learns of a cancel on the pool's next poll, so a
+        # run superseded just before it finished can still come back here.
+        if capacity_lease.is_cancelled():
+            raise BacktestSupersededError("backtest_superseded_by_newer_run")
+        return add_replayed_bot_backtest(db, values)
+    client = (
+        _projectx_client_for_user(db, user_id=user_id)
+        if str(payload.strategy_type or config.strategy_type) == "topbot_adaptive"
+        and use_legacy_sqlite_fixture
+        else None
+    )
+    row = create_bot_backtest(
+        db,
+        user_id=user_id,
+        bot_config_id=bot_config_id,
+        payload=payload,
+        client=client,
+        progress_callback=progress_callback,
+        cancellation_callback=capacity_lease.is_cancelled,
+    )
+    if capacity_lease.is_cancelled():
+        raise BacktestSupersededError("backtest_superseded_by_newer_run")
+    return row
+
+
+def _stream_trading_bot_backtest(
+    request: Request,
+    *,
+    user_id: str,
+    bot_config_id: int,
+    payload: BotBacktestIn,
+) -> StreamingResponse:
+    """Run a backtest off the event loop and stream replay progress to the caller.
+
+    Replays execute in the warm worker pool; this thread only relays events.
+    """
+
+    def work(
+        worker_db: Session,
+        capacity_lease: _BacktestCapacityLease,
+        enqueue: Callable[[dict[str, object] | None], None],
+    ) -> None:
+        def report_progress(progress: dict[str, object]) -> None:
+            enqueue({"event": "progress", "data": progress})
+
+        row = _run_bot_backtest(
+            worker_db,
+            user_id=user_id,
+            bot_config_id=bot_config_id,
+            payload=payload,
+            capacity_lease=capacity_lease,
+            progress_callback=report_progress,
+        )
+        worker_db.commit()
+        report_progress(
+            {
+                "phase": "complete",
+                "completed": int(row.bar_count),
+                "total": int(row.bar_count),
+                "percent": 100,
+                "remaining_percent": 0,
+            }
+        )
+        enqueue(
+            {
+                "event": "result",
+                "data": serialize_bot_backtest(row),
+            }
+        )
+
+    return _stream_backtest_worker(request, user_id=user_id, work=work)
+
+
+def _stream_backtest_worker(
+    request: Request,
+    *,
+    user_id: str,
+    work: Callable[
+        [
+            Session,
+            _BacktestCapacityLease,
+            Callable[[dict[str, object] | None], None],
+        ],
+        None,
+    ],
+) -> StreamingResponse:
+    """Run ``work`` in a capacity-leased worker thread and relay its SSE events."""
+
+    async def events():
+        loop = asyncio.get_running_loop()
         queue: asyncio.Queue[dict[str, object] | None] = asyncio.Queue()
         accept_events = Event()
         accept_events.set()
@@ -2659,9 +3371,6 @@ def _stream_trading_bot_backtest(
                 # The browser disconnected and the response event loop is gone.
                 return
 
-        def report_progress(progress: dict[str, object]) -> None:
-            enqueue({"event": "progress", "data": progress})
-
         def run() -> None:
             capacity_lease: _BacktestCapacityLease | None = None
             try:
@@ -2672,56 +3381,7 @@ def _stream_trading_bot_backtest(
                 capacity_lease = _acquire_backtest_capacity(user_id)
                 with SessionLocal() as worker_db:
                     try:
-                        config = get_bot_config(
-                            worker_db,
-                            user_id=user_id,
-                            bot_config_id=bot_config_id,
-                        )
-                        if config is None:
-                            raise LookupError("bot_config_not_found")
-                        use_legacy_sqlite_fixture = (
-                            legacy_projectx_backtest_fixtures_enabled(worker_db)
-                            and not databento_backtest_history_available(
-                                worker_db,
-                                config=config,
-                            )
-                        )
-                        client = (
-                            _projectx_client_for_user(worker_db, user_id=user_id)
-                            if str(payload.strategy_type or config.strategy_type)
-                            == "topbot_adaptive"
-                            and use_legacy_sqlite_fixture
-                            else None
-                        )
-                        row = create_bot_backtest(
-                            worker_db,
-                            user_id=user_id,
-                            bot_config_id=bot_config_id,
-                            payload=payload,
-                            client=client,
-                            progress_callback=report_progress,
-                            cancellation_callback=capacity_lease.is_cancelled,
-                        )
-                        if capacity_lease.is_cancelled():
-                            raise BacktestSupersededError(
-                                "backtest_superseded_by_newer_run"
-                            )
-                        worker_db.commit()
-                        report_progress(
-                            {
-                                "phase": "complete",
-                                "completed": int(row.bar_count),
-                                "total": int(row.bar_count),
-                                "percent": 100,
-                                "remaining_percent": 0,
-                            }
-                        )
-                        enqueue(
-                            {
-                                "event": "result",
-                                "data": serialize_bot_backtest(row),
-                            }
-                        )
+                        work(worker_db, capacity_lease, enqueue)
                     except Exception:
                         worker_db.rollback()
                         raise
@@ -2766,6 +3426,378 @@ def _stream_trading_bot_backtest(
     )
 
 
+@app.get(
+    "/api/bots/{bot_config_id}/backtests/{backtest_id}",
+    response_model=BotBacktestOut,
+)
+def get_trading_bot_backtest(
+    bot_config_id: int,
+    backtest_id: int,
+    include: str | None = Query(default=None, max_length=200),
+    max_points: int | None = Query(default=None, ge=4, le=100_000),
+    request: Request = None,  # type: ignore[assignment]
+    db: Session = Depends(get_db),
+):
+    """Return one saved backtest.
+
+    ``include`` is a comma-separated subset of the series sections to expand
+    (all by default); ``max_points`` downsamples the equity and drawdown
+    series, keeping each bucket's extremes. An Arrow IPC stream
+    (``Accept: application/vnd.apache.arrow.stream``) carries one series:
+    the single ``include`` section, ``equity_curve`` by default.
+    """
+
+    user_id = get_authenticated_user_id()
+    if bot_config_id <= 0 or backtest_id <= 0:
+        raise HTTPException(status_code=400, detail="ids must be positive integers")
+    sections = None
+    if include is not None:
+        sections = [name.strip() for name in include.split(",") if name.strip()]
+        unknown = sorted(set(sections) - set(RESULT_COLUMN_SECTIONS))
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"unknown_backtest_result_section:{unknown[0]}",
+            )
+    row = get_bot_backtest(
+        db,
+        user_id=user_id,
+        bot_config_id=bot_config_id,
+        backtest_id=backtest_id,
+    )
+    if row is None:
+        raise HTTPException(status_code=404, detail="bot_backtest_not_found")
+    if wants_arrow_stream(request):
+        return _bot_backtest_arrow_response(row, sections=sections, max_points=max_points)
+    return serialize_bot_backtest(row, sections=sections, max_points=max_points)
+
+
+def _bot_backtest_arrow_response(
+    row: BotBacktest,
+    *,
+    sections: list[str] | None,
+    max_points: int | None,
+) -> Response:
+    if sections is not None and len(set(sections)) != 1:
+        raise HTTPException(
+            status_code=400,
+            detail="backtest_arrow_stream_requires_one_section",
+        )
+    section = sections[0] if sections is not None else "equity_curve"
+    columns = None
+    if row.result_columns is not None:
+        columns = decode_result_column_arrays(
+            bytes(row.result_columns), section, max_points=max_points
+        )
+    if columns is not None:
+        batch = result_columns_record_batch(columns)
+    else:
+        result = bot_backtest_result(row, sections=[section], max_points=max_points)
+        batch = records_record_batch(list(result.get(section) or []))
+    return arrow_stream_response(
+        batch.schema,
+        [batch],
+        metadata={
+            "backtest_id": int(row.id),
+            "bot_config_id": row.bot_config_id,
+            "section": section,
+            "engine_version": row.engine_version,
+            "input_fingerprint": row.input_fingerprint,
+        },
+    )
+
+
+@app.post(
+    "/api/bots/{bot_config_id}/backtests/sweeps",
+    response_model=BotBacktestSweepOut,
+    status_code=201,
+)
+def create_trading_bot_backtest_sweep(
+    bot_config_id: int,
+    payload: BotBacktestSweepIn,
+    request: Request = None,  # type: ignore[assignment]
+    db: Session = Depends(get_db),
+):
+    """Replay a parameter grid across worker processes and keep a ranked summary."""
+
+    user_id = get_authenticated_user_id()
+    if bot_config_id <= 0:
+        raise HTTPException(status_code=400, detail="bot_config_id must be a positive integer")
+    if request is not None and "text/event-stream" in request.headers.get("accept", "").lower():
+        return _stream_trading_bot_backtest_sweep(
+            request,
+            user_id=user_id,
+            bot_config_id=bot_config_id,
+            payload=payload,
+        )
+    capacity_lease = _acquire_backtest_capacity(user_id)
+    try:
+        row = create_bot_backtest_sweep(
+            db,
+            user_id=user_id,
+            bot_config_id=bot_config_id,
+            payload=payload,
+            cancellation_callback=capacity_lease.is_cancelled,
+            worker_capacity=capacity_lease.reserve_workers,
+            process_pool=_backtest_process_pool(),
+        )
+        if capacity_lease.is_cancelled():
+            raise BacktestSupersededError("backtest_superseded_by_newer_run")
+        db.commit()
+    except (LookupError, BacktestError) as exc:
+        db.rollback()
+        error = _backtest_stream_error(exc)
+        raise HTTPException(status_code=int(error["status"]), detail=error["detail"]) from exc
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        capacity_lease.release()
+    return serialize_bot_backtest_sweep(row)
+
+
+def _stream_trading_bot_backtest_sweep(
+    request: Request,
+    *,
+    user_id: str,
+    bot_config_id: int,
+    payload: BotBacktestSweepIn,
+) -> StreamingResponse:
+    """Stream sweep progress and each combination's summary as it completes."""
+
+    def work(
+        worker_db: Session,
+        capacity_lease: _BacktestCapacityLease,
+        enqueue: Callable[[dict[str, object] | None], None],
+    ) -> None:
+        row = create_bot_backtest_sweep(
+            worker_db,
+            user_id=user_id,
+            bot_config_id=bot_config_id,
+            payload=payload,
+            progress_callback=lambda progress: enqueue(
+                {"event": "progress", "data": progress}
+            ),
+            combination_callback=lambda summary: enqueue(
+                {"event": "combination", "data": summary}
+            ),
+            cancellation_callback=capacity_lease.is_cancelled,
+            worker_capacity=capacity_lease.reserve_workers,
+            process_pool=_backtest_process_pool(),
+        )
+        if capacity_lease.is_cancelled():
+            raise BacktestSupersededError("backtest_superseded_by_newer_run")
+        worker_db.commit()
+        enqueue({"event": "result", "data": serialize_bot_backtest_sweep(row)})
+
+    return _stream_backtest_worker(request, user_id=user_id, work=work)
+
+
+@app.get(
+    "/api/bots/{bot_config_id}/backtests/sweeps/{sweep_id}",
+    response_model=BotBacktestSweepOut,
+)
+def get_trading_bot_backtest_sweep(
+    bot_config_id: int,
+    sweep_id: int,
+    db: Session = Depends(get_db),
+):
+    user_id = get_authenticated_user_id()
+    if bot_config_id <= 0 or sweep_id <= 0:
+        raise HTTPException(status_code=400, detail="ids must be positive integers")
+    row = get_bot_backtest_sweep(
+        db,
+        user_id=user_id,
+        bot_config_id=bot_config_id,
+        sweep_id=sweep_id,
+    )
+    if row is None:
+        raise HTTPException(status_code=404, detail="bot_backtest_sweep_not_found")
+    return serialize_bot_backtest_sweep(row)
+
+
+@app.post(
+    "/api/bots/{bot_config_id}/backtests/walk-forward",
+    response_model=BotBacktestOut,
+    status_code=201,
+)
+def create_trading_bot_backtest_walk_forward(
+    bot_config_id: int,
+    payload: BotBacktestWalkForwardIn,
+    request: Request = None,  # type: ignore[assignment]
+    db: Session = Depends(get_db),
+):
+    """Optimize each in-sample fold, replay the winner out of sample, and stitch."""
+
+    user_id = get_authenticated_user_id()
+    if bot_config_id <= 0:
+        raise HTTPException(status_code=400, detail="bot_config_id must be a positive integer")
+    if request is not None and "text/event-stream" in request.headers.get("accept", "").lower():
+        return _stream_trading_bot_backtest_walk_forward(
+            request,
+            user_id=user_id,
+            bot_config_id=bot_config_id,
+            payload=payload,
+        )
+    capacity_lease = _acquire_backtest_capacity(user_id)
+    try:
+        row = create_bot_backtest_walk_forward(
+            db,
+            user_id=user_id,
+            bot_config_id=bot_config_id,
+            payload=payload,
+            cancellation_callback=capacity_lease.is_cancelled,
+            worker_capacity=capacity_lease.reserve_workers,
+            process_pool=_backtest_process_pool(),
+        )
+        if capacity_lease.is_cancelled():
+            raise BacktestSupersededError("backtest_superseded_by_newer_run")
+        db.commit()
+    except (LookupError, BacktestError) as exc:
+        db.rollback()
+        error = _backtest_stream_error(exc)
+        raise HTTPException(status_code=int(error["status"]), detail=error["detail"]) from exc
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        capacity_lease.release()
+    return serialize_bot_backtest(row)
+
+
+def _stream_trading_bot_backtest_walk_forward(
+    request: Request,
+    *,
+    user_id: str,
+    bot_config_id: int,
+    payload: BotBacktestWalkForwardIn,
+) -> StreamingResponse:
+    """Stream walk-forward progress and each fold's selection as it is replayed."""
+
+    def work(
+        worker_db: Session,
+        capacity_lease: _BacktestCapacityLease,
+        enqueue: Callable[[dict[str, object] | None], None],
+    ) -> None:
+        row = create_bot_backtest_walk_forward(
+            worker_db,
+            user_id=user_id,
+            bot_config_id=bot_config_id,
+            payload=payload,
+            progress_callback=lambda progress: enqueue(
+                {"event": "progress", "data": progress}
+            ),
+            fold_callback=lambda fold: enqueue({"event": "fold", "data": fold}),
+            cancellation_callback=capacity_lease.is_cancelled,
+            worker_capacity=capacity_lease.reserve_workers,
+            process_pool=_backtest_process_pool(),
+        )
+        if capacity_lease.is_cancelled():
+            raise BacktestSupersededError("backtest_superseded_by_newer_run")
+        worker_db.commit()
+        enqueue({"event": "result", "data": serialize_bot_backtest(row)})
+
+    return _stream_backtest_worker(request, user_id=user_id, work=work)
+
+
+@app.post(
+    "/api/bots/{bot_config_id}/backtests/jobs",
+    response_model=BotBacktestJobOut,
+    status_code=202,
+)
+def submit_trading_bot_backtest_job(
+    bot_config_id: int,
+    payload: BotBacktestJobIn,
+    db: Session = Depends(get_db),
+):
+    """Queue a backtest, sweep, or walk-forward run to be collected later."""
+
+    user_id = get_authenticated_user_id()
+    if bot_config_id <= 0:
+        raise HTTPException(status_code=400, detail="bot_config_id must be a positive integer")
+    try:
+        row = submit_bot_backtest_job(
+            db,
+            user_id=user_id,
+            bot_config_id=bot_config_id,
+            kind=payload.kind,
+            request_payload=payload.request,
+        )
+        db.commit()
+    except LookupError as exc:
+        db.rollback()
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except Exception:
+        db.rollback()
+        raise
+    return serialize_bot_backtest_job(row)
+
+
+@app.get(
+    "/api/bots/{bot_config_id}/backtests/jobs/{job_id}",
+    response_model=BotBacktestJobOut,
+)
+def get_trading_bot_backtest_job(
+    bot_config_id: int,
+    job_id: int,
+    db: Session = Depends(get_db),
+):
+    return serialize_bot_backtest_job(_require_bot_backtest_job(db, bot_config_id, job_id))
+
+
+@app.get(
+    "/api/bots/{bot_config_id}/backtests/jobs/{job_id}/result",
+    response_model=BotBacktestOut | BotBacktestSweepOut,
+)
+def get_trading_bot_backtest_job_result(
+    bot_config_id: int,
+    job_id: int,
+    db: Session = Depends(get_db),
+):
+    row = _require_bot_backtest_job(db, bot_config_id, job_id)
+    if row.status != "succeeded":
+        raise HTTPException(status_code=409, detail=f"bot_backtest_job_{row.status}")
+    if row.bot_backtest_sweep_id is not None:
+        sweep = db.get(BotBacktestSweep, int(row.bot_backtest_sweep_id))
+        if sweep is not None:
+            return serialize_bot_backtest_sweep(sweep)
+    elif row.bot_backtest_id is not None:
+        backtest = db.get(BotBacktest, int(row.bot_backtest_id))
+        if backtest is not None:
+            return serialize_bot_backtest(backtest)
+    raise HTTPException(status_code=404, detail="bot_backtest_job_result_not_found")
+
+
+@app.post(
+    "/api/bots/{bot_config_id}/backtests/jobs/{job_id}/cancel",
+    response_model=BotBacktestJobOut,
+)
+def cancel_trading_bot_backtest_job(
+    bot_config_id: int,
+    job_id: int,
+    db: Session = Depends(get_db),
+):
+    row = _require_bot_backtest_job(db, bot_config_id, job_id)
+    request_bot_backtest_job_cancellation(db, row)
+    db.commit()
+    with _backtest_job_lock:
+        lease = _backtest_job_leases.get(job_id)
+    if lease is not None:
+        # Running here: stop now instead of at the scheduler's next heartbeat.
+        lease.cancel()
+    return serialize_bot_backtest_job(row)
+
+
+def _require_bot_backtest_job(db: Session, bot_config_id: int, job_id: int) -> BotBacktestJob:
+    user_id = get_authenticated_user_id()
+    if bot_config_id <= 0 or job_id <= 0:
+        raise HTTPException(status_code=400, detail="ids must be positive integers")
+    row = get_bot_backtest_job(db, user_id=user_id, bot_config_id=bot_config_id, job_id=job_id)
+    if row is None:
+        raise HTTPException(status_code=404, detail="bot_backtest_job_not_found")
+    return row
+
+
 def _backtest_stream_error(exc: Exception) -> dict[str, object]:
     if isinstance(exc, HTTPException):
         return {"status": int(exc.status_code), "detail": exc.detail}
@@ -3417,6 +4449,73 @@ def pull_projectx_account_journal_trade_stats(
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
 
+@app.post("/api/accounts/trades/refresh", response_model=ProjectXBulkTradeRefreshOut)
+def refresh_all_projectx_account_trades(
+    start: datetime | None = None,
+    end: datetime | None = None,
+    db: Session = Depends(get_db),
+):
+    user_id = get_authenticated_user_id()
+    _validate_time_range(start=start, end=end)
+    account_ids = [
+        account_id
+        for account_id in (
+            account_id_from_external_id(row.external_id)
+            for row in get_projectx_account_rows(db, user_id=user_id)
+            if row.trade_data_source != TRADE_DATA_SOURCE_CSV_IMPORT
+            and should_include_account(row, show_inactive=True, show_missing=False)
+        )
+        if account_id is not None
+    ]
+    if not account_ids:
+        return ProjectXBulkTradeRefreshOut(
+            fetched_count=0,
+            inserted_count=0,
+            failed_count=0,
+            accounts=[],
+        )
+
+    try:
+        client = _projectx_client_for_user(db, user_id=user_id)
+        # Each account refreshes in its own session on a worker thread; the
+        # request session is only used to list accounts and load credentials.
+        results = refresh_accounts_trades(
+            SessionLocal,
+            client,
+            account_ids,
+            user_id=user_id,
+            start=start,
+            end=end,
+        )
+    except ProjectXClientError as exc:
+        raise _to_http_exception(exc) from exc
+
+    accounts: list[ProjectXAccountTradeRefreshOut] = []
+    for result in results:
+        error_code: str | None = None
+        error_message: str | None = None
+        if isinstance(result.error, ProjectXClientError):
+            error_code, error_message = _projectx_sync_failure_metadata(result.error)
+        elif result.error is not None:
+            error_code = "projectx_trade_sync_internal_error"
+            error_message = "Trade refresh failed for this account. Try again."
+        accounts.append(
+            ProjectXAccountTradeRefreshOut(
+                account_id=result.account_id,
+                fetched_count=result.fetched_count,
+                inserted_count=result.inserted_count,
+                error_code=error_code,
+                error_message=error_message,
+            )
+        )
+    return ProjectXBulkTradeRefreshOut(
+        fetched_count=sum(item.fetched_count for item in accounts),
+        inserted_count=sum(item.inserted_count for item in accounts),
+        failed_count=sum(1 for item in accounts if item.error_code is not None),
+        accounts=accounts,
+    )
+
+
 @app.post("/api/accounts/{account_id}/trades/refresh", response_model=ProjectXTradeRefreshOut)
 def refresh_projectx_account_trades(
     account_id: int,
@@ -3699,6 +4798,7 @@ def get_projectx_account_pnl_calendar(
     end: datetime | None = None,
     all_time: bool = False,
     refresh: bool = False,
+    request: Request = None,  # type: ignore[assignment]
     db: Session = Depends(get_db),
 ):
     user_id = get_authenticated_user_id()
@@ -3729,7 +4829,7 @@ def get_projectx_account_pnl_calendar(
             refresh=refresh,
         )
 
-        return get_trade_event_pnl_calendar(
+        days = get_trade_event_pnl_calendar(
             db,
             account_id=account_id,
             user_id=user_id,
@@ -3738,6 +4838,13 @@ def get_projectx_account_pnl_calendar(
         )
     except ProjectXClientError as exc:
         raise _to_http_exception(exc) from exc
+    if wants_arrow_stream(request):
+        return arrow_stream_response(
+            PNL_CALENDAR_ARROW_SCHEMA,
+            [pnl_calendar_record_batch(days)],
+            metadata={"account_id": account_id},
+        )
+    return days
 
 
 def _projectx_client_for_user(db: Session, *, user_id: str) -> ProjectXClient:
@@ -10,6 +10,7 @@ from sqlalchemy import (
     ForeignKeyConstraint,
     Index,
     Integer,
+    LargeBinary,
     Numeric,
     Text,
     UniqueConstraint,
@@ -823,6 +824,10 @@ class BotBacktest(Base):
     config_snapshot = Column(JSON, nullable=False)
     assumptions_snapshot = Column(JSON, nullable=False)
     result_snapshot = Column(JSON, nullable=False)
+    # Series sections (equity, drawdown, trades, periods) in the columnar
+    # format of services.bot_backtest_columns; null for rows that keep them
+    # inline in result_snapshot.
+    result_columns = Column(LargeBinary, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     __table_args__ = (
@@ -843,6 +848,118 @@ class BotBacktest(Base):
     )
 
 
+class BotBacktestSweep(Base):
+    __tablename__ = "bot_backtest_sweeps"
+
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True)
+    user_id = Column(
+        USER_ID_TYPE,
+        nullable=False,
+        server_default=text(f"'{DEFAULT_USER_ID}'"),
+    )
+    bot_config_id = Column(BigInteger, ForeignKey("bot_configs.id", ondelete="SET NULL"), nullable=True)
+    account_id = Column(BigInteger, nullable=False)
+    engine_version = Column(Text, nullable=False)
+    strategy_type = Column(Text, nullable=False)
+    contract_id = Column(Text, nullable=False)
+    symbol = Column(Text, nullable=True)
+    timeframe_unit = Column(Text, nullable=False)
+    timeframe_unit_number = Column(Integer, nullable=False)
+    requested_start = Column(DateTime(timezone=True), nullable=False)
+    requested_end = Column(DateTime(timezone=True), nullable=False)
+    actual_start = Column(DateTime(timezone=True), nullable=False)
+    actual_end = Column(DateTime(timezone=True), nullable=False)
+    starting_balance = Column(Numeric(18, 6), nullable=False)
+    commission_per_contract = Column(Numeric(18, 6), nullable=False, server_default="0")
+    slippage_ticks = Column(Numeric(18, 6), nullable=False, server_default="0")
+    tick_size = Column(Numeric(18, 6), nullable=False)
+    tick_value = Column(Numeric(18, 6), nullable=False)
+    bar_count = Column(Integer, nullable=False)
+    rank_by = Column(Text, nullable=False)
+    combination_count = Column(Integer, nullable=False)
+    failed_count = Column(Integer, nullable=False, server_default="0")
+    config_snapshot = Column(JSON, nullable=False)
+    assumptions_snapshot = Column(JSON, nullable=False)
+    ranked_results = Column(JSON, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        CheckConstraint("requested_end > requested_start", name="bot_backtest_sweeps_requested_range_check"),
+        CheckConstraint("actual_end >= actual_start", name="bot_backtest_sweeps_actual_range_check"),
+        CheckConstraint("starting_balance > 0", name="bot_backtest_sweeps_starting_balance_positive_check"),
+        CheckConstraint(
+            "commission_per_contract >= 0",
+            name="bot_backtest_sweeps_commission_nonnegative_check",
+        ),
+        CheckConstraint("slippage_ticks >= 0", name="bot_backtest_sweeps_slippage_nonnegative_check"),
+        CheckConstraint("tick_size > 0", name="bot_backtest_sweeps_tick_size_positive_check"),
+        CheckConstraint("tick_value > 0", name="bot_backtest_sweeps_tick_value_positive_check"),
+        CheckConstraint("timeframe_unit_number > 0", name="bot_backtest_sweeps_timeframe_positive_check"),
+        CheckConstraint("bar_count > 0", name="bot_backtest_sweeps_bar_count_positive_check"),
+        CheckConstraint(
+            "combination_count > 0",
+            name="bot_backtest_sweeps_combination_count_positive_check",
+        ),
+        CheckConstraint(
+            "failed_count >= 0 and failed_count < combination_count",
+            name="bot_backtest_sweeps_failed_count_range_check",
+        ),
+        Index("idx_bot_backtest_sweeps_user_config_created", "user_id", "bot_config_id", created_at.desc()),
+    )
+
+
+class BotBacktestJob(Base):
+    __tablename__ = "bot_backtest_jobs"
+
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True)
+    user_id = Column(
+        USER_ID_TYPE,
+        nullable=False,
+        server_default=text(f"'{DEFAULT_USER_ID}'"),
+    )
+    bot_config_id = Column(BigInteger, ForeignKey("bot_configs.id", ondelete="CASCADE"), nullable=False)
+    kind = Column(Text, nullable=False)
+    status = Column(Text, nullable=False, server_default="queued")
+    request_payload = Column(JSON, nullable=False)
+    progress = Column(JSON, nullable=True)
+    attempt_count = Column(Integer, nullable=False, server_default="0")
+    cancel_requested_at = Column(DateTime(timezone=True), nullable=True)
+    error_status = Column(Integer, nullable=True)
+    error_detail = Column(Text, nullable=True)
+    bot_backtest_id = Column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        ForeignKey("bot_backtests.id", ondelete="SET NULL"),
+        nullable=True,
+    )
+    bot_backtest_sweep_id = Column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        ForeignKey("bot_backtest_sweeps.id", ondelete="SET NULL"),
+        nullable=True,
+    )
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    heartbeat_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        CheckConstraint(
+            "kind in ('backtest','sweep','walk_forward')",
+            name="bot_backtest_jobs_kind_check",
+        ),
+        CheckConstraint(
+            "status in ('queued','running','succeeded','failed','cancelled')",
+            name="bot_backtest_jobs_status_check",
+        ),
+        CheckConstraint("attempt_count >= 0", name="bot_backtest_jobs_attempt_count_nonnegative_check"),
+        CheckConstraint(
+            "finished_at is null or finished_at >= created_at",
+            name="bot_backtest_jobs_finished_at_check",
+        ),
+        Index("idx_bot_backtest_jobs_status_created", "status", "created_at"),
+        Index("idx_bot_backtest_jobs_user_config_created", "user_id", "bot_config_id", created_at.desc()),
+    )
+
+
 class BotRun(Base):
     __tablename__ = "bot_runs"
 
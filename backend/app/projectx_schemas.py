@@ -182,6 +182,21 @@ class ProjectXTradeRefreshOut(BaseModel):
     inserted_count: int
 
 
+class ProjectXAccountTradeRefreshOut(BaseModel):
+    account_id: int
+    fetched_count: int = 0
+    inserted_count: int = 0
+    error_code: str | None = None
+    error_message: str | None = None
+
+
+class ProjectXBulkTradeRefreshOut(BaseModel):
+    fetched_count: int
+    inserted_count: int
+    failed_count: int
+    accounts: list[ProjectXAccountTradeRefreshOut]
+
+
 class ProjectXPnlCalendarDayOut(BaseModel):
     date: date
     trade_count: int
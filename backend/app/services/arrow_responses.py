@@ -0,0 +1,201 @@
+"""Arrow IPC stream responses for the large columnar endpoints.
+
+Candle windows, backtest series and the PnL calendar are JSON lists of
+objects by default, which repeats every key and spells each timestamp out as
+an ISO string. Clients that send ``Accept: application/vnd.apache.arrow.stream``
+get the same rows as one Arrow IPC stream instead: timestamps are
+``timestamp[ns, UTC]``, numbers stay float64/int64, and columns that already
+exist as NumPy arrays (mmap candle slices, stored backtest columns) are handed
+to Arrow without rebuilding per-row objects. Response-level fields that JSON
+repeats on every row (contract, unit, backtest id) travel as schema metadata.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Mapping, Sequence
+from datetime import date, datetime
+from typing import Any
+
+import numpy as np
+import pyarrow as pa
+from fastapi import Request, Response
+
+from .bot_backtest_columns import ResultColumnArray
+from .databento_cache import PRICE_SCALE
+
+
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+_TIMESTAMP_TYPE = pa.timestamp("ns", tz="UTC")
+MARKET_CANDLE_ARROW_SCHEMA = pa.schema(
+    [
+        pa.field("timestamp", _TIMESTAMP_TYPE, nullable=False),
+        pa.field("open", pa.float64(), nullable=False),
+        pa.field("high", pa.float64(), nullable=False),
+        pa.field("low", pa.float64(), nullable=False),
+        pa.field("close", pa.float64(), nullable=False),
+        pa.field("volume", pa.float64()),
+        pa.field("is_partial", pa.bool_(), nullable=False),
+    ]
+)
+PNL_CALENDAR_ARROW_SCHEMA = pa.schema(
+    [
+        pa.field("date", pa.date32(), nullable=False),
+        pa.field("trade_count", pa.int64(), nullable=False),
+        pa.field("gross_pnl", pa.float64(), nullable=False),
+        pa.field("fees", pa.float64(), nullable=False),
+        pa.field("non_commission_fees", pa.float64(), nullable=False),
+        pa.field("commissions", pa.float64(), nullable=False),
+        pa.field("net_pnl", pa.float64(), nullable=False),
+        pa.field("win_count", pa.int64(), nullable=False),
+        pa.field("loss_count", pa.int64(), nullable=False),
+        pa.field("breakeven_count", pa.int64(), nullable=False),
+    ]
+)
+_ARROW_VALUE_TYPES = {
+    "ts": _TIMESTAMP_TYPE,
+    "f8": pa.float64(),
+    "i8": pa.int64(),
+    "b1": pa.bool_(),
+}
+
+
+def wants_arrow_stream(request: Request | None) -> bool:
+    """True when the client explicitly accepts an Arrow IPC stream.
+
+    Wildcards do not count: JSON stays the default for every existing client.
+    """
+
+    if request is None:
+        return False
+    for media_range in request.headers.get("accept", "").split(","):
+        if media_range.split(";", 1)[0].strip().lower() == ARROW_STREAM_MEDIA_TYPE:
+            return True
+    return False
+
+
+def arrow_stream_response(
+    schema: pa.Schema,
+    batches: Iterable[pa.RecordBatch],
+    *,
+    metadata: Mapping[str, Any] | None = None,
+) -> Response:
+    """Write ``batches`` as one IPC stream; ``metadata`` values are stringified."""
+
+    if metadata:
+        schema = schema.with_metadata(
+            {
+                str(key): "" if value is None else str(value)
+                for key, value in metadata.items()
+            }
+        )
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, schema) as writer:
+        for batch in batches:
+            if batch.num_rows:
+                writer.write_batch(batch.replace_schema_metadata(schema.metadata))
+    return Response(content=sink.getvalue().to_pybytes(), media_type=ARROW_STREAM_MEDIA_TYPE)
+
+
+def mmap_candle_record_batch(columns: Mapping[str, np.ndarray]) -> pa.RecordBatch:
+    """Candle batch from mmap cache columns (epoch-ns timestamps, nano prices).
+
+    Timestamps are wrapped without copying; prices are scaled in one vector
+    operation per column.
+    """
+
+    timestamps = np.ascontiguousarray(columns["timestamp_ns"], dtype=np.int64)
+    return pa.RecordBatch.from_arrays(
+        [
+            pa.Array.from_buffers(
+                _TIMESTAMP_TYPE, len(timestamps), [None, pa.py_buffer(timestamps)]
+            ),
+            pa.array(columns["open_nano"] / PRICE_SCALE, type=pa.float64()),
+            pa.array(columns["high_nano"] / PRICE_SCALE, type=pa.float64()),
+            pa.array(columns["low_nano"] / PRICE_SCALE, type=pa.float64()),
+            pa.array(columns["close_nano"] / PRICE_SCALE, type=pa.float64()),
+            pa.array(np.asarray(columns["volume"], dtype=np.float64), type=pa.float64()),
+            pa.array(np.zeros(len(timestamps), dtype=bool), type=pa.bool_()),
+        ],
+        schema=MARKET_CANDLE_ARROW_SCHEMA,
+    )
+
+
+def market_candle_record_batch(rows: Sequence[Mapping[str, Any]]) -> pa.RecordBatch:
+    """Candle batch from ``serialize_market_candle``-shaped rows."""
+
+    return pa.RecordBatch.from_pylist(
+        [
+            {field.name: row.get(field.name) for field in MARKET_CANDLE_ARROW_SCHEMA}
+            for row in rows
+        ],
+        schema=MARKET_CANDLE_ARROW_SCHEMA,
+    )
+
+
+def pnl_calendar_record_batch(rows: Sequence[Mapping[str, Any]]) -> pa.RecordBatch:
+    """PnL calendar batch; ``date`` strings become ``date32`` values."""
+
+    return pa.RecordBatch.from_pylist(
+        [
+            {
+                **{field.name: row.get(field.name) for field in PNL_CALENDAR_ARROW_SCHEMA},
+                "date": _as_date(row["date"]),
+            }
+            for row in rows
+        ],
+        schema=PNL_CALENDAR_ARROW_SCHEMA,
+    )
+
+
+def result_columns_record_batch(columns: Mapping[str, ResultColumnArray]) -> pa.RecordBatch:
+    """Backtest series batch from stored result columns.
+
+    Native columns keep their NumPy buffers; JSON-framed columns are left to
+    Arrow's type inference and fall back to JSON text when values are mixed.
+    """
+
+    arrays: list[pa.Array] = []
+    for column in columns.values():
+        value_type = _ARROW_VALUE_TYPES.get(column.kind)
+        if value_type is None:
+            arrays.append(_inferred_array(column.values))
+        elif column.kind == "ts":
+            values = np.ascontiguousarray(column.values, dtype=np.int64)
+            arrays.append(
+                pa.array(values, type=pa.int64(), mask=column.mask).view(value_type)
+            )
+        else:
+            arrays.append(pa.array(column.values, type=value_type, mask=column.mask))
+    return pa.RecordBatch.from_arrays(arrays, names=list(columns))
+
+
+def records_record_batch(records: Sequence[Mapping[str, Any]]) -> pa.RecordBatch:
+    """Batch for series stored as plain records (pre-columnar backtests)."""
+
+    names: list[str] = []
+    for record in records:
+        names.extend(key for key in record if key not in names)
+    return pa.RecordBatch.from_arrays(
+        [_inferred_array([record.get(name) for record in records]) for name in names],
+        names=names,
+    )
+
+
+def _inferred_array(values: Sequence[Any]) -> pa.Array:
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return pa.array(
+            [None if value is None else json.dumps(value) for value in values],
+            type=pa.string(),
+        )
+
+
+def _as_date(value: Any) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value))
@@ -0,0 +1,433 @@
+"""Columnar storage for the per-bar and per-trade series of a persisted backtest.
+
+A multi-year replay produces tens of thousands of equity, drawdown and trade
+records.  Stored as JSON lists of dicts, every record repeats its key names and
+spells its timestamps out as ISO strings, and serializing one row means
+building all of them again.  The series sections are instead kept in
+``bot_backtests.result_columns`` as struct-of-arrays frames: timestamps as
+int64 epoch nanoseconds, numbers as float64/int64, one frame per column, each
+zstd-compressed on its own.  The summary (range, metrics, warnings, ...) stays
+in ``result_snapshot`` so list views never touch the blob.
+
+Encoding is lossless: a column is only stored natively when every value
+round-trips to exactly what the engine produced (same type, same ISO spelling);
+anything else is kept as a JSON frame, and a section whose records do not share
+one key layout is stored whole as JSON.  Readers decode only the sections, and
+within a downsampled series only the rows, they return.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import struct
+from collections.abc import Iterable
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, NamedTuple
+
+import numpy as np
+import zstandard
+
+
+RESULT_COLUMN_SECTIONS = (
+    "equity_curve",
+    "drawdown_series",
+    "trades",
+    "daily_results",
+    "monthly_results",
+)
+# The value column whose extremes a downsampled series must keep.
+DOWNSAMPLE_VALUE_COLUMNS = {
+    "equity_curve": "equity",
+    "drawdown_series": "drawdown_dollars",
+}
+
+_MAGIC = b"TSRC"
+_FORMAT_VERSION = 1
+_PREAMBLE = struct.Struct("<4sBI")
+_COMPRESSION_LEVEL = 3
+# Frames this small rarely shrink and are cheaper to read raw.
+_MIN_COMPRESSED_FRAME_BYTES = 64
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_NATIVE_DTYPES = {"ts": "<i8", "f8": "<f8", "i8": "<i8", "b1": "u1"}
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+
+
+class ResultColumnsError(ValueError):
+    """Raised when a ``result_columns`` blob cannot be decoded."""
+
+
+class ResultColumnArray(NamedTuple):
+    """One decoded column: ``values`` is an ndarray unless ``kind`` is ``json``.
+
+    ``ts`` values are int64 epoch nanoseconds; ``mask`` flags null rows.
+    """
+
+    kind: str
+    values: Any
+    mask: np.ndarray | None
+
+
+def encode_result_columns(result: dict[str, Any]) -> tuple[dict[str, Any], bytes | None]:
+    """Split ``result`` into its summary snapshot and a columnar series blob.
+
+    Returns ``(result, None)`` unchanged when it carries no series sections.
+    ``result`` itself is never mutated.
+    """
+
+    names = [
+        name
+        for name in RESULT_COLUMN_SECTIONS
+        if isinstance(result.get(name), list)
+    ]
+    if not names:
+        return result, None
+    compressor = zstandard.ZstdCompressor(level=_COMPRESSION_LEVEL)
+    frames: list[bytes] = []
+    offset = 0
+    sections: dict[str, Any] = {}
+
+    def add_frame(payload: bytes) -> dict[str, Any]:
+        nonlocal offset
+        codec = "raw"
+        if len(payload) >= _MIN_COMPRESSED_FRAME_BYTES:
+            compressed = compressor.compress(payload)
+            if len(compressed) < len(payload):
+                payload = compressed
+                codec = "zstd"
+        frame = {"offset": offset, "length": len(payload), "codec": codec}
+        frames.append(payload)
+        offset += len(payload)
+        return frame
+
+    for name in names:
+        records = result[name]
+        keys = _shared_record_keys(records)
+        if keys is None:
+            sections[name] = {
+                "layout": "json",
+                "rows": len(records),
+                **add_frame(_json_bytes(records)),
+            }
+            continue
+        columns = []
+        for key in keys:
+            kind, nullable, payload = _encode_column([record[key] for record in records])
+            columns.append(
+                {"name": key, "kind": kind, "nullable": nullable, **add_frame(payload)}
+            )
+        sections[name] = {"layout": "columns", "rows": len(records), "columns": columns}
+
+    header = _json_bytes({"version": _FORMAT_VERSION, "sections": sections})
+    blob = b"".join([_PREAMBLE.pack(_MAGIC, _FORMAT_VERSION, len(header)), header, *frames])
+    snapshot = {key: value for key, value in result.items() if key not in sections}
+    return snapshot, blob
+
+
+def result_column_sections(blob: bytes) -> list[str]:
+    """Names of the series sections stored in ``blob``, in storage order."""
+
+    header, _data_start = _read_header(blob)
+    return list(header["sections"])
+
+
+def decode_result_columns(
+    blob: bytes,
+    names: Iterable[str] | None = None,
+    *,
+    max_points: int | None = None,
+) -> dict[str, list[dict[str, Any]]]:
+    """Expand the requested series sections (all of them by default).
+
+    ``max_points`` downsamples the sections in ``DOWNSAMPLE_VALUE_COLUMNS``:
+    only the selected rows are turned back into records.
+    """
+
+    header, data_start = _read_header(blob)
+    stored = header["sections"]
+    wanted = list(stored) if names is None else [name for name in names if name in stored]
+    frame_bytes = _frame_reader(blob, data_start)
+
+    decoded: dict[str, list[dict[str, Any]]] = {}
+    for name in wanted:
+        section = stored[name]
+        rows = int(section["rows"])
+        value_column = DOWNSAMPLE_VALUE_COLUMNS.get(name) if max_points is not None else None
+        if section["layout"] == "json":
+            records = json.loads(frame_bytes(section))
+            if value_column is not None:
+                records = downsample_records(records, value_key=value_column, max_points=max_points)
+            decoded[name] = records
+            continue
+        columns = {
+            column["name"]: _decode_column(column, frame_bytes(column), rows)
+            for column in section["columns"]
+        }
+        indices: Iterable[int] = range(rows)
+        if value_column is not None:
+            indices = _downsample_column_indices(
+                columns.get(value_column), rows, int(max_points or 0)
+            )
+        decoded[name] = [
+            {key: column[index] for key, column in columns.items()} for index in indices
+        ]
+    return decoded
+
+
+def decode_result_column_arrays(
+    blob: bytes,
+    name: str,
+    *,
+    max_points: int | None = None,
+) -> dict[str, ResultColumnArray] | None:
+    """Decode one columnar section without expanding it into records.
+
+    Native columns stay NumPy arrays so callers can hand them to another
+    columnar format as they are. Returns ``None`` when the section is missing
+    or stored whole as JSON; ``decode_result_columns`` still reads those.
+    """
+
+    header, data_start = _read_header(blob)
+    section = header["sections"].get(name)
+    if section is None or section["layout"] == "json":
+        return None
+    rows = int(section["rows"])
+    frame_bytes = _frame_reader(blob, data_start)
+    columns = {
+        column["name"]: _decode_column(column, frame_bytes(column), rows)
+        for column in section["columns"]
+    }
+    value_column = DOWNSAMPLE_VALUE_COLUMNS.get(name) if max_points is not None else None
+    indices: np.ndarray | None = None
+    if value_column is not None:
+        indices = np.asarray(
+            _downsample_column_indices(columns.get(value_column), rows, int(max_points or 0)),
+            dtype=np.int64,
+        )
+        if indices.shape[0] == rows:
+            indices = None
+    arrays: dict[str, ResultColumnArray] = {}
+    for key, column in columns.items():
+        if isinstance(column, _NativeColumn):
+            values, mask = column.values, column.mask
+            if indices is not None:
+                values = values[indices]
+                mask = mask[indices] if mask is not None else None
+            arrays[key] = ResultColumnArray(column.kind, values, mask)
+        else:
+            values = column if indices is None else [column[index] for index in indices.tolist()]
+            arrays[key] = ResultColumnArray("json", values, None)
+    return arrays
+
+
+def downsample_records(
+    records: list[dict[str, Any]],
+    *,
+    value_key: str,
+    max_points: int,
+) -> list[dict[str, Any]]:
+    """Downsample already-expanded records the same way as stored columns."""
+
+    try:
+        values = np.fromiter(
+            (float(record[value_key]) for record in records),
+            dtype=np.float64,
+            count=len(records),
+        )
+    except (KeyError, TypeError, ValueError):
+        return [records[index] for index in _even_indices(len(records), max_points)]
+    return [records[index] for index in downsample_indices(values, max_points=max_points).tolist()]
+
+
+def downsample_indices(values: np.ndarray, *, max_points: int) -> np.ndarray:
+    """Row indices that keep a series' shape within ``max_points`` rows.
+
+    The first and last rows are always kept; the rows between are split into
+    equal buckets and each bucket contributes its minimum and maximum, so peaks
+    and the deepest troughs survive any reduction.
+    """
+
+    count = int(values.shape[0])
+    if max_points <= 0 or count <= max_points:
+        return np.arange(count)
+    if max_points < 4:
+        return _even_indices(count, max_points)
+    bucket_count = (max_points - 2) // 2
+    inner = values[1:-1]
+    edges = np.linspace(0, inner.shape[0], bucket_count + 1).astype(np.int64)
+    selected = [0, count - 1]
+    for start, end in zip(edges[:-1].tolist(), edges[1:].tolist()):
+        if end <= start:
+            continue
+        bucket = inner[start:end]
+        selected.append(start + 1 + int(np.argmin(bucket)))
+        selected.append(start + 1 + int(np.argmax(bucket)))
+    return np.unique(np.asarray(selected, dtype=np.int64))
+
+
+def _even_indices(count: int, max_points: int) -> np.ndarray:
+    if max_points <= 0 or count <= max_points:
+        return np.arange(count)
+    if max_points == 1:
+        return np.asarray([count - 1], dtype=np.int64)
+    return np.unique(np.linspace(0, count - 1, max_points).round().astype(np.int64))
+
+
+def _downsample_column_indices(column: Any, rows: int, max_points: int) -> list[int]:
+    if isinstance(column, _NativeColumn) and column.kind == "f8" and column.mask is None:
+        return downsample_indices(column.values, max_points=max_points).tolist()
+    try:
+        numeric = np.asarray([float(column[index]) for index in range(rows)], dtype=np.float64)
+    except (TypeError, ValueError):
+        return _even_indices(rows, max_points).tolist()
+    return downsample_indices(numeric, max_points=max_points).tolist()
+
+
+def _shared_record_keys(records: list[Any]) -> list[str] | None:
+    if not records or not all(isinstance(record, dict) for record in records):
+        return None
+    keys = list(records[0])
+    if not all(isinstance(key, str) for key in keys):
+        return None
+    for record in records:
+        if len(record) != len(keys) or list(record) != keys:
+            return None
+    return keys
+
+
+def _encode_column(values: list[Any]) -> tuple[str, bool, bytes]:
+    present = [value for value in values if value is not None]
+    nullable = len(present) != len(values)
+    kind = _native_kind(present)
+    if kind is None:
+        return "json", False, _json_bytes(values)
+    if kind == "ts":
+        native = [_timestamp_ns(value) if value is not None else 0 for value in values]
+    else:
+        native = [value if value is not None else 0 for value in values]
+    array = np.asarray(native, dtype=_NATIVE_DTYPES[kind])
+    payload = array.tobytes()
+    if nullable:
+        mask = np.asarray([value is None for value in values], dtype=np.uint8)
+        payload = mask.tobytes() + payload
+    return kind, nullable, payload
+
+
+def _native_kind(values: list[Any]) -> str | None:
+    if not values:
+        return None
+    first = type(values[0])
+    if any(type(value) is not first for value in values):
+        return None
+    if first is float:
+        return "f8" if all(math.isfinite(value) for value in values) else None
+    if first is bool:
+        return "b1"
+    if first is int:
+        return "i8" if all(_INT64_MIN <= value <= _INT64_MAX for value in values) else None
+    if first is str and all(_timestamp_round_trips(value) for value in values):
+        return "ts"
+    return None
+
+
+def _timestamp_round_trips(value: str) -> bool:
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return False
+    if parsed.tzinfo is None or parsed.utcoffset() != timedelta(0):
+        return False
+    return _format_timestamp(_timestamp_ns(value)) == value
+
+
+def _timestamp_ns(value: str) -> int:
+    delta = datetime.fromisoformat(value) - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1_000
+
+
+def _format_timestamp(nanoseconds: int) -> str:
+    return (_EPOCH + timedelta(microseconds=nanoseconds // 1_000)).isoformat()
+
+
+def _decode_column(column: dict[str, Any], payload: bytes, rows: int) -> Any:
+    kind = column["kind"]
+    if kind == "json":
+        values = json.loads(payload)
+        if not isinstance(values, list) or len(values) != rows:
+            raise ResultColumnsError("result_columns_corrupt")
+        return values
+    dtype = _NATIVE_DTYPES.get(kind)
+    if dtype is None:
+        raise ResultColumnsError(f"result_columns_unknown_kind:{kind}")
+    mask = None
+    if column.get("nullable"):
+        mask = np.frombuffer(payload[:rows], dtype=np.uint8).astype(bool)
+        payload = payload[rows:]
+    if len(payload) != rows * np.dtype(dtype).itemsize:
+        raise ResultColumnsError("result_columns_corrupt")
+    array = np.frombuffer(payload, dtype=dtype)
+    if kind == "b1":
+        array = array.astype(bool)
+    return _NativeColumn(kind, array, mask)
+
+
+class _NativeColumn:
+    __slots__ = ("kind", "values", "mask")
+
+    def __init__(self, kind: str, values: np.ndarray, mask: np.ndarray | None):
+        self.kind = kind
+        self.values = values
+        self.mask = mask
+
+    def __getitem__(self, index: int) -> Any:
+        if self.mask is not None and self.mask[index]:
+            return None
+        value = self.values[index]
+        if self.kind == "ts":
+            return _format_timestamp(int(value))
+        if self.kind == "f8":
+            return float(value)
+        if self.kind == "i8":
+            return int(value)
+        return bool(value)
+
+
+def _frame_reader(blob: bytes, data_start: int) -> Callable[[dict[str, Any]], bytes]:
+    decompressor = zstandard.ZstdDecompressor()
+
+    def frame_bytes(frame: dict[str, Any]) -> bytes:
+        start = data_start + int(frame["offset"])
+        payload = blob[start : start + int(frame["length"])]
+        if len(payload) != int(frame["length"]):
+            raise ResultColumnsError("result_columns_truncated")
+        if frame["codec"] == "zstd":
+            try:
+                return decompressor.decompress(payload)
+            except zstandard.ZstdError as exc:
+                raise ResultColumnsError("result_columns_corrupt") from exc
+        return payload
+
+    return frame_bytes
+
+
+def _read_header(blob: bytes) -> tuple[dict[str, Any], int]:
+    if len(blob) < _PREAMBLE.size:
+        raise ResultColumnsError("result_columns_truncated")
+    magic, version, header_length = _PREAMBLE.unpack_from(blob)
+    if magic != _MAGIC:
+        raise ResultColumnsError("result_columns_bad_magic")
+    if version != _FORMAT_VERSION:
+        raise ResultColumnsError(f"result_columns_unsupported_version:{version}")
+    data_start = _PREAMBLE.size + header_length
+    try:
+        header = json.loads(blob[_PREAMBLE.size : data_start])
+    except ValueError as exc:
+        raise ResultColumnsError("result_columns_corrupt") from exc
+    if not isinstance(header, dict) or not isinstance(header.get("sections"), dict):
+        raise ResultColumnsError("result_columns_corrupt")
+    return header, data_start
+
+
+def _json_bytes(value: Any) -> bytes:
+    return json.dumps(value, allow_nan=False, separators=(",", ":")).encode("utf-8")
@@ -0,0 +1,358 @@
+"""Warm worker processes for CPU-bound bot backtest replays.
+
+A replay run on an API thread holds the GIL for its whole duration, so one
+full-history backtest stalls the event loop and every other request.  This
+pool runs replays in long-lived spawn-context processes instead.  Each worker
+imports the strategy evaluators and opens the default Databento replay store
+once at start-up, then serves jobs over a duplex pipe: the parent sends a job,
+the worker streams progress events back, and cancellation travels the other
+way as a message the worker's cancellation callback polls.  Workers never
+commit; the parent persists the replayed row in its own transaction.  Capacity
+accounting stays with the caller; the pool only bounds how many replays
+execute at once.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import multiprocessing
+import os
+import pickle
+import signal
+import threading
+import time
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from typing import Any, Callable
+
+from sqlalchemy.engine.url import make_url
+from sqlalchemy.orm import Session
+
+from ..db import SessionLocal
+from ..models import BotBacktest
+from .bot_backtesting import (
+    BacktestCancellationCallback,
+    BacktestProgressCallback,
+    BacktestSupersededError,
+    _raise_if_backtest_cancelled,
+    create_bot_backtest,
+)
+from .databento_cache import get_default_databento_cache
+
+logger = logging.getLogger(__name__)
+
+_POLL_SECONDS = 0.25
+# Workers check the pipe for a cancel message at most this often; the replay
+# engine asks every bar, and a syscall per bar would dominate short bars.
+_WORKER_CANCEL_CHECK_SECONDS = 0.05
+_DEFAULT_BACKTEST_WORKER_CANCEL_GRACE_SECONDS = 10.0
+try:
+    BACKTEST_WORKER_CANCEL_GRACE_SECONDS = float(
+        os.getenv(
+            "TOPSIGNAL_BACKTEST_WORKER_CANCEL_GRACE_SECONDS",
+            str(_DEFAULT_BACKTEST_WORKER_CANCEL_GRACE_SECONDS),
+        )
+    )
+except ValueError:
+    BACKTEST_WORKER_CANCEL_GRACE_SECONDS = _DEFAULT_BACKTEST_WORKER_CANCEL_GRACE_SECONDS
+
+BacktestWorkerJob = Callable[..., Any]
+_SERVER_ASSIGNED_BACKTEST_COLUMNS = frozenset({"id", "created_at"})
+
+
+class BacktestWorkerCrashedError(RuntimeError):
+    """Raised when a worker process exits while it owns a job."""
+
+
+@dataclass(frozen=True)
+class BotBacktestReplayRequest:
+    user_id: str
+    bot_config_id: int
+    payload: Any
+
+
+def worker_processes_share_database(database_url: str) -> bool:
+    """Whether a separately started process sees the same database.
+
+    An in-memory SQLite database exists only inside the process that opened it,
+    so replays against one must stay in-process.
+    """
+
+    parsed = make_url(database_url)
+    if parsed.get_backend_name() != "sqlite":
+        return True
+    database = str(parsed.database or "")
+    if database in {"", ":memory:"} or database.startswith("file::memory:"):
+        return False
+    return parsed.query.get("mode") != "memory"
+
+
+def run_bot_backtest_job(
+    request: BotBacktestReplayRequest,
+    *,
+    progress_callback: BacktestProgressCallback,
+    cancellation_callback: BacktestCancellationCallback,
+) -> dict[str, Any]:
+    """Replay one backtest in a worker process; return the row's column values.
+
+    Nothing is committed here: the parent persists the row with
+    ``add_replayed_bot_backtest`` only once it knows the run was not
+    superseded, since it cannot roll back another process's commit.
+    """
+
+    with SessionLocal() as db:
+        try:
+            row = create_bot_backtest(
+                db,
+                user_id=request.user_id,
+                bot_config_id=request.bot_config_id,
+                payload=request.payload,
+                progress_callback=progress_callback,
+                cancellation_callback=cancellation_callback,
+            )
+            # The replay's checks are rate-limited; read the pipe itself
+            # before returning so a cancel already sent is not missed.
+            _raise_if_backtest_cancelled(
+                getattr(cancellation_callback, "check_now", cancellation_callback)
+            )
+            return {
+                column.key: getattr(row, column.key)
+                for column in BotBacktest.__table__.columns
+                if column.key not in _SERVER_ASSIGNED_BACKTEST_COLUMNS
+            }
+        finally:
+            db.rollback()
+
+
+def add_replayed_bot_backtest(db: Session, values: dict[str, Any]) -> BotBacktest:
+    """Add a worker's replayed row to ``db``; the caller commits it."""
+
+    row = BotBacktest(**values)
+    db.add(row)
+    db.flush()
+    return row
+
+
+class _BacktestWorker:
+    def __init__(self, context: multiprocessing.context.BaseContext):
+        self.connection, child_connection = context.Pipe(duplex=True)
+        self.process = context.Process(
+            target=_backtest_worker_main,
+            args=(child_connection,),
+            name="topsignal-backtest-worker",
+            daemon=True,
+        )
+        self.process.start()
+        child_connection.close()
+
+    def stop(self) -> None:
+        try:
+            self.connection.send(("stop",))
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout=1.0)
+        self.kill()
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(timeout=1.0)
+        self.connection.close()
+
+
+class BacktestProcessPool:
+    """A bounded set of warm replay processes, started lazily up to ``size``."""
+
+    def __init__(self, size: int):
+        if size <= 0:
+            raise ValueError("backtest process pool size must be positive")
+        self.size = int(size)
+        self._context = multiprocessing.get_context("spawn")
+        self._condition = threading.Condition()
+        self._idle: list[_BacktestWorker] = []
+        self._worker_count = 0
+        self._closed = False
+        self._job_ids = itertools.count(1)
+
+    def start(self) -> None:
+        """Start every worker now so the first replays skip process start-up."""
+
+        with self._condition:
+            while not self._closed and self._worker_count < self.size:
+                self._idle.append(_BacktestWorker(self._context))
+                self._worker_count += 1
+
+    def shutdown(self) -> None:
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._worker_count -= len(idle)
+            self._condition.notify_all()
+        for worker in idle:
+            worker.stop()
+
+    def run(
+        self,
+        function: BacktestWorkerJob,
+        argument: Any,
+        *,
+        progress_callback: BacktestProgressCallback | None = None,
+        cancellation_callback: BacktestCancellationCallback | None = None,
+    ) -> Any:
+        """Run ``function(argument, progress_callback=..., cancellation_callback=...)``.
+
+        ``function`` must be importable by the spawned worker.  Its return value
+        or exception is re-raised here.  A job that ignores cancellation for
+        longer than the grace period is stopped by terminating its worker.
+        """
+
+        worker = self._checkout(cancellation_callback)
+        job_id = next(self._job_ids)
+        reusable = False
+        cancel_sent_at: float | None = None
+        try:
+            worker.connection.send(("run", job_id, function, argument))
+            while True:
+                if worker.connection.poll(_POLL_SECONDS):
+                    kind, value = worker.connection.recv()
+                    if kind == "progress":
+                        if progress_callback is not None:
+                            progress_callback(value)
+                        continue
+                    reusable = True
+                    if kind == "error":
+                        raise value
+                    return value
+                if not worker.process.is_alive():
+                    raise BacktestWorkerCrashedError("backtest_worker_exited")
+                if cancel_sent_at is None:
+                    if cancellation_callback is not None and cancellation_callback():
+                        worker.connection.send(("cancel", job_id))
+                        cancel_sent_at = time.monotonic()
+                elif time.monotonic() - cancel_sent_at > BACKTEST_WORKER_CANCEL_GRACE_SECONDS:
+                    raise BacktestSupersededError("backtest_superseded_by_newer_run")
+        except (EOFError, OSError) as exc:
+            raise BacktestWorkerCrashedError("backtest_worker_exited") from exc
+        finally:
+            self._checkin(worker, reusable=reusable)
+
+    def _checkout(
+        self,
+        cancellation_callback: BacktestCancellationCallback | None,
+    ) -> _BacktestWorker:
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("backtest_process_pool_closed")
+                if self._idle:
+                    return self._idle.pop()
+                if self._worker_count < self.size:
+                    self._worker_count += 1
+                    break
+                # Capacity leases can be released by a superseding run before
+                # the superseded replay notices; wait for its worker to free up.
+                self._condition.wait(_POLL_SECONDS)
+                _raise_if_backtest_cancelled(cancellation_callback)
+        try:
+            return _BacktestWorker(self._context)
+        except Exception:
+            with self._condition:
+                self._worker_count -= 1
+                self._condition.notify()
+            raise
+
+    def _checkin(self, worker: _BacktestWorker, *, reusable: bool) -> None:
+        with self._condition:
+            if reusable and not self._closed and worker.process.is_alive():
+                self._idle.append(worker)
+                self._condition.notify()
+                return
+            self._worker_count -= 1
+            self._condition.notify()
+        worker.kill()
+
+
+def _backtest_worker_main(connection: Connection) -> None:
+    # The API process owns shutdown; a terminal Ctrl-C must not interrupt a
+    # replay mid-commit in every worker at once.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    try:
+        get_default_databento_cache()
+    except Exception as exc:
+        logger.warning(
+            "backtest_worker_replay_store_unavailable",
+            extra={"error_type": type(exc).__name__},
+        )
+    while True:
+        try:
+            message = connection.recv()
+        except (EOFError, OSError):
+            return
+        if message[0] == "stop":
+            return
+        if message[0] != "run":
+            # A cancel that arrived after its job had already finished.
+            continue
+        _kind, job_id, function, argument = message
+        _run_worker_job(connection, job_id, function, argument)
+
+
+def _run_worker_job(
+    connection: Connection,
+    job_id: int,
+    function: BacktestWorkerJob,
+    argument: Any,
+) -> None:
+    is_cancelled = _WorkerCancellation(connection, job_id)
+
+    def report_progress(progress: dict[str, Any]) -> None:
+        connection.send(("progress", progress))
+
+    try:
+        value = function(
+            argument,
+            progress_callback=report_progress,
+            cancellation_callback=is_cancelled,
+        )
+    except Exception as exc:
+        connection.send(("error", _picklable_exception(exc)))
+    else:
+        connection.send(("result", value))
+
+
+class _WorkerCancellation:
+    """Cancellation callback fed by ``cancel`` messages on the worker pipe.
+
+    Calls read the pipe at most every ``_WORKER_CANCEL_CHECK_SECONDS``;
+    ``check_now`` always reads it.
+    """
+
+    def __init__(self, connection: Connection, job_id: int) -> None:
+        self._connection = connection
+        self._job_id = job_id
+        self._cancelled = False
+        self._next_check = 0.0
+
+    def __call__(self) -> bool:
+        if self._cancelled:
+            return True
+        if time.monotonic() < self._next_check:
+            return False
+        return self.check_now()
+
+    def check_now(self) -> bool:
+        self._next_check = time.monotonic() + _WORKER_CANCEL_CHECK_SECONDS
+        while self._connection.poll():
+            message = self._connection.recv()
+            if message[0] == "cancel" and message[1] == self._job_id:
+                self._cancelled = True
+        return self._cancelled
+
+
+def _picklable_exception(exc: Exception) -> Exception:
+    try:
+        pickle.loads(pickle.dumps(exc))
+    except Exception:
+        return RuntimeError(type(exc).__name__)
+    return exc
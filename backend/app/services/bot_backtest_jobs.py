@@ -0,0 +1,393 @@
+"""Durable queue for backtests submitted without holding a connection open.
+
+A job row records what was requested (``kind`` plus the validated request
+body), where it is in its lifecycle, the last progress event reported by the
+replay, and which ``bot_backtests`` / ``bot_backtest_sweeps`` row it produced.
+Schedulers claim queued rows with a compare-and-set update so several API
+replicas can drain one table, and a running row whose heartbeat stops is
+re-queued: replays are deterministic, so a restarted attempt reproduces the
+result the interrupted one would have persisted.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections.abc import Callable, Iterable
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from sqlalchemy import Update, update
+from sqlalchemy.orm import Session
+
+from ..models import BotBacktestJob
+from .bot_service import get_bot_config
+
+
+BACKTEST_JOB_KINDS = frozenset({"backtest", "sweep", "walk_forward"})
+BACKTEST_JOB_TERMINAL_STATUSES = frozenset({"succeeded", "failed", "cancelled"})
+BACKTEST_JOB_MAX_ATTEMPTS = 3
+_DEFAULT_BACKTEST_JOB_CHECKPOINT_SECONDS = 1.0
+try:
+    BACKTEST_JOB_CHECKPOINT_SECONDS = float(
+        os.getenv(
+            "TOPSIGNAL_BACKTEST_JOB_CHECKPOINT_SECONDS",
+            str(_DEFAULT_BACKTEST_JOB_CHECKPOINT_SECONDS),
+        )
+    )
+except ValueError:
+    BACKTEST_JOB_CHECKPOINT_SECONDS = _DEFAULT_BACKTEST_JOB_CHECKPOINT_SECONDS
+_DEFAULT_BACKTEST_JOB_STALE_SECONDS = 120
+try:
+    BACKTEST_JOB_STALE_SECONDS = int(
+        os.getenv("TOPSIGNAL_BACKTEST_JOB_STALE_SECONDS", str(_DEFAULT_BACKTEST_JOB_STALE_SECONDS))
+    )
+except ValueError:
+    BACKTEST_JOB_STALE_SECONDS = _DEFAULT_BACKTEST_JOB_STALE_SECONDS
+
+
+def submit_bot_backtest_job(
+    db: Session,
+    *,
+    user_id: str,
+    bot_config_id: int,
+    kind: str,
+    request_payload: dict[str, Any],
+) -> BotBacktestJob:
+    if kind not in BACKTEST_JOB_KINDS:
+        raise ValueError(f"unsupported_backtest_job_kind:{kind}")
+    if get_bot_config(db, user_id=user_id, bot_config_id=bot_config_id) is None:
+        raise LookupError("bot_config_not_found")
+    row = BotBacktestJob(
+        user_id=user_id,
+        bot_config_id=bot_config_id,
+        kind=kind,
+        status="queued",
+        request_payload=request_payload,
+        attempt_count=0,
+    )
+    db.add(row)
+    db.flush()
+    return row
+
+
+def get_bot_backtest_job(
+    db: Session,
+    *,
+    user_id: str,
+    bot_config_id: int,
+    job_id: int,
+) -> BotBacktestJob | None:
+    return (
+        db.query(BotBacktestJob)
+        .filter(BotBacktestJob.user_id == user_id)
+        .filter(BotBacktestJob.bot_config_id == bot_config_id)
+        .filter(BotBacktestJob.id == job_id)
+        .one_or_none()
+    )
+
+
+def request_bot_backtest_job_cancellation(
+    db: Session,
+    row: BotBacktestJob,
+    *,
+    now: datetime | None = None,
+) -> BotBacktestJob:
+    """Cancel a queued job at once; ask a running job's scheduler to stop it."""
+
+    current = _utc(now)
+    if row.status == "queued":
+        # Compare-and-set, like ``claim_bot_backtest_job``: a scheduler may
+        # have claimed the row since it was loaded.
+        result = db.execute(
+            update(BotBacktestJob)
+            .where(BotBacktestJob.id == row.id)
+            .where(BotBacktestJob.status == "queued")
+            .values(status="cancelled", finished_at=current)
+            .execution_options(synchronize_session=False)
+        )
+        db.refresh(row)
+        if result.rowcount == 1:
+            return row
+    if row.status == "running" and row.cancel_requested_at is None:
+        row.cancel_requested_at = current
+    db.flush()
+    return row
+
+
+def next_queued_bot_backtest_job(
+    db: Session,
+    *,
+    skip_user_ids: Iterable[str] = (),
+) -> BotBacktestJob | None:
+    query = db.query(BotBacktestJob).filter(BotBacktestJob.status == "queued")
+    skipped = list(skip_user_ids)
+    if skipped:
+        query = query.filter(BotBacktestJob.user_id.notin_(skipped))
+    return query.order_by(BotBacktestJob.created_at, BotBacktestJob.id).first()
+
+
+def claim_bot_backtest_job(db: Session, job_id: int, *, now: datetime | None = None) -> bool:
+    """Move one queued job to ``running``; ``False`` if another scheduler won."""
+
+    current = _utc(now)
+    result = db.execute(
+        update(BotBacktestJob)
+        .where(BotBacktestJob.id == job_id)
+        .where(BotBacktestJob.status == "queued")
+        .values(
+            status="running",
+            started_at=current,
+            heartbeat_at=current,
+            attempt_count=BotBacktestJob.attempt_count + 1,
+            progress=None,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount == 1
+
+
+def heartbeat_bot_backtest_jobs(
+    db: Session,
+    job_ids: Iterable[int],
+    *,
+    now: datetime | None = None,
+) -> set[int]:
+    """Refresh running jobs' heartbeats and return those asked to cancel."""
+
+    ids = list(job_ids)
+    if not ids:
+        return set()
+    db.execute(
+        update(BotBacktestJob)
+        .where(BotBacktestJob.id.in_(ids))
+        .where(BotBacktestJob.status == "running")
+        .values(heartbeat_at=_utc(now))
+        .execution_options(synchronize_session=False)
+    )
+    cancelled = {
+        int(job_id)
+        for (job_id,) in db.query(BotBacktestJob.id)
+        .filter(BotBacktestJob.id.in_(ids))
+        .filter(BotBacktestJob.cancel_requested_at.is_not(None))
+    }
+    db.commit()
+    return cancelled
+
+
+def requeue_stale_bot_backtest_jobs(
+    db: Session,
+    *,
+    now: datetime | None = None,
+    stale_after_seconds: int | None = None,
+) -> int:
+    """Re-queue running jobs whose scheduler stopped heartbeating.
+
+    A job that was already interrupted ``BACKTEST_JOB_MAX_ATTEMPTS`` times, or
+    whose cancellation was requested, is finished instead of retried.
+    """
+
+    current = _utc(now)
+    stale_after = BACKTEST_JOB_STALE_SECONDS if stale_after_seconds is None else stale_after_seconds
+    cutoff = current - timedelta(seconds=max(1, int(stale_after)))
+    rows = (
+        db.query(BotBacktestJob)
+        .filter(BotBacktestJob.status == "running")
+        .filter(BotBacktestJob.heartbeat_at < cutoff)
+        .all()
+    )
+    for row in rows:
+        if row.cancel_requested_at is not None:
+            row.status = "cancelled"
+            row.finished_at = current
+        elif int(row.attempt_count) >= BACKTEST_JOB_MAX_ATTEMPTS:
+            row.status = "failed"
+            row.error_status = 500
+            row.error_detail = "backtest_job_interrupted"
+            row.finished_at = current
+        else:
+            row.status = "queued"
+            row.started_at = None
+            row.heartbeat_at = None
+    db.commit()
+    return len(rows)
+
+
+def complete_bot_backtest_job(
+    db: Session,
+    job_id: int,
+    *,
+    attempt_count: int,
+    bot_backtest_id: int | None = None,
+    bot_backtest_sweep_id: int | None = None,
+    now: datetime | None = None,
+) -> bool:
+    """Mark one attempt's job succeeded without committing.
+
+    The caller commits this together with the row the attempt produced.
+    ``False`` means the attempt no longer owns the job (it was re-queued as
+    stale, cancelled, or finished by a later attempt) and its row must be
+    rolled back, so each job links to at most one result row.
+    """
+
+    result = db.execute(
+        update(BotBacktestJob)
+        .where(BotBacktestJob.id == job_id)
+        .where(BotBacktestJob.status == "running")
+        .where(BotBacktestJob.attempt_count == attempt_count)
+        .values(
+            status="succeeded",
+            bot_backtest_id=bot_backtest_id,
+            bot_backtest_sweep_id=bot_backtest_sweep_id,
+            finished_at=_utc(now),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount == 1
+
+
+def finish_bot_backtest_job(
+    db: Session,
+    job_id: int,
+    *,
+    status: str,
+    attempt_count: int | None = None,
+    bot_backtest_id: int | None = None,
+    bot_backtest_sweep_id: int | None = None,
+    error_status: int | None = None,
+    error_detail: str | None = None,
+    now: datetime | None = None,
+) -> None:
+    if status not in BACKTEST_JOB_TERMINAL_STATUSES:
+        raise ValueError(f"unsupported_backtest_job_terminal_status:{status}")
+    db.execute(
+        _owned_running_job(job_id, attempt_count)
+        .values(
+            status=status,
+            bot_backtest_id=bot_backtest_id,
+            bot_backtest_sweep_id=bot_backtest_sweep_id,
+            error_status=error_status,
+            error_detail=error_detail,
+            finished_at=_utc(now),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+
+
+def release_bot_backtest_job(db: Session, job_id: int, *, attempt_count: int | None = None) -> None:
+    """Return a running job to the queue when its scheduler shuts down cleanly.
+
+    The interrupted attempt is not counted against ``BACKTEST_JOB_MAX_ATTEMPTS``.
+    """
+
+    db.execute(
+        _owned_running_job(job_id, attempt_count)
+        .values(
+            status="queued",
+            started_at=None,
+            heartbeat_at=None,
+            attempt_count=BotBacktestJob.attempt_count - 1,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+
+
+def _owned_running_job(job_id: int, attempt_count: int | None) -> Update:
+    # With ``attempt_count``, an attempt that lost its job to a stale requeue
+    # cannot overwrite the outcome of the attempt that replaced it.
+    statement = (
+        update(BotBacktestJob)
+        .where(BotBacktestJob.id == job_id)
+        .where(BotBacktestJob.status == "running")
+    )
+    if attempt_count is not None:
+        statement = statement.where(BotBacktestJob.attempt_count == attempt_count)
+    return statement
+
+
+class BotBacktestJobCheckpointer:
+    """Progress callback that persists throttled checkpoints to a job row.
+
+    Replay progress arrives many times a second; the latest event is written
+    at most once per ``interval_seconds`` and whenever the phase changes, in a
+    short session of its own so the replay's transaction is never committed
+    early.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        job_id: int,
+        *,
+        interval_seconds: float | None = None,
+    ):
+        self._session_factory = session_factory
+        self.job_id = int(job_id)
+        self._interval = (
+            BACKTEST_JOB_CHECKPOINT_SECONDS if interval_seconds is None else float(interval_seconds)
+        )
+        self._lock = threading.Lock()
+        self._last_written_at: float | None = None
+        self._last_phase: object = None
+
+    def __call__(self, progress: dict[str, Any]) -> None:
+        phase = progress.get("phase")
+        now = time.monotonic()
+        with self._lock:
+            due = (
+                self._last_written_at is None
+                or phase != self._last_phase
+                or now - self._last_written_at >= self._interval
+            )
+            if not due:
+                return
+            self._last_written_at = now
+            self._last_phase = phase
+        self.write(progress)
+
+    def write(self, progress: dict[str, Any]) -> None:
+        with self._session_factory() as db:
+            db.execute(
+                update(BotBacktestJob)
+                .where(BotBacktestJob.id == self.job_id)
+                .where(BotBacktestJob.status == "running")
+                .values(progress=dict(progress), heartbeat_at=_utc(None))
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+
+
+def serialize_bot_backtest_job(row: BotBacktestJob) -> dict[str, Any]:
+    return {
+        "id": int(row.id),
+        "bot_config_id": int(row.bot_config_id),
+        "kind": row.kind,
+        "status": row.status,
+        "progress": row.progress,
+        "attempt_count": int(row.attempt_count or 0),
+        "cancel_requested": row.cancel_requested_at is not None,
+        "error": (
+            {"status": int(row.error_status or 500), "detail": row.error_detail}
+            if row.status == "failed"
+            else None
+        ),
+        "bot_backtest_id": int(row.bot_backtest_id) if row.bot_backtest_id is not None else None,
+        "bot_backtest_sweep_id": (
+            int(row.bot_backtest_sweep_id) if row.bot_backtest_sweep_id is not None else None
+        ),
+        "created_at": _utc(row.created_at).isoformat(),
+        "started_at": _utc(row.started_at).isoformat() if row.started_at is not None else None,
+        "finished_at": _utc(row.finished_at).isoformat() if row.finished_at is not None else None,
+    }
+
+
+def _utc(value: datetime | None) -> datetime:
+    if value is None:
+        return datetime.now(timezone.utc)
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
@@ -0,0 +1,693 @@
+"""Parameter sweeps over one bot config's Databento replay window.
+
+Each combination is an ordinary closed-bar replay of a non-persistent config
+view, so a sweep row reproduces exactly what ``POST /backtests`` would report
+for the same parameters.  With the local cache, combinations fan out to the
+warm backtest process pool, whose workers open the same partitioned memory
+maps read-only: every worker shares the OS page cache instead of copying
+candles, and only a compact per-combination summary crosses the process
+boundary.  The ranked
+summary is persisted instead of one full result snapshot per combination.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from itertools import product
+from types import SimpleNamespace
+from typing import Any, Callable
+
+from sqlalchemy.orm import Session
+
+from ..models import BotBacktestSweep, BotConfig
+from . import bot_service as bot_service_module
+from .bot_backtest_executor import BacktestProcessPool
+from .bot_backtesting import (
+    BACKTEST_ENGINE_VERSION,
+    BacktestCancellationCallback,
+    BacktestConfigurationError,
+    BacktestError,
+    BacktestProgressCallback,
+    BacktestSupersededError,
+    InsufficientBacktestDataError,
+    _as_utc,
+    _config_for_backtest_request,
+    _config_snapshot,
+    _load_databento_replay_inputs,
+    _notify_backtest_progress,
+    _raise_if_backtest_cancelled,
+    _replay_databento_inputs,
+    _require_supported_strategy,
+    _resolve_databento_history_source,
+    _validate_replay_configuration,
+)
+from .databento_cache import DatabentoReplayStore
+from .instruments import load_instrument_specs, normalize_symbol_key
+
+
+_DEFAULT_BACKTEST_SWEEP_MAX_COMBINATIONS = 256
+try:
+    BACKTEST_SWEEP_MAX_COMBINATIONS = int(
+        os.getenv(
+            "TOPSIGNAL_BACKTEST_SWEEP_MAX_COMBINATIONS",
+            str(_DEFAULT_BACKTEST_SWEEP_MAX_COMBINATIONS),
+        )
+    )
+except ValueError:
+    BACKTEST_SWEEP_MAX_COMBINATIONS = _DEFAULT_BACKTEST_SWEEP_MAX_COMBINATIONS
+# Each worker enforces the per-replay memory budget on its own, so the worker
+# count also bounds the sweep's total resident replay memory.
+_DEFAULT_BACKTEST_SWEEP_MAX_WORKERS = max(1, os.cpu_count() or 1)
+try:
+    BACKTEST_SWEEP_MAX_WORKERS = int(
+        os.getenv(
+            "TOPSIGNAL_BACKTEST_SWEEP_MAX_WORKERS",
+            str(_DEFAULT_BACKTEST_SWEEP_MAX_WORKERS),
+        )
+    )
+except ValueError:
+    BACKTEST_SWEEP_MAX_WORKERS = _DEFAULT_BACKTEST_SWEEP_MAX_WORKERS
+_CANCELLATION_POLL_SECONDS = 0.25
+_DESCENDING_RANK_METRICS = frozenset(
+    {"net_pnl", "profit_factor", "expectancy", "win_rate"}
+)
+_ASCENDING_RANK_METRICS = frozenset({"max_drawdown_dollars", "max_drawdown_percent"})
+_SUMMARY_METRIC_KEYS = (
+    "trade_count",
+    "win_rate",
+    "gross_pnl",
+    "net_pnl",
+    "total_commission",
+    "profit_factor",
+    "expectancy",
+    "max_drawdown_dollars",
+    "max_drawdown_percent",
+    "exposure_percent",
+)
+# Worker processes keep one read-only store per cache root for their lifetime.
+_WORKER_REPLAY_STORES: dict[str, DatabentoReplayStore] = {}
+
+BacktestSweepCombinationCallback = Callable[[dict[str, Any]], None]
+# Given the worker count a sweep wants, reserve backtest capacity for as many
+# of them as possible and return the granted count.
+BacktestWorkerCapacityCallback = Callable[[int], int]
+
+
+@dataclass(frozen=True)
+class _SweepReplayPlan:
+    """Picklable replay request shared by every combination of one sweep.
+
+    It doubles as the ``payload`` read by the Databento replay helpers.
+    """
+
+    user_id: str
+    root_symbol: str
+    history_bounds: tuple[datetime, datetime]
+    cache_root: str | None
+    now: datetime
+    start: datetime | None
+    end: datetime | None
+    starting_balance: float
+    commission_per_contract: float
+    slippage_ticks: float
+    force_close_at_end: bool
+    tick_size: float
+    tick_value: float
+
+
+@dataclass(frozen=True)
+class _SweepCombination:
+    index: int
+    fast_period: int
+    slow_period: int
+    strategy_params: dict[str, Any]
+    config_values: dict[str, Any] = field(repr=False)
+
+
+@dataclass(frozen=True)
+class _SweepTask:
+    plan: _SweepReplayPlan
+    combination: _SweepCombination
+    # Walk-forward out-of-sample replays need trades and equity for stitching;
+    # sweep combinations return only their compact summary.
+    keep_result: bool = False
+
+
+@dataclass(frozen=True)
+class _SweepOutcome:
+    summary: dict[str, Any]
+    range: dict[str, Any] | None = None
+    assumptions: dict[str, Any] | None = None
+    error: BacktestError | None = None
+    result: dict[str, Any] | None = None
+
+
+def create_bot_backtest_sweep(
+    db: Session,
+    *,
+    user_id: str,
+    bot_config_id: int,
+    payload: Any,
+    now: datetime | None = None,
+    max_workers: int | None = None,
+    progress_callback: BacktestProgressCallback | None = None,
+    combination_callback: BacktestSweepCombinationCallback | None = None,
+    cancellation_callback: BacktestCancellationCallback | None = None,
+    worker_capacity: BacktestWorkerCapacityCallback | None = None,
+    process_pool: BacktestProcessPool | None = None,
+) -> BotBacktestSweep:
+    """Replay every grid combination and persist one compact ranked summary."""
+
+    prepared = _prepare_sweep(
+        db,
+        user_id=user_id,
+        bot_config_id=bot_config_id,
+        payload=payload,
+        now=now,
+        progress_callback=progress_callback,
+        cancellation_callback=cancellation_callback,
+    )
+    config = prepared.config
+    base_config = prepared.base_config
+    combinations = prepared.combinations
+    plan = prepared.plan
+    replay_store = prepared.replay_store
+    outcomes = _run_sweep_tasks(
+        db,
+        tasks=[_SweepTask(plan, combination) for combination in combinations],
+        replay_store=replay_store,
+        max_workers=_sweep_worker_count(max_workers, len(combinations), worker_capacity),
+        progress_callback=progress_callback,
+        combination_callback=combination_callback,
+        cancellation_callback=cancellation_callback,
+        process_pool=process_pool,
+    )
+    successes = [outcome for outcome in outcomes if outcome.error is None]
+    if not successes:
+        # Every combination shares the window, so a common data error (for
+        # example insufficient history) surfaces exactly as a single run would.
+        raise outcomes[0].error  # type: ignore[misc]
+    rank_by = str(getattr(payload, "rank_by", "net_pnl") or "net_pnl")
+    ranked = _rank_sweep_summaries([outcome.summary for outcome in outcomes], rank_by)
+    first = successes[0]
+    assert first.range is not None and first.assumptions is not None
+    _notify_backtest_progress(
+        progress_callback,
+        phase="finalizing",
+        completed=len(outcomes),
+        total=len(outcomes),
+        percent=100,
+        remaining_percent=0,
+    )
+    _raise_if_backtest_cancelled(cancellation_callback)
+    requested_start = _as_utc(plan.start) if plan.start is not None else _as_utc(
+        datetime.fromisoformat(str(first.range["start"]))
+    )
+    requested_end = _as_utc(plan.end) if plan.end is not None else _as_utc(
+        datetime.fromisoformat(str(first.range["end"]))
+    )
+    row = BotBacktestSweep(
+        user_id=user_id,
+        bot_config_id=int(config.id),
+        account_id=int(base_config.account_id),
+        engine_version=BACKTEST_ENGINE_VERSION,
+        strategy_type=str(base_config.strategy_type),
+        contract_id=str(base_config.contract_id),
+        symbol=base_config.symbol,
+        timeframe_unit=str(base_config.timeframe_unit),
+        timeframe_unit_number=int(base_config.timeframe_unit_number),
+        requested_start=requested_start,
+        requested_end=requested_end,
+        actual_start=_as_utc(datetime.fromisoformat(str(first.range["start"]))),
+        actual_end=_as_utc(datetime.fromisoformat(str(first.range["end"]))),
+        starting_balance=plan.starting_balance,
+        commission_per_contract=plan.commission_per_contract,
+        slippage_ticks=plan.slippage_ticks,
+        tick_size=plan.tick_size,
+        tick_value=plan.tick_value,
+        bar_count=int(first.range["bar_count"]),
+        rank_by=rank_by,
+        combination_count=len(outcomes),
+        failed_count=len(outcomes) - len(successes),
+        config_snapshot=_config_snapshot(base_config),
+        assumptions_snapshot=first.assumptions,
+        ranked_results=ranked,
+    )
+    db.add(row)
+    db.flush()
+    return row
+
+
+@dataclass(frozen=True)
+class _PreparedSweep:
+    config: BotConfig
+    base_config: Any
+    combinations: list[_SweepCombination]
+    plan: _SweepReplayPlan
+    replay_store: DatabentoReplayStore | None
+
+
+def _prepare_sweep(
+    db: Session,
+    *,
+    user_id: str,
+    bot_config_id: int,
+    payload: Any,
+    now: datetime | None,
+    progress_callback: BacktestProgressCallback | None,
+    cancellation_callback: BacktestCancellationCallback | None,
+) -> _PreparedSweep:
+    """Load the owned config, expand its grid, and locate Databento history."""
+
+    config = (
+        db.query(BotConfig)
+        .filter(BotConfig.user_id == user_id)
+        .filter(BotConfig.id == bot_config_id)
+        .one_or_none()
+    )
+    if config is None:
+        raise LookupError("bot_config_not_found")
+    base_config = _config_for_backtest_request(config, payload)
+    _raise_if_backtest_cancelled(cancellation_callback)
+    _notify_backtest_progress(
+        progress_callback,
+        phase="preparing",
+        completed=None,
+        total=None,
+        percent=None,
+        remaining_percent=None,
+    )
+    combinations = _expand_sweep_grid(base_config, payload)
+    root = normalize_symbol_key(base_config.symbol) or normalize_symbol_key(
+        base_config.contract_id
+    )
+    bounds, replay_store = _resolve_databento_history_source(db, root_symbol=root)
+    if bounds is None:
+        # Sweeps never fall back to the legacy ProjectX fixture engine.
+        raise InsufficientBacktestDataError(
+            f"databento_history_missing:{root or base_config.contract_id}: import historical data before backtesting"
+        )
+    instrument_spec = load_instrument_specs(db).get(str(root))
+    if instrument_spec is None:
+        raise BacktestConfigurationError(f"instrument_metadata_missing:{root}")
+
+    plan = _SweepReplayPlan(
+        user_id=user_id,
+        root_symbol=str(root),
+        history_bounds=(_as_utc(bounds[0]), _as_utc(bounds[1])),
+        cache_root=str(replay_store.cache_root) if replay_store is not None else None,
+        now=_as_utc(now or datetime.now(timezone.utc)),
+        start=getattr(payload, "start", None),
+        end=getattr(payload, "end", None),
+        starting_balance=float(payload.starting_balance),
+        commission_per_contract=float(payload.commission_per_contract),
+        slippage_ticks=float(payload.slippage_ticks),
+        force_close_at_end=bool(payload.force_close_at_end),
+        tick_size=float(instrument_spec.tick_size),
+        tick_value=float(instrument_spec.tick_value),
+    )
+    return _PreparedSweep(
+        config=config,
+        base_config=base_config,
+        combinations=combinations,
+        plan=plan,
+        replay_store=replay_store,
+    )
+
+
+def get_bot_backtest_sweep(
+    db: Session,
+    *,
+    user_id: str,
+    bot_config_id: int,
+    sweep_id: int,
+) -> BotBacktestSweep | None:
+    return (
+        db.query(BotBacktestSweep)
+        .filter(BotBacktestSweep.user_id == user_id)
+        .filter(BotBacktestSweep.bot_config_id == bot_config_id)
+        .filter(BotBacktestSweep.id == sweep_id)
+        .one_or_none()
+    )
+
+
+def serialize_bot_backtest_sweep(row: BotBacktestSweep) -> dict[str, Any]:
+    return {
+        "id": int(row.id),
+        "bot_config_id": int(row.bot_config_id) if row.bot_config_id is not None else None,
+        "engine_version": row.engine_version,
+        "created_at": _as_utc(row.created_at).isoformat(),
+        "range": {
+            "contract_id": row.contract_id,
+            "symbol": row.symbol,
+            "timeframe_unit": row.timeframe_unit,
+            "timeframe_unit_number": int(row.timeframe_unit_number),
+            "start": _as_utc(row.actual_start).isoformat(),
+            "end": _as_utc(row.actual_end).isoformat(),
+            "bar_count": int(row.bar_count),
+        },
+        "rank_by": row.rank_by,
+        "combination_count": int(row.combination_count),
+        "failed_count": int(row.failed_count),
+        "config_snapshot": dict(row.config_snapshot or {}),
+        "assumptions": dict(row.assumptions_snapshot or {}),
+        "results": list(row.ranked_results or []),
+    }
+
+
+def _expand_sweep_grid(base_config: Any, payload: Any) -> list[_SweepCombination]:
+    """Cartesian product of the requested axes, normalized and de-duplicated.
+
+    Period pairs the strategy rejects (``slow <= fast``) are skipped because a
+    product of two period lists naturally contains them; every other invalid
+    combination fails the whole sweep before any replay starts.
+    """
+
+    strategy_type = str(base_config.strategy_type)
+    _require_supported_strategy(strategy_type)
+    fast_periods = list(getattr(payload, "fast_periods", None) or [int(base_config.fast_period)])
+    slow_periods = list(getattr(payload, "slow_periods", None) or [int(base_config.slow_period)])
+    param_grid = dict(getattr(payload, "strategy_param_grid", None) or {})
+    defaults = bot_service_module._normalize_strategy_params(strategy_type, {})
+    unknown = sorted(name for name in param_grid if name not in defaults)
+    if unknown:
+        raise BacktestConfigurationError(
+            f"unknown_backtest_sweep_strategy_params:{strategy_type}:{','.join(unknown)}"
+        )
+    param_names = sorted(param_grid)
+    requested_count = (
+        len(fast_periods)
+        * len(slow_periods)
+        * math.prod(len(param_grid[name]) for name in param_names)
+    )
+    if requested_count > BACKTEST_SWEEP_MAX_COMBINATIONS:
+        raise BacktestConfigurationError(
+            "backtest_sweep_too_many_combinations: "
+            f"{requested_count} requested, at most {BACKTEST_SWEEP_MAX_COMBINATIONS} allowed"
+        )
+
+    base_values = {
+        column.key: getattr(base_config, column.key)
+        for column in BotConfig.__table__.columns
+    }
+    combinations: list[_SweepCombination] = []
+    seen: set[tuple[int, int, str]] = set()
+    for raw_fast, raw_slow, *param_values in product(
+        fast_periods,
+        slow_periods,
+        *(param_grid[name] for name in param_names),
+    ):
+        fast_period, slow_period = bot_service_module._normalized_strategy_period_values(
+            strategy_type,
+            fast_period=int(raw_fast),
+            slow_period=int(raw_slow),
+        )
+        if slow_period <= fast_period:
+            continue
+        raw_params = dict(base_config.strategy_params or {})
+        raw_params.update(zip(param_names, param_values))
+        strategy_params = bot_service_module._normalize_strategy_params(
+            strategy_type,
+            raw_params,
+        )
+        identity = (
+            fast_period,
+            slow_period,
+            json.dumps(strategy_params, sort_keys=True, default=str),
+        )
+        if identity in seen:
+            continue
+        seen.add(identity)
+        config_values = dict(base_values)
+        config_values.update(
+            strategy_params=strategy_params,
+            fast_period=fast_period,
+            slow_period=slow_period,
+        )
+        _validate_replay_configuration(SimpleNamespace(**config_values))
+        combinations.append(
+            _SweepCombination(
+                index=len(combinations),
+                fast_period=fast_period,
+                slow_period=slow_period,
+                strategy_params=strategy_params,
+                config_values=config_values,
+            )
+        )
+    if not combinations:
+        raise BacktestConfigurationError(
+            "invalid_backtest_strategy_configuration: no sweep combination has slow_period greater than fast_period"
+        )
+    return combinations
+
+
+def _sweep_worker_count(
+    max_workers: int | None,
+    task_count: int,
+    worker_capacity: BacktestWorkerCapacityCallback | None = None,
+) -> int:
+    requested = BACKTEST_SWEEP_MAX_WORKERS if max_workers is None else int(max_workers)
+    requested = max(1, min(requested, task_count))
+    if worker_capacity is None:
+        return requested
+    # Every spawned worker is a full replay, so it counts against the same
+    # backtest capacity as a single run instead of hiding behind one lease.
+    return max(1, min(requested, int(worker_capacity(requested))))
+
+
+def _open_sweep_pool(worker_count: int) -> BacktestProcessPool:
+    # Used only when the caller has no warm pool to lend; each worker maps the
+    # cache read-only on first use.
+    return BacktestProcessPool(worker_count)
+
+
+def _run_sweep_tasks(
+    db: Session,
+    *,
+    tasks: list[_SweepTask],
+    replay_store: DatabentoReplayStore | None,
+    max_workers: int,
+    progress_callback: BacktestProgressCallback | None,
+    combination_callback: BacktestSweepCombinationCallback | None,
+    cancellation_callback: BacktestCancellationCallback | None,
+    process_pool: BacktestProcessPool | None = None,
+    phase: str = "sweeping",
+) -> list[_SweepOutcome]:
+    """Replay ``tasks`` and return their outcomes in task order.
+
+    A caller-supplied ``process_pool`` is borrowed and left running; otherwise
+    a pool is started for this call when more than one worker can be used.
+    Either way every replay has stopped by the time this returns or raises, so
+    the caller's capacity slots never outlive the processes they account for.
+    """
+
+    total = len(tasks)
+    outcomes: dict[int, _SweepOutcome] = {}
+
+    def record(position: int, outcome: _SweepOutcome) -> None:
+        outcomes[position] = outcome
+        _notify_backtest_callback(combination_callback, outcome.summary)
+        completed = len(outcomes)
+        percent = int(completed * 100 / total)
+        _notify_backtest_progress(
+            progress_callback,
+            phase=phase,
+            completed=completed,
+            total=total,
+            percent=percent,
+            remaining_percent=100 - percent,
+        )
+
+    worker_count = max(1, min(int(max_workers), total))
+    if replay_store is None or (process_pool is None and worker_count == 1):
+        # SQLite fixture history lives in this session and cannot be shared
+        # with worker processes; single-worker sweeps skip the pool start-up.
+        for position, task in enumerate(tasks):
+            _raise_if_backtest_cancelled(cancellation_callback)
+            record(
+                position,
+                _run_sweep_combination(
+                    task,
+                    db=db if replay_store is None else None,
+                    replay_store=replay_store,
+                    cancellation_callback=cancellation_callback,
+                ),
+            )
+        return [outcomes[position] for position in range(total)]
+
+    pool = process_pool if process_pool is not None else _open_sweep_pool(worker_count)
+    stopped = threading.Event()
+
+    def is_cancelled() -> bool:
+        return stopped.is_set() or (
+            cancellation_callback is not None and cancellation_callback()
+        )
+
+    def replay(task: _SweepTask) -> _SweepOutcome:
+        return pool.run(
+            _run_sweep_combination_in_worker,
+            task,
+            cancellation_callback=is_cancelled,
+        )
+
+    # One thread per granted worker keeps at most that many replays checked
+    # out of the pool at once.
+    runners = ThreadPoolExecutor(max_workers=worker_count, thread_name_prefix="backtest-sweep")
+    pending: dict[Future[_SweepOutcome], int] = {}
+    try:
+        for position, task in enumerate(tasks):
+            pending[runners.submit(replay, task)] = position
+        while pending:
+            _raise_if_backtest_cancelled(cancellation_callback)
+            done, _ = wait(
+                tuple(pending),
+                timeout=_CANCELLATION_POLL_SECONDS,
+                return_when=FIRST_COMPLETED,
+            )
+            for future in done:
+                record(pending.pop(future), future.result())
+    finally:
+        # Queued combinations are dropped and running ones are cancelled in
+        # their workers (or the workers stopped after the pool's grace period)
+        # before the caller releases this sweep's capacity.
+        stopped.set()
+        runners.shutdown(wait=True, cancel_futures=True)
+        if process_pool is None:
+            pool.shutdown()
+    _raise_if_backtest_cancelled(cancellation_callback)
+    return [outcomes[position] for position in range(total)]
+
+
+def _run_sweep_combination_in_worker(
+    task: _SweepTask,
+    *,
+    progress_callback: BacktestProgressCallback | None = None,
+    cancellation_callback: BacktestCancellationCallback | None = None,
+) -> _SweepOutcome:
+    cache_root = task.plan.cache_root
+    assert cache_root is not None
+    replay_store = _WORKER_REPLAY_STORES.get(cache_root)
+    if replay_store is None:
+        replay_store = DatabentoReplayStore(cache_root)
+        _WORKER_REPLAY_STORES[cache_root] = replay_store
+    return _run_sweep_combination(
+        task,
+        replay_store=replay_store,
+        cancellation_callback=cancellation_callback,
+    )
+
+
+def _run_sweep_combination(
+    task: _SweepTask,
+    *,
+    db: Session | None = None,
+    replay_store: DatabentoReplayStore | None,
+    cancellation_callback: BacktestCancellationCallback | None = None,
+) -> _SweepOutcome:
+    plan = task.plan
+    combination = task.combination
+    config = SimpleNamespace(**combination.config_values)
+    try:
+        inputs = _load_databento_replay_inputs(
+            db,
+            user_id=plan.user_id,
+            config=config,
+            payload=plan,
+            root_symbol=plan.root_symbol,
+            history_bounds=plan.history_bounds,
+            replay_store=replay_store,
+            now=plan.now,
+            cancellation_callback=cancellation_callback,
+        )
+        result = _replay_databento_inputs(
+            config=config,
+            inputs=inputs,
+            payload=plan,
+            root_symbol=plan.root_symbol,
+            tick_size=plan.tick_size,
+            tick_value=plan.tick_value,
+            replay_store=replay_store,
+            progress_callback=None,
+            cancellation_callback=cancellation_callback,
+        )
+    except BacktestSupersededError:
+        raise
+    except BacktestError as exc:
+        return _SweepOutcome(
+            summary=_combination_summary(combination, error=str(exc)),
+            error=exc,
+        )
+    metrics = result["metrics"]
+    return _SweepOutcome(
+        summary=_combination_summary(
+            combination,
+            input_fingerprint=inputs.input_fingerprint(),
+            metrics={key: metrics.get(key) for key in _SUMMARY_METRIC_KEYS},
+        ),
+        range=dict(result["range"]),
+        assumptions=dict(result["assumptions"]),
+        result=result if task.keep_result else None,
+    )
+
+
+def _combination_summary(
+    combination: _SweepCombination,
+    *,
+    input_fingerprint: str | None = None,
+    metrics: dict[str, Any] | None = None,
+    error: str | None = None,
+) -> dict[str, Any]:
+    return {
+        "index": combination.index,
+        "rank": None,
+        "fast_period": combination.fast_period,
+        "slow_period": combination.slow_period,
+        "strategy_params": combination.strategy_params,
+        "input_fingerprint": input_fingerprint,
+        "metrics": metrics,
+        "error": error,
+    }
+
+
+def _rank_sweep_summaries(
+    summaries: list[dict[str, Any]],
+    rank_by: str,
+) -> list[dict[str, Any]]:
+    """Best first by ``rank_by``; ties keep grid order, failures sort last."""
+
+    if rank_by not in _DESCENDING_RANK_METRICS | _ASCENDING_RANK_METRICS:
+        raise BacktestConfigurationError(f"unsupported_backtest_sweep_rank_metric:{rank_by}")
+    direction = -1.0 if rank_by in _DESCENDING_RANK_METRICS else 1.0
+
+    def sort_key(summary: dict[str, Any]) -> tuple[int, float, int]:
+        metrics = summary.get("metrics")
+        value = metrics.get(rank_by) if metrics is not None else None
+        if value is None:
+            return (1 if metrics is not None else 2, 0.0, int(summary["index"]))
+        return (0, direction * float(value), int(summary["index"]))
+
+    ranked: list[dict[str, Any]] = []
+    for position, summary in enumerate(sorted(summaries, key=sort_key), start=1):
+        ranked.append(
+            {**summary, "rank": position if summary.get("metrics") is not None else None}
+        )
+    return ranked
+
+
+def _notify_backtest_callback(
+    callback: BacktestSweepCombinationCallback | None,
+    summary: dict[str, Any],
+) -> None:
+    if callback is None:
+        return
+    try:
+        callback(summary)
+    except Exception:
+        # Streaming is advisory; the persisted summary is authoritative.
+        return
@@ -0,0 +1,446 @@
+"""Rolling walk-forward optimization over one bot config's replay window.
+
+The resolved window is split by execution bar into rolling folds: each fold
+optimizes the sweep grid on ``in_sample_bars`` and replays the top-ranked
+parameters on the following ``out_of_sample_bars``.  Fold bounds are bar
+timestamps of the same mapped series, so each fold replay is an O(1) slice of
+the shared cache and every fold of a phase is submitted to one process pool
+together.  Out-of-sample results are stitched into a single backtest result
+whose equity continues from fold to fold.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass, replace
+from datetime import datetime
+from typing import Any, Callable
+
+from sqlalchemy.orm import Session
+
+from ..models import BotBacktest
+from .bot_backtest_columns import encode_result_columns
+from .bot_backtest_executor import BacktestProcessPool
+from .bot_backtest_sweeps import (
+    BacktestWorkerCapacityCallback,
+    _SweepOutcome,
+    _SweepTask,
+    _notify_backtest_callback,
+    _open_sweep_pool,
+    _prepare_sweep,
+    _rank_sweep_summaries,
+    _run_sweep_tasks,
+    _sweep_worker_count,
+)
+from .bot_backtesting import (
+    BACKTEST_ENGINE_VERSION,
+    MIN_EXECUTION_BARS,
+    BacktestCancellationCallback,
+    BacktestConfigurationError,
+    BacktestProgressCallback,
+    InsufficientBacktestDataError,
+    _as_utc,
+    _build_metrics,
+    _candle_close_time_at,
+    _candle_start_time_at,
+    _clean,
+    _config_snapshot,
+    _load_databento_replay_inputs,
+    _notify_backtest_progress,
+    _period_results,
+    _raise_if_backtest_cancelled,
+    _search_candle_close,
+    _search_candle_start,
+)
+
+
+MAX_WALK_FORWARD_FOLDS = 64
+
+BacktestWalkForwardFoldCallback = Callable[[dict[str, Any]], None]
+
+
+@dataclass(frozen=True)
+class _WalkForwardFold:
+    index: int
+    in_sample_start: datetime
+    in_sample_end: datetime
+    in_sample_bars: int
+    out_of_sample_start: datetime
+    out_of_sample_end: datetime
+    out_of_sample_bars: int
+
+
+def create_bot_backtest_walk_forward(
+    db: Session,
+    *,
+    user_id: str,
+    bot_config_id: int,
+    payload: Any,
+    now: datetime | None = None,
+    max_workers: int | None = None,
+    progress_callback: BacktestProgressCallback | None = None,
+    fold_callback: BacktestWalkForwardFoldCallback | None = None,
+    cancellation_callback: BacktestCancellationCallback | None = None,
+    worker_capacity: BacktestWorkerCapacityCallback | None = None,
+    process_pool: BacktestProcessPool | None = None,
+) -> BotBacktest:
+    """Optimize in sample, replay out of sample, and persist the stitched result."""
+
+    prepared = _prepare_sweep(
+        db,
+        user_id=user_id,
+        bot_config_id=bot_config_id,
+        payload=payload,
+        now=now,
+        progress_callback=progress_callback,
+        cancellation_callback=cancellation_callback,
+    )
+    plan = prepared.plan
+    replay_store = prepared.replay_store
+    base_config = prepared.base_config
+    rank_by = str(getattr(payload, "rank_by", "net_pnl") or "net_pnl")
+    folds = _walk_forward_folds(
+        _load_databento_replay_inputs(
+            db if replay_store is None else None,
+            user_id=user_id,
+            config=base_config,
+            payload=plan,
+            root_symbol=plan.root_symbol,
+            history_bounds=plan.history_bounds,
+            replay_store=replay_store,
+            now=plan.now,
+            cancellation_callback=cancellation_callback,
+        ),
+        in_sample_bars=int(payload.in_sample_bars),
+        out_of_sample_bars=int(payload.out_of_sample_bars),
+    )
+
+    in_sample_tasks = [
+        _SweepTask(
+            replace(plan, start=fold.in_sample_start, end=fold.in_sample_end),
+            combination,
+        )
+        for fold in folds
+        for combination in prepared.combinations
+    ]
+    worker_count = _sweep_worker_count(max_workers, len(in_sample_tasks), worker_capacity)
+    pool = process_pool
+    if pool is None and replay_store is not None and worker_count > 1:
+        # Both phases share one pool instead of starting workers twice.
+        pool = _open_sweep_pool(worker_count)
+    try:
+        in_sample_outcomes = _run_sweep_tasks(
+            db,
+            tasks=in_sample_tasks,
+            replay_store=replay_store,
+            max_workers=worker_count,
+            progress_callback=progress_callback,
+            combination_callback=None,
+            cancellation_callback=cancellation_callback,
+            process_pool=pool,
+            phase="optimizing",
+        )
+        combination_count = len(prepared.combinations)
+        selections: list[tuple[_WalkForwardFold, dict[str, Any] | None]] = []
+        for fold in folds:
+            offset = fold.index * combination_count
+            ranked = _rank_sweep_summaries(
+                [
+                    outcome.summary
+                    for outcome in in_sample_outcomes[offset : offset + combination_count]
+                ],
+                rank_by,
+            )
+            selections.append((fold, ranked[0] if ranked[0]["rank"] == 1 else None))
+
+        out_of_sample_tasks = [
+            _SweepTask(
+                replace(
+                    plan,
+                    start=fold.out_of_sample_start,
+                    end=fold.out_of_sample_end,
+                    # Positions never straddle a fold boundary, where the
+                    # next fold may switch parameters.
+                    force_close_at_end=True,
+                ),
+                prepared.combinations[int(selected["index"])],
+                keep_result=True,
+            )
+            for fold, selected in selections
+            if selected is not None
+        ]
+        out_of_sample_outcomes = _run_sweep_tasks(
+            db,
+            tasks=out_of_sample_tasks,
+            replay_store=replay_store,
+            max_workers=worker_count,
+            progress_callback=progress_callback,
+            combination_callback=None,
+            cancellation_callback=cancellation_callback,
+            process_pool=pool,
+            phase="out_of_sample",
+        ) if out_of_sample_tasks else []
+    finally:
+        if pool is not None and pool is not process_pool:
+            pool.shutdown()
+
+    fold_summaries: list[dict[str, Any]] = []
+    replayed: list[tuple[_WalkForwardFold, _SweepOutcome]] = []
+    remaining = iter(out_of_sample_outcomes)
+    for fold, selected in selections:
+        outcome = next(remaining) if selected is not None else None
+        summary = _fold_summary(fold, selected, outcome)
+        fold_summaries.append(summary)
+        _notify_backtest_callback(fold_callback, summary)
+        if outcome is not None and outcome.error is None:
+            replayed.append((fold, outcome))
+    if not replayed:
+        first_error = next(
+            (
+                outcome.error
+                for outcome in [*out_of_sample_outcomes, *in_sample_outcomes]
+                if outcome.error is not None
+            ),
+            None,
+        )
+        if first_error is not None:
+            raise first_error
+        raise InsufficientBacktestDataError(
+            "insufficient_backtest_data: no walk-forward fold produced an out-of-sample replay"
+        )
+
+    _notify_backtest_progress(
+        progress_callback,
+        phase="finalizing",
+        completed=len(folds),
+        total=len(folds),
+        percent=100,
+        remaining_percent=0,
+    )
+    result = _stitch_out_of_sample_results(
+        [outcome.result for _fold, outcome in replayed],  # type: ignore[misc]
+        starting_balance=plan.starting_balance,
+    )
+    result["config_snapshot"] = _config_snapshot(base_config)
+    result["walk_forward"] = {
+        "in_sample_bars": int(payload.in_sample_bars),
+        "out_of_sample_bars": int(payload.out_of_sample_bars),
+        "rank_by": rank_by,
+        "combination_count": len(prepared.combinations),
+        "fold_rule": "rolling_in_sample_then_next_out_of_sample_force_closed_at_fold_end",
+        "folds": fold_summaries,
+    }
+    result["warnings"].append(
+        "Walk-forward replay: each out-of-sample fold used the parameters ranked first "
+        f"by {rank_by} on its preceding in-sample fold; fold equity was stitched in order."
+    )
+    input_fingerprint = hashlib.sha256(
+        "|".join(
+            str(outcome.summary["input_fingerprint"]) for _fold, outcome in replayed
+        ).encode("utf-8")
+    ).hexdigest()
+    _raise_if_backtest_cancelled(cancellation_callback)
+    requested_start = plan.start if plan.start is not None else folds[0].in_sample_start
+    requested_end = plan.end if plan.end is not None else folds[-1].out_of_sample_end
+    result_snapshot, result_columns = encode_result_columns(result)
+    row = BotBacktest(
+        user_id=user_id,
+        bot_config_id=int(prepared.config.id),
+        account_id=int(base_config.account_id),
+        engine_version=BACKTEST_ENGINE_VERSION,
+        strategy_type=str(base_config.strategy_type),
+        contract_id=str(base_config.contract_id),
+        symbol=base_config.symbol,
+        timeframe_unit=str(base_config.timeframe_unit),
+        timeframe_unit_number=int(base_config.timeframe_unit_number),
+        requested_start=_as_utc(requested_start),
+        requested_end=_as_utc(requested_end),
+        actual_start=_as_utc(datetime.fromisoformat(str(result["range"]["start"]))),
+        actual_end=_as_utc(datetime.fromisoformat(str(result["range"]["end"]))),
+        starting_balance=plan.starting_balance,
+        commission_per_contract=plan.commission_per_contract,
+        slippage_ticks=plan.slippage_ticks,
+        tick_size=plan.tick_size,
+        tick_value=plan.tick_value,
+        bar_count=int(result["range"]["bar_count"]),
+        input_fingerprint=input_fingerprint,
+        config_snapshot=result["config_snapshot"],
+        assumptions_snapshot=result["assumptions"],
+        result_snapshot=result_snapshot,
+        result_columns=result_columns,
+    )
+    db.add(row)
+    db.flush()
+    return row
+
+
+def _walk_forward_folds(
+    inputs: Any,
+    *,
+    in_sample_bars: int,
+    out_of_sample_bars: int,
+) -> list[_WalkForwardFold]:
+    """Split the resolved execution bars into rolling in/out-of-sample folds.
+
+    Folds step by ``out_of_sample_bars`` so the out-of-sample segments tile the
+    tail of the window; a final shorter segment is kept when it still has the
+    minimum number of execution bars.
+    """
+
+    if in_sample_bars < MIN_EXECUTION_BARS or out_of_sample_bars < MIN_EXECUTION_BARS:
+        raise BacktestConfigurationError(
+            f"walk_forward_fold_too_short: folds need at least {MIN_EXECUTION_BARS} bars"
+        )
+    rows = inputs.replay_rows
+    first = _search_candle_start(rows, inputs.window.start, side="left")
+    end = _search_candle_close(rows, inputs.window.end, side="right")
+    bar_count = max(0, end - first)
+    if bar_count < in_sample_bars + MIN_EXECUTION_BARS:
+        raise InsufficientBacktestDataError(
+            "insufficient_backtest_data: walk-forward needs at least "
+            f"{in_sample_bars + MIN_EXECUTION_BARS} execution bars; found {bar_count}"
+        )
+    folds: list[_WalkForwardFold] = []
+    in_sample_start = first
+    while True:
+        out_of_sample_start = in_sample_start + in_sample_bars
+        out_of_sample_end = min(end, out_of_sample_start + out_of_sample_bars)
+        if out_of_sample_end - out_of_sample_start < MIN_EXECUTION_BARS:
+            break
+        if len(folds) >= MAX_WALK_FORWARD_FOLDS:
+            raise BacktestConfigurationError(
+                f"walk_forward_too_many_folds: at most {MAX_WALK_FORWARD_FOLDS} folds allowed; "
+                "increase out_of_sample_bars or narrow the window"
+            )
+        folds.append(
+            _WalkForwardFold(
+                index=len(folds),
+                in_sample_start=_candle_start_time_at(rows, in_sample_start),
+                in_sample_end=_candle_close_time_at(rows, out_of_sample_start - 1),
+                in_sample_bars=in_sample_bars,
+                out_of_sample_start=_candle_start_time_at(rows, out_of_sample_start),
+                out_of_sample_end=_candle_close_time_at(rows, out_of_sample_end - 1),
+                out_of_sample_bars=out_of_sample_end - out_of_sample_start,
+            )
+        )
+        if out_of_sample_end >= end:
+            break
+        in_sample_start += out_of_sample_bars
+    return folds
+
+
+def _fold_summary(
+    fold: _WalkForwardFold,
+    selected: dict[str, Any] | None,
+    outcome: _SweepOutcome | None,
+) -> dict[str, Any]:
+    return {
+        "index": fold.index,
+        "in_sample": {
+            "start": _as_utc(fold.in_sample_start).isoformat(),
+            "end": _as_utc(fold.in_sample_end).isoformat(),
+            "bar_count": fold.in_sample_bars,
+        },
+        "out_of_sample": {
+            "start": _as_utc(fold.out_of_sample_start).isoformat(),
+            "end": _as_utc(fold.out_of_sample_end).isoformat(),
+            "bar_count": fold.out_of_sample_bars,
+        },
+        "selected": selected,
+        "out_of_sample_metrics": (
+            outcome.summary["metrics"] if outcome is not None else None
+        ),
+        "error": (
+            outcome.summary["error"]
+            if outcome is not None
+            else "no in-sample combination completed"
+        ),
+    }
+
+
+def _stitch_out_of_sample_results(
+    results: list[dict[str, Any]],
+    *,
+    starting_balance: float,
+) -> dict[str, Any]:
+    """Concatenate fold results, carrying realized P&L into each later fold.
+
+    Every fold replays from ``starting_balance`` and is flat at its end, so
+    shifting a fold's equity by the realized P&L of all earlier folds yields the
+    continuous account curve.  Drawdowns are re-measured against the stitched
+    running peak.  Each fold's full-resolution dollar maximum is kept as a lower
+    bound in case its curve was downsampled.  Its percentage is not, because it
+    is relative to the fold's own peak rather than the stitched one.
+    """
+
+    trades: list[dict[str, Any]] = []
+    equity_curve: list[dict[str, Any]] = []
+    drawdown_series: list[dict[str, Any]] = []
+    warnings: list[str] = []
+    carried = 0.0
+    peak = float(starting_balance)
+    max_drawdown_dollars = 0.0
+    max_drawdown_percent = 0.0
+    exposed_bars = 0.0
+    bar_count = 0
+    for result in results:
+        for trade in result["trades"]:
+            trades.append({**trade, "id": len(trades) + 1})
+        for point in result["equity_curve"]:
+            equity = _clean(float(point["equity"]) + carried)
+            peak = max(peak, float(equity))
+            drawdown = max(0.0, peak - float(equity))
+            drawdown_percent = drawdown / peak * 100.0 if peak > 0 else 0.0
+            equity_curve.append(
+                {
+                    **point,
+                    "equity": equity,
+                    "realized_pnl": _clean(float(point["realized_pnl"]) + carried),
+                }
+            )
+            drawdown_series.append(
+                {
+                    "timestamp": point["timestamp"],
+                    "equity": equity,
+                    "drawdown_dollars": _clean(drawdown),
+                    "drawdown_percent": _clean(drawdown_percent),
+                }
+            )
+            max_drawdown_dollars = max(max_drawdown_dollars, drawdown)
+            max_drawdown_percent = max(max_drawdown_percent, drawdown_percent)
+        metrics = result["metrics"]
+        max_drawdown_dollars = max(max_drawdown_dollars, float(metrics["max_drawdown_dollars"]))
+        fold_bars = int(result["range"]["bar_count"])
+        exposed_bars += float(metrics["exposure_percent"]) * fold_bars / 100.0
+        bar_count += fold_bars
+        if result["equity_curve"]:
+            carried += float(result["equity_curve"][-1]["realized_pnl"])
+        for warning in result["warnings"]:
+            if warning not in warnings:
+                warnings.append(warning)
+
+    first_range = results[0]["range"]
+    return {
+        "range": {
+            **first_range,
+            "start": first_range["start"],
+            "end": results[-1]["range"]["end"],
+            "bar_count": bar_count,
+        },
+        "config_snapshot": results[0]["config_snapshot"],
+        "assumptions": dict(results[0]["assumptions"]),
+        "metrics": _build_metrics(
+            trades,
+            equity_curve=equity_curve,
+            drawdown_series=drawdown_series,
+            max_drawdown_dollars=_clean(max_drawdown_dollars),
+            max_drawdown_percent=_clean(max_drawdown_percent),
+            exposure_percent=exposed_bars / bar_count * 100.0 if bar_count else 0.0,
+        ),
+        "equity_curve": equity_curve,
+        "drawdown_series": drawdown_series,
+        "daily_results": _period_results(trades, monthly=False),
+        "monthly_results": _period_results(trades, monthly=True),
+        "trades": trades,
+        "warnings": warnings,
+    }
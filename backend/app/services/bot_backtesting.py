@@ -5,21 +5,33 @@ import json
 import math
 import os
 import threading
+import uuid
 from bisect import bisect_left, bisect_right
 from collections.abc import Sequence
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from copy import deepcopy
 from dataclasses import dataclass
 from datetime import datetime, time, timedelta, timezone
 from decimal import Decimal, ROUND_HALF_EVEN
+from pathlib import Path
 from typing import Any, Callable, Iterable, Mapping
 
 import numpy as np
+import zstandard
 from sqlalchemy import inspect, or_
 from sqlalchemy.orm import Session
 
 from ..models import BotBacktest, BotConfig, ProjectXMarketCandle
 from . import bot_service as bot_service_module
+from .bot_backtest_columns import (
+    DOWNSAMPLE_VALUE_COLUMNS,
+    RESULT_COLUMN_SECTIONS,
+    decode_result_columns,
+    downsample_records,
+    encode_result_columns,
+)
+from .bot_indicator_state import ReplayIndicatorBook
+from .bot_signal_precompute import PrecomputedSignals, SignalPrecomputeInput
 from .bot_candle_acquisition import (
     _SourceConfigView,
     _build_topbot_source_result,
@@ -73,6 +85,13 @@ ALLOW_LEGACY_PROJECTX_BACKTEST_FIXTURES = False
 # explicit SQLite compatibility tests. Merely retaining old market tables must
 # never make an application request bypass the canonical local cache.
 ALLOW_LEGACY_DATABENTO_SQLITE_FIXTURES = False
+# Real-strategy replay reads EMA/RSI/ATR/ADX/Bollinger/session-VWAP points from
+# per-bar incremental state instead of rebuilding each rolling window. Parity
+# tests switch it off to replay through the reference indicator helpers.
+BACKTEST_INCREMENTAL_INDICATORS = True
+# Strategies registered with a signal precompute replay from one vectorized pass
+# over the whole series. Parity tests switch it off to replay the evaluator.
+BACKTEST_SIGNAL_PRECOMPUTES = True
 BACKTEST_INSTRUMENTS = frozenset({"MNQ", "MES", "NQ", "ES"})
 # Retained as a compatibility constant for callers/tests that display the old
 # limit. It is deliberately not used to truncate or reject replay history.
@@ -149,6 +168,21 @@ UNSUPPORTED_BACKTEST_STRATEGY_REASONS: dict[str, str] = {
 
 _BRACKET_REQUIRED_STRATEGIES = SUPPORTED_BACKTEST_STRATEGIES - {"sma_cross"}
 _TOPBOT_STRATEGY = "topbot_adaptive"
+# Config fields no source evaluator reads. The TopBot ensemble's own
+# strategy_params are replaced by each source's normalized params in the
+# shared source-result cache key.
+_TOPBOT_SOURCE_CACHE_IGNORED_CONFIG_FIELDS = frozenset(
+    {
+        "id",
+        "account_id",
+        "name",
+        "enabled",
+        "execution_mode_at_run",
+        "strategy_params",
+        "created_at",
+        "updated_at",
+    }
+)
 _TOPBOT_SHARED_CONFIGURED_STRATEGIES = {
     "sma_cross",
     "ema_scalping",
@@ -292,23 +326,6 @@ class _NanosecondDatetimeSequence(Sequence[datetime]):
         return _datetime_from_epoch_ns(int(self._values[index]))
 
 
-class _ScaledNanoPriceSequence(Sequence[float]):
-    """Expose mmap fixed-point closes with the eager candle float semantics."""
-
-    __slots__ = ("_values",)
-
-    def __init__(self, values: Any) -> None:
-        self._values = values
-
-    def __len__(self) -> int:
-        return len(self._values)
-
-    def __getitem__(self, index: int | slice) -> float | list[float]:
-        if isinstance(index, slice):
-            return [float(value) / 1_000_000_000 for value in self._values[index]]
-        return float(self._values[index]) / 1_000_000_000
-
-
 class _SessionMembershipSequence(Sequence[bool]):
     """Compute configured-session membership on demand without a bool list."""
 
@@ -515,6 +532,194 @@ class _BacktestResultLru:
 _BACKTEST_RESULT_CACHE = _BacktestResultLru()
 
 
+class _BacktestResultDiskCache:
+    """Content-addressed replay results shared by every process on one cache root.
+
+    The in-process LRU above is lost on restart and private to one worker.  This
+    second tier stores each result as zstd-compressed JSON under
+    ``<cache root>/backtest-results`` keyed by ``_backtest_result_cache_key``.
+    Files are published by renaming a completed temporary file, so concurrent
+    readers see either nothing or a whole entry; reads refresh the file's mtime
+    and writes evict the least recently used files beyond ``max_bytes``.
+    """
+
+    DIRECTORY_NAME = "backtest-results"
+    _SUFFIX = ".json.zst"
+
+    def __init__(self) -> None:
+        default_max_bytes = 1024 * 1024 * 1024
+        try:
+            self.max_bytes = int(
+                os.getenv(
+                    "TOPSIGNAL_BACKTEST_RESULT_DISK_CACHE_MAX_BYTES",
+                    str(default_max_bytes),
+                )
+            )
+        except ValueError:
+            self.max_bytes = default_max_bytes
+        self._evict_lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def path_for(self, cache_root: str | Path, key: str) -> Path:
+        return Path(cache_root) / self.DIRECTORY_NAME / key[:2] / f"{key}{self._SUFFIX}"
+
+    def get(self, cache_root: str | Path, key: str) -> dict[str, Any] | None:
+        if not self.enabled:
+            return None
+        path = self.path_for(cache_root, key)
+        try:
+            compressed = path.read_bytes()
+        except OSError:
+            return None
+        try:
+            result = json.loads(zstandard.ZstdDecompressor().decompress(compressed))
+        except (zstandard.ZstdError, ValueError):
+            # A torn or foreign file is only a miss; the next replay rewrites it.
+            path.unlink(missing_ok=True)
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return result if isinstance(result, dict) else None
+
+    def put(self, cache_root: str | Path, key: str, result: dict[str, Any]) -> None:
+        if not self.enabled:
+            return
+        try:
+            encoded = json.dumps(
+                result,
+                allow_nan=False,
+                default=_backtest_cache_json_default,
+                separators=(",", ":"),
+            ).encode("utf-8")
+        except (TypeError, ValueError):
+            return
+        compressed = zstandard.ZstdCompressor(level=3).compress(encoded)
+        if len(compressed) > self.max_bytes:
+            return
+        path = self.path_for(cache_root, key)
+        temporary = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temporary.write_bytes(compressed)
+            os.replace(temporary, path)
+        except OSError:
+            temporary.unlink(missing_ok=True)
+            return
+        self._evict(Path(cache_root) / self.DIRECTORY_NAME)
+
+    def _evict(self, directory: Path) -> None:
+        with self._evict_lock:
+            entries: list[tuple[float, int, str]] = []
+            total = 0
+            try:
+                shards = [entry.path for entry in os.scandir(directory) if entry.is_dir()]
+                for shard in shards:
+                    for entry in os.scandir(shard):
+                        if not entry.name.endswith(self._SUFFIX):
+                            continue
+                        try:
+                            stat = entry.stat()
+                        except OSError:
+                            continue
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+                        total += stat.st_size
+            except OSError:
+                return
+            if total <= self.max_bytes:
+                return
+            entries.sort()
+            for _mtime, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+                except OSError:
+                    continue
+                total -= size
+
+
+_BACKTEST_RESULT_DISK_CACHE = _BacktestResultDiskCache()
+
+
+class _TopBotSourceResultCache:
+    """TopBot source-strategy results shared by every replay in this process.
+
+    A source's result at one replay event is fixed by the source strategy, its
+    normalized params, the config fields its evaluator reads, the fingerprints
+    of the streams it reads, and the engine's per-event cache signature.  None
+    of those include the ensemble's own thresholds, so replays that only
+    change ``minimum_score``, ``minimum_directional_votes`` and the like
+    re-run the vote layer against stored source results.
+
+    Entries are grouped by namespace (one source over one set of streams) and
+    whole namespaces are evicted least recently used first.  A replay reads
+    its namespace front to back, so once a namespace alone fills the budget
+    later events are not stored rather than evicting the events a rerun will
+    ask for first.
+    """
+
+    def __init__(self) -> None:
+        default_max_entries = 250_000
+        try:
+            self.max_entries = int(
+                os.getenv(
+                    "TOPSIGNAL_TOPBOT_SOURCE_CACHE_MAX_ENTRIES",
+                    str(default_max_entries),
+                )
+            )
+        except ValueError:
+            self.max_entries = default_max_entries
+        self._lock = threading.Lock()
+        self._namespaces: OrderedDict[str, dict[tuple[Any, ...], dict[str, Any]]] = OrderedDict()
+        self._entry_count = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def get(self, namespace: str, signature: tuple[Any, ...]) -> dict[str, Any] | None:
+        with self._lock:
+            entries = self._namespaces.get(namespace)
+            if entries is None:
+                return None
+            self._namespaces.move_to_end(namespace)
+            return entries.get(signature)
+
+    def put(self, namespace: str, signature: tuple[Any, ...], result: dict[str, Any]) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            entries = self._namespaces.get(namespace)
+            if entries is None:
+                entries = self._namespaces[namespace] = {}
+            self._namespaces.move_to_end(namespace)
+            if signature in entries:
+                entries[signature] = result
+                return
+            while self._entry_count >= self.max_entries and len(self._namespaces) > 1:
+                _evicted, evicted_entries = self._namespaces.popitem(last=False)
+                self._entry_count -= len(evicted_entries)
+            if self._entry_count >= self.max_entries:
+                return
+            entries[signature] = result
+            self._entry_count += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._namespaces.clear()
+            self._entry_count = 0
+
+
+_TOPBOT_SOURCE_CACHE = _TopBotSourceResultCache()
+
+
 def _notify_backtest_progress(
     callback: BacktestProgressCallback | None,
     **progress: Any,
@@ -541,6 +746,7 @@ class BacktestEngine:
         replay_streams: Mapping[str, list[ProjectXMarketCandle]] | None = None,
         progress_callback: BacktestProgressCallback | None = None,
         cancellation_callback: BacktestCancellationCallback | None = None,
+        topbot_source_cache: _TopBotSourceResultCache | None = None,
     ) -> None:
         self.config = config
         self.progress_callback = progress_callback
@@ -559,15 +765,16 @@ class BacktestEngine:
         _raise_if_backtest_cancelled(self.cancellation_callback)
         self.all_start_times = _candle_time_sequence(self.all_candles, close=False)
         self.all_close_times = _candle_time_sequence(self.all_candles, close=True)
-        self._sma_close_values = (
-            (
-                _ScaledNanoPriceSequence(self.all_candles.close_nano_values)
-                if _is_mmap_candle_sequence(self.all_candles)
-                else [float(candle.close_price) for candle in self.all_candles]
-            )
+        self._signal_precompute = (
+            _replay_signal_precompute(self.strategy_type) if uses_real_evaluator else None
+        )
+        self._precomputed_signals: PrecomputedSignals | None = None
+        self._indicator_book = (
+            ReplayIndicatorBook.from_candles(self.all_candles)
             if uses_real_evaluator
-            and self.strategy_type == "sma_cross"
-            and evaluate_sma_cross is bot_service_module.evaluate_sma_cross
+            and BACKTEST_INCREMENTAL_INDICATORS
+            and self._signal_precompute is None
+            and self.strategy_type != _TOPBOT_STRATEGY
             else None
         )
         self.topbot_streams: dict[str, _PreparedReplayStream] = {}
@@ -700,7 +907,7 @@ class BacktestEngine:
                 source_evaluations=source_evaluations,
                 unavailable_sources=self.topbot_unavailable_sources,
             )
-        elif self._sma_close_values is not None:
+        elif self._signal_precompute is not None:
             estimated_evaluator_work = len(self.execution_candles) * (
                 2 * int(config.fast_period) + 2 * int(config.slow_period)
             )
@@ -731,6 +938,18 @@ class BacktestEngine:
             replay_storage_bytes=replay_storage_bytes,
             lazy_execution=_is_mmap_candle_sequence(self.execution_candles),
         )
+        if self._signal_precompute is not None:
+            self._precomputed_signals = self._signal_precompute(
+                SignalPrecomputeInput.from_candles(
+                    self.all_candles,
+                    start_times=self.all_start_times,
+                    fast_period=int(config.fast_period),
+                    slow_period=int(config.slow_period),
+                    strategy_params=config.strategy_params,
+                    history_limit=self.evaluator_history_limit,
+                )
+            )
+            _raise_if_backtest_cancelled(self.cancellation_callback)
 
         self.warnings: list[str] = []
         if excluded_partial:
@@ -760,23 +979,18 @@ class BacktestEngine:
         self.position: _OpenTrade | None = None
         self.pending: _PendingSignal | None = None
         self.trades: list[dict[str, Any]] = []
-        self.equity_curve: list[dict[str, Any]] = [
-            {
-                "timestamp": self.settings.start.isoformat(),
-                "equity": _clean(self.settings.starting_balance),
-                "realized_pnl": 0.0,
-                "unrealized_pnl": 0.0,
-            }
-        ]
-        self.drawdown_series: list[dict[str, Any]] = [
-            {
-                "timestamp": self.settings.start.isoformat(),
-                "equity": _clean(self.settings.starting_balance),
-                "drawdown_dollars": 0.0,
-                "drawdown_percent": 0.0,
-            }
-        ]
+        # One equity observation per replay bar plus a slot for the forced
+        # end-of-test close: the bar's close time, cash, mark price and open
+        # position. Unrealized P&L, peaks, drawdowns and the JSON-facing series
+        # are derived from these arrays once the replay finishes.
+        observation_capacity = len(self.execution_candles) + 1
+        self._equity_ns = np.empty(observation_capacity, dtype=np.int64)
+        self._equity_cash = np.empty(observation_capacity, dtype=np.float64)
+        self._equity_mark = np.zeros(observation_capacity, dtype=np.float64)
+        self._equity_position = np.empty(observation_capacity, dtype=np.int64)
+        self._equity_positions: list[_OpenTrade] = []
         self._equity_observation_count = 0
+        self._final_equity_replaced = False
         self._equity_sample_stride = max(
             1,
             math.ceil(
@@ -784,9 +998,6 @@ class BacktestEngine:
                 / max(2, int(BACKTEST_MAX_SERIES_POINTS) - 1)
             ),
         )
-        self._equity_peak = float(self.settings.starting_balance)
-        self._max_drawdown_dollars = 0.0
-        self._max_drawdown_percent = 0.0
         if self._equity_sample_stride > 1:
             self.warnings.append(
                 "Equity and drawdown output was deterministically sampled to bound replay memory; "
@@ -801,6 +1012,12 @@ class BacktestEngine:
         self.unfilled_final_signals = 0
         self._emitted_topbot_signal_identities: set[tuple[str, datetime]] = set()
         self._topbot_source_cache: dict[str, tuple[tuple[Any, ...], dict[str, Any]]] = {}
+        self._shared_topbot_source_cache = (
+            topbot_source_cache
+            if topbot_source_cache is not None and topbot_source_cache.enabled
+            else None
+        )
+        self._topbot_source_namespaces: dict[str, str] = {}
         self.topbot_source_failure_counts: dict[tuple[str, str], int] = defaultdict(int)
 
     def run(self) -> dict[str, Any]:
@@ -848,7 +1065,7 @@ class BacktestEngine:
                 if all_close_ns is not None
                 else self.all_close_times[history_cursor] <= event_time
             ):
-                if self._sma_close_values is None:
+                if self._signal_precompute is None:
                     closed_history.append(self.all_candles[history_cursor])
                 history_cursor += 1
             if (
@@ -857,13 +1074,20 @@ class BacktestEngine:
             ):
                 del closed_history[: -self.max_evaluator_input_bars]
             if self.strategy_type == _TOPBOT_STRATEGY and not inside_session:
-                self._record_equity(event_time=event_time, mark_price=float(candle.close_price))
+                self._record_equity(event_ns=event_ns, mark_price=float(candle.close_price))
                 self._report_replay_progress(completed=index + 1, total=total_bars)
                 continue
-            if self._sma_close_values is not None:
-                signal = self._evaluate_prepared_sma(history_cursor)
+            if self._precomputed_signals is not None:
+                entry_signal = self._precomputed_signals.entry_signal(history_cursor)
+                if entry_signal is None:
+                    self._record_equity(event_ns=event_ns, mark_price=float(candle.close_price))
+                    self._report_replay_progress(completed=index + 1, total=total_bars)
+                    continue
+                signal = entry_signal
             else:
-                signal = self.signal_evaluator(self._evaluator_input(closed_history))
+                signal = self.signal_evaluator(
+                    self._evaluator_input(closed_history, closed_count=history_cursor)
+                )
             if self.strategy_type == _TOPBOT_STRATEGY:
                 self._record_topbot_source_failures(signal)
             if signal.action in {"BUY", "SELL"}:
@@ -874,7 +1098,7 @@ class BacktestEngine:
                 ):
                     self.block_counts["outside_session"] += 1
                     self._record_equity(
-                        event_time=event_time,
+                        event_ns=event_ns,
                         mark_price=float(candle.close_price),
                     )
                     self._report_replay_progress(completed=index + 1, total=total_bars)
@@ -887,7 +1111,7 @@ class BacktestEngine:
                 if self.strategy_type == _TOPBOT_STRATEGY:
                     signal_identity = (str(signal.action), source_signal_timestamp)
                     if signal_identity in self._emitted_topbot_signal_identities:
-                        self._record_equity(event_time=event_time, mark_price=float(candle.close_price))
+                        self._record_equity(event_ns=event_ns, mark_price=float(candle.close_price))
                         self._report_replay_progress(completed=index + 1, total=total_bars)
                         continue
                     self._emitted_topbot_signal_identities.add(signal_identity)
@@ -900,7 +1124,7 @@ class BacktestEngine:
                     payload=dict(signal.raw_payload) if isinstance(signal.raw_payload, dict) else {},
                 )
 
-            self._record_equity(event_time=event_time, mark_price=float(candle.close_price))
+            self._record_equity(event_ns=event_ns, mark_price=float(candle.close_price))
             self._report_replay_progress(completed=index + 1, total=total_bars)
 
         if self.pending is not None:
@@ -916,7 +1140,7 @@ class BacktestEngine:
                 exit_timestamp=final_time,
                 exit_reason="forced_end_of_test",
             )
-            self._replace_last_equity(event_time=final_time)
+            self._replace_last_equity()
         elif self.position is not None:
             self.warnings.append(
                 "A position remained open because force_close_at_end was false; closed-trade metrics exclude it."
@@ -924,13 +1148,15 @@ class BacktestEngine:
 
         self._append_run_warnings()
         _raise_if_backtest_cancelled(self.cancellation_callback)
-        drawdown_series = self.drawdown_series
+        equity_curve, drawdown_series, max_drawdown_dollars, max_drawdown_percent = (
+            self._equity_series()
+        )
         metrics = _build_metrics(
             self.trades,
-            equity_curve=self.equity_curve,
+            equity_curve=equity_curve,
             drawdown_series=drawdown_series,
-            max_drawdown_dollars=self._max_drawdown_dollars,
-            max_drawdown_percent=self._max_drawdown_percent,
+            max_drawdown_dollars=max_drawdown_dollars,
+            max_drawdown_percent=max_drawdown_percent,
             exposure_percent=(
                 self.exposed_bar_count / len(self.execution_candles) * 100.0
             ),
@@ -948,7 +1174,7 @@ class BacktestEngine:
             "config_snapshot": _config_snapshot(self.config),
             "assumptions": _assumptions_snapshot(self.config, self.settings),
             "metrics": metrics,
-            "equity_curve": self.equity_curve,
+            "equity_curve": equity_curve,
             "drawdown_series": drawdown_series,
             "daily_results": _period_results(self.trades, monthly=False),
             "monthly_results": _period_results(self.trades, monthly=True),
@@ -1045,67 +1271,6 @@ class BacktestEngine:
             return start <= local_time <= end
         return local_time >= start or local_time <= end
 
-    def _evaluate_prepared_sma(self, closed_count: int) -> SignalResult:
-        closes = self._sma_close_values
-        assert closes is not None
-        fast_period = int(self.config.fast_period)
-        slow_period = int(self.config.slow_period)
-        visible_count = min(closed_count, self.evaluator_history_limit)
-        latest_index = closed_count - 1
-        latest = self.all_candles[latest_index]
-        if visible_count < slow_period + 1:
-            return SignalResult(
-                action="HOLD",
-                reason=(
-                    f"Need at least {slow_period + 1} closed candles; "
-                    f"found {visible_count}."
-                ),
-                candle_timestamp=self.all_start_times[latest_index],
-                price=float(latest.close_price),
-                raw_payload={
-                    "fast_period": fast_period,
-                    "slow_period": slow_period,
-                    "closed_count": visible_count,
-                },
-            )
-
-        previous_fast = bot_service_module._average(
-            closes[closed_count - fast_period - 1 : closed_count - 1]
-        )
-        previous_slow = bot_service_module._average(
-            closes[closed_count - slow_period - 1 : closed_count - 1]
-        )
-        current_fast = bot_service_module._average(
-            closes[closed_count - fast_period : closed_count]
-        )
-        current_slow = bot_service_module._average(
-            closes[closed_count - slow_period : closed_count]
-        )
-        action = "HOLD"
-        if previous_fast <= previous_slow and current_fast > current_slow:
-            action = "BUY"
-        elif previous_fast >= previous_slow and current_fast < current_slow:
-            action = "SELL"
-        reason = (
-            "No SMA crossover on the latest closed candle."
-            if action == "HOLD"
-            else f"{fast_period}/{slow_period} SMA crossover generated {action}."
-        )
-        return SignalResult(
-            action=action,
-            reason=reason,
-            candle_timestamp=self.all_start_times[latest_index],
-            price=float(latest.close_price),
-            raw_payload={
-                "fast_period": fast_period,
-                "slow_period": slow_period,
-                "previous_fast": previous_fast,
-                "previous_slow": previous_slow,
-                "current_fast": current_fast,
-                "current_slow": current_slow,
-            },
-        )
-
     def _record_topbot_source_failures(self, signal: SignalResult) -> None:
         payload = signal.raw_payload if isinstance(signal.raw_payload, dict) else {}
         ensemble = payload.get("ensemble") if isinstance(payload.get("ensemble"), dict) else {}
@@ -1120,6 +1285,8 @@ class BacktestEngine:
     def _evaluator_input(
         self,
         closed_history: list[ProjectXMarketCandle],
+        *,
+        closed_count: int | None = None,
     ) -> list[ProjectXMarketCandle]:
         if not closed_history:
             return _ClosedCandleList()
@@ -1151,6 +1318,12 @@ class BacktestEngine:
                 session_start=session_start,
                 latest_timestamp=latest_timestamp,
             )
+            self._prime_indicator_window(
+                session_rows,
+                closed_history,
+                start=session_start_index,
+                closed_count=closed_count,
+            )
             return session_rows
 
         if self.strategy_type in _TRADING_DAY_VWAP_STRATEGIES:
@@ -1169,12 +1342,41 @@ class BacktestEngine:
                     int(self.config.timeframe_unit_number),
                 ),
             )
-            return _closed_candle_slice(
+            window_start = min(rolling_start, session_start_index)
+            window = _closed_candle_slice(closed_history, window_start)
+            self._prime_indicator_window(
+                window,
                 closed_history,
-                min(rolling_start, session_start_index),
+                start=window_start,
+                closed_count=closed_count,
             )
+            return window
 
-        return _closed_candle_slice(closed_history, rolling_start)
+        window = _closed_candle_slice(closed_history, rolling_start)
+        self._prime_indicator_window(
+            window,
+            closed_history,
+            start=rolling_start,
+            closed_count=closed_count,
+        )
+        return window
+
+    def _prime_indicator_window(
+        self,
+        window: Sequence[ProjectXMarketCandle],
+        closed_history: list[ProjectXMarketCandle],
+        *,
+        start: int,
+        closed_count: int | None,
+    ) -> None:
+        if self._indicator_book is None or closed_count is None or not window:
+            return
+        absolute_start = closed_count - len(closed_history) + start
+        self._indicator_book.prime(
+            window,
+            start=absolute_start,
+            end=absolute_start + len(window),
+        )
 
     def _evaluate_real_strategy(self, candles: list[ProjectXMarketCandle]) -> SignalResult:
         params = self.config.strategy_params
@@ -1247,23 +1449,29 @@ class BacktestEngine:
             if cached is not None and cached[0] == signature:
                 source_results.append(cached[1])
                 continue
-            try:
-                result = self._evaluate_topbot_source(
-                    source_strategy,
-                    source_params=source_params,
-                    event_time=event_time,
-                    event_timestamp=event_timestamp,
-                )
-            except Exception as exc:
-                result = {
-                    "strategy_type": source_strategy,
-                    "action": "ERROR",
-                    "reason": "Source evaluation failed during synchronized replay.",
-                    "error": bot_service_module.sanitize_error(exc, max_length=300),
-                    "score": None,
-                    "reward_risk": None,
-                    "eligible": False,
-                }
+            shared = self._shared_topbot_source_cache
+            namespace = self._topbot_source_namespace(source_strategy) if shared else None
+            result = shared.get(namespace, signature) if shared and namespace else None
+            if result is None:
+                try:
+                    result = self._evaluate_topbot_source(
+                        source_strategy,
+                        source_params=source_params,
+                        event_time=event_time,
+                        event_timestamp=event_timestamp,
+                    )
+                except Exception as exc:
+                    result = {
+                        "strategy_type": source_strategy,
+                        "action": "ERROR",
+                        "reason": "Source evaluation failed during synchronized replay.",
+                        "error": bot_service_module.sanitize_error(exc, max_length=300),
+                        "score": None,
+                        "reward_risk": None,
+                        "eligible": False,
+                    }
+                if shared and namespace:
+                    shared.put(namespace, signature, result)
             self._topbot_source_cache[source_strategy] = (signature, result)
             source_results.append(result)
 
@@ -1272,6 +1480,44 @@ class BacktestEngine:
             strategy_params=topbot_params,
         )
 
+    def _topbot_source_namespace(self, source_strategy: str) -> str:
+        """Key of the shared cache entries one source reads in this replay."""
+
+        namespace = self._topbot_source_namespaces.get(source_strategy)
+        if namespace is not None:
+            return namespace
+        streams: dict[str, str] = {}
+        for key in self._topbot_source_keys[source_strategy]:
+            stream = self.topbot_streams.get(key)
+            if stream is None:
+                streams[key] = ""
+                continue
+            streams[key] = str(
+                getattr(stream.candles, "_topsignal_input_fingerprint", None)
+                or candle_input_fingerprint(stream.candles)
+            )
+        context = {
+            field: value
+            for field, value in _config_snapshot(self.config).items()
+            if field not in _TOPBOT_SOURCE_CACHE_IGNORED_CONFIG_FIELDS
+        }
+        canonical = json.dumps(
+            {
+                "engine_version": BACKTEST_ENGINE_VERSION,
+                "source_strategy": source_strategy,
+                "source_params": self._topbot_source_params[source_strategy],
+                "config": context,
+                "streams": streams,
+            },
+            allow_nan=False,
+            default=_backtest_cache_json_default,
+            separators=(",", ":"),
+            sort_keys=True,
+        ).encode("utf-8")
+        namespace = hashlib.sha256(canonical).hexdigest()
+        self._topbot_source_namespaces[source_strategy] = namespace
+        return namespace
+
     def _topbot_source_cache_signature(
         self,
         source_strategy: str,
@@ -2015,76 +2261,136 @@ class BacktestEngine:
         )
         return float(raw + slip if action == "BUY" else raw - slip)
 
-    def _record_equity(self, *, event_time: datetime, mark_price: float) -> None:
+    def _record_equity(self, *, event_ns: int, mark_price: float) -> None:
         if self._current_bar_exposed:
             self.exposed_bar_count += 1
-        unrealized = 0.0
-        if self.position is not None:
-            unrealized = _price_pnl(
-                side=self.position.side,
-                entry=self.position.entry_price,
-                exit=mark_price,
-                quantity=self.position.quantity,
-                tick_size=self.settings.tick_size,
-                tick_value=self.settings.tick_value,
-            )
-        realized = self.cash - self.settings.starting_balance
-        timestamp = _as_utc(event_time).isoformat()
-        equity = _clean(self.cash + unrealized)
-        self._equity_peak = max(self._equity_peak, float(equity))
-        drawdown = max(0.0, self._equity_peak - float(equity))
-        drawdown_percent = (
-            drawdown / self._equity_peak * 100.0 if self._equity_peak > 0 else 0.0
+        slot = self._equity_observation_count
+        self._equity_ns[slot] = event_ns
+        self._equity_cash[slot] = self.cash
+        position = self.position
+        if position is None:
+            self._equity_position[slot] = -1
+        else:
+            positions = self._equity_positions
+            if not positions or positions[-1] is not position:
+                positions.append(position)
+            self._equity_position[slot] = len(positions) - 1
+            self._equity_mark[slot] = mark_price
+        self._equity_observation_count = slot + 1
+
+    def _replace_last_equity(self) -> None:
+        """Restate the final bar's equity after the forced end-of-test close."""
+
+        slot = self._equity_observation_count
+        if slot == 0:
+            return
+        self._equity_ns[slot] = self._equity_ns[slot - 1]
+        self._equity_cash[slot] = self.cash
+        self._equity_position[slot] = -1
+        self._final_equity_replaced = True
+
+    def _unrealized_equity(self, count: int) -> np.ndarray:
+        unrealized = np.zeros(count, dtype=np.float64)
+        position_ids = self._equity_position[:count]
+        exposed = np.flatnonzero(position_ids >= 0)
+        if exposed.shape[0] == 0:
+            return unrealized
+        positions = self._equity_positions
+        marks = self._equity_mark[:count]
+        if float(self.settings.tick_size) != 0.25:
+            for index in exposed.tolist():
+                position = positions[int(position_ids[index])]
+                unrealized[index] = _price_pnl(
+                    side=position.side,
+                    entry=position.entry_price,
+                    exit=float(marks[index]),
+                    quantity=position.quantity,
+                    tick_size=self.settings.tick_size,
+                    tick_value=self.settings.tick_value,
+                )
+            return unrealized
+        # The same float operations, in the same order, as _price_pnl's
+        # quarter-tick path, so every bar's P&L is bit-identical.
+        entries = np.asarray([float(position.entry_price) for position in positions])
+        quantities = np.asarray([float(position.quantity) for position in positions])
+        directions = np.asarray(
+            [1.0 if position.side == "long" else -1.0 for position in positions]
         )
-        self._max_drawdown_dollars = max(self._max_drawdown_dollars, drawdown)
-        self._max_drawdown_percent = max(self._max_drawdown_percent, drawdown_percent)
-        self._equity_observation_count += 1
-        should_sample = (
-            self._equity_observation_count % self._equity_sample_stride == 0
-            or self._equity_observation_count == len(self.execution_candles)
+        held = position_ids[exposed]
+        unrealized[exposed] = (
+            (marks[exposed] - entries[held])
+            / float(self.settings.tick_size)
+            * float(self.settings.tick_value)
+            * quantities[held]
+            * directions[held]
         )
-        if should_sample:
-            self.equity_curve.append(
+        return unrealized
+
+    def _equity_series(
+        self,
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]], float, float]:
+        """Sampled equity and drawdown points plus drawdown maxima over every bar.
+
+        The restated final observation keeps the peak its mark-to-market value
+        set, and replaces the last sampled point.
+        """
+
+        observed = self._equity_observation_count
+        count = observed + (1 if self._final_equity_replaced else 0)
+        starting_balance = float(self.settings.starting_balance)
+        cash = self._equity_cash[:count]
+        unrealized = self._unrealized_equity(count)
+        equity = _clean_array(cash + unrealized)
+        peak = np.maximum(np.maximum.accumulate(equity), starting_balance)
+        drawdown = np.maximum(peak - equity, 0.0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            drawdown_percent = np.where(peak > 0, drawdown / peak * 100.0, 0.0)
+        max_drawdown_dollars = max(0.0, float(drawdown.max())) if count else 0.0
+        max_drawdown_percent = max(0.0, float(drawdown_percent.max())) if count else 0.0
+
+        stride = self._equity_sample_stride
+        sampled = list(range(stride - 1, observed, stride))
+        if observed >= len(self.execution_candles) and (not sampled or sampled[-1] != observed - 1):
+            sampled.append(observed - 1)
+        if self._final_equity_replaced:
+            sampled[-1] = observed
+        start_timestamp = self.settings.start.isoformat()
+        equity_curve: list[dict[str, Any]] = [
+            {
+                "timestamp": start_timestamp,
+                "equity": _clean(starting_balance),
+                "realized_pnl": 0.0,
+                "unrealized_pnl": 0.0,
+            }
+        ]
+        drawdown_series: list[dict[str, Any]] = [
+            {
+                "timestamp": start_timestamp,
+                "equity": _clean(starting_balance),
+                "drawdown_dollars": 0.0,
+                "drawdown_percent": 0.0,
+            }
+        ]
+        for index in sampled:
+            timestamp = _datetime_from_epoch_ns(int(self._equity_ns[index])).isoformat()
+            point_equity = float(equity[index])
+            equity_curve.append(
                 {
                     "timestamp": timestamp,
-                    "equity": equity,
-                    "realized_pnl": _clean(realized),
-                    "unrealized_pnl": _clean(unrealized),
+                    "equity": point_equity,
+                    "realized_pnl": _clean(float(cash[index]) - starting_balance),
+                    "unrealized_pnl": _clean(float(unrealized[index])),
                 }
             )
-            self.drawdown_series.append(
+            drawdown_series.append(
                 {
                     "timestamp": timestamp,
-                    "equity": equity,
-                    "drawdown_dollars": _clean(drawdown),
-                    "drawdown_percent": _clean(drawdown_percent),
+                    "equity": point_equity,
+                    "drawdown_dollars": _clean(float(drawdown[index])),
+                    "drawdown_percent": _clean(float(drawdown_percent[index])),
                 }
             )
-
-    def _replace_last_equity(self, *, event_time: datetime) -> None:
-        point = {
-            "timestamp": _as_utc(event_time).isoformat(),
-            "equity": _clean(self.cash),
-            "realized_pnl": _clean(self.cash - self.settings.starting_balance),
-            "unrealized_pnl": 0.0,
-        }
-        if self.equity_curve:
-            self.equity_curve[-1] = point
-            self._equity_peak = max(self._equity_peak, float(point["equity"]))
-            drawdown = max(0.0, self._equity_peak - float(point["equity"]))
-            drawdown_percent = (
-                drawdown / self._equity_peak * 100.0 if self._equity_peak > 0 else 0.0
-            )
-            self._max_drawdown_dollars = max(self._max_drawdown_dollars, drawdown)
-            self._max_drawdown_percent = max(self._max_drawdown_percent, drawdown_percent)
-            self.drawdown_series[-1] = {
-                "timestamp": point["timestamp"],
-                "equity": point["equity"],
-                "drawdown_dollars": _clean(drawdown),
-                "drawdown_percent": _clean(drawdown_percent),
-            }
-        else:
-            self.equity_curve.append(point)
+        return equity_curve, drawdown_series, max_drawdown_dollars, max_drawdown_percent
 
     def _add_data_quality_warnings(self) -> None:
         warmup_count = min(
@@ -3351,6 +3657,7 @@ def run_backtest(
     replay_streams: Mapping[str, list[ProjectXMarketCandle]] | None = None,
     progress_callback: BacktestProgressCallback | None = None,
     cancellation_callback: BacktestCancellationCallback | None = None,
+    topbot_source_cache: _TopBotSourceResultCache | None = None,
 ) -> dict[str, Any]:
     """Run a pure replay. This function cannot create or route an order."""
 
@@ -3371,6 +3678,7 @@ def run_backtest(
         replay_streams=replay_streams,
         progress_callback=progress_callback,
         cancellation_callback=cancellation_callback,
+        topbot_source_cache=topbot_source_cache,
     ).run()
 
 
@@ -3839,25 +4147,7 @@ def create_bot_backtest(
     config = _config_for_backtest_request(config, payload)
     _raise_if_backtest_cancelled(cancellation_callback)
     root = normalize_symbol_key(config.symbol) or normalize_symbol_key(config.contract_id)
-    database_fixture_bounds = (
-        _database_databento_fixture_bounds(db, root_symbol=root) if root else None
-    )
-    replay_store: DatabentoReplayStore | None = None
-    bounds = database_fixture_bounds
-    if (
-        bounds is None
-        and root
-        and not legacy_projectx_backtest_fixtures_enabled(db)
-    ):
-        replay_store = get_default_databento_cache()
-        try:
-            bounds = replay_store.history_bounds(root)
-        except DatabentoCacheMissingError:
-            bounds = None
-        except DatabentoCacheStaleError as exc:
-            raise BacktestConfigurationError(str(exc)) from exc
-        except DatabentoCacheError as exc:
-            raise BacktestConfigurationError(str(exc)) from exc
+    bounds, replay_store = _resolve_databento_history_source(db, root_symbol=root)
     if bounds is None:
         # The legacy path is retained solely so the repository's historical
         # SQLite engine fixtures remain useful. Application PostgreSQL requests
@@ -3890,6 +4180,37 @@ def create_bot_backtest(
     )
 
 
+def _resolve_databento_history_source(
+    db: Session,
+    *,
+    root_symbol: str | None,
+) -> tuple[tuple[datetime, datetime] | None, DatabentoReplayStore | None]:
+    """Return replay bounds and the local cache store (``None`` for SQLite fixtures)."""
+
+    database_fixture_bounds = (
+        _database_databento_fixture_bounds(db, root_symbol=root_symbol)
+        if root_symbol
+        else None
+    )
+    replay_store: DatabentoReplayStore | None = None
+    bounds = database_fixture_bounds
+    if (
+        bounds is None
+        and root_symbol
+        and not legacy_projectx_backtest_fixtures_enabled(db)
+    ):
+        replay_store = get_default_databento_cache()
+        try:
+            bounds = replay_store.history_bounds(root_symbol)
+        except DatabentoCacheMissingError:
+            bounds = None
+        except DatabentoCacheStaleError as exc:
+            raise BacktestConfigurationError(str(exc)) from exc
+        except DatabentoCacheError as exc:
+            raise BacktestConfigurationError(str(exc)) from exc
+    return bounds, replay_store
+
+
 def _create_databento_bot_backtest(
     db: Session,
     *,
@@ -3919,6 +4240,106 @@ def _create_databento_bot_backtest(
     if instrument_spec is None:
         raise BacktestConfigurationError(f"instrument_metadata_missing:{root_symbol}")
 
+    inputs = _load_databento_replay_inputs(
+        db,
+        user_id=user_id,
+        config=config,
+        payload=payload,
+        root_symbol=root_symbol,
+        history_bounds=history_bounds,
+        replay_store=replay_store,
+        now=now,
+        cancellation_callback=cancellation_callback,
+        progress_callback=progress_callback,
+    )
+    window = inputs.window
+    result = _replay_databento_inputs(
+        config=config,
+        inputs=inputs,
+        payload=payload,
+        root_symbol=root_symbol,
+        tick_size=instrument_spec.tick_size,
+        tick_value=instrument_spec.tick_value,
+        replay_store=replay_store,
+        progress_callback=progress_callback,
+        cancellation_callback=cancellation_callback,
+    )
+    _notify_backtest_progress(
+        progress_callback,
+        phase="finalizing",
+        completed=int(result["range"]["bar_count"]),
+        total=int(result["range"]["bar_count"]),
+        percent=100,
+        remaining_percent=0,
+    )
+    input_fingerprint = inputs.input_fingerprint()
+    _raise_if_backtest_cancelled(cancellation_callback)
+    result_snapshot, result_columns = encode_result_columns(result)
+    row = BotBacktest(
+        user_id=user_id,
+        bot_config_id=int(config.id),
+        account_id=int(config.account_id),
+        engine_version=BACKTEST_ENGINE_VERSION,
+        strategy_type=str(config.strategy_type),
+        contract_id=str(config.contract_id),
+        symbol=config.symbol,
+        timeframe_unit=str(config.timeframe_unit),
+        timeframe_unit_number=int(config.timeframe_unit_number),
+        requested_start=window.requested_start,
+        requested_end=window.requested_end,
+        actual_start=_as_utc(datetime.fromisoformat(str(result["range"]["start"]))),
+        actual_end=_as_utc(datetime.fromisoformat(str(result["range"]["end"]))),
+        starting_balance=float(payload.starting_balance),
+        commission_per_contract=float(payload.commission_per_contract),
+        slippage_ticks=float(payload.slippage_ticks),
+        tick_size=instrument_spec.tick_size,
+        tick_value=instrument_spec.tick_value,
+        bar_count=int(result["range"]["bar_count"]),
+        input_fingerprint=input_fingerprint,
+        config_snapshot=result["config_snapshot"],
+        assumptions_snapshot=result["assumptions"],
+        result_snapshot=result_snapshot,
+        result_columns=result_columns,
+    )
+    db.add(row)
+    db.flush()
+    return row
+
+
+@dataclass(frozen=True)
+class _DatabentoReplayInputs:
+    """Closed replay rows (with warmup) and synchronized streams for one config."""
+
+    window: _ResolvedBacktestWindow
+    replay_rows: Sequence[ProjectXMarketCandle]
+    replay_streams: dict[str, Sequence[ProjectXMarketCandle]] | None
+
+    def input_fingerprint(self) -> str:
+        if self.replay_streams is not None:
+            return candle_stream_input_fingerprint(self.replay_streams)
+        return candle_input_fingerprint(self.replay_rows)
+
+
+def _load_databento_replay_inputs(
+    db: Session | None,
+    *,
+    user_id: str,
+    config: BotConfig,
+    payload: Any,
+    root_symbol: str,
+    history_bounds: tuple[datetime, datetime],
+    replay_store: DatabentoReplayStore | None,
+    now: datetime | None,
+    cancellation_callback: BacktestCancellationCallback | None,
+    progress_callback: BacktestProgressCallback | None = None,
+) -> _DatabentoReplayInputs:
+    """Resolve the window and slice warmup plus execution bars for ``config``.
+
+    ``db`` is only read for SQLite fixture history; cache-backed callers such as
+    sweep worker processes pass ``None`` together with their own replay store.
+    """
+
+
     captured_now = _as_utc(now or datetime.now(timezone.utc))
     source_start, source_end = history_bounds
     closed_by = min(captured_now, _as_utc(source_end))
@@ -4054,6 +4475,30 @@ def _create_databento_bot_backtest(
     # execution indexes. The replay slice (and any synchronized streams) retain
     # exactly the projected candle objects they need.
     del primary_start_times, primary_close_times, primary_rows
+    return _DatabentoReplayInputs(
+        window=window,
+        replay_rows=replay_rows,
+        replay_streams=replay_streams,
+    )
+
+
+def _replay_databento_inputs(
+    *,
+    config: BotConfig,
+    inputs: _DatabentoReplayInputs,
+    payload: Any,
+    root_symbol: str,
+    tick_size: float,
+    tick_value: float,
+    replay_store: DatabentoReplayStore | None,
+    progress_callback: BacktestProgressCallback | None,
+    cancellation_callback: BacktestCancellationCallback | None,
+) -> dict[str, Any]:
+    """Replay prepared Databento inputs through the shared result cache."""
+
+    window = inputs.window
+    replay_rows = inputs.replay_rows
+    replay_streams = inputs.replay_streams
 
     result_cache_key = (
         _backtest_result_cache_key(
@@ -4065,8 +4510,8 @@ def _create_databento_bot_backtest(
             starting_balance=float(payload.starting_balance),
             commission_per_contract=float(payload.commission_per_contract),
             slippage_ticks=float(payload.slippage_ticks),
-            tick_size=instrument_spec.tick_size,
-            tick_value=instrument_spec.tick_value,
+            tick_size=tick_size,
+            tick_value=tick_value,
             force_close_at_end=bool(payload.force_close_at_end),
         )
         if replay_store is not None
@@ -4077,6 +4522,10 @@ def _create_databento_bot_backtest(
         if result_cache_key is not None
         else None
     )
+    if result is None and result_cache_key is not None:
+        result = _BACKTEST_RESULT_DISK_CACHE.get(replay_store.cache_root, result_cache_key)
+        if result is not None:
+            _BACKTEST_RESULT_CACHE.put(result_cache_key, result)
     _raise_if_backtest_cancelled(cancellation_callback)
     if result is None:
         result = run_backtest(
@@ -4087,16 +4536,18 @@ def _create_databento_bot_backtest(
             starting_balance=float(payload.starting_balance),
             commission_per_contract=float(payload.commission_per_contract),
             slippage_ticks=float(payload.slippage_ticks),
-            tick_size=instrument_spec.tick_size,
-            tick_value=instrument_spec.tick_value,
+            tick_size=tick_size,
+            tick_value=tick_value,
             force_close_at_end=bool(payload.force_close_at_end),
             replay_streams=replay_streams,
             progress_callback=progress_callback,
             cancellation_callback=cancellation_callback,
+            topbot_source_cache=_TOPBOT_SOURCE_CACHE if replay_store is not None else None,
         )
         _raise_if_backtest_cancelled(cancellation_callback)
         if result_cache_key is not None:
             _BACKTEST_RESULT_CACHE.put(result_cache_key, result)
+            _BACKTEST_RESULT_DISK_CACHE.put(replay_store.cache_root, result_cache_key, result)
     else:
         _notify_backtest_progress(
             progress_callback,
@@ -4118,52 +4569,10 @@ def _create_databento_bot_backtest(
         f"{'local Parquet/memory-map cache' if replay_store is not None else 'SQLite test fixture'} "
         "with a prior-completed-session volume rollover schedule; ProjectX market history was not read."
     )
-    _notify_backtest_progress(
-        progress_callback,
-        phase="finalizing",
-        completed=int(result["range"]["bar_count"]),
-        total=int(result["range"]["bar_count"]),
-        percent=100,
-        remaining_percent=0,
-    )
-    input_fingerprint = (
-        candle_stream_input_fingerprint(replay_streams)
-        if replay_streams is not None
-        else candle_input_fingerprint(replay_rows)
-    )
-    _raise_if_backtest_cancelled(cancellation_callback)
-    row = BotBacktest(
-        user_id=user_id,
-        bot_config_id=int(config.id),
-        account_id=int(config.account_id),
-        engine_version=BACKTEST_ENGINE_VERSION,
-        strategy_type=str(config.strategy_type),
-        contract_id=str(config.contract_id),
-        symbol=config.symbol,
-        timeframe_unit=str(config.timeframe_unit),
-        timeframe_unit_number=int(config.timeframe_unit_number),
-        requested_start=window.requested_start,
-        requested_end=window.requested_end,
-        actual_start=_as_utc(datetime.fromisoformat(str(result["range"]["start"]))),
-        actual_end=_as_utc(datetime.fromisoformat(str(result["range"]["end"]))),
-        starting_balance=float(payload.starting_balance),
-        commission_per_contract=float(payload.commission_per_contract),
-        slippage_ticks=float(payload.slippage_ticks),
-        tick_size=instrument_spec.tick_size,
-        tick_value=instrument_spec.tick_value,
-        bar_count=int(result["range"]["bar_count"]),
-        input_fingerprint=input_fingerprint,
-        config_snapshot=result["config_snapshot"],
-        assumptions_snapshot=result["assumptions"],
-        result_snapshot=result,
-    )
-    db.add(row)
-    db.flush()
-    return row
-
+    return result
 
 def _load_databento_topbot_replay_streams(
-    db: Session,
+    db: Session | None,
     *,
     user_id: str,
     config: BotConfig,
@@ -4465,6 +4874,7 @@ def _create_legacy_projectx_bot_backtest(
     _raise_if_backtest_cancelled(cancellation_callback)
     assumptions = result["assumptions"]
     snapshot = result["config_snapshot"]
+    result_snapshot, result_columns = encode_result_columns(result)
     row = BotBacktest(
         user_id=user_id,
         bot_config_id=int(config.id),
@@ -4488,15 +4898,74 @@ def _create_legacy_projectx_bot_backtest(
         input_fingerprint=input_fingerprint,
         config_snapshot=snapshot,
         assumptions_snapshot=assumptions,
-        result_snapshot=result,
+        result_snapshot=result_snapshot,
+        result_columns=result_columns,
     )
     db.add(row)
     db.flush()
     return row
 
 
-def serialize_bot_backtest(row: BotBacktest) -> dict[str, Any]:
+def get_bot_backtest(
+    db: Session,
+    *,
+    user_id: str,
+    bot_config_id: int,
+    backtest_id: int,
+) -> BotBacktest | None:
+    return (
+        db.query(BotBacktest)
+        .filter(BotBacktest.user_id == user_id)
+        .filter(BotBacktest.bot_config_id == bot_config_id)
+        .filter(BotBacktest.id == backtest_id)
+        .one_or_none()
+    )
+
+
+def bot_backtest_result(
+    row: BotBacktest,
+    *,
+    sections: Iterable[str] | None = None,
+    max_points: int | None = None,
+) -> dict[str, Any]:
+    """The persisted result with its series sections expanded.
+
+    ``sections`` limits which of ``RESULT_COLUMN_SECTIONS`` are returned (all
+    by default); the others are listed under ``omitted_sections``.
+    ``max_points`` downsamples the equity and drawdown series.
+    """
+
+    wanted = RESULT_COLUMN_SECTIONS if sections is None else tuple(
+        name for name in RESULT_COLUMN_SECTIONS if name in set(sections)
+    )
     payload = dict(row.result_snapshot or {})
+    if row.result_columns is not None:
+        payload.update(
+            decode_result_columns(bytes(row.result_columns), wanted, max_points=max_points)
+        )
+    else:
+        for name in RESULT_COLUMN_SECTIONS:
+            if name not in wanted:
+                payload.pop(name, None)
+            elif max_points is not None and name in DOWNSAMPLE_VALUE_COLUMNS:
+                payload[name] = downsample_records(
+                    list(payload.get(name) or []),
+                    value_key=DOWNSAMPLE_VALUE_COLUMNS[name],
+                    max_points=max_points,
+                )
+    omitted = [name for name in RESULT_COLUMN_SECTIONS if name not in wanted]
+    if omitted:
+        payload["omitted_sections"] = omitted
+    return payload
+
+
+def serialize_bot_backtest(
+    row: BotBacktest,
+    *,
+    sections: Iterable[str] | None = None,
+    max_points: int | None = None,
+) -> dict[str, Any]:
+    payload = bot_backtest_result(row, sections=sections, max_points=max_points)
     payload.update(
         {
             "id": int(row.id),
@@ -5655,6 +6124,23 @@ def _contains_open_futures_timestamp(
     return False
 
 
+def _replay_signal_precompute(
+    strategy_type: str,
+) -> Callable[[SignalPrecomputeInput], PrecomputedSignals] | None:
+    """Return a registered precompute while its reference evaluator is unpatched."""
+
+    if not BACKTEST_SIGNAL_PRECOMPUTES:
+        return None
+    definition = get_strategy_definition(strategy_type)
+    precompute = definition.signal_precompute
+    evaluator_name = getattr(definition.evaluator, "callable_name", None)
+    if precompute is None or evaluator_name is None:
+        return None
+    if globals().get(evaluator_name) is not getattr(bot_service_module, evaluator_name, None):
+        return None
+    return precompute
+
+
 def _max_evaluator_input_bars(config: BotConfig, *, rolling_limit: int) -> int:
     timeframe_seconds = _timeframe_seconds(
         str(config.timeframe_unit), int(config.timeframe_unit_number)
@@ -5836,6 +6322,23 @@ def _json_safe(value: Any) -> Any:
     return json.loads(json.dumps(value, sort_keys=True, default=str))
 
 
+def _clean_array(values: np.ndarray) -> np.ndarray:
+    """``_clean`` applied elementwise with Python's exact decimal rounding.
+
+    ``np.round`` scales by a power of ten and can land one ulp away from
+    ``round(value, 10)``.  Flat stretches repeat the same value, so only the
+    distinct values are rounded in Python.
+    """
+
+    distinct, inverse = np.unique(values, return_inverse=True)
+    cleaned = np.fromiter(
+        (_clean(value) for value in distinct.tolist()),
+        dtype=np.float64,
+        count=int(distinct.shape[0]),
+    )
+    return cleaned[inverse]
+
+
 def _as_utc(value: datetime) -> datetime:
     if value.tzinfo is None:
         return value.replace(tzinfo=timezone.utc)
@@ -0,0 +1,724 @@
+"""Incremental indicator state for closed-bar backtest replay.
+
+Replay hands each evaluator a rolling window of closed candles, and the
+reference helpers in ``bot_service`` seed EMA, Wilder RSI, ATR and ADX from the
+first bar of that window.  Rebuilding those series for every replay bar costs
+O(window) Python work per bar.  The states here advance once per closed bar and
+keep one smoothing lane per possible window start, so the value a window would
+have produced is read back instead of rebuilt.  Lanes are updated with the same
+float operations, in the same order, as the reference helpers, which keeps
+replay signals bit-for-bit identical.  Anything the states cannot answer
+exactly falls back to the reference helper on an uncached copy of the window.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Iterator, Sequence
+from typing import Any
+
+import numpy as np
+
+from . import bot_service as bot_service_module
+from .bot_service import _IndicatorValues
+
+
+# Evaluators read the latest one or two indicator points, plus short slope and
+# trend-confirmation lookbacks.  Older points fall back to the reference path.
+INDICATOR_TAIL_DEPTH = 32
+# One spare row, so the row a bar writes is never one a retained snapshot reads.
+_LANE_ROWS = INDICATOR_TAIL_DEPTH + 1
+_INITIAL_LANE_CAPACITY = 64
+_MISSING = object()
+
+
+class _AnchoredLaneState:
+    """Smoothing lanes for every window start that a later window may use.
+
+    Lane ``k`` holds the indicator for a window anchored at absolute candle
+    index ``first_anchor + k``.  A lane is created at absolute index
+    ``anchor + lane_offset`` and reports values from ``anchor + output_offset``.
+
+    Lanes live in one preallocated ring buffer with a row per retained bar end
+    and a column per anchor.  A bar writes the next row from the previous one
+    with in-place ufuncs and seeds one new column, so it costs one vectorized
+    pass over the live lanes and allocates nothing.  Columns no retained row
+    can read are compacted away once the buffer fills, and it only grows when
+    more than half of it is still live.
+    """
+
+    lane_offset = 0
+    output_offset = 0
+    lane_fields = 1
+
+    def __init__(self, book: "ReplayIndicatorBook", period: int) -> None:
+        self._book = book
+        self.period = max(1, int(period))
+        self._end: int | None = None
+        self._first_anchor = 0
+        self._lane_count = 0
+        # Absolute anchor of buffer column 0, and the row of the latest bar.
+        self._base = 0
+        self._row = 0
+        self._buffer = np.empty(
+            (self.lane_fields, _LANE_ROWS, _INITIAL_LANE_CAPACITY), dtype=np.float64
+        )
+        self._snapshots: deque[tuple[int, int, int]] = deque(maxlen=INDICATOR_TAIL_DEPTH)
+
+    def advance(self, start: int, end: int) -> None:
+        """Bring lanes up to ``end`` (exclusive) for windows starting at ``start``."""
+
+        if (
+            self._end is None
+            or end < self._end
+            or start < self._first_anchor
+            or start > self._end
+        ):
+            self._reset(start)
+        assert self._end is not None
+        self._drop_anchors_before(start)
+        while self._end < end:
+            self._step(self._end)
+            self._end += 1
+            self._snapshots.append((self._first_anchor, self._lane_count, self._row))
+
+    def value(self, anchor: int, index: int) -> Any:
+        """Return the reference value at ``index`` for a window starting at ``anchor``."""
+
+        if index < anchor + self.output_offset:
+            return None
+        assert self._end is not None
+        position = index - (self._end - len(self._snapshots))
+        if position < 0 or position >= len(self._snapshots):
+            return _MISSING
+        first_anchor, lane_count, row = self._snapshots[position]
+        lane = anchor - first_anchor
+        if lane < 0 or lane >= lane_count:
+            return _MISSING
+        return self._output(self._buffer[:, row], anchor - self._base)
+
+    def _reset(self, start: int) -> None:
+        self._end = start
+        self._first_anchor = start
+        self._lane_count = 0
+        self._base = start
+        self._snapshots.clear()
+        self._reset_extra()
+
+    def _reset_extra(self) -> None:
+        return None
+
+    def _drop_anchors_before(self, start: int) -> None:
+        drop = min(max(start - self._first_anchor, 0), self._lane_count)
+        if drop == self._lane_count:
+            self._lane_count = 0
+            self._first_anchor = max(self._first_anchor, start)
+        elif drop:
+            self._lane_count -= drop
+            self._first_anchor += drop
+
+    def _lanes(self) -> np.ndarray:
+        """View of the live lanes after the latest bar, one row per field."""
+
+        left = self._first_anchor - self._base
+        return self._buffer[:, self._row, left : left + self._lane_count]
+
+    def _step(self, index: int) -> None:
+        lane_count = self._lane_count
+        anchor = index - self.lane_offset
+        seeds = anchor >= 0 and (lane_count > 0 or anchor >= self._first_anchor)
+        if seeds and lane_count == 0:
+            self._first_anchor = anchor
+        left = self._first_anchor - self._base
+        if left + lane_count + seeds > self._buffer.shape[2]:
+            left = self._reserve(lane_count + seeds)
+        right = left + lane_count
+        source = self._row
+        target = self._row = (source + 1) % _LANE_ROWS
+        if lane_count:
+            buffer = self._buffer
+            self._update(buffer[:, source, left:right], buffer[:, target, left:right], index)
+        if seeds:
+            self._buffer[:, target, right] = self._seed(anchor, index)
+            self._lane_count = lane_count + 1
+
+    def _reserve(self, lane_count: int) -> int:
+        """Make room for ``lane_count`` lanes from the first anchor; return its column."""
+
+        capacity = self._buffer.shape[2]
+        keep_from = min(
+            [self._first_anchor]
+            + [first_anchor for first_anchor, count, _row in self._snapshots if count]
+        )
+        shift = keep_from - self._base
+        live = self._first_anchor + self._lane_count - keep_from
+        required = self._first_anchor + lane_count - keep_from
+        buffer = self._buffer
+        if required * 2 > capacity:
+            buffer = np.empty(
+                (self.lane_fields, _LANE_ROWS, max(capacity * 2, required * 2)),
+                dtype=np.float64,
+            )
+        buffer[:, :, :live] = self._buffer[:, :, shift : shift + live]
+        self._buffer = buffer
+        self._base = keep_from
+        return self._first_anchor - self._base
+
+    def _update(self, lanes: np.ndarray, out: np.ndarray, index: int) -> None:
+        """Write the lanes after bar ``index`` into ``out`` (fields by lanes)."""
+
+        raise NotImplementedError
+
+    def _seed(self, anchor: int, index: int) -> tuple[float, ...]:
+        raise NotImplementedError
+
+    def _output(self, lanes: np.ndarray, lane: int) -> Any:
+        return float(lanes[0][lane])
+
+
+class _EmaState(_AnchoredLaneState):
+    """Mirror ``bot_service._ema_series``: SMA seed, then the EMA recurrence."""
+
+    def __init__(self, book: "ReplayIndicatorBook", period: int) -> None:
+        super().__init__(book, period)
+        self.lane_offset = self.period - 1
+        self.output_offset = self.period - 1
+        self._multiplier = 2 / (self.period + 1)
+
+    def _update(self, lanes: np.ndarray, out: np.ndarray, index: int) -> None:
+        # ((value - current) * multiplier) + current
+        np.subtract(self._book.close_at(index), lanes, out=out)
+        np.multiply(out, self._multiplier, out=out)
+        np.add(out, lanes, out=out)
+
+    def _seed(self, anchor: int, index: int) -> tuple[float, ...]:
+        return (bot_service_module._average(self._book.closes(anchor, index + 1)),)
+
+
+class _RsiState(_AnchoredLaneState):
+    """Mirror ``bot_service._rsi_series`` Wilder gain/loss smoothing."""
+
+    lane_fields = 2
+
+    def __init__(self, book: "ReplayIndicatorBook", period: int) -> None:
+        super().__init__(book, period)
+        self.lane_offset = self.period
+        self.output_offset = self.period
+
+    def _update(self, lanes: np.ndarray, out: np.ndarray, index: int) -> None:
+        change = self._book.close_at(index) - self._book.close_at(index - 1)
+        increments = np.array([[max(change, 0.0)], [max(-change, 0.0)]])
+        _wilder_smooth(lanes, increments, self.period, out)
+
+    def _seed(self, anchor: int, index: int) -> tuple[float, ...]:
+        closes = self._book.closes(anchor, index + 1)
+        gains: list[float] = []
+        losses: list[float] = []
+        for position in range(1, len(closes)):
+            change = closes[position] - closes[position - 1]
+            gains.append(max(change, 0.0))
+            losses.append(max(-change, 0.0))
+        return (
+            bot_service_module._average(gains),
+            bot_service_module._average(losses),
+        )
+
+    def _output(self, lanes: np.ndarray, lane: int) -> Any:
+        return bot_service_module._wilder_rsi(float(lanes[0][lane]), float(lanes[1][lane]))
+
+
+class _AtrState(_AnchoredLaneState):
+    """Mirror ``bot_service._atr_series``; a window's first range ignores prior bars."""
+
+    def __init__(self, book: "ReplayIndicatorBook", period: int) -> None:
+        super().__init__(book, period)
+        self.lane_offset = self.period - 1
+        self.output_offset = self.period - 1
+
+    def _update(self, lanes: np.ndarray, out: np.ndarray, index: int) -> None:
+        _wilder_smooth(lanes, self._book.true_range_at(index), self.period, out)
+
+    def _seed(self, anchor: int, index: int) -> tuple[float, ...]:
+        true_ranges = [self._book.high_at(anchor) - self._book.low_at(anchor)]
+        true_ranges.extend(
+            self._book.true_range_at(position) for position in range(anchor + 1, index + 1)
+        )
+        return (bot_service_module._average(true_ranges),)
+
+
+class _AdxState(_AnchoredLaneState):
+    """Mirror ``bot_service._adx_series`` two-stage Wilder smoothing.
+
+    Lanes start with the directional-movement sums at ``anchor + period`` and
+    seed ADX from their own first ``period`` DX values at
+    ``anchor + 2 * period - 1``.
+    """
+
+    lane_fields = 4
+
+    def __init__(self, book: "ReplayIndicatorBook", period: int) -> None:
+        super().__init__(book, period)
+        self.lane_offset = self.period
+        self.output_offset = self.period * 2 - 1
+        self._dx_history: deque[tuple[int, int, np.ndarray]] = deque(maxlen=self.period)
+
+    def _reset_extra(self) -> None:
+        self._dx_history.clear()
+
+    def _update(self, lanes: np.ndarray, out: np.ndarray, index: int) -> None:
+        plus_dm, minus_dm = self._book.directional_movement_at(index)
+        increments = np.array([[self._book.true_range_at(index)], [plus_dm], [minus_dm]])
+        sums, targets = lanes[:3], out[:3]
+        # sums - (sums / period) + increments, for TR, +DM and -DM at once
+        np.divide(sums, self.period, out=targets)
+        np.subtract(sums, targets, out=targets)
+        np.add(targets, increments, out=targets)
+        out[3] = lanes[3]
+
+    def _seed(self, anchor: int, index: int) -> tuple[float, ...]:
+        true_ranges: list[float] = []
+        plus_values: list[float] = []
+        minus_values: list[float] = []
+        for position in range(anchor + 1, index + 1):
+            plus_dm, minus_dm = self._book.directional_movement_at(position)
+            true_ranges.append(self._book.true_range_at(position))
+            plus_values.append(plus_dm)
+            minus_values.append(minus_dm)
+        return (sum(true_ranges), sum(plus_values), sum(minus_values), np.nan)
+
+    def _step(self, index: int) -> None:
+        seeded_before = self._lane_count
+        super()._step(index)
+        lane_count = self._lane_count
+        if lane_count == 0:
+            return
+        # Views into the row this bar just wrote, so ADX is smoothed in place.
+        smoothed_tr, smoothed_plus_dm, smoothed_minus_dm, adx = self._lanes()
+        dx = _directional_movement_dx(smoothed_tr, smoothed_plus_dm, smoothed_minus_dm)
+        self._dx_history.append((index, self._first_anchor, dx))
+
+        period = self.period
+        # Lanes whose first ADX value is older than this bar continue smoothing.
+        continuing = min(max(index - (period * 2 - 1) - self._first_anchor, 0), seeded_before)
+        if continuing:
+            adx[:continuing] = ((adx[:continuing] * (period - 1)) + dx[:continuing]) / period
+        seeding_anchor = index - (period * 2 - 1)
+        seeding_lane = seeding_anchor - self._first_anchor
+        if 0 <= seeding_lane < lane_count and len(self._dx_history) == period:
+            first_window: list[float] = []
+            for dx_index, first_anchor, values in self._dx_history:
+                lane = seeding_anchor - first_anchor
+                if dx_index != seeding_anchor + period + len(first_window):
+                    break
+                if lane < 0 or lane >= len(values):
+                    break
+                first_window.append(float(values[lane]))
+            if len(first_window) == period:
+                adx[seeding_lane] = bot_service_module._average(first_window)
+
+    def _output(self, lanes: np.ndarray, lane: int) -> Any:
+        value = float(lanes[3][lane])
+        return _MISSING if np.isnan(value) else value
+
+
+def _wilder_smooth(
+    current: np.ndarray, increment: float | np.ndarray, period: int, out: np.ndarray
+) -> None:
+    """``((current * (period - 1)) + increment) / period`` written into ``out``."""
+
+    np.multiply(current, period - 1, out=out)
+    np.add(out, increment, out=out)
+    np.divide(out, period, out=out)
+
+
+def _directional_movement_dx(
+    smoothed_tr: np.ndarray,
+    smoothed_plus_dm: np.ndarray,
+    smoothed_minus_dm: np.ndarray,
+) -> np.ndarray:
+    """Vector form of ``bot_service._directional_movement_dx``."""
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        plus_di = 100 * smoothed_plus_dm / smoothed_tr
+        minus_di = 100 * smoothed_minus_dm / smoothed_tr
+        denominator = plus_di + minus_di
+        dx = np.abs(plus_di - minus_di) / denominator * 100
+    return np.where((smoothed_tr <= 0) | ~(denominator > 0), 0.0, dx)
+
+
+class _SessionVwapState:
+    """Session VWAP accumulated once per closed bar from the first bar seen."""
+
+    def __init__(self, book: "ReplayIndicatorBook", session_start_time: str | None) -> None:
+        self._book = book
+        self._session_start_time = session_start_time
+        self._base = 0
+        self._end: int | None = None
+        self._keys: list[str] = []
+        self._values: list[float | None] = []
+        self._session_starts: list[int] = []
+        self._cumulative_volume = 0.0
+        self._cumulative_price_volume = 0.0
+        self._current_vwap: float | None = None
+
+    def advance(self, start: int, end: int) -> None:
+        if (
+            self._end is None
+            or start < self._base
+            or start > self._end
+            or end < self._end
+        ):
+            self._base = start
+            self._end = start
+            self._keys = []
+            self._values = []
+            self._session_starts = []
+        elif start - self._base > max(len(self._keys) // 2, INDICATOR_TAIL_DEPTH):
+            trim = start - self._base
+            del self._keys[:trim]
+            del self._values[:trim]
+            del self._session_starts[:trim]
+            self._base = start
+        while self._end < end:
+            self._step(self._end)
+            self._end += 1
+
+    def window(
+        self,
+        candles: Sequence[Any],
+        start: int,
+        end: int,
+    ) -> tuple[list[str], Sequence[float | None]]:
+        offset = start - self._base
+        keys = self._keys[offset : end - self._base]
+        values = _SessionVwapWindow(
+            self._values[offset : end - self._base],
+            self._session_starts[offset : end - self._base],
+            start=start,
+            fallback=lambda: bot_service_module._session_vwap_values(
+                list(candles),
+                session_start_time=self._session_start_time,
+            )[1],
+        )
+        return keys, values
+
+    def _step(self, index: int) -> None:
+        session_key = bot_service_module._session_key_for_candle(
+            self._book.candle_at(index),
+            session_start_time=self._session_start_time,
+        )
+        if not self._keys or session_key != self._keys[-1]:
+            self._cumulative_volume = 0.0
+            self._cumulative_price_volume = 0.0
+            self._current_vwap = None
+            session_start = index
+        else:
+            session_start = self._session_starts[-1]
+        volume = self._book.volume_at(index)
+        if volume > 0:
+            typical_price = (
+                self._book.high_at(index) + self._book.low_at(index) + self._book.close_at(index)
+            ) / 3
+            self._cumulative_volume += volume
+            self._cumulative_price_volume += typical_price * volume
+            self._current_vwap = self._cumulative_price_volume / self._cumulative_volume
+        self._keys.append(session_key)
+        self._values.append(self._current_vwap)
+        self._session_starts.append(session_start)
+
+
+class _SessionVwapWindow(Sequence[Any]):
+    """Window VWAP values; a session cut by the window start uses the reference."""
+
+    __slots__ = ("_values", "_session_starts", "_start", "_fallback", "_reference")
+
+    def __init__(
+        self,
+        values: list[float | None],
+        session_starts: list[int],
+        *,
+        start: int,
+        fallback: Callable[[], list[float | None]],
+    ) -> None:
+        self._values = values
+        self._session_starts = session_starts
+        self._start = start
+        self._fallback = fallback
+        self._reference: list[float | None] | None = None
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+        position = index + len(self._values) if index < 0 else index
+        if position < 0 or position >= len(self._values):
+            raise IndexError("session VWAP index out of range")
+        if self._session_starts[position] >= self._start:
+            return self._values[position]
+        if self._reference is None:
+            self._reference = self._fallback()
+        return self._reference[position]
+
+    def __iter__(self) -> Iterator[Any]:
+        for position in range(len(self._values)):
+            yield self[position]
+
+
+class _IndicatorWindowSeries(Sequence[Any]):
+    """One window's indicator series, read from lane state where it is exact."""
+
+    __slots__ = ("_state", "_start", "_length", "_fallback", "_reference")
+
+    def __init__(
+        self,
+        state: _AnchoredLaneState,
+        *,
+        start: int,
+        end: int,
+        fallback: Callable[[], list[Any]],
+    ) -> None:
+        self._state = state
+        self._start = start
+        self._length = end - start
+        self._fallback = fallback
+        self._reference: list[Any] | None = None
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(self._length))]
+        position = index + self._length if index < 0 else index
+        if position < 0 or position >= self._length:
+            raise IndexError("indicator index out of range")
+        if self._reference is None:
+            value = self._state.value(self._start, self._start + position)
+            if value is not _MISSING:
+                return value
+            self._reference = self._fallback()
+        return self._reference[position]
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._reference is None:
+            self._reference = self._fallback()
+        return iter(self._reference)
+
+
+class _ReplayIndicatorCache(dict):
+    """Indicator cache that answers supported keys from replay state."""
+
+    def __init__(
+        self,
+        book: "ReplayIndicatorBook",
+        source: Sequence[Any],
+        *,
+        start: int,
+        end: int,
+        candles: bool,
+    ) -> None:
+        super().__init__()
+        self._book = book
+        self._source = source
+        self._start = start
+        self._end = end
+        self._candles = candles
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        value = dict.get(self, key, _MISSING)
+        if value is not _MISSING:
+            return value
+        value = self._book.lookup(
+            key,
+            self._source,
+            start=self._start,
+            end=self._end,
+            candles=self._candles,
+        )
+        if value is _MISSING:
+            return default
+        self[key] = value
+        return value
+
+
+class ReplayIndicatorBook:
+    """Per-replay indicator states over one immutable, closed candle stream."""
+
+    def __init__(
+        self,
+        candles: Sequence[Any],
+        *,
+        highs: np.ndarray,
+        lows: np.ndarray,
+        closes: np.ndarray,
+        volumes: np.ndarray,
+    ) -> None:
+        self._candles = candles
+        self._highs = highs
+        self._lows = lows
+        self._closes = closes
+        self._volumes = volumes
+        self._states: dict[tuple[Any, ...], Any] = {}
+        self._bollinger_points: dict[tuple[int, int, float], tuple[Any, Any, Any]] = {}
+
+    @classmethod
+    def from_candles(cls, candles: Sequence[Any]) -> "ReplayIndicatorBook":
+        """Build price arrays with the same float values evaluators read per candle."""
+
+        if getattr(candles, "_topsignal_mmap_backed", False):
+            scale = 1_000_000_000
+            return cls(
+                candles,
+                highs=np.asarray(candles.high_nano_values, dtype=np.float64) / scale,
+                lows=np.asarray(candles.low_nano_values, dtype=np.float64) / scale,
+                closes=np.asarray(candles.close_nano_values, dtype=np.float64) / scale,
+                volumes=np.asarray(candles.volume_values, dtype=np.float64),
+            )
+        count = len(candles)
+        return cls(
+            candles,
+            highs=np.fromiter((float(c.high_price) for c in candles), np.float64, count),
+            lows=np.fromiter((float(c.low_price) for c in candles), np.float64, count),
+            closes=np.fromiter((float(c.close_price) for c in candles), np.float64, count),
+            volumes=np.fromiter((float(c.volume or 0) for c in candles), np.float64, count),
+        )
+
+    def prime(self, window: Sequence[Any], *, start: int, end: int) -> None:
+        """Attach a state-backed indicator cache to one evaluator window."""
+
+        if end - start != len(window) or end <= start:
+            return
+        cache = _ReplayIndicatorCache(self, window, start=start, end=end, candles=True)
+        try:
+            setattr(window, "_topsignal_indicator_cache", cache)
+        except (AttributeError, TypeError):
+            return
+        stale_before = end - INDICATOR_TAIL_DEPTH
+        if self._bollinger_points and min(self._bollinger_points)[0] < stale_before:
+            self._bollinger_points = {
+                key: value
+                for key, value in self._bollinger_points.items()
+                if key[0] >= stale_before
+            }
+
+    def lookup(
+        self,
+        key: Any,
+        source: Sequence[Any],
+        *,
+        start: int,
+        end: int,
+        candles: bool,
+    ) -> Any:
+        if not isinstance(key, tuple) or not key:
+            return _MISSING
+        kind = key[0]
+        if candles:
+            if kind == "close_values" and len(key) == 1:
+                values = _IndicatorValues(self._closes[start:end].tolist())
+                values._topsignal_indicator_cache = _ReplayIndicatorCache(
+                    self, values, start=start, end=end, candles=False
+                )
+                return values
+            if kind == "atr" and len(key) == 2:
+                state = self._state(("atr", key[1]), _AtrState, key[1])
+                state.advance(start, end)
+                return _IndicatorWindowSeries(
+                    state,
+                    start=start,
+                    end=end,
+                    fallback=lambda: bot_service_module._atr_series(list(source), period=key[1]),
+                )
+            if kind == "adx" and len(key) == 2:
+                state = self._state(("adx", key[1]), _AdxState, key[1])
+                state.advance(start, end)
+                return _IndicatorWindowSeries(
+                    state,
+                    start=start,
+                    end=end,
+                    fallback=lambda: bot_service_module._adx_series(list(source), period=key[1]),
+                )
+            if kind == "session_vwap" and len(key) == 2:
+                state = self._states.get(key)
+                if state is None:
+                    state = _SessionVwapState(self, key[1])
+                    self._states[key] = state
+                state.advance(start, end)
+                return state.window(source, start, end)
+            return _MISSING
+
+        if kind == "ema" and len(key) == 2:
+            state = self._state(("ema", key[1]), _EmaState, key[1])
+            state.advance(start, end)
+            return _IndicatorWindowSeries(
+                state,
+                start=start,
+                end=end,
+                fallback=lambda: bot_service_module._ema_series(list(source), key[1]),
+            )
+        if kind == "rsi" and len(key) == 2:
+            state = self._state(("rsi", key[1]), _RsiState, key[1])
+            state.advance(start, end)
+            return _IndicatorWindowSeries(
+                state,
+                start=start,
+                end=end,
+                fallback=lambda: bot_service_module._rsi_series(list(source), period=key[1]),
+            )
+        if kind == "bollinger_at" and len(key) == 4:
+            _kind, index, period, multiplier = key
+            absolute_index = start + int(index)
+            point_key = (absolute_index, int(period), float(multiplier))
+            point = self._bollinger_points.get(point_key)
+            if point is None:
+                # A band point only depends on its own trailing closes, never on
+                # where the window starts, so neighbouring windows share it.
+                point = bot_service_module._bollinger_band_at(
+                    self.closes(absolute_index - int(period) + 1, absolute_index + 1),
+                    index=-1,
+                    period=int(period),
+                    stddev_multiplier=float(multiplier),
+                )
+                self._bollinger_points[point_key] = point
+            return point
+        return _MISSING
+
+    def _state(self, key: tuple[Any, ...], factory: type[_AnchoredLaneState], period: int) -> Any:
+        state = self._states.get(key)
+        if state is None:
+            state = factory(self, int(period))
+            self._states[key] = state
+        return state
+
+    def candle_at(self, index: int) -> Any:
+        return self._candles[index]
+
+    def closes(self, start: int, end: int) -> list[float]:
+        return self._closes[start:end].tolist()
+
+    def close_at(self, index: int) -> float:
+        return float(self._closes[index])
+
+    def high_at(self, index: int) -> float:
+        return float(self._highs[index])
+
+    def low_at(self, index: int) -> float:
+        return float(self._lows[index])
+
+    def volume_at(self, index: int) -> float:
+        return float(self._volumes[index])
+
+    def true_range_at(self, index: int) -> float:
+        high = float(self._highs[index])
+        low = float(self._lows[index])
+        previous_close = float(self._closes[index - 1])
+        return max(high - low, abs(high - previous_close), abs(low - previous_close))
+
+    def directional_movement_at(self, index: int) -> tuple[float, float]:
+        up_move = float(self._highs[index]) - float(self._highs[index - 1])
+        down_move = float(self._lows[index - 1]) - float(self._lows[index])
+        plus_dm = up_move if up_move > down_move and up_move > 0 else 0.0
+        minus_dm = down_move if down_move > up_move and down_move > 0 else 0.0
+        return plus_dm, minus_dm
@@ -5620,10 +5620,12 @@ def evaluate_vwap_atr_mean_reversion(
             raw_payload=raw_payload,
         )
 
+    # Closed candles are time ordered, so the latest session is a contiguous suffix.
+    current_session_start = len(session_keys) - 1
+    while current_session_start > 0 and session_keys[current_session_start - 1] == session_key:
+        current_session_start -= 1
     current_session_vwaps = [
-        value
-        for index, value in enumerate(session_vwaps)
-        if session_keys[index] == session_key and value is not None
+        value for value in session_vwaps[current_session_start:] if value is not None
     ]
     if len(current_session_vwaps) < vwap_slope_bars + 1:
         raw_payload["session_vwap_points"] = len(current_session_vwaps)
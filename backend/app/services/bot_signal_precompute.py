@@ -0,0 +1,183 @@
+"""Whole-series signal precomputes for closed-bar backtest replay.
+
+A strategy registered with a ``signal_precompute`` computes its BUY/SELL/HOLD
+decision for every closed bar in one vectorized pass over the replay price
+arrays.  The engine then reads decisions by index and only materializes a
+``SignalResult`` for entry signals.  The per-bar evaluator in ``bot_service``
+remains the reference implementation: a precompute must reproduce its actions,
+prices and payload floats exactly, which the replay parity tests enforce.
+
+Only ``sma_cross`` has a precompute so far; it is the pilot for this path.
+The other backtestable strategies seed their EMA/RSI/ATR indicators from the
+start of each rolling history window, so one pass over the whole series
+does not reproduce their evaluators exactly. They replay per bar from incremental
+indicator state instead. Bracket and stop levels are not precomputed either:
+they are still read from the ``SignalResult`` of each entry bar.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+
+from . import bot_service as bot_service_module
+from .bot_service import SignalResult
+
+
+SIGNAL_HOLD = 0
+SIGNAL_BUY = 1
+SIGNAL_SELL = -1
+_PRICE_SCALE = 1_000_000_000
+# Python 3.12 switched float ``sum`` to compensated summation.  Vectorized
+# rolling sums only reproduce ``bot_service._average`` when ``sum`` adds left to
+# right; otherwise each window is averaged through the reference helper.
+_SEQUENTIAL_FLOAT_SUM = sum([1e16, 1.0, -1e16]) == 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class SignalPrecomputeInput:
+    """Closed replay bars as float arrays carrying the evaluator's candle values."""
+
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    start_times: Sequence[datetime]
+    fast_period: int
+    slow_period: int
+    strategy_params: Any
+    history_limit: int
+
+    @classmethod
+    def from_candles(
+        cls,
+        candles: Sequence[Any],
+        *,
+        start_times: Sequence[datetime],
+        fast_period: int,
+        slow_period: int,
+        strategy_params: Any,
+        history_limit: int,
+    ) -> "SignalPrecomputeInput":
+        if getattr(candles, "_topsignal_mmap_backed", False):
+            arrays = {
+                name: np.asarray(getattr(candles, f"{name}_nano_values"), dtype=np.float64)
+                / _PRICE_SCALE
+                for name in ("open", "high", "low", "close")
+            }
+            volume = np.asarray(candles.volume_values, dtype=np.float64)
+        else:
+            count = len(candles)
+            arrays = {
+                name: np.fromiter(
+                    (float(getattr(candle, f"{name}_price")) for candle in candles),
+                    dtype=np.float64,
+                    count=count,
+                )
+                for name in ("open", "high", "low", "close")
+            }
+            volume = np.fromiter(
+                (float(candle.volume or 0) for candle in candles),
+                dtype=np.float64,
+                count=count,
+            )
+        return cls(
+            open=arrays["open"],
+            high=arrays["high"],
+            low=arrays["low"],
+            close=arrays["close"],
+            volume=volume,
+            start_times=start_times,
+            fast_period=int(fast_period),
+            slow_period=int(slow_period),
+            strategy_params=strategy_params,
+            history_limit=int(history_limit),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class PrecomputedSignals:
+    """Per-bar decisions indexed by the latest closed bar's absolute index."""
+
+    actions: np.ndarray
+    signal_builder: Callable[[int], SignalResult] = field(repr=False)
+
+    def entry_signal(self, closed_count: int) -> SignalResult | None:
+        """Return the reference ``SignalResult`` for BUY/SELL bars, else ``None``."""
+
+        if closed_count <= 0 or int(self.actions[closed_count - 1]) == SIGNAL_HOLD:
+            return None
+        return self.signal_builder(closed_count)
+
+
+def _rolling_means(values: np.ndarray, period: int) -> np.ndarray:
+    """``means[i] == _average(values[i : i + period])`` for every full window."""
+
+    window_count = len(values) - period + 1
+    if window_count <= 0:
+        return np.empty(0, dtype=np.float64)
+    if not _SEQUENTIAL_FLOAT_SUM:
+        python_values = values.tolist()
+        return np.fromiter(
+            (
+                bot_service_module._average(python_values[index : index + period])
+                for index in range(window_count)
+            ),
+            dtype=np.float64,
+            count=window_count,
+        )
+    total = 0.0 + values[:window_count]
+    for offset in range(1, period):
+        total = total + values[offset : offset + window_count]
+    return total / period
+
+
+def precompute_sma_cross_signals(prepared: SignalPrecomputeInput) -> PrecomputedSignals:
+    """Vectorized ``evaluate_sma_cross`` over every replay bar."""
+
+    fast_period = prepared.fast_period
+    slow_period = prepared.slow_period
+    bot_service_module._validate_strategy_periods(fast_period, slow_period)
+    closes = prepared.close
+    count = len(closes)
+    actions = np.zeros(count, dtype=np.int8)
+    fast_means = _rolling_means(closes, fast_period)
+    slow_means = _rolling_means(closes, slow_period)
+    if prepared.history_limit >= slow_period + 1 and count >= slow_period + 1:
+        # For ``closed_count`` k the current mean covers closes[k - period : k]
+        # and the previous mean closes[k - period - 1 : k - 1].
+        closed_counts = np.arange(slow_period + 1, count + 1)
+        current_fast = fast_means[closed_counts - fast_period]
+        previous_fast = fast_means[closed_counts - fast_period - 1]
+        current_slow = slow_means[closed_counts - slow_period]
+        previous_slow = slow_means[closed_counts - slow_period - 1]
+        buy = (previous_fast <= previous_slow) & (current_fast > current_slow)
+        sell = ~buy & (previous_fast >= previous_slow) & (current_fast < current_slow)
+        latest_indexes = closed_counts - 1
+        actions[latest_indexes[buy]] = SIGNAL_BUY
+        actions[latest_indexes[sell]] = SIGNAL_SELL
+
+    def build_signal(closed_count: int) -> SignalResult:
+        latest_index = closed_count - 1
+        action = "BUY" if int(actions[latest_index]) == SIGNAL_BUY else "SELL"
+        return SignalResult(
+            action=action,
+            reason=f"{fast_period}/{slow_period} SMA crossover generated {action}.",
+            candle_timestamp=prepared.start_times[latest_index],
+            price=float(closes[latest_index]),
+            raw_payload={
+                "fast_period": fast_period,
+                "slow_period": slow_period,
+                "previous_fast": float(fast_means[closed_count - fast_period - 1]),
+                "previous_slow": float(slow_means[closed_count - slow_period - 1]),
+                "current_fast": float(fast_means[closed_count - fast_period]),
+                "current_slow": float(slow_means[closed_count - slow_period]),
+            },
+        )
+
+    return PrecomputedSignals(actions=actions, signal_builder=build_signal)
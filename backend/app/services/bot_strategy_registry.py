@@ -55,6 +55,12 @@ def _bot_service_module() -> Any:
     return import_module(".bot_service", package=__package__)
 
 
+@lru_cache(maxsize=1)
+def _signal_precompute_module() -> Any:
+    # Replay-only numpy precomputes import bot_service, so resolve them lazily too.
+    return import_module(".bot_signal_precompute", package=__package__)
+
+
 @dataclass(frozen=True)
 class LazyParameterNormalizer:
     identifier: str
@@ -100,6 +106,17 @@ class LazyEvaluator:
         return evaluator(*args, **kwargs)
 
 
+@dataclass(frozen=True)
+class LazySignalPrecompute:
+    """Whole-series replay signals that must match ``evaluator`` bar for bar."""
+
+    callable_name: str
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        precompute = getattr(_signal_precompute_module(), self.callable_name)
+        return precompute(*args, **kwargs)
+
+
 @dataclass(frozen=True)
 class MinimumHistoryResolver:
     identifier: str
@@ -140,6 +157,7 @@ class StrategyDefinition:
     evaluator: Callable[..., Any]
     auxiliary_data_requirements: tuple[str, ...]
     backtesting_supported: bool = False
+    signal_precompute: Callable[..., Any] | None = None
 
 
 def _configured(
@@ -190,6 +208,8 @@ def _definition(
     evaluator_name: str,
     required_timeframes: tuple[TimeframeRequirement, ...],
     auxiliary_data_requirements: tuple[str, ...] = (),
+    *,
+    signal_precompute: str | None = None,
 ) -> StrategyDefinition:
     return StrategyDefinition(
         identifier=identifier,
@@ -200,6 +220,9 @@ def _definition(
         evaluator=LazyEvaluator(evaluator_name),
         auxiliary_data_requirements=auxiliary_data_requirements,
         backtesting_supported=identifier in BACKTEST_SUPPORTED_STRATEGY_IDENTIFIERS,
+        signal_precompute=(
+            LazySignalPrecompute(signal_precompute) if signal_precompute else None
+        ),
     )
 
 
@@ -210,7 +233,14 @@ _DEFINITIONS = (
         (_configured(notes="Primary chart stream; configured source strategies may acquire auxiliary streams."),),
         ("dynamic_source_strategies", "source_trade_plan_scores"),
     ),
-    _definition("sma_cross", "evaluate_sma_cross", (_configured(),)),
+    # The only registered precompute; see ``bot_signal_precompute`` for why
+    # the window-seeded indicator strategies replay per bar.
+    _definition(
+        "sma_cross",
+        "evaluate_sma_cross",
+        (_configured(),),
+        signal_precompute="precompute_sma_cross_signals",
+    ),
     _definition(
         "support_resistance",
         "evaluate_support_resistance_levels",
@@ -3,14 +3,17 @@ from __future__ import annotations
 import gc
 import hashlib
 import json
+import multiprocessing
 import os
 import re
 import shutil
 import threading
+import time
 import uuid
-from bisect import bisect_right
+from bisect import bisect_left, bisect_right
 from collections import OrderedDict, defaultdict
-from dataclasses import asdict, dataclass, field
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import asdict, dataclass, field, replace
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Iterable, Iterator, Mapping, Sequence
@@ -28,6 +31,20 @@ from databento_dbn import (
     StatMsg,
 )
 
+from .databento_records import (
+    UNIX_EPOCH_ORDINAL,
+    DbnArrayError,
+    DbnLayoutUnsupportedError,
+    calendar_day_ordinals,
+    invalid_ohlcv_rows,
+    read_ohlcv_arrays,
+    session_ordinals,
+)
+from .databento_shared_slices import (
+    SharedSliceLease,
+    get_shared_slice_registry,
+    shared_slices_supported,
+)
 from .trading_day import trading_day_bounds_utc, trading_day_date
 
 
@@ -72,6 +89,17 @@ _ARRAY_DTYPES: Mapping[str, np.dtype[Any]] = {
     "raw_symbol_code": np.dtype(np.uint32),
     "session_ordinal": np.dtype(np.int32),
 }
+# Columns kept by each downsampling pyramid level; a level bar spans several
+# source bars, so per-bar contract identity is not carried.
+_PYRAMID_COLUMNS = (
+    "timestamp_ns",
+    "close_timestamp_ns",
+    "open_nano",
+    "high_nano",
+    "low_nano",
+    "close_nano",
+    "volume",
+)
 _UINT64_MAX = (1 << 64) - 1
 _SERIES_VALIDATION_CHUNK_ROWS = 1_000_000
 # The hot LRU is a hard working-set guard, so charge conservatively above the
@@ -79,6 +107,29 @@ _SERIES_VALIDATION_CHUNK_ROWS = 1_000_000
 # put the process beyond the configured byte ceiling.
 _EAGER_CANDLE_ESTIMATED_BYTES = 640
 _DEFAULT_PROXY_CACHE_ROWS = 16_384
+# Archive decoding is CPU bound in the DBN decoder and Parquet encoder; beyond
+# a handful of processes the build is limited by disk throughput instead.
+_DEFAULT_BUILD_WORKERS = max(1, min(8, os.cpu_count() or 1))
+# Each cached timeframe index holds four int64 values per bucket.
+_RESAMPLE_INDEX_MAX_TIMEFRAMES = 8
+_DECODED_ARCHIVE_FORMAT = 2
+_PARQUET_DIRS_BY_SCHEMA = {
+    "definition": "definitions",
+    "ohlcv-1m": "ohlcv_1m",
+    "statistics": "statistics",
+}
+_ROW_KEPT = 0
+_ROW_MAPPING_MISSING = 1
+_ROW_OUTRIGHT_MISSING = 2
+_ROW_SPREAD = 3
+_INTEGRITY_LEDGER = "integrity.json"
+_INTEGRITY_LEDGER_FORMAT = 1
+# Rewritten in place after publish, so never ledgered.
+_UNLEDGERED_FILES = frozenset({"manifest.json", _INTEGRITY_LEDGER})
+# A file edited within the filesystem's timestamp granularity of its record
+# can keep the recorded mtime. Recording waits this long after the newest
+# write, and verification re-hashes any record taken closer than that.
+_INTEGRITY_SETTLE_NS = 100_000_000
 _MMAP_STORAGE_BYTES_PER_ROW = sum(
     int(_ARRAY_DTYPES[name].itemsize) for name in _ARRAY_COLUMNS
 )
@@ -114,6 +165,21 @@ class ArchiveDescriptor:
     end_ns: int
 
 
+@dataclass(frozen=True)
+class CacheVerifyResult:
+    cache_root: str
+    version_dir: str
+    deep: bool
+    files_checked: int
+    unledgered_files: int
+    series_checked: int
+    problems: tuple[str, ...]
+
+    @property
+    def ok(self) -> bool:
+        return not self.problems
+
+
 @dataclass(frozen=True)
 class CacheBuildResult:
     cache_root: str
@@ -124,6 +190,7 @@ class CacheBuildResult:
     archive_count: int
     records_by_schema: Mapping[str, int]
     reused: bool
+    reused_archive_count: int = 0
 
 
 @dataclass(frozen=True)
@@ -213,6 +280,10 @@ class _MappedSeries:
     _lease_count: int = field(default=0, init=False, repr=False)
     _retired: bool = field(default=False, init=False, repr=False)
     _closed: bool = field(default=False, init=False, repr=False)
+    _pyramid: "_SeriesPyramid | None" = field(default=None, init=False, repr=False)
+    _pyramid_loaded: bool = field(default=False, init=False, repr=False)
+    # Set when ``arrays`` live in a host-wide shared segment.
+    shared_lease: SharedSliceLease | None = field(default=None, repr=False)
 
     @classmethod
     def open(
@@ -221,7 +292,20 @@ class _MappedSeries:
         *,
         expected_entry: Mapping[str, Any],
         expected_source_fingerprint: str,
+        ledger: "_IntegrityLedger | None" = None,
     ) -> "_MappedSeries":
+        """Map and validate a series directory.
+
+        The row-by-row content checks are skipped when ``ledger`` vouches for
+        every file; files that differ from their record are scanned and then
+        rejected even if the scan passes.
+        """
+
+        ledger_state = (
+            ledger.check_all(_series_file_paths(directory))
+            if ledger is not None
+            else None
+        )
         metadata = _read_json(directory / "metadata.json")
         arrays: dict[str, np.ndarray] = {}
         try:
@@ -233,6 +317,7 @@ class _MappedSeries:
                 arrays=arrays,
                 expected_entry=expected_entry,
                 expected_source_fingerprint=expected_source_fingerprint,
+                check_content=ledger_state is not True,
             )
             raw_by_code = metadata.get("raw_symbols_by_code")
             if isinstance(raw_by_code, dict):
@@ -251,16 +336,21 @@ class _MappedSeries:
                 raise DatabentoCacheError(
                     f"databento_series_raw_symbol_mapping_missing:{directory}"
                 )
-            known_codes = set(raw_symbols_by_code)
-            raw_codes = arrays["raw_symbol_code"]
-            for start in range(0, int(raw_codes.size), _SERIES_VALIDATION_CHUNK_ROWS):
-                stop = min(
-                    int(raw_codes.size), start + _SERIES_VALIDATION_CHUNK_ROWS
-                )
-                if any(int(code) not in known_codes for code in np.unique(raw_codes[start:stop])):
-                    raise DatabentoCacheError(
-                        f"databento_series_raw_symbol_code_unknown:{directory}"
+            if ledger_state is not True:
+                known_codes = set(raw_symbols_by_code)
+                raw_codes = arrays["raw_symbol_code"]
+                for start in range(0, int(raw_codes.size), _SERIES_VALIDATION_CHUNK_ROWS):
+                    stop = min(
+                        int(raw_codes.size), start + _SERIES_VALIDATION_CHUNK_ROWS
                     )
+                    if any(int(code) not in known_codes for code in np.unique(raw_codes[start:stop])):
+                        raise DatabentoCacheError(
+                            f"databento_series_raw_symbol_code_unknown:{directory}"
+                        )
+            if ledger_state is False:
+                raise DatabentoCacheError(
+                    f"databento_series_integrity_mismatch:{directory}"
+                )
         except Exception:
             for array in arrays.values():
                 _close_memmap(array)
@@ -272,6 +362,16 @@ class _MappedSeries:
             raw_symbols_by_code=raw_symbols_by_code,
         )
 
+    def pyramid(self) -> "_SeriesPyramid | None":
+        """Open the series' downsampling pyramid on first use, if it has one."""
+
+        if not self._pyramid_loaded:
+            self._pyramid = _SeriesPyramid.open(
+                self.directory, self.metadata.get("pyramid_levels")
+            )
+            self._pyramid_loaded = True
+        return self._pyramid
+
     def acquire(self) -> "_MappedSeriesLease":
         with self._lease_lock:
             if self._closed:
@@ -315,6 +415,53 @@ class _MappedSeries:
         # the final array/view is collected, while versioned cache files make
         # delayed OS-handle release safe during source invalidation.
         self.arrays.clear()
+        if self.shared_lease is not None:
+            self.shared_lease.release()
+
+
+@dataclass(frozen=True)
+class _SeriesPyramid:
+    """Power-of-two OHLCV levels stored next to one mmap series.
+
+    Level ``factor`` row ``i`` aggregates series rows ``[i * factor,
+    (i + 1) * factor)``; every level is concatenated into one array per column.
+    """
+
+    levels: Mapping[int, tuple[int, int]]
+    arrays: Mapping[str, np.ndarray]
+
+    @classmethod
+    def open(cls, directory: Path, declared: Any) -> "_SeriesPyramid | None":
+        if not isinstance(declared, list) or not declared:
+            return None
+        try:
+            levels = {
+                int(level["factor"]): (int(level["offset"]), int(level["rows"]))
+                for level in declared
+            }
+            total_rows = sum(rows for _offset, rows in levels.values())
+            arrays = {
+                name: np.load(directory / "pyramid" / f"{name}.npy", mmap_mode="r")
+                for name in _PYRAMID_COLUMNS
+            }
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if any(
+            array.shape != (total_rows,) or array.dtype != _ARRAY_DTYPES[name]
+            for name, array in arrays.items()
+        ):
+            return None
+        return cls(levels=levels, arrays=arrays)
+
+    def level(self, factor: int, start: int, stop: int) -> dict[str, np.ndarray] | None:
+        bounds = self.levels.get(int(factor))
+        if bounds is None or stop > bounds[1]:
+            return None
+        offset = bounds[0]
+        return {
+            name: array[offset + start : offset + stop]
+            for name, array in self.arrays.items()
+        }
 
 
 class _MappedSeriesLease:
@@ -538,6 +685,22 @@ class MmapReplayCandle:
     __hash__ = None
 
 
+def downsample_factor(count: int, max_points: int) -> int:
+    """Smallest power-of-two bucket that fits ``count`` bars in ``max_points``.
+
+    A window that does not start on a bucket boundary gains one partial
+    bucket, so the bound leaves room for it.
+    """
+
+    limit = max(2, int(max_points))
+    if count <= limit:
+        return 1
+    factor = 2
+    while -(-count // factor) + 1 > limit:
+        factor *= 2
+    return factor
+
+
 class MmapCandleSequence(Sequence[MmapReplayCandle]):
     """O(1) read-only view over one contiguous interval of mmap arrays."""
 
@@ -702,6 +865,10 @@ class MmapCandleSequence(Sequence[MmapReplayCandle]):
     def session_ordinal_values(self) -> np.ndarray:
         return self._array_view("session_ordinal")
 
+    @property
+    def raw_symbols_by_code(self) -> Mapping[int, str]:
+        return self._raw_symbols_by_code
+
     def search_start(self, value: datetime | int, *, side: str = "left") -> int:
         return self._search("timestamp_ns", value, side=side)
 
@@ -725,6 +892,65 @@ class MmapCandleSequence(Sequence[MmapReplayCandle]):
             right=absolute_right,
         )
 
+    def downsampled_columns(self, max_points: int) -> dict[str, np.ndarray]:
+        """Aggregate the view into at most ``max_points`` bars.
+
+        Buckets are power-of-two runs aligned to the whole series, so the same
+        window always yields the same bars and interior buckets are read from
+        the series' pyramid. Highs and lows are true extremes of every source
+        bar; only partial edge buckets are reduced from the source rows.
+        """
+
+        return self.bucketed_columns(downsample_factor(len(self), max_points))
+
+    def bucketed_columns(self, factor: int) -> dict[str, np.ndarray]:
+        """Aggregate the view into series-aligned buckets of ``factor`` bars."""
+
+        left, right = self._left, self._right
+        factor = int(factor)
+        if factor <= 1:
+            return {name: self._array_view(name) for name in _PYRAMID_COLUMNS}
+        full_start = min(-(-left // factor), right // factor)
+        full_stop = right // factor
+        pyramid = self._lease.mapped.pyramid()
+        interior = (
+            pyramid.level(factor, full_start, full_stop)
+            if pyramid is not None and full_stop > full_start
+            else None
+        )
+        if interior is None:
+            boundaries = np.arange(
+                -(-left // factor) * factor, right, factor, dtype=np.int64
+            )
+            if not boundaries.size or boundaries[0] != left:
+                boundaries = np.concatenate(
+                    (np.array([left], dtype=np.int64), boundaries)
+                )
+            return _pyramid_level(self._source_columns(left, right), boundaries - left)
+        parts = []
+        if left < full_start * factor:
+            parts.append(
+                _pyramid_level(
+                    self._source_columns(left, full_start * factor),
+                    np.zeros(1, dtype=np.int64),
+                )
+            )
+        parts.append(interior)
+        if full_stop * factor < right:
+            parts.append(
+                _pyramid_level(
+                    self._source_columns(full_stop * factor, right),
+                    np.zeros(1, dtype=np.int64),
+                )
+            )
+        return {
+            name: np.concatenate([part[name] for part in parts])
+            for name in _PYRAMID_COLUMNS
+        }
+
+    def _source_columns(self, left: int, right: int) -> dict[str, np.ndarray]:
+        return {name: self._arrays[name][left:right] for name in _PYRAMID_COLUMNS}
+
     def _array_view(self, name: str) -> np.ndarray:
         return self._arrays[name][self._left : self._right]
 
@@ -807,7 +1033,15 @@ def _materialize_mapped_slice(
 
 
 class DatabentoReplayStore:
-    """Thread-safe mmap reader with binary slicing and a byte-bounded hot LRU."""
+    """Thread-safe mmap reader with binary slicing and a byte-bounded hot LRU.
+
+    Timeframes missing from the manifest are served from the 1m series: each
+    requested slice is aggregated on demand and cached in the same LRU, unless
+    ``build_missing_timeframes`` asks for a persisted series instead. With
+    ``shared`` those aggregated arrays are published to host-wide shared
+    memory, so other worker processes attach to them instead of aggregating
+    their own copy.
+    """
 
     def __init__(
         self,
@@ -816,6 +1050,7 @@ class DatabentoReplayStore:
         max_entries: int | None = None,
         max_bytes: int | None = None,
         build_missing_timeframes: bool = False,
+        shared: bool | None = None,
     ) -> None:
         self.cache_root = _resolve_cache_root(cache_root)
         self.max_entries = _positive_int_setting(
@@ -829,14 +1064,19 @@ class DatabentoReplayStore:
             default=512 * 1024 * 1024,
         )
         self.build_missing_timeframes = bool(build_missing_timeframes)
+        self.shared = _bool_setting(
+            shared, env_name="TOPSIGNAL_DATABENTO_SHARED_SLICES", default=False
+        ) and shared_slices_supported()
         self._lock = threading.RLock()
         self._pointer_signature: tuple[int, int, int, int, int] | None = None
         self._manifest: dict[str, Any] | None = None
         self._version_dir: Path | None = None
+        self._ledger: _IntegrityLedger | None = None
         self._mapped: OrderedDict[str, _MappedSeries] = OrderedDict()
         self._slices: OrderedDict[
-            tuple[Any, ...], tuple[CachedCandleList, int]
+            tuple[Any, ...], tuple[CachedCandleList | _MappedSeries, int]
         ] = OrderedDict()
+        self._resample_indexes: OrderedDict[str, _ResampleIndex] = OrderedDict()
         self._slice_bytes = 0
         self._hits = 0
         self._misses = 0
@@ -999,6 +1239,18 @@ class DatabentoReplayStore:
         if entry is None and self.build_missing_timeframes:
             manifest = self._build_missing_series(root, normalized_unit, number)
             entry = self._series_entry(manifest, root, normalized_unit, number)
+        minute_entry = self._series_entry(manifest, root, "minute", 1)
+        if entry is None and minute_entry is not None:
+            return self._resolve_resampled_slice(
+                manifest,
+                minute_entry,
+                root=root,
+                unit=normalized_unit,
+                unit_number=number,
+                start=start,
+                end=end,
+                closed_by=closed_by,
+            )
         if entry is None:
             raise DatabentoCacheMissingError(
                 f"databento_timeframe_cache_missing:{root}:{timeframe_key(normalized_unit, number)}: "
@@ -1006,7 +1258,6 @@ class DatabentoReplayStore:
             )
         mapped = self._open_series(entry)
         start_ns = _datetime_to_ns(_as_utc(start))
-        minute_entry = self._series_entry(manifest, root, "minute", 1)
         if (
             minute_entry is not None
             and start_ns <= int(minute_entry["first_timestamp_ns"])
@@ -1033,6 +1284,94 @@ class DatabentoReplayStore:
         )
         return root, normalized_unit, number, mapped, left, max(left, right)
 
+    def _resolve_resampled_slice(
+        self,
+        manifest: Mapping[str, Any],
+        minute_entry: Mapping[str, Any],
+        *,
+        root: str,
+        unit: str,
+        unit_number: int,
+        start: datetime,
+        end: datetime,
+        closed_by: datetime,
+    ) -> tuple[str, str, int, _MappedSeries, int, int]:
+        minute = self._open_series(minute_entry)
+        minute_fingerprint = str(minute_entry["series_fingerprint"])
+        index = self._resample_indexes.get(minute_fingerprint)
+        if index is None:
+            index = _ResampleIndex.from_arrays(minute.arrays)
+            self._resample_indexes[minute_fingerprint] = index
+            while len(self._resample_indexes) > len(SUPPORTED_ROOTS):
+                self._resample_indexes.popitem(last=False)
+        else:
+            self._resample_indexes.move_to_end(minute_fingerprint)
+        groups = index.groups(unit, unit_number)
+        start_ns = _datetime_to_ns(_as_utc(start))
+        if groups.size and start_ns <= int(minute_entry["first_timestamp_ns"]):
+            start_ns = min(start_ns, int(groups.timestamp_ns[0]))
+        requested_end_ns = min(
+            _datetime_to_ns(_as_utc(end)),
+            _datetime_to_ns(_as_utc(closed_by)),
+            int(minute_entry["source_end_ns"]),
+        )
+        left = int(np.searchsorted(groups.timestamp_ns, start_ns, side="left"))
+        right = max(
+            left,
+            int(
+                np.searchsorted(
+                    groups.close_timestamp_ns, requested_end_ns, side="right"
+                )
+            ),
+        )
+        series_fingerprint = _series_fingerprint(
+            str(manifest["source_fingerprint"]), root, unit, unit_number
+        )
+        key = ("resampled", series_fingerprint, left, right)
+        cached = self._slices.get(key)
+        if cached is not None and isinstance(cached[0], _MappedSeries):
+            self._hits += 1
+            self._slices.move_to_end(key)
+            return root, unit, unit_number, cached[0], 0, right - left
+        self._misses += 1
+        metadata = dict(minute.metadata)
+        metadata.pop("pyramid_levels", None)
+        metadata.update(
+            {
+                "unit": unit,
+                "unit_number": int(unit_number),
+                "rows": right - left,
+                # Each aggregated slice is its own zero-based series, so its
+                # identity includes the bucket range it was cut from.
+                "series_fingerprint": _resampled_slice_fingerprint(
+                    series_fingerprint, left, right
+                ),
+            }
+        )
+        shared_lease = None
+        if self.shared:
+            registry = get_shared_slice_registry()
+            shared_key = str(metadata["series_fingerprint"])
+            shared_lease = registry.acquire(shared_key)
+            if shared_lease is None:
+                arrays = _aggregate_resampled(minute.arrays, groups, left, right)
+                shared_lease = registry.publish(shared_key, arrays)
+        else:
+            arrays = _aggregate_resampled(minute.arrays, groups, left, right)
+        resampled = _MappedSeries(
+            directory=minute.directory,
+            metadata=metadata,
+            arrays=dict(shared_lease.arrays) if shared_lease is not None else arrays,
+            raw_symbols_by_code=minute.raw_symbols_by_code,
+            shared_lease=shared_lease,
+        )
+        size = max(1, right - left) * _MMAP_STORAGE_BYTES_PER_ROW
+        if size <= self.max_bytes:
+            self._slices[key] = (resampled, size)
+            self._slice_bytes += size
+            self._evict_slices()
+        return root, unit, unit_number, resampled, 0, right - left
+
     def clear(self) -> None:
         with self._lock:
             self._clear_unlocked(reset_manifest=False)
@@ -1091,6 +1430,7 @@ class DatabentoReplayStore:
                 self._clear_unlocked(reset_manifest=False)
             self._manifest = manifest
             self._version_dir = version_dir
+            self._ledger = _IntegrityLedger.load(version_dir)
             self._pointer_signature = signature
         self._validate_sources(self._manifest)
         return self._manifest
@@ -1156,13 +1496,16 @@ class DatabentoReplayStore:
     ) -> dict[str, Any]:
         assert self._version_dir is not None
         version_manifest = _read_json(self._version_dir / "manifest.json")
+        built: list[str] = []
         _ensure_series(
             self._version_dir,
             version_manifest,
             root_symbol,
             unit,
             unit_number,
+            built=built,
         )
+        _record_integrity(self._version_dir, built)
         version_manifest["built_at"] = datetime.now(timezone.utc).isoformat()
         _write_json_atomic(self._version_dir / "manifest.json", version_manifest)
         _write_json_atomic(self.cache_root / "current.json", version_manifest)
@@ -1182,6 +1525,7 @@ class DatabentoReplayStore:
             self._version_dir / str(entry["path"]),
             expected_entry=entry,
             expected_source_fingerprint=str(self._manifest["source_fingerprint"]),
+            ledger=self._ledger,
         )
         self._mapped[fingerprint] = mapped
         # Mappings are tiny virtual-memory handles; cap them separately from
@@ -1218,13 +1562,19 @@ class DatabentoReplayStore:
         while self._slices and (
             len(self._slices) > self.max_entries or self._slice_bytes > self.max_bytes
         ):
-            _key, (_candles, size) = self._slices.popitem(last=False)
+            _key, (value, size) = self._slices.popitem(last=False)
+            if isinstance(value, _MappedSeries):
+                value.close()
             self._slice_bytes -= size
             self._evictions += 1
 
     def _clear_unlocked(self, *, reset_manifest: bool) -> None:
+        for value, _size in self._slices.values():
+            if isinstance(value, _MappedSeries):
+                value.close()
         self._slices.clear()
         self._slice_bytes = 0
+        self._resample_indexes.clear()
         for mapped in self._mapped.values():
             mapped.close()
         self._mapped.clear()
@@ -1282,6 +1632,15 @@ def _positive_int_setting(
         return int(default)
 
 
+def _bool_setting(explicit: bool | None, *, env_name: str, default: bool) -> bool:
+    if explicit is not None:
+        return bool(explicit)
+    raw = os.getenv(env_name)
+    if raw is None or not raw.strip():
+        return default
+    return raw.strip().lower() in {"1", "true", "yes", "y", "on"}
+
+
 def _normalize_timeframes(
     values: Sequence[tuple[str, int] | str],
 ) -> list[tuple[str, int]]:
@@ -1409,6 +1768,11 @@ def _slice_fingerprint(
     return hashlib.sha256(value).hexdigest()
 
 
+def _resampled_slice_fingerprint(series_fingerprint: str, left: int, right: int) -> str:
+    value = f"{series_fingerprint}\0resampled\0{left}\0{right}".encode()
+    return hashlib.sha256(value).hexdigest()
+
+
 def _read_current_manifest(cache_root: Path) -> dict[str, Any] | None:
     path = cache_root / "current.json"
     try:
@@ -1532,12 +1896,14 @@ def _all_roots_have_series(
     if not isinstance(series, dict):
         return False
     key_suffix = timeframe_key(unit, unit_number)
+    ledger = _IntegrityLedger.load(version_dir)
     for root in manifest.get("roots", []):
         entry = series.get(f"{root}:{key_suffix}")
         if not isinstance(entry, dict) or not _series_files_complete(
             version_dir / str(entry.get("path") or ""),
             expected_entry=entry,
             expected_source_fingerprint=str(manifest.get("source_fingerprint") or ""),
+            ledger=ledger,
         ):
             return False
     return True
@@ -1548,6 +1914,7 @@ def _series_files_complete(
     *,
     expected_entry: Mapping[str, Any] | None = None,
     expected_source_fingerprint: str | None = None,
+    ledger: "_IntegrityLedger | None" = None,
 ) -> bool:
     if not (directory / "metadata.json").is_file() or not all(
         (directory / f"{name}.npy").is_file() for name in _ARRAY_COLUMNS
@@ -1573,6 +1940,13 @@ def _series_files_complete(
             actual = int(actual) if isinstance(expected, int) else str(actual or "")
             if actual != expected:
                 return False
+        ledger_state = (
+            ledger.check_all(_series_file_paths(directory))
+            if ledger is not None
+            else None
+        )
+        if ledger_state is not None:
+            return ledger_state
         for name in _ARRAY_COLUMNS:
             array = np.load(directory / f"{name}.npy", mmap_mode="r")
             arrays[name] = array
@@ -1590,6 +1964,139 @@ def _series_files_complete(
             _close_memmap(array)
 
 
+def _series_file_paths(directory: Path) -> list[Path]:
+    return [directory / "metadata.json"] + [
+        directory / f"{name}.npy" for name in _ARRAY_COLUMNS
+    ]
+
+
+class _IntegrityLedger:
+    """Stat identity and BLAKE2b digest of each file in one cache version.
+
+    Recorded when the version (or a series added to it) is published. A file
+    whose size, mtime and inode still match its record is trusted without
+    being read; any other file is re-hashed, and ``deep`` re-hashes every file.
+    """
+
+    def __init__(self, version_dir: Path, files: dict[str, dict[str, Any]]) -> None:
+        self.version_dir = version_dir
+        self.files = files
+
+    @classmethod
+    def load(cls, version_dir: Path) -> "_IntegrityLedger":
+        try:
+            payload = _read_json(version_dir / _INTEGRITY_LEDGER)
+        except (OSError, ValueError):
+            return cls(version_dir, {})
+        if (
+            not isinstance(payload, dict)
+            or payload.get("ledger_format") != _INTEGRITY_LEDGER_FORMAT
+            or not isinstance(payload.get("files"), dict)
+        ):
+            return cls(version_dir, {})
+        return cls(version_dir, dict(payload["files"]))
+
+    def key(self, path: Path) -> str:
+        return path.relative_to(self.version_dir).as_posix()
+
+    def check(self, path: Path, *, deep: bool = False) -> bool | None:
+        """``None`` when ``path`` has no record, else whether it still matches."""
+
+        record = self.files.get(self.key(path))
+        if not isinstance(record, dict):
+            return None
+        try:
+            stat = path.stat()
+            if int(stat.st_size) != int(record["size"]):
+                return False
+            if (
+                not deep
+                and int(stat.st_mtime_ns) == int(record["mtime_ns"])
+                and int(stat.st_ino) == int(record["inode"])
+                and int(record["mtime_ns"]) < int(record["recorded_ns"]) - _INTEGRITY_SETTLE_NS
+            ):
+                return True
+            if _blake2b_path(path) != str(record["blake2b"]):
+                return False
+        except (OSError, KeyError, TypeError, ValueError):
+            return False
+        # Only touched: trust the new stat for the rest of this process.
+        self.files[self.key(path)] = {
+            **record,
+            "mtime_ns": int(stat.st_mtime_ns),
+            "inode": int(stat.st_ino),
+            "recorded_ns": time.time_ns(),
+        }
+        return True
+
+    def check_all(self, paths: Iterable[Path], *, deep: bool = False) -> bool | None:
+        """``False`` if any file differs, ``None`` if any has no record."""
+
+        states = [self.check(path, deep=deep) for path in paths]
+        if False in states:
+            return False
+        if None in states:
+            return None
+        return True
+
+    def record(self, paths: Sequence[Path]) -> None:
+        if not paths:
+            return
+        newest_write_ns = max(int(path.stat().st_mtime_ns) for path in paths)
+        remaining_ns = newest_write_ns + _INTEGRITY_SETTLE_NS - time.time_ns()
+        if remaining_ns > 0:
+            time.sleep(remaining_ns / 1_000_000_000)
+        for path in paths:
+            before = path.stat()
+            digest = _blake2b_path(path)
+            after = path.stat()
+            if (before.st_size, before.st_mtime_ns) != (after.st_size, after.st_mtime_ns):
+                raise DatabentoCacheError(f"databento_artifact_changed_while_recording:{path}")
+            self.files[self.key(path)] = {
+                "size": int(after.st_size),
+                "mtime_ns": int(after.st_mtime_ns),
+                "inode": int(after.st_ino),
+                "recorded_ns": time.time_ns(),
+                "blake2b": digest,
+            }
+
+    def save(self) -> None:
+        _write_json_atomic(
+            self.version_dir / _INTEGRITY_LEDGER,
+            {
+                "ledger_format": _INTEGRITY_LEDGER_FORMAT,
+                "files": dict(sorted(self.files.items())),
+            },
+        )
+
+
+def _version_files(directory: Path) -> list[Path]:
+    """Ledgered files below ``directory``, skipping in-progress ``.tmp`` trees."""
+
+    return sorted(
+        path
+        for path in directory.rglob("*")
+        if path.is_file()
+        and not any(part.startswith(".") for part in path.relative_to(directory).parts)
+        and path.relative_to(directory).as_posix() not in _UNLEDGERED_FILES
+    )
+
+
+def _record_integrity(version_dir: Path, relative_dirs: Sequence[str]) -> None:
+    """Add or refresh the ledger records of the files below ``relative_dirs``."""
+
+    paths = [
+        path
+        for relative in relative_dirs
+        for path in _version_files(version_dir / relative)
+    ]
+    if not paths:
+        return
+    ledger = _IntegrityLedger.load(version_dir)
+    ledger.record(paths)
+    ledger.save()
+
+
 def _dbn_entries(archive: ZipFile, schema: str) -> list[ZipInfo]:
     marker = f".{schema}.dbn.zst"
     return sorted(
@@ -1693,9 +2200,18 @@ def _resolve_contract_code(
     candidates: Sequence[_Instrument],
     codes: Mapping[str, int],
     cache: dict[tuple[str, int], tuple[str, int] | None],
+    lookups: dict[tuple[str, int], int] | None = None,
 ) -> tuple[str, int] | None:
+    """Resolve ``raw_symbol`` to its contract, memoized per calendar day.
+
+    ``lookups`` records the timestamp of each memo key's first lookup, which
+    is all a later build needs to check the resolution against new inputs.
+    """
+
     calendar_date = _datetime_from_ns(timestamp_ns).date()
     cache_key = (raw_symbol, calendar_date.toordinal())
+    if lookups is not None:
+        lookups.setdefault(cache_key, timestamp_ns)
     if cache_key in cache:
         return cache[cache_key]
     if _raw_symbol_root(raw_symbol) is None:
@@ -1855,6 +2371,17 @@ def _write_json_atomic(path: Path, value: Mapping[str, Any]) -> None:
     temporary.replace(path)
 
 
+def _blake2b_path(path: Path) -> str:
+    digest = hashlib.blake2b(digest_size=32)
+    with path.open("rb") as source:
+        while True:
+            chunk = source.read(4 * 1024 * 1024)
+            if not chunk:
+                break
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
 def _sha256_path(path: Path) -> str:
     digest = hashlib.sha256()
     with path.open("rb") as source:
@@ -1900,6 +2427,7 @@ def _validate_mapped_series(
     arrays: Mapping[str, np.ndarray],
     expected_entry: Mapping[str, Any],
     expected_source_fingerprint: str,
+    check_content: bool = True,
 ) -> None:
     expected_metadata: dict[str, Any] = {
         "cache_format_version": CACHE_FORMAT_VERSION,
@@ -1945,6 +2473,8 @@ def _validate_mapped_series(
                 f"databento_series_dtype_mismatch:{directory}:{name}:"
                 f"{array.dtype}:{_ARRAY_DTYPES[name]}"
             )
+    if not check_content:
+        return
 
     timestamps = arrays["timestamp_ns"]
     close_timestamps = arrays["close_timestamp_ns"]
@@ -2098,11 +2628,24 @@ def build_databento_cache(
     cache_root: str | Path | None = None,
     timeframes: Sequence[tuple[str, int] | str] = DEFAULT_TIMEFRAMES,
     force: bool = False,
+    max_workers: int | None = None,
+    incremental: bool = False,
 ) -> CacheBuildResult:
-    """Build immutable Parquet and mmap artifacts, then atomically publish them."""
+    """Build immutable Parquet and mmap artifacts, then atomically publish them.
+
+    Archives are decoded, and series then materialized, by up to
+    ``max_workers`` processes (``TOPSIGNAL_DATABENTO_BUILD_WORKERS``); the
+    published artifacts and fingerprints do not depend on the worker count. With ``incremental``, a
+    new version links the current version's partitions for every archive whose
+    contract lookups still resolve the same way and decodes only the rest;
+    rolls and series keep the current version's rows up to the first session
+    the changed archives reach.
+    """
 
     if not archives:
         raise DatabentoCacheError("databento_archives_required")
+    if incremental and force:
+        raise DatabentoCacheError("databento_incremental_force_conflict")
     root = _resolve_cache_root(cache_root)
     root.mkdir(parents=True, exist_ok=True)
     normalized_timeframes = _normalize_timeframes(timeframes)
@@ -2127,7 +2670,18 @@ def build_databento_cache(
         if not missing:
             return _build_result(root, version_dir, current, reused=True)
 
-    descriptors = [inspect_archive(path) for path in archives]
+    # Content hashes recorded for an archive whose stat identity is unchanged
+    # are reused; --force re-hashes every archive.
+    recorded_archives = {
+        str(item.get("path")): item
+        for item in (current.get("archives", []) if current is not None and not force else [])
+        if isinstance(item, dict) and item.get("sha256")
+    }
+    descriptors = [
+        _reuse_archive_digest(descriptor, recorded_archives.get(descriptor.path))
+        or inspect_archive(path)
+        for path, descriptor in zip(archives, quick)
+    ]
     descriptors.sort(
         key=lambda item: (
             item.root_symbol,
@@ -2156,7 +2710,18 @@ def build_databento_cache(
         if ((root / legacy_rel) / "manifest.json").is_file():
             reusable_rel = legacy_rel
 
+    reused_archives = 0
     if reusable_rel is None:
+        reuse_from: Path | None = None
+        if (
+            incremental
+            and current is not None
+            and int(current.get("cache_format_version", -1)) == CACHE_FORMAT_VERSION
+            and str(current.get("roll_policy_version")) == ROLL_POLICY_VERSION
+        ):
+            candidate_dir = root / str(current.get("version_dir") or "")
+            if current.get("version_dir") and candidate_dir.is_dir():
+                reuse_from = candidate_dir
         generation = uuid.uuid4().hex
         # Keep generation paths comfortably below legacy Windows MAX_PATH;
         # the complete source fingerprint remains in both manifests.
@@ -2169,7 +2734,16 @@ def build_databento_cache(
         )
         staging.mkdir(parents=True, exist_ok=False)
         try:
-            build_manifest = _build_parquet_and_rolls(staging, descriptors)
+            (
+                build_manifest,
+                reused_archives,
+                first_changed_sessions,
+            ) = _build_parquet_and_rolls(
+                staging,
+                descriptors,
+                max_workers=max_workers,
+                reuse_from=reuse_from,
+            )
             build_manifest.update(
                 {
                     "cache_format_version": CACHE_FORMAT_VERSION,
@@ -2179,10 +2753,22 @@ def build_databento_cache(
                     "version_dir": str(version_rel).replace("\\", "/"),
                 }
             )
-            for unit, number in normalized_timeframes:
-                _ensure_series_for_all_roots(staging, build_manifest, unit, number)
+            _ensure_series_for_all_roots(
+                staging,
+                build_manifest,
+                normalized_timeframes,
+                max_workers=max_workers,
+                extensions=(
+                    _series_extensions(reuse_from, build_manifest, first_changed_sessions)
+                    if reuse_from is not None
+                    else None
+                ),
+            )
             build_manifest["built_at"] = datetime.now(timezone.utc).isoformat()
             _write_json(staging / "manifest.json", build_manifest)
+            ledger = _IntegrityLedger(staging, {})
+            ledger.record(_version_files(staging))
+            ledger.save()
             version_dir.parent.mkdir(parents=True, exist_ok=True)
             staging.replace(version_dir)
         except Exception:
@@ -2201,15 +2787,117 @@ def build_databento_cache(
                 "version_dir": str(version_rel).replace("\\", "/"),
             }
         )
-        for unit, number in normalized_timeframes:
-            _ensure_series_for_all_roots(version_dir, build_manifest, unit, number)
+        built = _ensure_series_for_all_roots(
+            version_dir,
+            build_manifest,
+            normalized_timeframes,
+            max_workers=max_workers,
+        )
+        _record_integrity(version_dir, built)
         build_manifest["built_at"] = datetime.now(timezone.utc).isoformat()
         _write_json_atomic(version_dir / "manifest.json", build_manifest)
 
     manifest = _read_json(version_dir / "manifest.json")
     _write_json_atomic(root / "current.json", manifest)
     clear_default_databento_cache()
-    return _build_result(root, version_dir, manifest, reused=False)
+    return _build_result(
+        root,
+        version_dir,
+        manifest,
+        reused=False,
+        reused_archive_count=reused_archives,
+    )
+
+
+def _reuse_archive_digest(
+    descriptor: ArchiveDescriptor,
+    recorded: Mapping[str, Any] | None,
+) -> ArchiveDescriptor | None:
+    if recorded is None:
+        return None
+    try:
+        unchanged = (
+            int(recorded["size"]),
+            int(recorded["mtime_ns"]),
+            int(recorded["change_ns"]),
+            int(recorded["device"]),
+            int(recorded["inode"]),
+        ) == (
+            descriptor.size,
+            descriptor.mtime_ns,
+            descriptor.change_ns,
+            descriptor.device,
+            descriptor.inode,
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
+    return replace(descriptor, sha256=str(recorded["sha256"])) if unchanged else None
+
+
+def verify_databento_cache(
+    cache_root: str | Path | None = None,
+    *,
+    deep: bool = False,
+) -> CacheVerifyResult:
+    """Check the current cache version against its integrity ledger.
+
+    The default pass trusts files whose stat identity matches the ledger and
+    re-hashes the rest. ``deep`` re-hashes every file and source archive and
+    runs the full row-level validation of every series.
+    """
+
+    root = _resolve_cache_root(cache_root)
+    manifest = _read_current_manifest(root)
+    if manifest is None:
+        raise DatabentoCacheMissingError(
+            f"databento_cache_missing:{root / 'current.json'}: run build_databento_cache.py"
+        )
+    version_dir = root / str(manifest.get("version_dir") or "")
+    ledger = _IntegrityLedger.load(version_dir)
+    problems: list[str] = []
+    if not ledger.files:
+        problems.append(f"integrity_ledger_missing:{version_dir / _INTEGRITY_LEDGER}")
+    for key in sorted(ledger.files):
+        if not ledger.check(version_dir / key, deep=deep):
+            problems.append(f"artifact_changed:{key}")
+    present = _version_files(version_dir) if version_dir.is_dir() else []
+    unledgered = [path for path in present if ledger.key(path) not in ledger.files]
+    series = manifest.get("series") if isinstance(manifest.get("series"), dict) else {}
+    for key, entry in sorted(series.items()):
+        if not isinstance(entry, dict):
+            continue
+        try:
+            mapped = _MappedSeries.open(
+                version_dir / str(entry.get("path") or ""),
+                expected_entry=entry,
+                expected_source_fingerprint=str(manifest.get("source_fingerprint") or ""),
+                ledger=None if deep else ledger,
+            )
+        except (DatabentoCacheError, OSError, ValueError, KeyError) as exc:
+            problems.append(f"series_invalid:{key}:{exc}")
+        else:
+            mapped.close()
+    if deep:
+        for raw in manifest.get("archives", []):
+            if not isinstance(raw, dict):
+                continue
+            path = Path(str(raw.get("path") or ""))
+            try:
+                digest = _sha256_path(path)
+            except OSError:
+                problems.append(f"source_missing:{path}")
+                continue
+            if digest != str(raw.get("sha256") or ""):
+                problems.append(f"source_changed:{path}")
+    return CacheVerifyResult(
+        cache_root=str(root),
+        version_dir=str(version_dir),
+        deep=deep,
+        files_checked=len(ledger.files),
+        unledgered_files=len(unledgered),
+        series_checked=len(series),
+        problems=tuple(problems),
+    )
 
 
 def _build_result(
@@ -2218,6 +2906,7 @@ def _build_result(
     manifest: Mapping[str, Any],
     *,
     reused: bool,
+    reused_archive_count: int = 0,
 ) -> CacheBuildResult:
     series = manifest.get("series") if isinstance(manifest.get("series"), dict) else {}
     timeframes = sorted(
@@ -2237,6 +2926,7 @@ def _build_result(
         archive_count=len(manifest.get("archives", [])),
         records_by_schema=dict(records) if isinstance(records, dict) else {},
         reused=reused,
+        reused_archive_count=reused_archive_count,
     )
 
 
@@ -2308,13 +2998,22 @@ _ROLL_SCHEMA = pa.schema(
 
 
 class _PartitionedParquetWriter:
-    def __init__(self, base: Path, schema: pa.Schema) -> None:
+    def __init__(
+        self,
+        base: Path,
+        schema: pa.Schema,
+        *,
+        part_prefix: str = "",
+    ) -> None:
         self.base = base
         self.schema = schema
+        self.part_prefix = part_prefix
         self._key: tuple[str, int, int] | None = None
         self._columns: dict[str, list[Any]] = {
             field.name: [] for field in self.schema
         }
+        self._chunks: list[pa.Table] = []
+        self._buffered_rows = 0
         self._parts: defaultdict[tuple[str, int, int], int] = defaultdict(int)
         self.rows_written = 0
 
@@ -2330,11 +3029,57 @@ class _PartitionedParquetWriter:
         self._key = key
         for field in self.schema:
             self._columns[field.name].append(values.get(field.name))
-        if len(next(iter(self._columns.values()))) >= PARQUET_BATCH_ROWS:
+        self._buffered_rows += 1
+        if self._buffered_rows >= PARQUET_BATCH_ROWS:
             self.flush()
 
+    def append_columns(
+        self,
+        root_symbol: str,
+        month_keys: np.ndarray,
+        columns: Mapping[str, np.ndarray],
+    ) -> None:
+        """Append whole columns; ``month_keys`` are months since 1970-01.
+
+        Partition switches and part boundaries match appending the same rows
+        one at a time, so both paths write identical partitions.
+        """
+
+        count = int(month_keys.size)
+        starts = np.flatnonzero(month_keys[1:] != month_keys[:-1]) + 1
+        start = 0
+        for stop in [*starts.tolist(), count]:
+            month = int(month_keys[start])
+            key = (root_symbol, 1970 + month // 12, month % 12 + 1)
+            if self._key is not None and self._key != key:
+                self.flush()
+            self._key = key
+            while start < stop:
+                take = min(stop - start, PARQUET_BATCH_ROWS - self._buffered_rows)
+                self._stage_row_values()
+                self._chunks.append(
+                    pa.Table.from_pydict(
+                        {
+                            field.name: columns[field.name][start : start + take]
+                            for field in self.schema
+                        },
+                        schema=self.schema,
+                    )
+                )
+                self._buffered_rows += take
+                start += take
+                if self._buffered_rows >= PARQUET_BATCH_ROWS:
+                    self.flush()
+
+    def _stage_row_values(self) -> None:
+        if self._columns[self.schema[0].name]:
+            self._chunks.append(
+                pa.Table.from_pydict(self._columns, schema=self.schema)
+            )
+            self._columns = {field.name: [] for field in self.schema}
+
     def flush(self) -> None:
-        if self._key is None or not self._columns[self.schema[0].name]:
+        if self._key is None or not self._buffered_rows:
             return
         root_symbol, year, month = self._key
         directory = (
@@ -2346,23 +3091,35 @@ class _PartitionedParquetWriter:
         directory.mkdir(parents=True, exist_ok=True)
         part = self._parts[self._key]
         self._parts[self._key] += 1
-        table = pa.Table.from_pydict(self._columns, schema=self.schema)
-        pq.write_table(
-            table,
-            directory / f"part-{part:05d}.parquet",
-            compression="zstd",
-            compression_level=3,
-            use_dictionary=True,
-            write_statistics=True,
-            row_group_size=PARQUET_BATCH_ROWS,
+        self._stage_row_values()
+        table = (
+            self._chunks[0]
+            if len(self._chunks) == 1
+            else pa.concat_tables(self._chunks)
+        )
+        _write_parquet_part(
+            table, directory / f"part-{self.part_prefix}{part:05d}.parquet"
         )
         self.rows_written += table.num_rows
-        self._columns = {field.name: [] for field in self.schema}
+        self._chunks = []
+        self._buffered_rows = 0
 
     def close(self) -> None:
         self.flush()
 
 
+def _write_parquet_part(table: pa.Table, path: Path) -> None:
+    pq.write_table(
+        table,
+        path,
+        compression="zstd",
+        compression_level=3,
+        use_dictionary=True,
+        write_statistics=True,
+        row_group_size=PARQUET_BATCH_ROWS,
+    )
+
+
 class _SessionResolver:
     """Resolve sequential UTC bars without a zone conversion per row."""
 
@@ -2427,124 +3184,1019 @@ class _MappingResolver:
         return self._by_day_id.get((calendar_day, int(instrument_id)))
 
 
-def _build_parquet_and_rolls(
-    version_dir: Path,
-    descriptors: Sequence[ArchiveDescriptor],
-) -> dict[str, Any]:
-    parquet_root = version_dir / "parquet"
-    definition_writer = _PartitionedParquetWriter(
-        parquet_root / "definitions", _DEFINITION_SCHEMA
-    )
-    ohlcv_writer = _PartitionedParquetWriter(parquet_root / "ohlcv_1m", _OHLCV_SCHEMA)
-    statistics_writer = _PartitionedParquetWriter(
-        parquet_root / "statistics", _STATISTICS_SCHEMA
-    )
-    records_by_schema: defaultdict[str, int] = defaultdict(int)
-    contracts: dict[str, dict[str, list[_Instrument]]] = {
-        root: {} for root in sorted({item.root_symbol for item in descriptors})
-    }
-    unique_instrument_mapping: dict[str, dict[int, str | None]] = {
-        root: {} for root in contracts
-    }
+@dataclass(frozen=True)
+class _DefinitionArchiveDecode:
+    records: int
+    rows_written: int
+    outrights: tuple[_Instrument, ...]
+    instrument_mapping: Mapping[int, str | None]
 
-    for source_id, descriptor in enumerate(descriptors):
-        if descriptor.schema != "definition":
-            continue
-        with ZipFile(descriptor.path) as archive:
-            for entry in _dbn_entries(archive, descriptor.schema):
-                metadata_seen = False
-                for record in _iter_dbn_entry(archive, entry):
-                    if isinstance(record, Metadata):
-                        _validate_dbn_metadata(record, descriptor)
-                        metadata_seen = True
-                        continue
-                    if not isinstance(record, InstrumentDefMsg):
-                        raise DatabentoCacheError(
-                            f"unexpected_dbn_record:{entry.filename}:{type(record).__name__}"
-                        )
-                    records_by_schema[descriptor.schema] += 1
-                    raw_symbol = str(record.raw_symbol).strip().upper()
-                    instrument_class = _enum_value(record.instrument_class)
-                    security_update_action = _enum_value(record.security_update_action)
-                    definition_ts_ns = int(record.ts_recv)
-                    definition_date = _datetime_from_ns(definition_ts_ns).date()
-                    activation_ns = _nullable_ns(record.activation)
-                    expiration_ns = _nullable_ns(record.expiration)
-                    contract_key = (
-                        _contract_key(
-                            raw_symbol,
-                            expiration_ns=expiration_ns,
-                            reference_date=definition_date,
-                        )
-                        if instrument_class == "F"
-                        and _raw_symbol_root(raw_symbol) == descriptor.root_symbol
-                        else ""
-                    )
-                    instrument = _Instrument(
-                        root_symbol=descriptor.root_symbol,
-                        instrument_id=int(record.instrument_id),
-                        raw_symbol=raw_symbol,
-                        contract_key=contract_key,
-                        instrument_class=instrument_class,
-                        security_type=str(record.security_type or ""),
-                        activation_ns=activation_ns,
-                        expiration_ns=expiration_ns,
-                        min_price_increment_nano=_nullable_fixed_int(
-                            record.min_price_increment
-                        ),
-                        unit_of_measure_qty_nano=_nullable_fixed_int(
-                            record.unit_of_measure_qty
-                        ),
-                        definition_ts_ns=definition_ts_ns,
-                        source_sha256=descriptor.sha256,
-                        security_update_action=security_update_action,
-                    )
-                    prior_mapping = unique_instrument_mapping[
-                        descriptor.root_symbol
-                    ].get(instrument.instrument_id)
-                    if prior_mapping is None and instrument.instrument_id not in unique_instrument_mapping[
-                        descriptor.root_symbol
-                    ]:
-                        unique_instrument_mapping[descriptor.root_symbol][
-                            instrument.instrument_id
-                        ] = raw_symbol
-                    elif prior_mapping != raw_symbol:
-                        unique_instrument_mapping[descriptor.root_symbol][
-                            instrument.instrument_id
-                        ] = None
-                    definition_writer.append(
-                        descriptor.root_symbol,
-                        definition_date,
-                        {
-                            "root_symbol": descriptor.root_symbol,
-                            "definition_date_ordinal": definition_date.toordinal(),
-                            "instrument_id": instrument.instrument_id,
-                            "raw_symbol": raw_symbol,
-                            "contract_key": contract_key,
-                            "instrument_class": instrument_class,
-                            "security_type": instrument.security_type,
-                            "security_update_action": security_update_action,
-                            "activation_ns": instrument.activation_ns,
-                            "expiration_ns": instrument.expiration_ns,
-                            "min_price_increment_nano": instrument.min_price_increment_nano,
-                            "unit_of_measure_qty_nano": instrument.unit_of_measure_qty_nano,
-                            "definition_ts_ns": definition_ts_ns,
-                            "source_id": source_id,
-                        },
-                    )
-                    if (
-                        instrument_class == "F"
-                        and _raw_symbol_root(raw_symbol) == descriptor.root_symbol
-                    ):
-                        contracts[descriptor.root_symbol].setdefault(
-                            contract_key, []
-                        ).append(instrument)
-                if not metadata_seen:
-                    raise DatabentoCacheError(f"dbn_metadata_missing:{entry.filename}")
-    definition_writer.close()
 
-    missing_definitions = [root for root, values in contracts.items() if not values]
-    if missing_definitions:
+@dataclass(frozen=True)
+class _OhlcvArchiveDecode:
+    records: int
+    rows_written: int
+    daily_volumes: Mapping[date, Mapping[str, int]]
+    bounds_ns: tuple[int, int]
+    contract_codes: Mapping[tuple[str, int], tuple[str, int] | None]
+    lookups: Mapping[tuple[str, int], tuple[int, str | None]]
+    instrument_fallbacks: Mapping[int, str | None]
+
+
+@dataclass(frozen=True)
+class _StatisticsArchiveDecode:
+    records: int
+    rows_written: int
+    contract_codes: Mapping[tuple[str, int], tuple[str, int] | None]
+    lookups: Mapping[tuple[str, int], tuple[int, str | None]]
+
+
+@dataclass(frozen=True)
+class _ContractInputs:
+    """What an OHLCV or statistics decode reads besides the archive bytes."""
+
+    contracts_by_raw: Mapping[str, Sequence[_Instrument]]
+    raw_symbol_codes: Mapping[str, int]
+    instrument_mapping: Mapping[int, str | None]
+    seed_contract_codes: Mapping[tuple[str, int], tuple[str, int] | None]
+
+
+def _build_worker_count(max_workers: int | None) -> int:
+    return _positive_int_setting(
+        max_workers,
+        env_name="TOPSIGNAL_DATABENTO_BUILD_WORKERS",
+        default=_DEFAULT_BUILD_WORKERS,
+    )
+
+
+def _decode_archives(
+    decode: Any,
+    tasks: Sequence[tuple[Any, ...]],
+    *,
+    max_workers: int,
+) -> list[Any]:
+    """Run one decode call per archive and return the results in task order.
+
+    Results are consumed in task order, so a failing archive surfaces the same
+    error the serial build would raise first.
+    """
+
+    workers = min(max_workers, len(tasks))
+    if workers <= 1:
+        return [decode(*task) for task in tasks]
+    # ``spawn`` keeps decoder processes free of the caller's threads and open
+    # handles; each worker opens its own ZIP and writes its own partitions.
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+    try:
+        futures = [executor.submit(decode, *task) for task in tasks]
+        return [future.result() for future in futures]
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _decode_definition_archive(
+    parquet_root: Path,
+    source_id: int,
+    descriptor: ArchiveDescriptor,
+) -> _DefinitionArchiveDecode:
+    writer = _PartitionedParquetWriter(
+        parquet_root / "definitions",
+        _DEFINITION_SCHEMA,
+        part_prefix=f"{source_id:04d}-",
+    )
+    records = 0
+    outrights: list[_Instrument] = []
+    instrument_mapping: dict[int, str | None] = {}
+    with ZipFile(descriptor.path) as archive:
+        for entry in _dbn_entries(archive, descriptor.schema):
+            metadata_seen = False
+            for record in _iter_dbn_entry(archive, entry):
+                if isinstance(record, Metadata):
+                    _validate_dbn_metadata(record, descriptor)
+                    metadata_seen = True
+                    continue
+                if not isinstance(record, InstrumentDefMsg):
+                    raise DatabentoCacheError(
+                        f"unexpected_dbn_record:{entry.filename}:{type(record).__name__}"
+                    )
+                records += 1
+                raw_symbol = str(record.raw_symbol).strip().upper()
+                instrument_class = _enum_value(record.instrument_class)
+                security_update_action = _enum_value(record.security_update_action)
+                definition_ts_ns = int(record.ts_recv)
+                definition_date = _datetime_from_ns(definition_ts_ns).date()
+                activation_ns = _nullable_ns(record.activation)
+                expiration_ns = _nullable_ns(record.expiration)
+                contract_key = (
+                    _contract_key(
+                        raw_symbol,
+                        expiration_ns=expiration_ns,
+                        reference_date=definition_date,
+                    )
+                    if instrument_class == "F"
+                    and _raw_symbol_root(raw_symbol) == descriptor.root_symbol
+                    else ""
+                )
+                instrument = _Instrument(
+                    root_symbol=descriptor.root_symbol,
+                    instrument_id=int(record.instrument_id),
+                    raw_symbol=raw_symbol,
+                    contract_key=contract_key,
+                    instrument_class=instrument_class,
+                    security_type=str(record.security_type or ""),
+                    activation_ns=activation_ns,
+                    expiration_ns=expiration_ns,
+                    min_price_increment_nano=_nullable_fixed_int(
+                        record.min_price_increment
+                    ),
+                    unit_of_measure_qty_nano=_nullable_fixed_int(
+                        record.unit_of_measure_qty
+                    ),
+                    definition_ts_ns=definition_ts_ns,
+                    source_sha256=descriptor.sha256,
+                    security_update_action=security_update_action,
+                )
+                _merge_instrument_mapping(
+                    instrument_mapping, instrument.instrument_id, raw_symbol
+                )
+                writer.append(
+                    descriptor.root_symbol,
+                    definition_date,
+                    {
+                        "root_symbol": descriptor.root_symbol,
+                        "definition_date_ordinal": definition_date.toordinal(),
+                        "instrument_id": instrument.instrument_id,
+                        "raw_symbol": raw_symbol,
+                        "contract_key": contract_key,
+                        "instrument_class": instrument_class,
+                        "security_type": instrument.security_type,
+                        "security_update_action": security_update_action,
+                        "activation_ns": instrument.activation_ns,
+                        "expiration_ns": instrument.expiration_ns,
+                        "min_price_increment_nano": instrument.min_price_increment_nano,
+                        "unit_of_measure_qty_nano": instrument.unit_of_measure_qty_nano,
+                        "definition_ts_ns": definition_ts_ns,
+                        "source_id": source_id,
+                    },
+                )
+                if contract_key:
+                    outrights.append(instrument)
+            if not metadata_seen:
+                raise DatabentoCacheError(f"dbn_metadata_missing:{entry.filename}")
+    writer.close()
+    return _DefinitionArchiveDecode(
+        records=records,
+        rows_written=writer.rows_written,
+        outrights=tuple(outrights),
+        instrument_mapping=instrument_mapping,
+    )
+
+
+def _merge_instrument_mapping(
+    mapping: dict[int, str | None],
+    instrument_id: int,
+    raw_symbol: str | None,
+) -> None:
+    """Keep an instrument id's raw symbol only while every definition agrees."""
+
+    if instrument_id not in mapping:
+        mapping[instrument_id] = raw_symbol
+    elif mapping[instrument_id] != raw_symbol:
+        mapping[instrument_id] = None
+
+
+def _decode_ohlcv_archive(
+    parquet_root: Path,
+    source_id: int,
+    descriptor: ArchiveDescriptor,
+    contracts_by_raw: Mapping[str, Sequence[_Instrument]],
+    raw_symbol_codes: Mapping[str, int],
+    instrument_mapping: Mapping[int, str | None],
+    seed_contract_codes: Mapping[tuple[str, int], tuple[str, int] | None],
+) -> _OhlcvArchiveDecode:
+    decoder = _OhlcvArchiveDecoder(
+        parquet_root,
+        source_id,
+        descriptor,
+        contracts_by_raw=contracts_by_raw,
+        raw_symbol_codes=raw_symbol_codes,
+        instrument_mapping=instrument_mapping,
+        seed_contract_codes=seed_contract_codes,
+    )
+    with ZipFile(descriptor.path) as archive:
+        for entry in _dbn_entries(archive, descriptor.schema):
+            decoder.decode_entry(archive, entry)
+    return decoder.finish()
+
+
+class _OhlcvArchiveDecoder:
+    """Decode one OHLCV archive in stream order, in bulk where the layout allows.
+
+    Both paths share the contract memo, session and volume state, so an
+    archive whose entries mix them still produces the serial rows.
+    """
+
+    def __init__(
+        self,
+        parquet_root: Path,
+        source_id: int,
+        descriptor: ArchiveDescriptor,
+        *,
+        contracts_by_raw: Mapping[str, Sequence[_Instrument]],
+        raw_symbol_codes: Mapping[str, int],
+        instrument_mapping: Mapping[int, str | None],
+        seed_contract_codes: Mapping[tuple[str, int], tuple[str, int] | None],
+    ) -> None:
+        self.source_id = source_id
+        self.descriptor = descriptor
+        self.contracts_by_raw = contracts_by_raw
+        self.raw_symbol_codes = raw_symbol_codes
+        self.contract_keys_by_code = {
+            int(code): contract_key for contract_key, code in raw_symbol_codes.items()
+        }
+        self.instrument_mapping = instrument_mapping
+        self.seed_contract_codes = seed_contract_codes
+        self.contract_code_cache = dict(seed_contract_codes)
+        self.lookups: dict[tuple[str, int], int] = {}
+        self.instrument_fallbacks: dict[int, str | None] = {}
+        self.writer = _PartitionedParquetWriter(
+            parquet_root / "ohlcv_1m",
+            _OHLCV_SCHEMA,
+            part_prefix=f"{source_id:04d}-",
+        )
+        self.records = 0
+        self.daily_volumes: dict[date, dict[str, int]] = {}
+        self.bounds = [0, 0]
+        self.session_resolver = _SessionResolver()
+        self.prior_timestamp_ns: int | None = None
+
+    def decode_entry(self, archive: ZipFile, entry: ZipInfo) -> None:
+        with archive.open(entry, "r") as source:
+            try:
+                metadata, batches = read_ohlcv_arrays(source, name=entry.filename)
+            except DbnLayoutUnsupportedError:
+                batches = None
+            except DbnArrayError as exc:
+                raise DatabentoCacheError(str(exc)) from exc
+            if batches is not None:
+                _validate_dbn_metadata(metadata, self.descriptor)
+                mapping = _MappingResolver(
+                    metadata, root_symbol=self.descriptor.root_symbol
+                )
+                try:
+                    for records in batches:
+                        self._append_records(records, mapping)
+                except DbnArrayError as exc:
+                    raise DatabentoCacheError(str(exc)) from exc
+                return
+        self._decode_entry_records(archive, entry)
+
+    def finish(self) -> _OhlcvArchiveDecode:
+        self.writer.close()
+        return _OhlcvArchiveDecode(
+            records=self.records,
+            rows_written=self.writer.rows_written,
+            daily_volumes=self.daily_volumes,
+            bounds_ns=(self.bounds[0], self.bounds[1]),
+            contract_codes=_new_contract_codes(
+                self.contract_code_cache, self.seed_contract_codes
+            ),
+            lookups=_observed_lookups(self.lookups, self.contract_code_cache),
+            instrument_fallbacks=self.instrument_fallbacks,
+        )
+
+    def _resolve(
+        self,
+        mapping: _MappingResolver,
+        timestamp_ns: int,
+        instrument_id: int,
+    ) -> tuple[str | None, tuple[str, int] | None]:
+        raw_symbol = mapping.resolve(timestamp_ns, instrument_id)
+        if raw_symbol is None:
+            raw_symbol = self.instrument_mapping.get(instrument_id)
+            self.instrument_fallbacks[instrument_id] = raw_symbol
+        if raw_symbol is None:
+            return None, None
+        return raw_symbol, _resolve_contract_code(
+            raw_symbol=raw_symbol,
+            timestamp_ns=timestamp_ns,
+            candidates=self.contracts_by_raw.get(raw_symbol, []),
+            codes=self.raw_symbol_codes,
+            cache=self.contract_code_cache,
+            lookups=self.lookups,
+        )
+
+    def _append_records(
+        self, records: np.ndarray, mapping: _MappingResolver
+    ) -> None:
+        """Apply the per-record checks as array predicates to one batch.
+
+        Errors are raised for the first offending record with the same code
+        and check order as ``_decode_entry_records``.
+        """
+
+        count = int(records.size)
+        if not count:
+            return
+        root_symbol = self.descriptor.root_symbol
+        self.records += count
+        timestamps = records["ts_event"].astype(np.int64)
+        instrument_ids = records["instrument_id"].astype(np.int64)
+        previous = np.empty(count, dtype=np.int64)
+        previous[0] = (
+            self.prior_timestamp_ns
+            if self.prior_timestamp_ns is not None
+            else timestamps[0]
+        )
+        previous[1:] = timestamps[:-1]
+        unordered = timestamps < previous
+
+        # Symbology only varies per (calendar day, instrument id). Resolving
+        # pairs in first-occurrence order keeps the contract memo identical to
+        # the row-by-row path, which keys it by (raw symbol, calendar day).
+        pair_keys = calendar_day_ordinals(timestamps) * (1 << 32) + instrument_ids
+        _pairs, first_rows, inverse = np.unique(
+            pair_keys, return_index=True, return_inverse=True
+        )
+        inverse = inverse.reshape(-1)
+        pair_state = np.zeros(first_rows.size, dtype=np.int8)
+        pair_code = np.zeros(first_rows.size, dtype=np.uint32)
+        pair_symbols: list[str | None] = [None] * first_rows.size
+        for pair in np.argsort(first_rows, kind="stable").tolist():
+            row = int(first_rows[pair])
+            raw_symbol, resolved_contract = self._resolve(
+                mapping, int(timestamps[row]), int(instrument_ids[row])
+            )
+            pair_symbols[pair] = raw_symbol
+            if raw_symbol is None:
+                pair_state[pair] = _ROW_MAPPING_MISSING
+            elif resolved_contract is not None:
+                pair_code[pair] = resolved_contract[1]
+            elif _raw_symbol_root(raw_symbol) is None:
+                # Parent streams contain spreads; they are retained in
+                # definitions/statistics but excluded from rolls.
+                pair_state[pair] = _ROW_SPREAD
+            else:
+                pair_state[pair] = _ROW_OUTRIGHT_MISSING
+        row_state = pair_state[inverse]
+        kept = row_state == _ROW_KEPT
+        nonpositive, envelope = invalid_ohlcv_rows(records)
+        invalid = (
+            unordered
+            | (row_state == _ROW_MAPPING_MISSING)
+            | (row_state == _ROW_OUTRIGHT_MISSING)
+            | (kept & (nonpositive | envelope))
+        )
+        if invalid.any():
+            row = int(np.argmax(invalid))
+            timestamp_ns = int(timestamps[row])
+            instrument_id = int(instrument_ids[row])
+            if unordered[row]:
+                raise DatabentoCacheError(
+                    f"databento_rows_not_monotonic:{self.descriptor.job_id}"
+                )
+            if row_state[row] == _ROW_MAPPING_MISSING:
+                raise DatabentoCacheError(
+                    f"databento_mapping_missing:{root_symbol}:{instrument_id}:{timestamp_ns}"
+                )
+            if row_state[row] == _ROW_OUTRIGHT_MISSING:
+                raise DatabentoCacheError(
+                    "databento_outright_definition_missing:"
+                    f"{root_symbol}:{pair_symbols[int(inverse[row])]}:{instrument_id}:"
+                    f"{timestamp_ns}"
+                )
+            if nonpositive[row]:
+                raise DatabentoCacheError("databento_nonpositive_ohlcv_price")
+            raise DatabentoCacheError("databento_invalid_ohlcv_envelope")
+        self.prior_timestamp_ns = int(timestamps[-1])
+        if not kept.any():
+            return
+
+        kept_records = records[kept]
+        kept_timestamps = timestamps[kept]
+        codes = pair_code[inverse][kept]
+        sessions = session_ordinals(kept_timestamps)
+        volumes = kept_records["volume"]
+        month_keys = (
+            (sessions.astype(np.int64) - UNIX_EPOCH_ORDINAL)
+            .astype("datetime64[D]")
+            .astype("datetime64[M]")
+            .astype(np.int64)
+        )
+        self.writer.append_columns(
+            root_symbol,
+            month_keys,
+            {
+                "timestamp_ns": kept_timestamps,
+                "session_ordinal": sessions,
+                "instrument_id": kept_records["instrument_id"].astype(np.uint32),
+                "raw_symbol_code": codes,
+                "open_nano": kept_records["open"].astype(np.int64),
+                "high_nano": kept_records["high"].astype(np.int64),
+                "low_nano": kept_records["low"].astype(np.int64),
+                "close_nano": kept_records["close"].astype(np.int64),
+                "volume": volumes.astype(np.uint64),
+                "source_id": np.full(
+                    kept_timestamps.size, self.source_id, dtype=np.uint16
+                ),
+            },
+        )
+        volume_keys, volume_inverse = np.unique(
+            sessions.astype(np.int64) * (1 << 32) + codes, return_inverse=True
+        )
+        volume_sums = np.zeros(volume_keys.size, dtype=np.uint64)
+        np.add.at(volume_sums, volume_inverse.reshape(-1), volumes)
+        for key, total in zip(volume_keys.tolist(), volume_sums.tolist()):
+            session_date = date.fromordinal(key >> 32)
+            contract_key = self.contract_keys_by_code[key & 0xFFFFFFFF]
+            by_contract = self.daily_volumes.setdefault(session_date, {})
+            by_contract[contract_key] = by_contract.get(contract_key, 0) + int(total)
+        first_ns = int(kept_timestamps.min())
+        last_ns = int(kept_timestamps.max())
+        if self.bounds[0] == 0 or first_ns < self.bounds[0]:
+            self.bounds[0] = first_ns
+        if last_ns > self.bounds[1]:
+            self.bounds[1] = last_ns
+
+    def _decode_entry_records(self, archive: ZipFile, entry: ZipInfo) -> None:
+        descriptor = self.descriptor
+        mapping: _MappingResolver | None = None
+        for record in _iter_dbn_entry(archive, entry):
+            if isinstance(record, Metadata):
+                _validate_dbn_metadata(record, descriptor)
+                mapping = _MappingResolver(
+                    record, root_symbol=descriptor.root_symbol
+                )
+                continue
+            if not isinstance(record, OHLCVMsg):
+                raise DatabentoCacheError(
+                    f"unexpected_dbn_record:{entry.filename}:{type(record).__name__}"
+                )
+            self.records += 1
+            if mapping is None:
+                raise DatabentoCacheError(f"dbn_metadata_missing:{entry.filename}")
+            timestamp_ns = int(record.ts_event)
+            if (
+                self.prior_timestamp_ns is not None
+                and timestamp_ns < self.prior_timestamp_ns
+            ):
+                raise DatabentoCacheError(
+                    f"databento_rows_not_monotonic:{descriptor.job_id}"
+                )
+            self.prior_timestamp_ns = timestamp_ns
+            instrument_id = int(record.instrument_id)
+            raw_symbol, resolved_contract = self._resolve(
+                mapping, timestamp_ns, instrument_id
+            )
+            if raw_symbol is None:
+                raise DatabentoCacheError(
+                    f"databento_mapping_missing:{descriptor.root_symbol}:{instrument_id}:{timestamp_ns}"
+                )
+            if resolved_contract is None:
+                raw_root = _raw_symbol_root(raw_symbol)
+                if raw_root is None:
+                    # Parent streams contain spreads; they are retained
+                    # in definitions/statistics but excluded from rolls.
+                    continue
+                raise DatabentoCacheError(
+                    "databento_outright_definition_missing:"
+                    f"{descriptor.root_symbol}:{raw_symbol}:{instrument_id}:"
+                    f"{timestamp_ns}"
+                )
+            contract_key, code = resolved_contract
+            open_nano = int(record.open)
+            high_nano = int(record.high)
+            low_nano = int(record.low)
+            close_nano = int(record.close)
+            volume = int(record.volume)
+            _validate_ohlcv(open_nano, high_nano, low_nano, close_nano, volume)
+            session_ordinal = self.session_resolver.ordinal(timestamp_ns)
+            session_date = date.fromordinal(session_ordinal)
+            self.writer.append(
+                descriptor.root_symbol,
+                session_date,
+                {
+                    "timestamp_ns": timestamp_ns,
+                    "session_ordinal": session_ordinal,
+                    "instrument_id": instrument_id,
+                    "raw_symbol_code": code,
+                    "open_nano": open_nano,
+                    "high_nano": high_nano,
+                    "low_nano": low_nano,
+                    "close_nano": close_nano,
+                    "volume": volume,
+                    "source_id": self.source_id,
+                },
+            )
+            by_contract = self.daily_volumes.setdefault(session_date, {})
+            by_contract[contract_key] = by_contract.get(contract_key, 0) + volume
+            if self.bounds[0] == 0 or timestamp_ns < self.bounds[0]:
+                self.bounds[0] = timestamp_ns
+            if timestamp_ns > self.bounds[1]:
+                self.bounds[1] = timestamp_ns
+        if mapping is None:
+            raise DatabentoCacheError(f"dbn_metadata_missing:{entry.filename}")
+
+
+def _decode_statistics_archive(
+    parquet_root: Path,
+    source_id: int,
+    descriptor: ArchiveDescriptor,
+    contracts_by_raw: Mapping[str, Sequence[_Instrument]],
+    raw_symbol_codes: Mapping[str, int],
+    seed_contract_codes: Mapping[tuple[str, int], tuple[str, int] | None],
+) -> _StatisticsArchiveDecode:
+    writer = _PartitionedParquetWriter(
+        parquet_root / "statistics",
+        _STATISTICS_SCHEMA,
+        part_prefix=f"{source_id:04d}-",
+    )
+    records = 0
+    contract_code_cache = dict(seed_contract_codes)
+    lookups: dict[tuple[str, int], int] = {}
+    with ZipFile(descriptor.path) as archive:
+        for entry in _dbn_entries(archive, descriptor.schema):
+            mapping: _MappingResolver | None = None
+            for record in _iter_dbn_entry(archive, entry):
+                if isinstance(record, Metadata):
+                    _validate_dbn_metadata(record, descriptor)
+                    mapping = _MappingResolver(
+                        record, root_symbol=descriptor.root_symbol
+                    )
+                    continue
+                if not isinstance(record, StatMsg):
+                    raise DatabentoCacheError(
+                        f"unexpected_dbn_record:{entry.filename}:{type(record).__name__}"
+                    )
+                records += 1
+                timestamp_ns = int(record.ts_event)
+                raw_symbol = (
+                    mapping.resolve(timestamp_ns, int(record.instrument_id))
+                    if mapping is not None
+                    else None
+                )
+                reference_ns = int(record.ts_ref)
+                contract_key = ""
+                if raw_symbol:
+                    lookup_ns = (
+                        reference_ns
+                        if 0 < reference_ns < (1 << 63) - 1
+                        else timestamp_ns
+                    )
+                    resolved_contract = _resolve_contract_code(
+                        raw_symbol=raw_symbol,
+                        timestamp_ns=lookup_ns,
+                        candidates=contracts_by_raw.get(raw_symbol, []),
+                        codes=raw_symbol_codes,
+                        cache=contract_code_cache,
+                        lookups=lookups,
+                    )
+                    if resolved_contract is not None:
+                        contract_key = resolved_contract[0]
+                writer.append(
+                    descriptor.root_symbol,
+                    _datetime_from_ns(timestamp_ns).date(),
+                    {
+                        "timestamp_ns": timestamp_ns,
+                        "reference_timestamp_ns": reference_ns,
+                        "instrument_id": int(record.instrument_id),
+                        "raw_symbol": raw_symbol or "",
+                        "contract_key": contract_key,
+                        "price_nano": int(record.price),
+                        "quantity": int(record.quantity),
+                        "sequence": int(record.sequence),
+                        "stat_type": _enum_value(record.stat_type),
+                        "update_action": _enum_value(record.update_action),
+                        "stat_flags": int(record.stat_flags),
+                        "source_id": source_id,
+                    },
+                )
+            if mapping is None:
+                raise DatabentoCacheError(f"dbn_metadata_missing:{entry.filename}")
+    writer.close()
+    return _StatisticsArchiveDecode(
+        records=records,
+        rows_written=writer.rows_written,
+        contract_codes=_new_contract_codes(contract_code_cache, seed_contract_codes),
+        lookups=_observed_lookups(lookups, contract_code_cache),
+    )
+
+
+def _new_contract_codes(
+    cache: Mapping[tuple[str, int], tuple[str, int] | None],
+    seed: Mapping[tuple[str, int], tuple[str, int] | None],
+) -> dict[tuple[str, int], tuple[str, int] | None]:
+    return {key: value for key, value in cache.items() if key not in seed}
+
+
+def _observed_lookups(
+    lookups: Mapping[tuple[str, int], int],
+    cache: Mapping[tuple[str, int], tuple[str, int] | None],
+) -> dict[tuple[str, int], tuple[int, str | None]]:
+    """Each memo key's first lookup time and the contract the decode saw."""
+
+    return {
+        key: (timestamp_ns, cache[key][0] if cache[key] is not None else None)
+        for key, timestamp_ns in lookups.items()
+    }
+
+
+def _merge_contract_codes(
+    merged: dict[tuple[str, int], tuple[str, int] | None],
+    decoded: Mapping[tuple[str, int], tuple[str, int] | None],
+) -> bool:
+    """Fold one archive's day-level contract resolutions into ``merged``.
+
+    ``_resolve_contract_code`` memoizes by calendar day, so the serial build
+    reused the first archive's resolution for a day that a later archive also
+    touches. Returns ``False`` when an independently decoded archive resolved
+    such a day differently and must be decoded again from ``merged``.
+    """
+
+    if any(key in merged and merged[key] != value for key, value in decoded.items()):
+        return False
+    for key, value in decoded.items():
+        merged.setdefault(key, value)
+    return True
+
+
+def _remove_source_parts(base: Path, source_id: int) -> None:
+    for path in base.rglob(f"part-{source_id:04d}-*.parquet"):
+        path.unlink()
+
+
+def _decode_inputs_digest(descriptor: ArchiveDescriptor) -> str:
+    """Identify an archive and the decode format its partitions were written in.
+
+    Contract inputs are not part of the digest: a decode record lists the
+    lookups the archive actually made, and those are checked one by one.
+    """
+
+    canonical = {
+        "cache_format_version": CACHE_FORMAT_VERSION,
+        "roll_policy_version": ROLL_POLICY_VERSION,
+        "decoded_archive_format": _DECODED_ARCHIVE_FORMAT,
+        "sha256": descriptor.sha256,
+        "schema": descriptor.schema,
+        "root_symbol": descriptor.root_symbol,
+    }
+    return hashlib.sha256(
+        json.dumps(canonical, sort_keys=True, separators=(",", ":")).encode()
+    ).hexdigest()
+
+
+def _persist_decoded_archive(
+    version_dir: Path,
+    *,
+    source_id: int,
+    descriptor: ArchiveDescriptor,
+    decoded: _DefinitionArchiveDecode | _OhlcvArchiveDecode | _StatisticsArchiveDecode,
+    raw_symbol_codes: Mapping[str, int],
+) -> None:
+    """Record one archive's decode so a later build can reuse its partitions.
+
+    Definition records only keep the earliest outright definition time, which
+    bounds the sessions whose roll decisions the archive can change.
+    """
+
+    subdir = _PARQUET_DIRS_BY_SCHEMA[descriptor.schema]
+    record: dict[str, Any] = {
+        "decoded_archive_format": _DECODED_ARCHIVE_FORMAT,
+        "sha256": descriptor.sha256,
+        "schema": descriptor.schema,
+        "root_symbol": descriptor.root_symbol,
+        "source_id": source_id,
+        "inputs_digest": _decode_inputs_digest(descriptor),
+        "records": decoded.records,
+        "rows_written": decoded.rows_written,
+        "files": sorted(
+            path.relative_to(version_dir).as_posix()
+            for path in (version_dir / "parquet" / subdir).rglob(
+                f"part-{source_id:04d}-*.parquet"
+            )
+        ),
+    }
+    if isinstance(decoded, _DefinitionArchiveDecode):
+        record["first_outright_definition_ns"] = min(
+            (item.definition_ts_ns for item in decoded.outrights), default=None
+        )
+        _write_json(version_dir / "decoded" / f"{descriptor.sha256}.json", record)
+        return
+    record["lookups"] = sorted(
+        [raw_symbol, day, timestamp_ns, contract_key]
+        for (raw_symbol, day), (timestamp_ns, contract_key) in decoded.lookups.items()
+    )
+    if isinstance(decoded, _OhlcvArchiveDecode):
+        record["instrument_fallbacks"] = sorted(
+            [instrument_id, raw_symbol]
+            for instrument_id, raw_symbol in decoded.instrument_fallbacks.items()
+        )
+        # Rows store contract codes, which shift when a listing is added.
+        record["raw_symbol_codes"] = {
+            contract_key: raw_symbol_codes[contract_key]
+            for contract_key in sorted(
+                {
+                    contract_key
+                    for _timestamp_ns, contract_key in decoded.lookups.values()
+                    if contract_key is not None
+                }
+            )
+        }
+        record["daily_volumes"] = {
+            str(session_date.toordinal()): dict(volumes)
+            for session_date, volumes in sorted(decoded.daily_volumes.items())
+        }
+        record["bounds_ns"] = list(decoded.bounds_ns)
+    _write_json(version_dir / "decoded" / f"{descriptor.sha256}.json", record)
+
+
+def _load_decoded_archives(version_dir: Path) -> dict[str, dict[str, Any]]:
+    records: dict[str, dict[str, Any]] = {}
+    for path in sorted((version_dir / "decoded").glob("*.json")):
+        try:
+            record = _read_json(path)
+        except (OSError, ValueError):
+            continue
+        if record.get("decoded_archive_format") != _DECODED_ARCHIVE_FORMAT:
+            continue
+        if all((version_dir / str(name)).is_file() for name in record.get("files", [])):
+            records[str(record.get("sha256"))] = record
+    return records
+
+
+def _revalidated_contract_codes(
+    record: Mapping[str, Any] | None,
+    descriptor: ArchiveDescriptor,
+    inputs: _ContractInputs,
+) -> dict[tuple[str, int], tuple[str, int] | None] | None:
+    """The archive's new memo entries if its prior decode still holds, else ``None``.
+
+    A decode only depends on the instrument ids it mapped through the
+    definitions and on the (raw symbol, day) keys it resolved, so those are
+    re-resolved against ``inputs`` at their first lookup time. Any other
+    definition, listing or OHLCV day leaves the archive reusable.
+    """
+
+    if (
+        record is None
+        or record.get("schema") != descriptor.schema
+        or record.get("inputs_digest") != _decode_inputs_digest(descriptor)
+    ):
+        return None
+    for instrument_id, raw_symbol in record.get("instrument_fallbacks", []):
+        if inputs.instrument_mapping.get(int(instrument_id)) != raw_symbol:
+            return None
+    cache: dict[tuple[str, int], tuple[str, int] | None] = {}
+    contract_codes: dict[tuple[str, int], tuple[str, int] | None] = {}
+    for raw_symbol, day, timestamp_ns, contract_key in record["lookups"]:
+        key = (str(raw_symbol), int(day))
+        if key in inputs.seed_contract_codes:
+            resolved = inputs.seed_contract_codes[key]
+        else:
+            resolved = _resolve_contract_code(
+                raw_symbol=key[0],
+                timestamp_ns=int(timestamp_ns),
+                candidates=inputs.contracts_by_raw.get(key[0], []),
+                codes=inputs.raw_symbol_codes,
+                cache=cache,
+            )
+            contract_codes[key] = resolved
+        if (resolved[0] if resolved is not None else None) != contract_key:
+            return None
+    return contract_codes
+
+
+def _restore_decoded_archive(
+    record: Mapping[str, Any],
+    *,
+    previous_dir: Path,
+    version_dir: Path,
+    source_id: int,
+    raw_symbol_codes: Mapping[str, int],
+    contract_codes: Mapping[tuple[str, int], tuple[str, int] | None],
+) -> _OhlcvArchiveDecode | _StatisticsArchiveDecode:
+    """Link a prior decode's partitions into ``version_dir``.
+
+    Partitions are immutable, so they are hard-linked. When added archives
+    renumber this source or its contracts' codes, only the ``source_id`` and
+    ``raw_symbol_code`` columns and the file names change.
+    """
+
+    previous_source_id = int(record["source_id"])
+    previous_codes = {
+        str(contract_key): int(code)
+        for contract_key, code in record.get("raw_symbol_codes", {}).items()
+    }
+    code_map = {
+        code: raw_symbol_codes[contract_key]
+        for contract_key, code in previous_codes.items()
+        if raw_symbol_codes[contract_key] != code
+    }
+    old_prefix = f"part-{previous_source_id:04d}-"
+    for name in record["files"]:
+        source = previous_dir / str(name)
+        target = version_dir / Path(str(name)).parent / source.name.replace(
+            old_prefix, f"part-{source_id:04d}-", 1
+        )
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if previous_source_id == source_id and not code_map:
+            try:
+                os.link(source, target)
+            except OSError:
+                shutil.copy2(source, target)
+            continue
+        table = pq.read_table(source)
+        index = table.schema.get_field_index("source_id")
+        table = table.set_column(
+            index,
+            table.schema.field(index),
+            pa.array(np.full(table.num_rows, source_id, dtype=np.uint16)),
+        )
+        if code_map:
+            index = table.schema.get_field_index("raw_symbol_code")
+            codes = table.column(index).to_numpy(zero_copy_only=False)
+            remap = np.arange(max(previous_codes.values()) + 1, dtype=np.uint32)
+            for old_code, new_code in code_map.items():
+                remap[old_code] = new_code
+            table = table.set_column(
+                index, table.schema.field(index), pa.array(remap[codes])
+            )
+        _write_parquet_part(table, target)
+    lookups = {
+        (str(raw_symbol), int(day)): (int(timestamp_ns), contract_key)
+        for raw_symbol, day, timestamp_ns, contract_key in record["lookups"]
+    }
+    if record["schema"] == "statistics":
+        return _StatisticsArchiveDecode(
+            records=int(record["records"]),
+            rows_written=int(record["rows_written"]),
+            contract_codes=contract_codes,
+            lookups=lookups,
+        )
+    first_ns, last_ns = record["bounds_ns"]
+    return _OhlcvArchiveDecode(
+        records=int(record["records"]),
+        rows_written=int(record["rows_written"]),
+        daily_volumes=_decoded_daily_volumes(record),
+        bounds_ns=(int(first_ns), int(last_ns)),
+        contract_codes=contract_codes,
+        lookups=lookups,
+        instrument_fallbacks={
+            int(instrument_id): raw_symbol
+            for instrument_id, raw_symbol in record["instrument_fallbacks"]
+        },
+    )
+
+
+def _decoded_daily_volumes(
+    record: Mapping[str, Any],
+) -> dict[date, dict[str, int]]:
+    return {
+        date.fromordinal(int(ordinal)): {
+            str(contract_key): int(volume)
+            for contract_key, volume in volumes.items()
+        }
+        for ordinal, volumes in record["daily_volumes"].items()
+    }
+
+
+def _decode_or_reuse(
+    decode: Any,
+    sources: Sequence[tuple[int, ArchiveDescriptor]],
+    tasks: Sequence[tuple[Any, ...]],
+    inputs: Sequence[_ContractInputs],
+    *,
+    reusable: Mapping[str, Mapping[str, Any]],
+    previous_dir: Path | None,
+    version_dir: Path,
+    max_workers: int,
+) -> list[tuple[Any, bool]]:
+    """Decode the archives without a reusable prior decode, in source order."""
+
+    restorable: dict[int, dict[tuple[str, int], tuple[str, int] | None]] = {}
+    if previous_dir is not None:
+        for index, ((_source_id, descriptor), task_inputs) in enumerate(
+            zip(sources, inputs)
+        ):
+            contract_codes = _revalidated_contract_codes(
+                reusable.get(descriptor.sha256), descriptor, task_inputs
+            )
+            if contract_codes is not None:
+                restorable[index] = contract_codes
+    pending = [index for index in range(len(sources)) if index not in restorable]
+    decoded = dict(
+        zip(
+            pending,
+            _decode_archives(
+                decode, [tasks[index] for index in pending], max_workers=max_workers
+            ),
+        )
+    )
+    results: list[tuple[Any, bool]] = []
+    for index, (source_id, descriptor) in enumerate(sources):
+        if index in decoded:
+            results.append((decoded[index], False))
+            continue
+        assert previous_dir is not None
+        results.append(
+            (
+                _restore_decoded_archive(
+                    reusable[descriptor.sha256],
+                    previous_dir=previous_dir,
+                    version_dir=version_dir,
+                    source_id=source_id,
+                    raw_symbol_codes=inputs[index].raw_symbol_codes,
+                    contract_codes=restorable[index],
+                ),
+                True,
+            )
+        )
+    return results
+
+
+def _build_parquet_and_rolls(
+    version_dir: Path,
+    descriptors: Sequence[ArchiveDescriptor],
+    *,
+    max_workers: int | None = None,
+    reuse_from: Path | None = None,
+) -> tuple[dict[str, Any], int, dict[str, int]]:
+    """Decode every archive into Parquet, then merge the roll inputs in order.
+
+    Each archive is decoded independently and writes its own ``part-<source>-``
+    files, so the Parquet rows, roll schedule and manifest are identical for
+    any worker count. With ``reuse_from``, OHLCV and statistics archives whose
+    recorded contract lookups still resolve the same way are linked instead of
+    decoded, and each root's roll schedule is only re-derived from the first
+    session an added or removed archive can change.
+
+    Returns the manifest, the number of reused archives and, per root whose
+    changes are known, the first session ordinal at which its continuous
+    series may differ from the ``reuse_from`` series.
+    """
+
+    parquet_root = version_dir / "parquet"
+    workers = _build_worker_count(max_workers)
+    reusable = _load_decoded_archives(reuse_from) if reuse_from is not None else {}
+    previous_manifest = (
+        _read_json(reuse_from / "manifest.json")
+        if reuse_from is not None and (reuse_from / "manifest.json").is_file()
+        else None
+    )
+    reused_archives = 0
+    restored: set[str] = set()
+    decoded_sessions: defaultdict[str, set[date]] = defaultdict(set)
+    definition_starts: dict[str, int | None] = {}
+    records_by_schema: defaultdict[str, int] = defaultdict(int)
+    parquet_rows = {"definitions": 0, "ohlcv_1m": 0, "statistics": 0}
+    contracts: dict[str, dict[str, list[_Instrument]]] = {
+        root: {} for root in sorted({item.root_symbol for item in descriptors})
+    }
+    unique_instrument_mapping: dict[str, dict[int, str | None]] = {
+        root: {} for root in contracts
+    }
+
+    definition_sources = [
+        (source_id, descriptor)
+        for source_id, descriptor in enumerate(descriptors)
+        if descriptor.schema == "definition"
+    ]
+    definition_results = _decode_archives(
+        _decode_definition_archive,
+        [
+            (parquet_root, source_id, descriptor)
+            for source_id, descriptor in definition_sources
+        ],
+        max_workers=workers,
+    )
+    for (source_id, descriptor), decoded in zip(
+        definition_sources, definition_results
+    ):
+        _persist_decoded_archive(
+            version_dir,
+            source_id=source_id,
+            descriptor=descriptor,
+            decoded=decoded,
+            raw_symbol_codes={},
+        )
+        definition_starts[descriptor.sha256] = min(
+            (item.definition_ts_ns for item in decoded.outrights), default=None
+        )
+        records_by_schema[descriptor.schema] += decoded.records
+        parquet_rows["definitions"] += decoded.rows_written
+        root_mapping = unique_instrument_mapping[descriptor.root_symbol]
+        for instrument_id, raw_symbol in decoded.instrument_mapping.items():
+            _merge_instrument_mapping(root_mapping, instrument_id, raw_symbol)
+        for instrument in decoded.outrights:
+            contracts[descriptor.root_symbol].setdefault(
+                instrument.contract_key, []
+            ).append(instrument)
+
+    missing_definitions = [root for root, values in contracts.items() if not values]
+    if missing_definitions:
         raise DatabentoCacheError(
             f"databento_outright_definitions_missing:{','.join(missing_definitions)}"
         )
@@ -2565,181 +4217,153 @@ def _build_parquet_and_rolls(
             contracts_by_raw[root][instrument.raw_symbol].append(instrument)
         for candidates in contracts_by_raw[root].values():
             candidates.sort(key=lambda item: item.expiration_ns)
-    contract_code_cache: dict[str, dict[tuple[str, int], tuple[str, int] | None]] = {
-        root: {} for root in contracts
-    }
     daily_volumes: dict[str, dict[date, dict[str, int]]] = {
         root: {} for root in contracts
     }
     raw_bounds: dict[str, list[int]] = {root: [0, 0] for root in contracts}
+    contract_codes: dict[str, dict[tuple[str, int], tuple[str, int] | None]] = {
+        root: {} for root in contracts
+    }
 
-    for source_id, descriptor in enumerate(descriptors):
-        if descriptor.schema != "ohlcv-1m":
-            continue
-        session_resolver = _SessionResolver()
-        prior_timestamp_ns: int | None = None
-        with ZipFile(descriptor.path) as archive:
-            for entry in _dbn_entries(archive, descriptor.schema):
-                mapping: _MappingResolver | None = None
-                for record in _iter_dbn_entry(archive, entry):
-                    if isinstance(record, Metadata):
-                        _validate_dbn_metadata(record, descriptor)
-                        mapping = _MappingResolver(
-                            record, root_symbol=descriptor.root_symbol
-                        )
-                        continue
-                    if not isinstance(record, OHLCVMsg):
-                        raise DatabentoCacheError(
-                            f"unexpected_dbn_record:{entry.filename}:{type(record).__name__}"
-                        )
-                    records_by_schema[descriptor.schema] += 1
-                    if mapping is None:
-                        raise DatabentoCacheError(f"dbn_metadata_missing:{entry.filename}")
-                    timestamp_ns = int(record.ts_event)
-                    if prior_timestamp_ns is not None and timestamp_ns < prior_timestamp_ns:
-                        raise DatabentoCacheError(
-                            f"databento_rows_not_monotonic:{descriptor.job_id}"
-                        )
-                    prior_timestamp_ns = timestamp_ns
-                    instrument_id = int(record.instrument_id)
-                    raw_symbol = mapping.resolve(timestamp_ns, instrument_id)
-                    if raw_symbol is None:
-                        raw_symbol = unique_instrument_mapping[
-                            descriptor.root_symbol
-                        ].get(instrument_id)
-                    if raw_symbol is None:
-                        raise DatabentoCacheError(
-                            f"databento_mapping_missing:{descriptor.root_symbol}:{instrument_id}:{timestamp_ns}"
-                        )
-                    resolved_contract = _resolve_contract_code(
-                        raw_symbol=raw_symbol,
-                        timestamp_ns=timestamp_ns,
-                        candidates=contracts_by_raw[descriptor.root_symbol].get(
-                            raw_symbol, []
-                        ),
-                        codes=raw_symbol_codes[descriptor.root_symbol],
-                        cache=contract_code_cache[descriptor.root_symbol],
-                    )
-                    if resolved_contract is None:
-                        raw_root = _raw_symbol_root(raw_symbol)
-                        if raw_root is None:
-                            # Parent streams contain spreads; they are retained
-                            # in definitions/statistics but excluded from rolls.
-                            continue
-                        raise DatabentoCacheError(
-                            "databento_outright_definition_missing:"
-                            f"{descriptor.root_symbol}:{raw_symbol}:{instrument_id}:"
-                            f"{timestamp_ns}"
-                        )
-                    contract_key, code = resolved_contract
-                    open_nano = int(record.open)
-                    high_nano = int(record.high)
-                    low_nano = int(record.low)
-                    close_nano = int(record.close)
-                    volume = int(record.volume)
-                    _validate_ohlcv(
-                        open_nano, high_nano, low_nano, close_nano, volume
-                    )
-                    session_ordinal = session_resolver.ordinal(timestamp_ns)
-                    session_date = date.fromordinal(session_ordinal)
-                    ohlcv_writer.append(
-                        descriptor.root_symbol,
-                        session_date,
-                        {
-                            "timestamp_ns": timestamp_ns,
-                            "session_ordinal": session_ordinal,
-                            "instrument_id": instrument_id,
-                            "raw_symbol_code": code,
-                            "open_nano": open_nano,
-                            "high_nano": high_nano,
-                            "low_nano": low_nano,
-                            "close_nano": close_nano,
-                            "volume": volume,
-                            "source_id": source_id,
-                        },
-                    )
-                    by_contract = daily_volumes[descriptor.root_symbol].setdefault(
-                        session_date, {}
-                    )
-                    by_contract[contract_key] = (
-                        by_contract.get(contract_key, 0) + volume
-                    )
-                    bounds = raw_bounds[descriptor.root_symbol]
-                    if bounds[0] == 0 or timestamp_ns < bounds[0]:
-                        bounds[0] = timestamp_ns
-                    if timestamp_ns > bounds[1]:
-                        bounds[1] = timestamp_ns
-                if mapping is None:
-                    raise DatabentoCacheError(f"dbn_metadata_missing:{entry.filename}")
-    ohlcv_writer.close()
-
-    for source_id, descriptor in enumerate(descriptors):
-        if descriptor.schema != "statistics":
-            continue
-        with ZipFile(descriptor.path) as archive:
-            for entry in _dbn_entries(archive, descriptor.schema):
-                mapping: _MappingResolver | None = None
-                for record in _iter_dbn_entry(archive, entry):
-                    if isinstance(record, Metadata):
-                        _validate_dbn_metadata(record, descriptor)
-                        mapping = _MappingResolver(
-                            record, root_symbol=descriptor.root_symbol
-                        )
-                        continue
-                    if not isinstance(record, StatMsg):
-                        raise DatabentoCacheError(
-                            f"unexpected_dbn_record:{entry.filename}:{type(record).__name__}"
-                        )
-                    records_by_schema[descriptor.schema] += 1
-                    timestamp_ns = int(record.ts_event)
-                    raw_symbol = (
-                        mapping.resolve(timestamp_ns, int(record.instrument_id))
-                        if mapping is not None
-                        else None
-                    )
-                    reference_ns = int(record.ts_ref)
-                    contract_key = ""
-                    if raw_symbol:
-                        lookup_ns = (
-                            reference_ns
-                            if 0 < reference_ns < (1 << 63) - 1
-                            else timestamp_ns
-                        )
-                        resolved_contract = _resolve_contract_code(
-                            raw_symbol=raw_symbol,
-                            timestamp_ns=lookup_ns,
-                            candidates=contracts_by_raw[descriptor.root_symbol].get(
-                                raw_symbol, []
-                            ),
-                            codes=raw_symbol_codes[descriptor.root_symbol],
-                            cache=contract_code_cache[descriptor.root_symbol],
-                        )
-                        if resolved_contract is not None:
-                            contract_key = resolved_contract[0]
-                    statistics_writer.append(
-                        descriptor.root_symbol,
-                        _datetime_from_ns(timestamp_ns).date(),
-                        {
-                            "timestamp_ns": timestamp_ns,
-                            "reference_timestamp_ns": reference_ns,
-                            "instrument_id": int(record.instrument_id),
-                            "raw_symbol": raw_symbol or "",
-                            "contract_key": contract_key,
-                            "price_nano": int(record.price),
-                            "quantity": int(record.quantity),
-                            "sequence": int(record.sequence),
-                            "stat_type": _enum_value(record.stat_type),
-                            "update_action": _enum_value(record.update_action),
-                            "stat_flags": int(record.stat_flags),
-                            "source_id": source_id,
-                        },
-                    )
-                if mapping is None:
-                    raise DatabentoCacheError(f"dbn_metadata_missing:{entry.filename}")
-    statistics_writer.close()
+    ohlcv_sources = [
+        (source_id, descriptor)
+        for source_id, descriptor in enumerate(descriptors)
+        if descriptor.schema == "ohlcv-1m"
+    ]
+    ohlcv_tasks = [
+        (
+            parquet_root,
+            source_id,
+            descriptor,
+            dict(contracts_by_raw[descriptor.root_symbol]),
+            raw_symbol_codes[descriptor.root_symbol],
+            unique_instrument_mapping[descriptor.root_symbol],
+            {},
+        )
+        for source_id, descriptor in ohlcv_sources
+    ]
+    ohlcv_results = _decode_or_reuse(
+        _decode_ohlcv_archive,
+        ohlcv_sources,
+        ohlcv_tasks,
+        [_ContractInputs(*task[3:]) for task in ohlcv_tasks],
+        reusable=reusable,
+        previous_dir=reuse_from,
+        version_dir=version_dir,
+        max_workers=workers,
+    )
+    for (source_id, descriptor), task, (decoded, reused) in zip(
+        ohlcv_sources, ohlcv_tasks, ohlcv_results
+    ):
+        root_codes = contract_codes[descriptor.root_symbol]
+        reseeded = not _merge_contract_codes(root_codes, decoded.contract_codes)
+        if reseeded:
+            _remove_source_parts(parquet_root / "ohlcv_1m", source_id)
+            decoded = _decode_ohlcv_archive(*task[:-1], dict(root_codes))
+            _merge_contract_codes(root_codes, decoded.contract_codes)
+        if reused and not reseeded:
+            reused_archives += 1
+            restored.add(descriptor.sha256)
+        else:
+            decoded_sessions[descriptor.root_symbol].update(decoded.daily_volumes)
+        _persist_decoded_archive(
+            version_dir,
+            source_id=source_id,
+            descriptor=descriptor,
+            decoded=decoded,
+            raw_symbol_codes=raw_symbol_codes[descriptor.root_symbol],
+        )
+        records_by_schema[descriptor.schema] += decoded.records
+        parquet_rows["ohlcv_1m"] += decoded.rows_written
+        root_volumes = daily_volumes[descriptor.root_symbol]
+        for session_date, volumes in decoded.daily_volumes.items():
+            by_contract = root_volumes.setdefault(session_date, {})
+            for contract_key, volume in volumes.items():
+                by_contract[contract_key] = by_contract.get(contract_key, 0) + volume
+        if decoded.records:
+            bounds = raw_bounds[descriptor.root_symbol]
+            first_ns, last_ns = decoded.bounds_ns
+            if first_ns and (bounds[0] == 0 or first_ns < bounds[0]):
+                bounds[0] = first_ns
+            if last_ns > bounds[1]:
+                bounds[1] = last_ns
+
+    statistics_sources = [
+        (source_id, descriptor)
+        for source_id, descriptor in enumerate(descriptors)
+        if descriptor.schema == "statistics"
+    ]
+    statistics_tasks = [
+        (
+            parquet_root,
+            source_id,
+            descriptor,
+            dict(contracts_by_raw[descriptor.root_symbol]),
+            raw_symbol_codes[descriptor.root_symbol],
+            dict(contract_codes[descriptor.root_symbol]),
+        )
+        for source_id, descriptor in statistics_sources
+    ]
+    # Statistics resolve contracts through the memo every OHLCV archive
+    # populated; only the memo days an archive looks up decide its reuse.
+    statistics_results = _decode_or_reuse(
+        _decode_statistics_archive,
+        statistics_sources,
+        statistics_tasks,
+        [
+            _ContractInputs(
+                contracts_by_raw=task[3],
+                raw_symbol_codes=task[4],
+                instrument_mapping={},
+                seed_contract_codes=task[5],
+            )
+            for task in statistics_tasks
+        ],
+        reusable=reusable,
+        previous_dir=reuse_from,
+        version_dir=version_dir,
+        max_workers=workers,
+    )
+    for (source_id, descriptor), task, (decoded, reused) in zip(
+        statistics_sources, statistics_tasks, statistics_results
+    ):
+        root_codes = contract_codes[descriptor.root_symbol]
+        reseeded = not _merge_contract_codes(root_codes, decoded.contract_codes)
+        if reseeded:
+            _remove_source_parts(parquet_root / "statistics", source_id)
+            decoded = _decode_statistics_archive(*task[:-1], dict(root_codes))
+            _merge_contract_codes(root_codes, decoded.contract_codes)
+        reused_archives += int(reused and not reseeded)
+        _persist_decoded_archive(
+            version_dir,
+            source_id=source_id,
+            descriptor=descriptor,
+            decoded=decoded,
+            raw_symbol_codes=raw_symbol_codes[descriptor.root_symbol],
+        )
+        records_by_schema[descriptor.schema] += decoded.records
+        parquet_rows["statistics"] += decoded.rows_written
 
     roll_counts: dict[str, int] = {}
+    first_changed_sessions: dict[str, int] = {}
     for root_symbol in sorted(contracts):
+        sessions = sorted(daily_volumes[root_symbol])
+        changes = _root_changes_since(
+            previous_manifest,
+            reusable,
+            root_symbol=root_symbol,
+            descriptors=descriptors,
+            restored=restored,
+            decoded_sessions=decoded_sessions[root_symbol],
+            definition_starts=definition_starts,
+        )
+        previous_decisions: list[_RollDecision] = []
+        resume_from: date | None = None
+        if changes is not None and reuse_from is not None and sessions:
+            previous_decisions = _read_roll_decisions(
+                reuse_from / "parquet" / "rolls" / f"root={root_symbol}" / "rolls.parquet"
+            )
+            resume_from = _first_affected_session(sessions, *changes)
         decisions = _build_roll_schedule(
             root_symbol=root_symbol,
             contracts=[
@@ -2748,9 +4372,15 @@ def _build_parquet_and_rolls(
                 for definition in timeline
             ],
             daily_volumes=daily_volumes[root_symbol],
+            resume_from=resume_from if previous_decisions else None,
+            previous=previous_decisions,
         )
         if not decisions:
             raise DatabentoCacheError(f"databento_roll_schedule_missing:{root_symbol}")
+        if changes is not None and previous_decisions:
+            first_changed_sessions[root_symbol] = _first_changed_series_session(
+                previous_decisions, decisions, changes[1]
+            )
         roll_dir = parquet_root / "rolls" / f"root={root_symbol}"
         roll_dir.mkdir(parents=True, exist_ok=True)
         code_by_symbol = raw_symbol_codes[root_symbol]
@@ -2790,16 +4420,145 @@ def _build_parquet_and_rolls(
     return {
         "roots": sorted(contracts),
         "records_by_schema": dict(sorted(records_by_schema.items())),
-        "parquet_rows": {
-            "definitions": definition_writer.rows_written,
-            "ohlcv_1m": ohlcv_writer.rows_written,
-            "statistics": statistics_writer.rows_written,
-        },
+        "parquet_rows": parquet_rows,
         "raw_bounds_ns": raw_bounds,
         "raw_symbol_codes": raw_symbol_codes,
         "roll_schedule_rows": roll_counts,
         "series": {},
+    }, reused_archives, first_changed_sessions
+
+
+def _root_changes_since(
+    previous_manifest: Mapping[str, Any] | None,
+    reusable: Mapping[str, Mapping[str, Any]],
+    *,
+    root_symbol: str,
+    descriptors: Sequence[ArchiveDescriptor],
+    restored: set[str],
+    decoded_sessions: set[date],
+    definition_starts: Mapping[str, int | None],
+) -> tuple[int | None, date | None] | None:
+    """The earliest definition time and OHLCV session the changed archives touch.
+
+    Changed archives are the added and removed definition archives and every
+    OHLCV archive that was decoded rather than restored, in either build.
+    ``None`` when the previous build left no record to bound one of them.
+    """
+
+    if previous_manifest is None or root_symbol not in previous_manifest.get(
+        "roots", []
+    ):
+        return None
+    previous = {
+        str(item.get("sha256")): str(item.get("schema"))
+        for item in previous_manifest.get("archives", [])
+        if item.get("root_symbol") == root_symbol
     }
+    current = {
+        item.sha256: item.schema
+        for item in descriptors
+        if item.root_symbol == root_symbol
+    }
+    definition_times = [
+        definition_starts[sha256]
+        for sha256, schema in current.items()
+        if schema == "definition" and sha256 not in previous
+    ]
+    sessions = set(decoded_sessions)
+    for sha256, schema in previous.items():
+        if schema == "statistics" or sha256 in restored:
+            continue
+        if schema == "definition" and current.get(sha256) == "definition":
+            continue
+        record = reusable.get(sha256)
+        if record is None:
+            return None
+        if schema == "definition":
+            definition_times.append(record.get("first_outright_definition_ns"))
+        else:
+            sessions.update(_decoded_daily_volumes(record))
+    known_times = [int(value) for value in definition_times if value is not None]
+    return (
+        min(known_times) if known_times else None,
+        min(sessions) if sessions else None,
+    )
+
+
+def _first_affected_session(
+    sessions: Sequence[date],
+    first_definition_ns: int | None,
+    first_session: date | None,
+) -> date:
+    """The first session whose roll inputs the changed archives can reach.
+
+    A definition only applies from the first session that opens after it;
+    an OHLCV day changes its own session and the decision that follows it.
+    Unchanged inputs resume after the last session.
+    """
+
+    affected = sessions[-1] + timedelta(days=1)
+    if first_session is not None:
+        affected = min(affected, first_session)
+    if first_definition_ns is not None:
+        for session_date in sessions:
+            if session_date >= affected:
+                break
+            session_start, _ = trading_day_bounds_utc(session_date)
+            if _datetime_to_ns(session_start) >= first_definition_ns:
+                affected = session_date
+                break
+    return affected
+
+
+def _read_roll_decisions(path: Path) -> list[_RollDecision]:
+    if not path.is_file():
+        return []
+    return [
+        _RollDecision(
+            root_symbol=str(row["root_symbol"]),
+            trading_date=row["trading_date"],
+            instrument_id=int(row["instrument_id"]),
+            raw_symbol=str(row["raw_symbol"]),
+            contract_key=str(row["contract_key"]),
+            decision_session_date=row["decision_session_date"],
+            from_instrument_id=row["from_instrument_id"],
+            current_volume=row["current_volume"],
+            candidate_volume=row["candidate_volume"],
+            reason=str(row["reason"]),
+            policy_version=str(row["policy_version"]),
+        )
+        for row in pq.read_table(path).to_pylist()
+    ]
+
+
+def _first_changed_series_session(
+    previous: Sequence[_RollDecision],
+    decisions: Sequence[_RollDecision],
+    first_session: date | None,
+) -> int:
+    """The first session ordinal whose continuous rows can differ.
+
+    Sessions before it kept both their OHLCV rows and their rolled contract,
+    so every series keeps its rows up to there.
+    """
+
+    changed = decisions[-1].trading_date + timedelta(days=1)
+    if previous:
+        changed = max(changed, previous[-1].trading_date + timedelta(days=1))
+    for before, after in zip(previous, decisions):
+        if (before.trading_date, before.contract_key) != (
+            after.trading_date,
+            after.contract_key,
+        ):
+            changed = min(before.trading_date, after.trading_date)
+            break
+    else:
+        if len(previous) != len(decisions):
+            longer = previous if len(previous) > len(decisions) else decisions
+            changed = longer[min(len(previous), len(decisions))].trading_date
+    if first_session is not None:
+        changed = min(changed, first_session)
+    return changed.toordinal()
 
 
 def _build_roll_schedule(
@@ -2807,8 +4566,14 @@ def _build_roll_schedule(
     root_symbol: str,
     contracts: Sequence[_Instrument],
     daily_volumes: Mapping[date, Mapping[str, int]],
+    resume_from: date | None = None,
+    previous: Sequence[_RollDecision] = (),
 ) -> list[_RollDecision]:
-    """Choose session D from D-1 volume and definitions known by D's open."""
+    """Choose session D from D-1 volume and definitions known by D's open.
+
+    With ``resume_from``, the ``previous`` decisions before that session are
+    kept and the walk continues from their contract.
+    """
 
     sessions = sorted(daily_volumes)
     if not sessions:
@@ -2828,7 +4593,20 @@ def _build_roll_schedule(
     current_key: str | None = None
     prior_session: date | None = None
     output: list[_RollDecision] = []
-    for session_date in sessions:
+    start = 0
+    if resume_from is not None:
+        output = [item for item in previous if item.trading_date < resume_from]
+        start = bisect_left(sessions, resume_from)
+        prior_session = sessions[start - 1] if start else None
+        if output:
+            last = output[-1]
+            current_key = last.contract_key
+            definition_times, definitions = timelines[current_key]
+            last_start, _ = trading_day_bounds_utc(last.trading_date)
+            current = definitions[
+                bisect_right(definition_times, _datetime_to_ns(last_start)) - 1
+            ]
+    for session_date in sessions[start:]:
         session_start, _ = trading_day_bounds_utc(session_date)
         session_start_ns = _datetime_to_ns(session_start)
         point_in_time: list[_Instrument] = []
@@ -2931,14 +4709,188 @@ def _later_contracts(
     ]
 
 
+@dataclass(frozen=True)
+class _SeriesExtension:
+    """A previous version's copy of a series and the session it stops holding at.
+
+    Rows before ``first_session`` are copied with their contract codes
+    renumbered through ``code_map``; only the later rows are rebuilt.
+    """
+
+    directory: Path
+    first_session: int
+    code_map: tuple[int, ...]
+
+    def unchanged_rows(self) -> int:
+        sessions = np.load(self.directory / "session_ordinal.npy", mmap_mode="r")
+        try:
+            return int(np.searchsorted(sessions, self.first_session, side="left"))
+        finally:
+            _close_memmap(sessions)
+
+    def copy_rows(self, name: str, output: np.ndarray, rows: int) -> None:
+        """Copy the first ``rows`` of column ``name`` into ``output``."""
+
+        values = np.load(self.directory / f"{name}.npy", mmap_mode="r")
+        code_map = (
+            np.asarray(self.code_map, dtype=np.uint32)
+            if name == "raw_symbol_code"
+            else None
+        )
+        try:
+            for start in range(0, rows, PARQUET_BATCH_ROWS):
+                stop = min(rows, start + PARQUET_BATCH_ROWS)
+                output[start:stop] = (
+                    code_map[values[start:stop]]
+                    if code_map is not None
+                    else values[start:stop]
+                )
+        finally:
+            _close_memmap(values)
+
+
+def _series_extensions(
+    previous_dir: Path,
+    manifest: Mapping[str, Any],
+    first_changed_sessions: Mapping[str, int],
+) -> dict[str, _SeriesExtension]:
+    """Intact series of ``previous_dir`` that the new version can extend."""
+
+    previous_manifest = _read_json(previous_dir / "manifest.json")
+    ledger = _IntegrityLedger.load(previous_dir)
+    extensions: dict[str, _SeriesExtension] = {}
+    for key in previous_manifest.get("series") or {}:
+        root_symbol = str(key).split(":", 1)[0]
+        if root_symbol not in first_changed_sessions:
+            continue
+        entry, _ = _complete_series_entry(
+            previous_dir, previous_manifest, key, ledger=ledger
+        )
+        if entry is None:
+            continue
+        previous_codes = previous_manifest["raw_symbol_codes"][root_symbol]
+        codes = manifest["raw_symbol_codes"][root_symbol]
+        code_map = [0] * (max(map(int, previous_codes.values()), default=0) + 1)
+        for contract_key, code in previous_codes.items():
+            code_map[int(code)] = int(codes.get(contract_key, 0))
+        extensions[key] = _SeriesExtension(
+            directory=previous_dir / str(entry["path"]),
+            first_session=first_changed_sessions[root_symbol],
+            code_map=tuple(code_map),
+        )
+    return extensions
+
+
 def _ensure_series_for_all_roots(
     version_dir: Path,
     manifest: dict[str, Any],
-    unit: str,
-    unit_number: int,
-) -> None:
-    for root_symbol in manifest.get("roots", []):
-        _ensure_series(version_dir, manifest, str(root_symbol), unit, unit_number)
+    timeframes: Sequence[tuple[str, int]],
+    *,
+    max_workers: int | None = None,
+    extensions: Mapping[str, _SeriesExtension] | None = None,
+) -> list[str]:
+    """Materialize every root's series for ``timeframes``.
+
+    The builds form a small DAG: each root's continuous 1m series, then every
+    timeframe resampled from it. Roots are independent, so the nodes run on
+    up to ``max_workers`` processes as soon as their 1m series exists. Entries
+    land in ``manifest["series"]`` in the order a serial build adds them, and
+    a failure surfaces the error the serial build would raise first.
+    Series with an entry in ``extensions`` copy that series' unchanged rows.
+    Returns the relative directories of the series that were (re)built.
+    """
+
+    extensions = extensions or {}
+
+    series = manifest.setdefault("series", {})
+    order: list[tuple[str, str, int]] = []
+    for unit, unit_number in timeframes:
+        for root_symbol in manifest.get("roots", []):
+            for node in (
+                (str(root_symbol), "minute", 1),
+                (str(root_symbol), unit, int(unit_number)),
+            ):
+                if node not in order:
+                    order.append(node)
+    entries: dict[str, dict[str, Any]] = {}
+    pending: dict[str, tuple[str, str, int, bool]] = {}
+    ledger = _IntegrityLedger.load(version_dir)
+    for root_symbol, unit, unit_number in order:
+        key = f"{root_symbol}:{timeframe_key(unit, unit_number)}"
+        existing, existing_is_invalid = _complete_series_entry(
+            version_dir, manifest, key, ledger=ledger
+        )
+        if existing is not None:
+            entries[key] = existing
+        else:
+            pending[key] = (root_symbol, unit, unit_number, existing_is_invalid)
+
+    def node_manifest(root_symbol: str, unit: str, unit_number: int) -> dict[str, Any]:
+        if (unit, unit_number) == ("minute", 1):
+            return manifest
+        minute_key = f"{root_symbol}:1m"
+        return {**manifest, "series": {**series, minute_key: entries[minute_key]}}
+
+    workers = min(_build_worker_count(max_workers), len(pending))
+    if workers <= 1:
+        for key, (root_symbol, unit, unit_number, existing_is_invalid) in pending.items():
+            entries[key] = _materialize_series(
+                version_dir,
+                node_manifest(root_symbol, unit, unit_number),
+                root_symbol,
+                unit,
+                unit_number,
+                existing_is_invalid=existing_is_invalid,
+                extension=extensions.get(key),
+            )
+    else:
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        running: dict[Future[dict[str, Any]], str] = {}
+        failures: dict[str, BaseException] = {}
+        waiting = dict(pending)
+        try:
+            while waiting or running:
+                if not failures:
+                    for key, (root_symbol, unit, unit_number, existing_is_invalid) in list(
+                        waiting.items()
+                    ):
+                        if (unit, unit_number) != ("minute", 1) and (
+                            f"{root_symbol}:1m" not in entries
+                        ):
+                            continue
+                        del waiting[key]
+                        future = executor.submit(
+                            _materialize_series,
+                            version_dir,
+                            node_manifest(root_symbol, unit, unit_number),
+                            root_symbol,
+                            unit,
+                            unit_number,
+                            existing_is_invalid=existing_is_invalid,
+                            extension=extensions.get(key),
+                        )
+                        running[future] = key
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    key = running.pop(future)
+                    try:
+                        entries[key] = future.result()
+                    except Exception as exc:
+                        failures[key] = exc
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+        for key in pending:
+            if key in failures:
+                raise failures[key]
+    for root_symbol, unit, unit_number in order:
+        key = f"{root_symbol}:{timeframe_key(unit, unit_number)}"
+        series[key] = entries[key]
+    return [str(entries[key]["path"]) for key in pending]
 
 
 def _ensure_series(
@@ -2947,22 +4899,75 @@ def _ensure_series(
     root_symbol: str,
     unit: str,
     unit_number: int,
+    *,
+    built: list[str] | None = None,
 ) -> Mapping[str, Any]:
+    """Build one series (and its 1m base) unless it is already complete.
+
+    The relative directories of series actually built are appended to ``built``.
+    """
+
     key = f"{root_symbol}:{timeframe_key(unit, unit_number)}"
     series = manifest.setdefault("series", {})
-    existing = series.get(key)
-    existing_is_invalid = False
-    if isinstance(existing, dict):
-        series_dir = version_dir / str(existing.get("path") or "")
-        if _series_files_complete(
-            series_dir,
-            expected_entry=existing,
-            expected_source_fingerprint=str(manifest.get("source_fingerprint") or ""),
-        ):
-            return existing
-        existing_is_invalid = True
+    existing, existing_is_invalid = _complete_series_entry(
+        version_dir, manifest, key, ledger=_IntegrityLedger.load(version_dir)
+    )
+    if existing is not None:
+        return existing
     if (unit, int(unit_number)) != ("minute", 1):
-        _ensure_series(version_dir, manifest, root_symbol, "minute", 1)
+        _ensure_series(version_dir, manifest, root_symbol, "minute", 1, built=built)
+    entry = _materialize_series(
+        version_dir,
+        manifest,
+        root_symbol,
+        unit,
+        unit_number,
+        existing_is_invalid=existing_is_invalid,
+    )
+    series[key] = entry
+    if built is not None:
+        built.append(str(entry["path"]))
+    return entry
+
+
+def _complete_series_entry(
+    version_dir: Path,
+    manifest: Mapping[str, Any],
+    key: str,
+    *,
+    ledger: _IntegrityLedger | None = None,
+) -> tuple[dict[str, Any] | None, bool]:
+    """The manifest entry for ``key`` if its files are intact, and whether one was broken."""
+
+    existing = (manifest.get("series") or {}).get(key)
+    if not isinstance(existing, dict):
+        return None, False
+    if _series_files_complete(
+        version_dir / str(existing.get("path") or ""),
+        expected_entry=existing,
+        expected_source_fingerprint=str(manifest.get("source_fingerprint") or ""),
+        ledger=ledger,
+    ):
+        return existing, False
+    return None, True
+
+
+def _materialize_series(
+    version_dir: Path,
+    manifest: Mapping[str, Any],
+    root_symbol: str,
+    unit: str,
+    unit_number: int,
+    *,
+    existing_is_invalid: bool = False,
+    extension: _SeriesExtension | None = None,
+) -> dict[str, Any]:
+    """Build one series (resampled ones need their 1m entry in ``manifest``).
+
+    Runs in build worker processes, so it only touches its own target
+    directory and returns the manifest entry instead of recording it.
+    """
+
     fingerprint = _series_fingerprint(
         str(manifest["source_fingerprint"]), root_symbol, unit, unit_number
     )
@@ -2991,6 +4996,7 @@ def _ensure_series(
                     root_symbol=root_symbol,
                     target=temporary,
                     fingerprint=fingerprint,
+                    extension=extension,
                 )
             else:
                 metadata = _build_resampled_series(
@@ -3001,7 +5007,11 @@ def _ensure_series(
                     unit_number=unit_number,
                     target=temporary,
                     fingerprint=fingerprint,
+                    extension=extension,
                 )
+            metadata["pyramid_levels"] = _write_series_pyramid(
+                temporary, extension=extension
+            )
             _write_json(temporary / "metadata.json", metadata)
             target.parent.mkdir(parents=True, exist_ok=True)
             temporary.replace(target)
@@ -3009,7 +5019,7 @@ def _ensure_series(
             shutil.rmtree(temporary, ignore_errors=True)
             raise
     metadata = _read_json(target / "metadata.json")
-    entry = {
+    return {
         "path": str(relative).replace("\\", "/"),
         "series_fingerprint": fingerprint,
         "rows": int(metadata["rows"]),
@@ -3018,8 +5028,6 @@ def _ensure_series(
         "first_timestamp_ns": int(metadata["first_timestamp_ns"]),
         "source_end_ns": int(metadata["source_end_ns"]),
     }
-    series[key] = entry
-    return entry
 
 
 def _build_continuous_minute_series(
@@ -3029,6 +5037,7 @@ def _build_continuous_minute_series(
     root_symbol: str,
     target: Path,
     fingerprint: str,
+    extension: _SeriesExtension | None = None,
 ) -> dict[str, Any]:
     files = sorted(
         (version_dir / "parquet" / "ohlcv_1m" / f"root={root_symbol}").rglob(
@@ -3037,6 +5046,20 @@ def _build_continuous_minute_series(
     )
     if not files:
         raise DatabentoCacheError(f"databento_parquet_missing:{root_symbol}")
+    unchanged_rows = 0
+    first_session = 0
+    if extension is not None:
+        # Partitions are monthly by session, so months before the first
+        # changed session only hold rows the previous series already has.
+        unchanged_rows = extension.unchanged_rows()
+        first_session = extension.first_session
+        first_month = date.fromordinal(first_session)
+        files = [
+            file
+            for file in files
+            if (int(file.parent.parent.name[5:]), int(file.parent.name[6:]))
+            >= (first_month.year, first_month.month)
+        ]
     roll_table = pq.read_table(
         version_dir
         / "parquet"
@@ -3063,29 +5086,24 @@ def _build_continuous_minute_series(
                     for index, name in enumerate(columns)
                 }
                 offsets = values["session_ordinal"].astype(np.int64) - minimum_day
-                valid = (offsets >= 0) & (offsets < lookup.size)
+                valid = (
+                    (offsets >= 0)
+                    & (offsets < lookup.size)
+                    & (values["session_ordinal"] >= first_session)
+                )
                 expected = np.zeros(offsets.shape, dtype=np.uint32)
                 expected[valid] = lookup[offsets[valid]]
                 mask = valid & (values["raw_symbol_code"] == expected)
                 if mask.any():
                     yield {name: value[mask] for name, value in values.items()}
 
-    row_count = 0
-    last_timestamp: int | None = None
-    for batch in selected_batches():
-        timestamps = batch["timestamp_ns"]
-        if timestamps.size:
-            if last_timestamp is not None and int(timestamps[0]) <= last_timestamp:
-                raise DatabentoCacheError(
-                    f"databento_continuous_rows_not_unique:{root_symbol}"
-                )
-            if np.any(np.diff(timestamps.astype(np.int64)) <= 0):
-                raise DatabentoCacheError(
-                    f"databento_continuous_rows_not_unique:{root_symbol}"
-                )
-            last_timestamp = int(timestamps[-1])
-            row_count += int(timestamps.size)
-    if row_count == 0:
+    # The roll filter keeps one contract per session, so the partitions' row
+    # total bounds the output. Files are allocated at that size (sparse until
+    # written), filled in one pass and truncated to the selected rows.
+    capacity = unchanged_rows + sum(
+        pq.ParquetFile(file).metadata.num_rows for file in files
+    )
+    if capacity == 0:
         raise DatabentoCacheError(f"databento_continuous_rows_missing:{root_symbol}")
 
     dtypes: dict[str, Any] = {
@@ -3102,13 +5120,30 @@ def _build_continuous_minute_series(
     }
     output = {
         name: np.lib.format.open_memmap(
-            target / f"{name}.npy", mode="w+", dtype=dtype, shape=(row_count,)
+            target / f"{name}.npy", mode="w+", dtype=dtype, shape=(capacity,)
         )
         for name, dtype in dtypes.items()
     }
     offset = 0
+    last_timestamp: int | None = None
+    if unchanged_rows:
+        assert extension is not None
+        for name in dtypes:
+            extension.copy_rows(name, output[name], unchanged_rows)
+        offset = unchanged_rows
+        last_timestamp = int(output["timestamp_ns"][offset - 1])
     for batch in selected_batches():
-        count = int(batch["timestamp_ns"].size)
+        timestamps = batch["timestamp_ns"]
+        count = int(timestamps.size)
+        if last_timestamp is not None and int(timestamps[0]) <= last_timestamp:
+            raise DatabentoCacheError(
+                f"databento_continuous_rows_not_unique:{root_symbol}"
+            )
+        if np.any(np.diff(timestamps.astype(np.int64)) <= 0):
+            raise DatabentoCacheError(
+                f"databento_continuous_rows_not_unique:{root_symbol}"
+            )
+        last_timestamp = int(timestamps[-1])
         stop = offset + count
         for name in (
             "timestamp_ns",
@@ -3126,14 +5161,19 @@ def _build_continuous_minute_series(
             batch["timestamp_ns"].astype(np.int64) + 60_000_000_000
         )
         offset = stop
-    first_timestamp_ns = int(output["timestamp_ns"][0])
-    source_end_ns = int(output["close_timestamp_ns"][-1])
+    row_count = offset
+    first_timestamp_ns = int(output["timestamp_ns"][0]) if row_count else 0
+    source_end_ns = int(output["close_timestamp_ns"][row_count - 1]) if row_count else 0
     for array in output.values():
         array.flush()
         _close_memmap(array)
     del array
     del output
     gc.collect()
+    if row_count == 0:
+        raise DatabentoCacheError(f"databento_continuous_rows_missing:{root_symbol}")
+    for name in dtypes:
+        _truncate_npy_rows(target / f"{name}.npy", row_count)
     return {
         "cache_format_version": CACHE_FORMAT_VERSION,
         "source_fingerprint": manifest["source_fingerprint"],
@@ -3149,6 +5189,278 @@ def _build_continuous_minute_series(
     }
 
 
+def _truncate_npy_rows(path: Path, rows: int) -> None:
+    """Shrink an over-allocated 1-D ``.npy`` file to its first ``rows`` rows.
+
+    NumPy pads array headers so the length can change in place; the data
+    offset is checked rather than assumed.
+    """
+
+    with path.open("r+b") as handle:
+        version = np.lib.format.read_magic(handle)
+        if version == (1, 0):
+            _shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(handle)
+        else:
+            _shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(handle)
+        data_offset = handle.tell()
+        header = {
+            "descr": np.lib.format.dtype_to_descr(dtype),
+            "fortran_order": fortran_order,
+            "shape": (int(rows),),
+        }
+        handle.seek(0)
+        if version == (1, 0):
+            np.lib.format.write_array_header_1_0(handle, header)
+        else:
+            np.lib.format.write_array_header_2_0(handle, header)
+        if handle.tell() != data_offset:
+            raise DatabentoCacheError(f"databento_series_header_resize_failed:{path.name}")
+        handle.truncate(data_offset + int(rows) * dtype.itemsize)
+
+
+@dataclass(frozen=True)
+class _ResampleGroups:
+    """Bucket boundaries of one timeframe over the continuous 1m rows."""
+
+    starts: np.ndarray
+    ends: np.ndarray
+    timestamp_ns: np.ndarray
+    close_timestamp_ns: np.ndarray
+
+    @property
+    def size(self) -> int:
+        return int(self.starts.size)
+
+    @property
+    def nbytes(self) -> int:
+        return int(
+            self.starts.nbytes
+            + self.ends.nbytes
+            + self.timestamp_ns.nbytes
+            + self.close_timestamp_ns.nbytes
+        )
+
+
+class _ResampleIndex:
+    """Session-anchored bucket index over one root's continuous 1m series.
+
+    Session bounds are resolved once per root; each timeframe's groups are
+    derived from them on first use and kept for later slices.
+    """
+
+    def __init__(
+        self,
+        *,
+        timestamps: np.ndarray,
+        raw_symbol_codes: np.ndarray,
+        session_ordinals: np.ndarray,
+        max_timeframes: int = _RESAMPLE_INDEX_MAX_TIMEFRAMES,
+    ) -> None:
+        self._timestamps = timestamps
+        self._raw_symbol_codes = raw_symbol_codes
+        self._session_ordinals = session_ordinals
+        minimum_day = int(session_ordinals.min())
+        maximum_day = int(session_ordinals.max())
+        self._minimum_day = minimum_day
+        self._starts_by_day = np.zeros(maximum_day - minimum_day + 1, dtype=np.int64)
+        self._ends_by_day = np.zeros(maximum_day - minimum_day + 1, dtype=np.int64)
+        for ordinal in np.unique(session_ordinals):
+            session_start, session_end_inclusive = trading_day_bounds_utc(
+                date.fromordinal(int(ordinal))
+            )
+            index = int(ordinal) - minimum_day
+            self._starts_by_day[index] = _datetime_to_ns(session_start)
+            self._ends_by_day[index] = _datetime_to_ns(session_end_inclusive) + 1_000
+        self._max_timeframes = max(1, int(max_timeframes))
+        self._groups: OrderedDict[tuple[str, int], _ResampleGroups] = OrderedDict()
+
+    @classmethod
+    def from_arrays(cls, arrays: Mapping[str, np.ndarray]) -> "_ResampleIndex":
+        return cls(
+            timestamps=arrays["timestamp_ns"],
+            raw_symbol_codes=arrays["raw_symbol_code"],
+            session_ordinals=np.asarray(arrays["session_ordinal"], dtype=np.int32),
+        )
+
+    def groups(self, unit: str, unit_number: int) -> _ResampleGroups:
+        key = (unit, int(unit_number))
+        cached = self._groups.get(key)
+        if cached is not None:
+            self._groups.move_to_end(key)
+            return cached
+        day_offsets = self._session_ordinals.astype(np.int64) - self._minimum_day
+        session_starts = self._starts_by_day[day_offsets]
+        session_ends = self._ends_by_day[day_offsets]
+        if unit == "day":
+            bucket_starts = session_starts
+            bucket_ends = session_ends
+        else:
+            timestamps = np.asarray(self._timestamps, dtype=np.int64)
+            duration_ns = _timeframe_seconds(unit, unit_number) * 1_000_000_000
+            bucket_starts = session_starts + (
+                (timestamps - session_starts) // duration_ns
+            ) * duration_ns
+            bucket_ends = np.minimum(bucket_starts + duration_ns, session_ends)
+        raw_symbol_codes = np.asarray(self._raw_symbol_codes, dtype=np.uint32)
+        transitions = (bucket_starts[1:] != bucket_starts[:-1]) | (
+            raw_symbol_codes[1:] != raw_symbol_codes[:-1]
+        )
+        starts = np.concatenate(
+            (np.array([0], dtype=np.int64), np.flatnonzero(transitions) + 1)
+        )
+        groups = _ResampleGroups(
+            starts=starts,
+            ends=np.concatenate(
+                (starts[1:], np.array([bucket_starts.size], dtype=np.int64))
+            ),
+            timestamp_ns=bucket_starts[starts],
+            close_timestamp_ns=bucket_ends[starts],
+        )
+        self._groups[key] = groups
+        while len(self._groups) > self._max_timeframes:
+            self._groups.popitem(last=False)
+        return groups
+
+
+def _aggregate_resampled(
+    arrays: Mapping[str, np.ndarray],
+    groups: _ResampleGroups,
+    left: int,
+    right: int,
+) -> dict[str, np.ndarray]:
+    """Aggregate buckets ``[left, right)`` by reducing only their 1m rows."""
+
+    if right <= left:
+        return {
+            name: np.empty(0, dtype=_ARRAY_DTYPES[name]) for name in _ARRAY_COLUMNS
+        }
+    first_row = int(groups.starts[left])
+    last_row = int(groups.ends[right - 1])
+    offsets = groups.starts[left:right] - first_row
+    last_rows = groups.ends[left:right] - 1 - first_row
+
+    def rows(name: str) -> np.ndarray:
+        return np.asarray(arrays[name][first_row:last_row], dtype=_ARRAY_DTYPES[name])
+
+    return {
+        "timestamp_ns": groups.timestamp_ns[left:right].copy(),
+        "close_timestamp_ns": groups.close_timestamp_ns[left:right].copy(),
+        "open_nano": rows("open_nano")[offsets],
+        "high_nano": np.maximum.reduceat(rows("high_nano"), offsets),
+        "low_nano": np.minimum.reduceat(rows("low_nano"), offsets),
+        "close_nano": rows("close_nano")[last_rows],
+        "volume": np.add.reduceat(rows("volume"), offsets),
+        "instrument_id": rows("instrument_id")[offsets],
+        "raw_symbol_code": rows("raw_symbol_code")[offsets],
+        "session_ordinal": rows("session_ordinal")[offsets],
+    }
+
+
+def _pyramid_level(
+    values: Mapping[str, np.ndarray], starts: np.ndarray
+) -> dict[str, np.ndarray]:
+    """Aggregate the consecutive runs of rows that begin at ``starts``."""
+
+    size = int(values["timestamp_ns"].size)
+    lasts = np.concatenate((starts[1:], np.array([size], dtype=np.int64))) - 1
+    return {
+        "timestamp_ns": values["timestamp_ns"][starts],
+        "close_timestamp_ns": values["close_timestamp_ns"][lasts],
+        "open_nano": values["open_nano"][starts],
+        "high_nano": np.maximum.reduceat(values["high_nano"], starts),
+        "low_nano": np.minimum.reduceat(values["low_nano"], starts),
+        "close_nano": values["close_nano"][lasts],
+        "volume": np.add.reduceat(values["volume"], starts),
+    }
+
+
+def _write_series_pyramid(
+    directory: Path, *, extension: _SeriesExtension | None = None
+) -> list[dict[str, int]]:
+    """Write every power-of-two level of a finished series under ``pyramid/``.
+
+    With ``extension``, a level row built only from unchanged series rows is
+    copied from the previous pyramid instead of aggregated again.
+    """
+
+    arrays = {
+        name: np.load(directory / f"{name}.npy", mmap_mode="r")
+        for name in _PYRAMID_COLUMNS
+    }
+    unchanged = 0
+    previous_levels: dict[int, Mapping[str, int]] = {}
+    previous_arrays: dict[str, np.ndarray] = {}
+    if extension is not None:
+        previous_metadata = _read_json(extension.directory / "metadata.json")
+        previous_levels = {
+            int(level["factor"]): level
+            for level in previous_metadata.get("pyramid_levels") or []
+        }
+        if previous_levels:
+            unchanged = extension.unchanged_rows()
+            previous_arrays = {
+                name: np.load(
+                    extension.directory / "pyramid" / f"{name}.npy", mmap_mode="r"
+                )
+                for name in _PYRAMID_COLUMNS
+            }
+    levels: list[dict[str, int]] = []
+    chunks: dict[str, list[np.ndarray]] = {name: [] for name in _PYRAMID_COLUMNS}
+    try:
+        previous: Mapping[str, np.ndarray] = arrays
+        factor = 1
+        offset = 0
+        while int(previous["timestamp_ns"].size) > 1:
+            factor *= 2
+            size = int(previous["timestamp_ns"].size)
+            prior_level = previous_levels.get(factor)
+            unchanged = (
+                min(unchanged // 2, int(prior_level["rows"]))
+                if prior_level is not None
+                else 0
+            )
+            level = (
+                _pyramid_level(
+                    previous,
+                    np.arange(2 * unchanged, size, 2, dtype=np.int64),
+                )
+                if 2 * unchanged < size
+                else {
+                    name: np.empty(0, dtype=_ARRAY_DTYPES[name])
+                    for name in _PYRAMID_COLUMNS
+                }
+            )
+            if unchanged:
+                assert prior_level is not None
+                start = int(prior_level["offset"])
+                level = {
+                    name: np.concatenate(
+                        (
+                            previous_arrays[name][start : start + unchanged],
+                            level[name],
+                        )
+                    )
+                    for name in _PYRAMID_COLUMNS
+                }
+            previous = level
+            rows = int(previous["timestamp_ns"].size)
+            levels.append({"factor": factor, "offset": offset, "rows": rows})
+            for name in _PYRAMID_COLUMNS:
+                chunks[name].append(previous[name])
+            offset += rows
+    finally:
+        for array in [*arrays.values(), *previous_arrays.values()]:
+            _close_memmap(array)
+    if levels:
+        (directory / "pyramid").mkdir()
+        for name in _PYRAMID_COLUMNS:
+            np.save(
+                directory / "pyramid" / f"{name}.npy",
+                np.concatenate(chunks[name]).astype(_ARRAY_DTYPES[name], copy=False),
+            )
+    return levels
+
+
 def _build_resampled_series(
     version_dir: Path,
     manifest: Mapping[str, Any],
@@ -3158,6 +5470,7 @@ def _build_resampled_series(
     unit_number: int,
     target: Path,
     fingerprint: str,
+    extension: _SeriesExtension | None = None,
 ) -> dict[str, Any]:
     base_entry = manifest["series"][f"{root_symbol}:1m"]
     base_dir = version_dir / str(base_entry["path"])
@@ -3165,81 +5478,43 @@ def _build_resampled_series(
         name: np.load(base_dir / f"{name}.npy", mmap_mode="r")
         for name in _ARRAY_COLUMNS
     }
-    rows = int(arrays["timestamp_ns"].size)
-    if rows == 0:
+    if int(arrays["timestamp_ns"].size) == 0:
         raise DatabentoCacheError(f"databento_continuous_rows_missing:{root_symbol}")
-    session_ordinals = np.asarray(arrays["session_ordinal"], dtype=np.int32)
-    minimum_day = int(session_ordinals.min())
-    maximum_day = int(session_ordinals.max())
-    starts_by_day = np.zeros(maximum_day - minimum_day + 1, dtype=np.int64)
-    ends_by_day = np.zeros(maximum_day - minimum_day + 1, dtype=np.int64)
-    for ordinal in np.unique(session_ordinals):
-        session_start, session_end_inclusive = trading_day_bounds_utc(
-            date.fromordinal(int(ordinal))
-        )
-        index = int(ordinal) - minimum_day
-        starts_by_day[index] = _datetime_to_ns(session_start)
-        ends_by_day[index] = _datetime_to_ns(session_end_inclusive) + 1_000
-    day_offsets = session_ordinals.astype(np.int64) - minimum_day
-    session_starts = starts_by_day[day_offsets]
-    session_ends = ends_by_day[day_offsets]
-    timestamps = np.asarray(arrays["timestamp_ns"], dtype=np.int64)
-    if unit == "day":
-        bucket_starts = session_starts
-        bucket_ends = session_ends
-    else:
-        duration_ns = _timeframe_seconds(unit, unit_number) * 1_000_000_000
-        bucket_starts = session_starts + (
-            (timestamps - session_starts) // duration_ns
-        ) * duration_ns
-        bucket_ends = np.minimum(bucket_starts + duration_ns, session_ends)
-    instrument_ids = np.asarray(arrays["instrument_id"], dtype=np.uint32)
-    raw_symbol_codes = np.asarray(arrays["raw_symbol_code"], dtype=np.uint32)
-    transitions = (
-        (bucket_starts[1:] != bucket_starts[:-1])
-        | (raw_symbol_codes[1:] != raw_symbol_codes[:-1])
-    )
-    group_starts = np.concatenate(
-        (np.array([0], dtype=np.int64), np.flatnonzero(transitions) + 1)
-    )
-    group_ends = np.concatenate(
-        (group_starts[1:], np.array([rows], dtype=np.int64))
+    unchanged_rows = 0
+    if extension is not None:
+        # Buckets never span sessions, so the buckets of unchanged sessions
+        # are copied and only the later 1m rows are grouped again.
+        unchanged_rows = extension.unchanged_rows()
+        first_row = int(
+            np.searchsorted(
+                arrays["session_ordinal"], extension.first_session, side="left"
+            )
+        )
+        arrays = {name: values[first_row:] for name, values in arrays.items()}
+    groups = (
+        _ResampleIndex.from_arrays(arrays).groups(unit, unit_number)
+        if int(arrays["timestamp_ns"].size)
+        else None
     )
-    output_rows = int(group_starts.size)
-    dtypes: dict[str, Any] = {
-        "timestamp_ns": np.int64,
-        "close_timestamp_ns": np.int64,
-        "open_nano": np.int64,
-        "high_nano": np.int64,
-        "low_nano": np.int64,
-        "close_nano": np.int64,
-        "volume": np.uint64,
-        "instrument_id": np.uint32,
-        "raw_symbol_code": np.uint32,
-        "session_ordinal": np.int32,
-    }
+    output_rows = unchanged_rows + (groups.size if groups is not None else 0)
     output = {
         name: np.lib.format.open_memmap(
-            target / f"{name}.npy", mode="w+", dtype=dtype, shape=(output_rows,)
+            target / f"{name}.npy",
+            mode="w+",
+            dtype=_ARRAY_DTYPES[name],
+            shape=(output_rows,),
         )
-        for name, dtype in dtypes.items()
+        for name in _ARRAY_COLUMNS
     }
-    output["timestamp_ns"][:] = bucket_starts[group_starts]
-    output["close_timestamp_ns"][:] = bucket_ends[group_starts]
-    output["open_nano"][:] = np.asarray(arrays["open_nano"])[group_starts]
-    output["high_nano"][:] = np.maximum.reduceat(
-        np.asarray(arrays["high_nano"]), group_starts
-    )
-    output["low_nano"][:] = np.minimum.reduceat(
-        np.asarray(arrays["low_nano"]), group_starts
-    )
-    output["close_nano"][:] = np.asarray(arrays["close_nano"])[group_ends - 1]
-    output["volume"][:] = np.add.reduceat(
-        np.asarray(arrays["volume"], dtype=np.uint64), group_starts
-    )
-    output["instrument_id"][:] = instrument_ids[group_starts]
-    output["raw_symbol_code"][:] = raw_symbol_codes[group_starts]
-    output["session_ordinal"][:] = session_ordinals[group_starts]
+    if unchanged_rows:
+        assert extension is not None
+        for name in _ARRAY_COLUMNS:
+            extension.copy_rows(name, output[name], unchanged_rows)
+    if groups is not None:
+        for name, values in _aggregate_resampled(
+            arrays, groups, 0, groups.size
+        ).items():
+            output[name][unchanged_rows:] = values
     first_timestamp_ns = int(output["timestamp_ns"][0])
     source_end_ns = int(base_entry["source_end_ns"])
     for array in output.values():
@@ -0,0 +1,316 @@
+"""Chart candle history served from the local Databento mmap cache.
+
+``/api/projectx/candles`` asks ProjectX (through the per-user candle table) for
+every window. For supported roots the local cache already holds the closed
+history, so the endpoint answers that part from a binary-searched mmap slice
+and only asks the provider for bars after the cache ends.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta, timezone
+from functools import cached_property
+from typing import Any, Mapping
+
+import numpy as np
+
+from .databento_cache import (
+    PRICE_SCALE,
+    SUPPORTED_ROOTS,
+    DatabentoCacheError,
+    DatabentoReplayStore,
+    MmapCandleSequence,
+    downsample_factor,
+    get_default_databento_cache,
+)
+from .instruments import normalize_symbol_key
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_EXPIRY_PATTERN = re.compile(r"([FGHJKMNQUVXZ])(\d{1,4})")
+_OUTRIGHT_PATTERN = re.compile(r"([A-Z0-9]+?)([FGHJKMNQUVXZ])(\d{1,4})")
+# ProjectX product codes that differ from the CME root the cache is keyed by
+# (``CON.F.US.ENQ.U26`` is an NQ outright).
+_PROJECTX_PRODUCT_ROOTS = {"ENQ": "NQ", "EP": "ES"}
+
+
+@dataclass(frozen=True)
+class DatabentoChartHistory:
+    """Cached bars as mmap columns; ``rows`` serializes them on first use.
+
+    ``bucket_factor`` is how many source bars each row merges (1 unless
+    ``max_points`` downsampled the window).
+    """
+
+    columns: Mapping[str, np.ndarray]
+    covered_until: datetime
+    contract_id: str
+    symbol: str
+    live: bool
+    unit: str
+    unit_number: int
+    bucket_factor: int = 1
+    source: MmapCandleSequence | None = field(default=None, repr=False, compare=False)
+
+    def __len__(self) -> int:
+        return int(self.columns["timestamp_ns"].shape[0])
+
+    @cached_property
+    def rows(self) -> list[dict[str, Any]]:
+        return serialize_mmap_market_candles(
+            self.columns,
+            contract_id=self.contract_id,
+            symbol=self.symbol,
+            live=self.live,
+            unit=self.unit,
+            unit_number=self.unit_number,
+        )
+
+    @property
+    def last_timestamp(self) -> datetime | None:
+        if not len(self):
+            return None
+        return _EPOCH + timedelta(microseconds=int(self.columns["timestamp_ns"][-1]) // 1_000)
+
+    def newest(self, count: int) -> DatabentoChartHistory:
+        """The same history limited to its newest ``count`` bars."""
+
+        drop = max(0, len(self) - max(0, int(count)))
+        if not drop:
+            return self
+        return replace(
+            self, columns={name: values[drop:] for name, values in self.columns.items()}
+        )
+
+
+def load_databento_chart_history(
+    *,
+    user_id: str,
+    contract_id: str,
+    symbol: str | None,
+    live: bool,
+    start: datetime,
+    end: datetime,
+    unit: str,
+    unit_number: int,
+    limit: int,
+    max_points: int | None = None,
+    store: DatabentoReplayStore | None = None,
+) -> DatabentoChartHistory | None:
+    """Return the newest ``limit`` cached bars in ``[start, end]``.
+
+    With ``max_points`` the whole cached window is returned instead, merged
+    into at most that many bars from the series' min/max pyramid.
+
+    The cache holds the root's continuous front-month series. A request for a
+    specific expiry (``CON.F.US.MNQ.H25``) is only answered from bars of that
+    expiry: the history stops at the first bar of another contract, and
+    ``covered_until`` moves back to it so the provider serves the rest.
+
+    ``None`` means the cache cannot answer any part of the window: the root is
+    not cached, the timeframe cannot be derived from 1m bars, the window
+    starts after the cached history ends, or its first bar belongs to another
+    expiry than the one requested.
+    """
+
+    root = _cache_root(normalize_symbol_key(symbol) or normalize_symbol_key(contract_id))
+    if root not in SUPPORTED_ROOTS:
+        return None
+    replay_store = store if store is not None else get_default_databento_cache()
+    try:
+        bounds = replay_store.history_bounds(root)
+        if bounds is None or start >= bounds[1]:
+            return None
+        history_end = min(end, bounds[1])
+        candles = replay_store.open_candles(
+            user_id=user_id,
+            contract_id=contract_id,
+            root_symbol=root,
+            unit=unit,
+            unit_number=unit_number,
+            start=start,
+            end=history_end,
+            closed_by=history_end,
+        )
+    except DatabentoCacheError:
+        return None
+    covered_until = bounds[1]
+    expiry = _requested_expiry(contract_id)
+    if expiry is not None and len(candles):
+        other_rows = np.flatnonzero(
+            ~np.isin(candles.raw_symbol_code_values, _expiry_codes(candles, expiry))
+        )
+        if other_rows.size:
+            first_other = int(other_rows[0])
+            if first_other == 0:
+                return None
+            covered_until = _EPOCH + timedelta(
+                microseconds=int(candles.start_ns[first_other]) // 1_000
+            )
+            candles = candles[:first_other]
+    if max_points is None:
+        candles = candles[max(0, len(candles) - max(1, int(limit))) :]
+        factor = 1
+    else:
+        factor = downsample_factor(len(candles), max_points)
+    return DatabentoChartHistory(
+        columns=candles.bucketed_columns(factor),
+        covered_until=covered_until,
+        contract_id=contract_id,
+        symbol=symbol or root,
+        live=live,
+        unit=unit,
+        unit_number=int(unit_number),
+        bucket_factor=factor,
+        source=candles,
+    )
+
+
+def merge_chart_tail(
+    history: DatabentoChartHistory,
+    rows: list[dict[str, Any]],
+    *,
+    max_points: int,
+) -> tuple[DatabentoChartHistory, list[dict[str, Any]]]:
+    """Bucket cached history and provider tail rows with one shared factor.
+
+    The factor is the smallest power of two at or above the history's own
+    that fits both parts in ``max_points`` bars; a coarser factor re-buckets
+    the history from its pyramid. Tail buckets start at the first tail row
+    and keep the same min/max merge as the history.
+    """
+
+    source_count = len(history.source) if history.source is not None else len(history)
+    total = source_count + len(rows)
+    factor = max(1, int(history.bucket_factor))
+    while factor < total and (
+        -(-source_count // factor)
+        + (1 if factor > 1 and source_count else 0)
+        + -(-len(rows) // factor)
+        > max(2, int(max_points))
+    ):
+        factor *= 2
+    if factor != history.bucket_factor and history.source is not None:
+        history = replace(
+            history,
+            columns=history.source.bucketed_columns(factor),
+            bucket_factor=factor,
+        )
+    return history, _merge_candle_rows(rows, factor)
+
+
+def _merge_candle_rows(rows: list[dict[str, Any]], factor: int) -> list[dict[str, Any]]:
+    if factor <= 1:
+        return rows
+    merged = []
+    for offset in range(0, len(rows), factor):
+        bucket = rows[offset : offset + factor]
+        merged.append(
+            {
+                **bucket[0],
+                "id": None if len(bucket) > 1 else bucket[0].get("id"),
+                "high": max(row["high"] for row in bucket),
+                "low": min(row["low"] for row in bucket),
+                "close": bucket[-1]["close"],
+                "volume": sum(float(row["volume"] or 0.0) for row in bucket),
+                "is_partial": bool(bucket[-1].get("is_partial")),
+                "fetched_at": bucket[-1].get("fetched_at"),
+            }
+        )
+    return merged
+
+
+def _requested_expiry(contract_id: str) -> tuple[str, str, str] | None:
+    """``(cache root, month code, year digits)`` of an outright contract id.
+
+    ``None`` for root or continuous requests such as ``MNQ``.
+    """
+
+    text = str(contract_id).strip().upper()
+    tokens = [token for token in text.split(".") if token]
+    if len(tokens) >= 2:
+        match = _EXPIRY_PATTERN.fullmatch(tokens[-1])
+        if match is None:
+            return None
+        return _cache_root(tokens[-2]), match.group(1), match.group(2)
+    match = _OUTRIGHT_PATTERN.fullmatch(text)
+    if match is None:
+        return None
+    return _cache_root(match.group(1)), match.group(2), match.group(3)
+
+
+def _cache_root(code: str | None) -> str | None:
+    if code is None:
+        return None
+    return _PROJECTX_PRODUCT_ROOTS.get(code, code)
+
+
+def _expiry_codes(candles: MmapCandleSequence, expiry: tuple[str, str, str]) -> list[int]:
+    """Raw symbol codes of the series that name the requested expiry.
+
+    Databento outrights usually carry a one-digit year (``MNQH5``) and ProjectX
+    ids two (``H25``), so years are compared on their common trailing digits.
+    """
+
+    root, month, year = expiry
+    codes = []
+    for code, raw_symbol in candles.raw_symbols_by_code.items():
+        match = _OUTRIGHT_PATTERN.fullmatch(str(raw_symbol).strip().upper())
+        if match is None or match.group(1) != root or match.group(2) != month:
+            continue
+        digits = min(len(year), len(match.group(3)))
+        if year[-digits:] == match.group(3)[-digits:]:
+            codes.append(int(code))
+    return codes
+
+
+def serialize_mmap_market_candles(
+    columns: Mapping[str, np.ndarray],
+    *,
+    contract_id: str,
+    symbol: str,
+    live: bool,
+    unit: str,
+    unit_number: int,
+) -> list[dict[str, Any]]:
+    """Serialize mmap candle columns like ``serialize_market_candle`` rows.
+
+    Columns are converted as whole arrays; no per-bar candle proxy is built.
+    """
+
+    # datetime64[ns] converts to int; microseconds convert to naive datetimes.
+    timestamps = (
+        np.asarray(columns["timestamp_ns"])
+        .view("datetime64[ns]")
+        .astype("datetime64[us]")
+        .tolist()
+    )
+    values = zip(
+        timestamps,
+        (columns["open_nano"] / PRICE_SCALE).tolist(),
+        (columns["high_nano"] / PRICE_SCALE).tolist(),
+        (columns["low_nano"] / PRICE_SCALE).tolist(),
+        (columns["close_nano"] / PRICE_SCALE).tolist(),
+        np.asarray(columns["volume"], dtype=np.float64).tolist(),
+    )
+    return [
+        {
+            "id": None,
+            "contract_id": contract_id,
+            "symbol": symbol,
+            "live": bool(live),
+            "unit": unit,
+            "unit_number": int(unit_number),
+            "timestamp": timestamp.replace(tzinfo=timezone.utc),
+            "open": open_price,
+            "high": high_price,
+            "low": low_price,
+            "close": close_price,
+            "volume": volume,
+            "is_partial": False,
+            "fetched_at": None,
+        }
+        for timestamp, open_price, high_price, low_price, close_price, volume in values
+    ]
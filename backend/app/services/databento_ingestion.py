@@ -4,11 +4,12 @@ import hashlib
 import json
 import re
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from pathlib import Path
 from typing import Any, Iterable, Iterator, Mapping, Sequence
 from zipfile import BadZipFile, ZipFile, ZipInfo
 
+import numpy as np
 from sqlalchemy import func, select
 from sqlalchemy.dialects.postgresql import insert as postgresql_insert
 from sqlalchemy.dialects.sqlite import insert as sqlite_insert
@@ -27,6 +28,13 @@ from ..models import (
     DatabentoInstrument,
     DatabentoOhlcv1m,
 )
+from .databento_records import (
+    DbnArrayError,
+    DbnLayoutUnsupportedError,
+    invalid_ohlcv_rows,
+    read_ohlcv_arrays,
+    session_ordinals,
+)
 from .trading_day import trading_day_date
 
 
@@ -34,6 +42,7 @@ SUPPORTED_DATASET = "GLBX.MDP3"
 SUPPORTED_ROOT = "MNQ"
 SUPPORTED_SYMBOL = "MNQ.FUT"
 MNQ_HISTORY_START_UTC = datetime(2019, 5, 5, 22, 0, tzinfo=timezone.utc)
+_MNQ_HISTORY_START_NS = int(MNQ_HISTORY_START_UTC.timestamp()) * 1_000_000_000
 DBN_READ_CHUNK_BYTES = 64 * 1024
 _OUTRIGHT_PATTERN = re.compile(r"^([A-Z0-9]+?)[FGHJKMNQUVXZ]\d{1,4}$")
 
@@ -369,64 +378,27 @@ def _import_ohlcv_entries(
         file_row.error_message = None
         if commit_batches:
             db.commit()
-        rows: list[dict[str, Any]] = []
         file_read = 0
         # A failed file can have committed row checkpoints. Preserve that
         # progress while replaying the file; duplicate rows are ignored.
         file_inserted = int(file_row.records_inserted or 0)
-        metadata_seen = False
-        for record in _iter_dbn_entry(zip_file, entry):
-            if isinstance(record, Metadata):
-                _validate_dbn_metadata(record, dataset=str(batch.dataset), schema_name="ohlcv-1m")
-                metadata_seen = True
-                continue
-            if not isinstance(record, OHLCVMsg):
-                raise DatabentoIngestionError(
-                    f"unexpected_dbn_record:{entry.filename}:{type(record).__name__}"
-                )
-            file_read += 1
-            instrument = instruments.get(int(record.instrument_id))
-            if instrument is None:
-                raise DatabentoIngestionError(
-                    f"databento_instrument_mapping_missing:{int(record.instrument_id)}"
-                )
-            if str(instrument.instrument_class) != "F" or str(instrument.root_symbol) != SUPPORTED_ROOT:
-                continue
-            timestamp = _datetime_from_unix_nanos(int(record.ts_event))
-            if timestamp < MNQ_HISTORY_START_UTC:
-                raise DatabentoIngestionError(
-                    f"mnq_prelaunch_record_rejected:{timestamp.isoformat()}"
-                )
-            values = {
-                "dataset": str(batch.dataset),
-                "instrument_id": int(record.instrument_id),
-                "ts_event": timestamp,
-                "trading_date": trading_day_date(timestamp),
-                "open_nano": int(record.open),
-                "high_nano": int(record.high),
-                "low_nano": int(record.low),
-                "close_nano": int(record.close),
-                "volume": int(record.volume),
-                "source_file_sha256": hashes[entry.filename],
-            }
-            _validate_ohlcv_values(values)
-            rows.append(values)
-            if len(rows) >= batch_size:
-                inserted = _insert_ohlcv_rows(db, rows)
-                file_inserted += inserted
-                rows.clear()
-                if commit_batches:
-                    _checkpoint_ohlcv_import(
-                        db,
-                        batch=batch,
-                        file_row=file_row,
-                        records_read=file_read,
-                        records_inserted=file_inserted,
-                    )
-        if rows:
+        for rows, file_read in _iter_ohlcv_row_batches(
+            zip_file,
+            entry,
+            dataset=str(batch.dataset),
+            instruments=instruments,
+            source_hash=hashes[entry.filename],
+            batch_size=batch_size,
+        ):
             file_inserted += _insert_ohlcv_rows(db, rows)
-        if not metadata_seen:
-            raise DatabentoIngestionError(f"dbn_metadata_missing:{entry.filename}")
+            if commit_batches and len(rows) >= batch_size:
+                _checkpoint_ohlcv_import(
+                    db,
+                    batch=batch,
+                    file_row=file_row,
+                    records_read=file_read,
+                    records_inserted=file_inserted,
+                )
         file_inserted = int(
             db.scalar(
                 select(func.count())
@@ -451,6 +423,210 @@ def _import_ohlcv_entries(
     batch.files_completed = _completed_file_count(db, batch_id=int(batch.id))
 
 
+def _iter_ohlcv_row_batches(
+    zip_file: ZipFile,
+    entry: ZipInfo,
+    *,
+    dataset: str,
+    instruments: Mapping[int, DatabentoInstrument],
+    source_hash: str,
+    batch_size: int,
+) -> Iterator[tuple[list[dict[str, Any]], int]]:
+    """Yield insert-ready rows with the records read through each batch.
+
+    Full batches hold exactly ``batch_size`` rows; the final batch may be
+    short or empty and always carries the entry's total record count.
+    """
+
+    with zip_file.open(entry, "r") as source:
+        try:
+            metadata, record_batches = read_ohlcv_arrays(source, name=entry.filename)
+        except DbnLayoutUnsupportedError:
+            record_batches = None
+        except DbnArrayError as exc:
+            raise DatabentoIngestionError(str(exc)) from exc
+        if record_batches is not None:
+            _validate_dbn_metadata(metadata, dataset=dataset, schema_name="ohlcv-1m")
+            yield from _bulk_ohlcv_row_batches(
+                record_batches,
+                dataset=dataset,
+                instruments=instruments,
+                source_hash=source_hash,
+                batch_size=batch_size,
+            )
+            return
+    yield from _record_ohlcv_row_batches(
+        zip_file,
+        entry,
+        dataset=dataset,
+        instruments=instruments,
+        source_hash=source_hash,
+        batch_size=batch_size,
+    )
+
+
+def _bulk_ohlcv_row_batches(
+    record_batches: Iterator[Any],
+    *,
+    dataset: str,
+    instruments: Mapping[int, DatabentoInstrument],
+    source_hash: str,
+    batch_size: int,
+) -> Iterator[tuple[list[dict[str, Any]], int]]:
+    rows: list[dict[str, Any]] = []
+    row_reads: list[int] = []
+    file_read = 0
+    trading_dates: dict[int, date] = {}
+    try:
+        for records in record_batches:
+            count = int(records.size)
+            if not count:
+                continue
+            instrument_ids = records["instrument_id"].astype(np.int64)
+            unique_ids, inverse = np.unique(instrument_ids, return_inverse=True)
+            inverse = inverse.reshape(-1)
+            known = np.array(
+                [int(value) in instruments for value in unique_ids.tolist()],
+                dtype=bool,
+            )
+            supported = np.array(
+                [
+                    instrument is not None
+                    and str(instrument.instrument_class) == "F"
+                    and str(instrument.root_symbol) == SUPPORTED_ROOT
+                    for instrument in (
+                        instruments.get(int(value)) for value in unique_ids.tolist()
+                    )
+                ],
+                dtype=bool,
+            )
+            timestamps = records["ts_event"].astype(np.int64)
+            kept = supported[inverse]
+            prelaunch = timestamps < _MNQ_HISTORY_START_NS
+            nonpositive, envelope = invalid_ohlcv_rows(records)
+            invalid = ~known[inverse] | (kept & (prelaunch | nonpositive | envelope))
+            if invalid.any():
+                row = int(np.argmax(invalid))
+                if not known[inverse[row]]:
+                    raise DatabentoIngestionError(
+                        f"databento_instrument_mapping_missing:{int(instrument_ids[row])}"
+                    )
+                if prelaunch[row]:
+                    timestamp = _datetime_from_unix_nanos(int(timestamps[row]))
+                    raise DatabentoIngestionError(
+                        f"mnq_prelaunch_record_rejected:{timestamp.isoformat()}"
+                    )
+                if nonpositive[row]:
+                    raise DatabentoIngestionError("databento_nonpositive_ohlcv_price")
+                raise DatabentoIngestionError("databento_invalid_ohlcv_envelope")
+            kept_rows = np.flatnonzero(kept)
+            kept_records = records[kept_rows]
+            kept_timestamps = timestamps[kept_rows]
+            kept_sessions = session_ordinals(kept_timestamps)
+            for ordinal in np.unique(kept_sessions).tolist():
+                trading_dates.setdefault(ordinal, date.fromordinal(ordinal))
+            for (
+                read,
+                instrument_id,
+                timestamp_ns,
+                ordinal,
+                open_nano,
+                high_nano,
+                low_nano,
+                close_nano,
+                volume,
+            ) in zip(
+                (kept_rows + file_read + 1).tolist(),
+                kept_records["instrument_id"].tolist(),
+                kept_timestamps.tolist(),
+                kept_sessions.tolist(),
+                kept_records["open"].tolist(),
+                kept_records["high"].tolist(),
+                kept_records["low"].tolist(),
+                kept_records["close"].tolist(),
+                kept_records["volume"].tolist(),
+            ):
+                rows.append(
+                    {
+                        "dataset": dataset,
+                        "instrument_id": instrument_id,
+                        "ts_event": _datetime_from_unix_nanos(timestamp_ns),
+                        "trading_date": trading_dates[ordinal],
+                        "open_nano": open_nano,
+                        "high_nano": high_nano,
+                        "low_nano": low_nano,
+                        "close_nano": close_nano,
+                        "volume": volume,
+                        "source_file_sha256": source_hash,
+                    }
+                )
+                row_reads.append(read)
+                if len(rows) >= batch_size:
+                    yield rows, row_reads[-1]
+                    rows = []
+                    row_reads = []
+            file_read += count
+    except DbnArrayError as exc:
+        raise DatabentoIngestionError(str(exc)) from exc
+    yield rows, file_read
+
+
+def _record_ohlcv_row_batches(
+    zip_file: ZipFile,
+    entry: ZipInfo,
+    *,
+    dataset: str,
+    instruments: Mapping[int, DatabentoInstrument],
+    source_hash: str,
+    batch_size: int,
+) -> Iterator[tuple[list[dict[str, Any]], int]]:
+    rows: list[dict[str, Any]] = []
+    file_read = 0
+    metadata_seen = False
+    for record in _iter_dbn_entry(zip_file, entry):
+        if isinstance(record, Metadata):
+            _validate_dbn_metadata(record, dataset=dataset, schema_name="ohlcv-1m")
+            metadata_seen = True
+            continue
+        if not isinstance(record, OHLCVMsg):
+            raise DatabentoIngestionError(
+                f"unexpected_dbn_record:{entry.filename}:{type(record).__name__}"
+            )
+        file_read += 1
+        instrument = instruments.get(int(record.instrument_id))
+        if instrument is None:
+            raise DatabentoIngestionError(
+                f"databento_instrument_mapping_missing:{int(record.instrument_id)}"
+            )
+        if str(instrument.instrument_class) != "F" or str(instrument.root_symbol) != SUPPORTED_ROOT:
+            continue
+        timestamp = _datetime_from_unix_nanos(int(record.ts_event))
+        if timestamp < MNQ_HISTORY_START_UTC:
+            raise DatabentoIngestionError(
+                f"mnq_prelaunch_record_rejected:{timestamp.isoformat()}"
+            )
+        values = {
+            "dataset": dataset,
+            "instrument_id": int(record.instrument_id),
+            "ts_event": timestamp,
+            "trading_date": trading_day_date(timestamp),
+            "open_nano": int(record.open),
+            "high_nano": int(record.high),
+            "low_nano": int(record.low),
+            "close_nano": int(record.close),
+            "volume": int(record.volume),
+            "source_file_sha256": source_hash,
+        }
+        _validate_ohlcv_values(values)
+        rows.append(values)
+        if len(rows) >= batch_size:
+            yield rows, file_read
+            rows = []
+    if not metadata_seen:
+        raise DatabentoIngestionError(f"dbn_metadata_missing:{entry.filename}")
+    yield rows, file_read
+
+
 def _checkpoint_ohlcv_import(
     db: Session,
     *,
@@ -0,0 +1,459 @@
+"""Host-wide shared memory for replay arrays derived from the mmap cache.
+
+Persisted series are file-backed mmaps, so every worker on a host already
+shares their pages. Timeframes served from the 1m series are not: each uvicorn,
+sweep or benchmark process reduces the same buckets into private arrays. In
+shared mode the replay store publishes those lazily resampled arrays into one
+POSIX shared memory segment per slice fingerprint, and every later process
+attaches to the segment zero-copy instead of aggregating its own copy.
+
+Only those resampled OHLCV columns are shared. Eager ``CachedCandleList``
+slices in the replay store's LRU, and indicator or precompute arrays built
+from any slice, stay private to each process, so per-worker RSS still grows
+with them.
+
+A segment's header carries a lease table with the id of each process attached
+to it. Updates hold an ``flock`` on a host-wide lock file. A process gives up
+its slot when its last local lease is released, and whoever frees the final
+live slot unlinks the segment. Slots left by processes that have exited are
+reaped when the same segment is attached or released again. A segment that
+no live process holds, and that nobody asks for again, is unlinked by the
+sweep that runs when a process creates its default registry.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import os
+import struct
+import tempfile
+import threading
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass
+from multiprocessing import resource_tracker, shared_memory
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows has no flock
+    fcntl = None  # type: ignore[assignment]
+
+
+_SEGMENT_MAGIC = b"TSSLICE1"
+_SEGMENT_PREFIX = "tsds_"
+_LEASE_SLOTS = 64
+_STATE_READY = 1
+# Magic, state, descriptor length, then one process id per lease slot.
+_HEADER = struct.Struct(f"<8sqq{_LEASE_SLOTS}q")
+_STATE_OFFSET = 8
+_SLOTS_OFFSET = 24
+_COLUMN_ALIGNMENT = 64
+_LOCK_FILE_NAME = "topsignal-databento-shared-slices.lock"
+# Where Linux exposes POSIX shared memory; other hosts skip the sweep.
+_SHM_DIRECTORY = Path("/dev/shm")
+# Python 3.13 can opt a segment out of the per-process resource tracker, which
+# would otherwise unlink segments that other workers still use when the
+# creating process exits.
+_TRACK_PARAMETER = "track" in inspect.signature(shared_memory.SharedMemory).parameters
+
+
+def shared_slices_supported() -> bool:
+    """Shared mode needs POSIX shared memory and ``flock``."""
+
+    return fcntl is not None and os.name == "posix"
+
+
+def segment_name(key: str) -> str:
+    """Short, portable segment name for a slice fingerprint."""
+
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=10).hexdigest()
+    return f"{_SEGMENT_PREFIX}{digest}"
+
+
+class SharedSliceLease:
+    """One process-local reference to an attached segment's arrays."""
+
+    __slots__ = ("arrays", "_registry", "_name", "_released")
+
+    def __init__(
+        self,
+        registry: "SharedSliceRegistry",
+        name: str,
+        arrays: Mapping[str, np.ndarray],
+    ) -> None:
+        self.arrays = dict(arrays)
+        self._registry = registry
+        self._name = name
+        self._released = False
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def release(self) -> None:
+        if self._released:
+            return
+        self._released = True
+        self.arrays = {}
+        self._registry._release(self._name)
+
+    def __del__(self) -> None:
+        self.release()
+
+
+@dataclass
+class _Attachment:
+    segment: shared_memory.SharedMemory
+    arrays: dict[str, np.ndarray]
+    leases: int = 0
+
+
+class SharedSliceRegistry:
+    """Process-side view of the host's shared slice segments."""
+
+    def __init__(self, lock_path: str | Path | None = None) -> None:
+        self.lock_path = (
+            Path(lock_path)
+            if lock_path is not None
+            else Path(tempfile.gettempdir()) / _LOCK_FILE_NAME
+        )
+        self._lock = threading.RLock()
+        self._pid = os.getpid()
+        self._attachments: dict[str, _Attachment] = {}
+        self._unclosed: list[shared_memory.SharedMemory] = []
+        self._published = 0
+        self._attached = 0
+
+    def acquire(self, key: str) -> SharedSliceLease | None:
+        """Lease the arrays published under ``key``, or ``None`` if absent."""
+
+        name = segment_name(key)
+        with self._lock:
+            self._after_fork()
+            attachment = self._attachments.get(name)
+            if attachment is None:
+                with self._host_lock():
+                    attachment = self._attach_unlocked(name, key)
+                if attachment is None:
+                    return None
+                self._attached += 1
+            return self._lease(name, attachment)
+
+    def publish(
+        self, key: str, arrays: Mapping[str, np.ndarray]
+    ) -> SharedSliceLease | None:
+        """Copy ``arrays`` into a new segment and lease it.
+
+        When another process published ``key`` first, its segment is leased
+        instead. ``None`` means the arrays could not be shared (no free lease
+        slot or no shared memory left); callers keep their private copy.
+        """
+
+        name = segment_name(key)
+        with self._lock:
+            self._after_fork()
+            attachment = self._attachments.get(name)
+            if attachment is None:
+                with self._host_lock():
+                    attachment = self._attach_unlocked(name, key)
+                    if attachment is None:
+                        attachment = self._create_unlocked(name, key, arrays)
+                        if attachment is None:
+                            return None
+                        self._published += 1
+                    else:
+                        self._attached += 1
+            return self._lease(name, attachment)
+
+    def sweep_dead_segments(self) -> int:
+        """Unlink segments whose lease slots all belong to exited processes.
+
+        Also drops segments a writer never finished. Returns how many were
+        unlinked.
+        """
+
+        if not _SHM_DIRECTORY.is_dir():
+            return 0
+        swept = 0
+        with self._lock:
+            self._after_fork()
+            with self._host_lock():
+                for path in _SHM_DIRECTORY.glob(f"{_SEGMENT_PREFIX}*"):
+                    if path.name in self._attachments:
+                        continue
+                    try:
+                        segment = _open_segment(path.name)
+                    except (FileNotFoundError, OSError, ValueError):
+                        continue
+                    try:
+                        if _segment_abandoned(segment):
+                            _unlink(segment)
+                            swept += 1
+                    finally:
+                        segment.close()
+        return swept
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "published": self._published,
+                "attached": self._attached,
+                "segments": len(self._attachments),
+                "segment_bytes": sum(
+                    attachment.segment.size
+                    for attachment in self._attachments.values()
+                ),
+            }
+
+    def _lease(self, name: str, attachment: _Attachment) -> SharedSliceLease:
+        attachment.leases += 1
+        return SharedSliceLease(self, name, attachment.arrays)
+
+    def _release(self, name: str) -> None:
+        with self._lock:
+            if os.getpid() != self._pid:
+                return
+            attachment = self._attachments.get(name)
+            if attachment is None:
+                return
+            attachment.leases -= 1
+            if attachment.leases > 0:
+                return
+            del self._attachments[name]
+            attachment.arrays.clear()
+            segment = attachment.segment
+            try:
+                with self._host_lock():
+                    slots = _lease_slots(segment)
+                    for index, pid in enumerate(slots):
+                        if pid == self._pid:
+                            _set_lease_slot(segment, index, 0)
+                    if not any(
+                        pid and pid != self._pid and _process_alive(pid) for pid in slots
+                    ):
+                        _unlink(segment)
+            except OSError:
+                pass
+            self._unclosed.append(segment)
+            self._close_released_segments()
+
+    def _attach_unlocked(self, name: str, key: str) -> _Attachment | None:
+        try:
+            segment = _open_segment(name)
+        except FileNotFoundError:
+            return None
+        try:
+            arrays = _segment_arrays(segment, key)
+        except ValueError:
+            # A writer died before marking the segment ready, or a different
+            # key hashed to the same name. Drop it so it can be republished.
+            if not any(_process_alive(pid) for pid in _lease_slots(segment) if pid):
+                _unlink(segment)
+            segment.close()
+            return None
+        if not _claim_lease_slot(segment, self._pid):
+            arrays.clear()
+            segment.close()
+            return None
+        attachment = _Attachment(segment=segment, arrays=arrays)
+        self._attachments[name] = attachment
+        return attachment
+
+    def _create_unlocked(
+        self, name: str, key: str, arrays: Mapping[str, np.ndarray]
+    ) -> _Attachment | None:
+        columns: list[list[Any]] = []
+        offset = 0
+        for column, values in arrays.items():
+            values = np.ascontiguousarray(values)
+            offset = _aligned(offset)
+            columns.append([column, values.dtype.str, offset, int(values.size)])
+            offset += int(values.nbytes)
+        descriptor = json.dumps(
+            {"key": key, "columns": columns}, separators=(",", ":")
+        ).encode("utf-8")
+        data_start = _aligned(_HEADER.size + len(descriptor))
+        try:
+            segment = _open_segment(
+                name, create=True, size=max(1, data_start + offset)
+            )
+        except (FileExistsError, OSError):
+            return None
+        try:
+            _HEADER.pack_into(
+                segment.buf, 0, _SEGMENT_MAGIC, 0, len(descriptor), *([0] * _LEASE_SLOTS)
+            )
+            segment.buf[_HEADER.size : _HEADER.size + len(descriptor)] = descriptor
+            for column, _dtype, column_offset, _size in columns:
+                values = np.ascontiguousarray(arrays[column])
+                target = np.ndarray(
+                    values.shape,
+                    dtype=values.dtype,
+                    buffer=segment.buf,
+                    offset=data_start + column_offset,
+                )
+                target[...] = values
+                del target
+            struct.pack_into("<q", segment.buf, _STATE_OFFSET, _STATE_READY)
+            _claim_lease_slot(segment, self._pid)
+            attachment = _Attachment(segment=segment, arrays=_segment_arrays(segment, key))
+        except BaseException:
+            _unlink(segment)
+            segment.close()
+            raise
+        self._attachments[name] = attachment
+        return attachment
+
+    def _close_released_segments(self) -> None:
+        remaining: list[shared_memory.SharedMemory] = []
+        for segment in self._unclosed:
+            try:
+                segment.close()
+            except BufferError:
+                # A caller still holds a view of the arrays; NumPy keeps the
+                # mapping valid until that view is gone, so retry later.
+                remaining.append(segment)
+        self._unclosed = remaining
+
+    def _after_fork(self) -> None:
+        pid = os.getpid()
+        if pid != self._pid:
+            # Leases taken by the parent belong to the parent's slots.
+            self._pid = pid
+            self._attachments = {}
+            self._unclosed = []
+
+    @contextmanager
+    def _host_lock(self) -> Iterator[None]:
+        with open(self.lock_path, "a+b") as handle:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+def _aligned(offset: int) -> int:
+    return -(-int(offset) // _COLUMN_ALIGNMENT) * _COLUMN_ALIGNMENT
+
+
+def _open_segment(
+    name: str, *, create: bool = False, size: int = 0
+) -> shared_memory.SharedMemory:
+    if _TRACK_PARAMETER:
+        return shared_memory.SharedMemory(
+            name=name, create=create, size=size, track=False
+        )
+    segment = shared_memory.SharedMemory(name=name, create=create, size=size)
+    resource_tracker.unregister(segment._name, "shared_memory")  # type: ignore[attr-defined]
+    return segment
+
+
+def _unlink(segment: shared_memory.SharedMemory) -> None:
+    if not _TRACK_PARAMETER:
+        # ``unlink`` unregisters the name; pair it so the tracker stays balanced.
+        resource_tracker.register(segment._name, "shared_memory")  # type: ignore[attr-defined]
+    try:
+        segment.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def _segment_arrays(
+    segment: shared_memory.SharedMemory, key: str
+) -> dict[str, np.ndarray]:
+    if segment.size < _HEADER.size:
+        raise ValueError("shared_slice_segment_truncated")
+    magic, state, descriptor_length, *_slots = _HEADER.unpack_from(segment.buf, 0)
+    if magic != _SEGMENT_MAGIC or state != _STATE_READY:
+        raise ValueError("shared_slice_segment_not_ready")
+    try:
+        descriptor = json.loads(
+            bytes(segment.buf[_HEADER.size : _HEADER.size + descriptor_length])
+        )
+    except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+        raise ValueError("shared_slice_descriptor_invalid") from exc
+    if not isinstance(descriptor, dict) or descriptor.get("key") != key:
+        raise ValueError("shared_slice_key_mismatch")
+    data_start = _aligned(_HEADER.size + descriptor_length)
+    arrays: dict[str, np.ndarray] = {}
+    for column, dtype, offset, size in descriptor["columns"]:
+        values = np.ndarray(
+            (int(size),),
+            dtype=np.dtype(dtype),
+            buffer=segment.buf,
+            offset=data_start + int(offset),
+        )
+        values.flags.writeable = False
+        arrays[str(column)] = values
+    return arrays
+
+
+def _lease_slots(segment: shared_memory.SharedMemory) -> list[int]:
+    return list(struct.unpack_from(f"<{_LEASE_SLOTS}q", segment.buf, _SLOTS_OFFSET))
+
+
+def _set_lease_slot(segment: shared_memory.SharedMemory, index: int, pid: int) -> None:
+    struct.pack_into("<q", segment.buf, _SLOTS_OFFSET + index * 8, int(pid))
+
+
+def _claim_lease_slot(segment: shared_memory.SharedMemory, pid: int) -> bool:
+    free: int | None = None
+    for index, holder in enumerate(_lease_slots(segment)):
+        if holder == pid:
+            return True
+        if holder and not _process_alive(holder):
+            _set_lease_slot(segment, index, 0)
+            holder = 0
+        if not holder and free is None:
+            free = index
+    if free is None:
+        return False
+    _set_lease_slot(segment, free, pid)
+    return True
+
+
+def _segment_abandoned(segment: shared_memory.SharedMemory) -> bool:
+    """Whether no live process holds ``segment``; call under the host lock."""
+
+    if segment.size < _HEADER.size:
+        return True
+    magic, state, _descriptor_length, *slots = _HEADER.unpack_from(segment.buf, 0)
+    if magic not in (_SEGMENT_MAGIC, bytes(len(_SEGMENT_MAGIC))):
+        return False
+    if state != _STATE_READY:
+        # Writers publish under the host lock, so this one died mid-write.
+        return True
+    return not any(pid and _process_alive(pid) for pid in slots)
+
+
+def _process_alive(pid: int) -> bool:
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+    return True
+
+
+_DEFAULT_REGISTRY_LOCK = threading.Lock()
+_DEFAULT_REGISTRY: SharedSliceRegistry | None = None
+
+
+def get_shared_slice_registry() -> SharedSliceRegistry:
+    global _DEFAULT_REGISTRY
+    with _DEFAULT_REGISTRY_LOCK:
+        if _DEFAULT_REGISTRY is None:
+            _DEFAULT_REGISTRY = SharedSliceRegistry()
+            if shared_slices_supported():
+                _DEFAULT_REGISTRY.sweep_dead_segments()
+        return _DEFAULT_REGISTRY
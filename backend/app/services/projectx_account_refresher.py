@@ -0,0 +1,209 @@
+"""Stale-while-revalidate ProjectX account discovery.
+
+``GET /api/accounts`` used to call ``list_accounts`` and reconcile the result
+inline, so every dashboard load waited on a provider round-trip. With
+background refresh enabled the route answers from the persisted snapshot and
+asks this refresher to revalidate it instead. Per user:
+
+* at most one refresh runs at a time (single flight), and
+* a new refresh starts no sooner than ``min_interval_seconds`` plus up to
+  ``jitter_seconds`` after the previous one started, so many open tabs or
+  users do not hit the gateway in lockstep.
+
+Each finished refresh is published to that user's subscribers, which the SSE
+route forwards to the browser.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import random
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_MIN_INTERVAL_SECONDS = 60.0
+_DEFAULT_JITTER_SECONDS = 10.0
+
+REFRESH_SCHEDULED = "scheduled"
+REFRESH_IN_FLIGHT = "in_flight"
+REFRESH_THROTTLED = "throttled"
+
+AccountRefreshFunction = Callable[[str], dict[str, Any]]
+
+
+class AccountRefreshSubscription:
+    """One SSE listener; events arrive on ``queue`` in the subscriber's loop."""
+
+    def __init__(
+        self,
+        *,
+        refresher: "ProjectXAccountRefresher",
+        user_id: str,
+        loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        self.user_id = user_id
+        self.queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+        self._refresher = refresher
+        self._loop = loop
+
+    def deliver(self, event: dict[str, Any]) -> None:
+        try:
+            self._loop.call_soon_threadsafe(self.queue.put_nowait, event)
+        except RuntimeError:
+            # The response loop already shut down; the route drops us shortly.
+            pass
+
+    def close(self) -> None:
+        self._refresher._unsubscribe(self)
+
+
+@dataclass
+class _UserRefreshState:
+    in_flight: bool = False
+    not_before: float = 0.0
+    subscribers: set[AccountRefreshSubscription] = field(default_factory=set)
+    idle: threading.Event = field(default_factory=threading.Event)
+
+    def __post_init__(self) -> None:
+        self.idle.set()
+
+
+class ProjectXAccountRefresher:
+    """Run ``refresh(user_id)`` on background threads and fan out its event.
+
+    ``refresh`` owns the provider call and its own DB session; it returns the
+    ``{"event": ..., "data": ...}`` dict to publish. An unexpected exception
+    is logged and published as ``accounts_refresh_failed``.
+    """
+
+    def __init__(
+        self,
+        refresh: AccountRefreshFunction,
+        *,
+        min_interval_seconds: float | None = None,
+        jitter_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        jitter: Callable[[], float] = random.random,
+    ) -> None:
+        self._refresh = refresh
+        self.min_interval_seconds = max(
+            0.0,
+            _float_setting(
+                min_interval_seconds,
+                env_name="PROJECTX_ACCOUNT_REFRESH_MIN_INTERVAL_SECONDS",
+                default=_DEFAULT_MIN_INTERVAL_SECONDS,
+            ),
+        )
+        self.jitter_seconds = max(
+            0.0,
+            _float_setting(
+                jitter_seconds,
+                env_name="PROJECTX_ACCOUNT_REFRESH_JITTER_SECONDS",
+                default=_DEFAULT_JITTER_SECONDS,
+            ),
+        )
+        self._clock = clock
+        self._jitter = jitter
+        self._lock = threading.Lock()
+        self._users: dict[str, _UserRefreshState] = {}
+        self._closed = False
+
+    def request_refresh(self, user_id: str) -> str:
+        """Start a background refresh unless one is running or was too recent."""
+
+        with self._lock:
+            if self._closed:
+                return REFRESH_THROTTLED
+            self._prune_expired_locked()
+            state = self._users.setdefault(user_id, _UserRefreshState())
+            if state.in_flight:
+                return REFRESH_IN_FLIGHT
+            now = self._clock()
+            if now < state.not_before:
+                return REFRESH_THROTTLED
+            state.in_flight = True
+            state.idle.clear()
+            state.not_before = now + self.min_interval_seconds + self._jitter() * self.jitter_seconds
+        thread = threading.Thread(
+            target=self._run,
+            args=(user_id,),
+            name="projectx-account-refresh",
+            daemon=True,
+        )
+        thread.start()
+        return REFRESH_SCHEDULED
+
+    def subscribe(self, user_id: str) -> AccountRefreshSubscription:
+        """Register a listener; call from the event loop that will consume it."""
+
+        subscription = AccountRefreshSubscription(
+            refresher=self,
+            user_id=user_id,
+            loop=asyncio.get_running_loop(),
+        )
+        with self._lock:
+            self._users.setdefault(user_id, _UserRefreshState()).subscribers.add(subscription)
+        return subscription
+
+    def wait_idle(self, user_id: str, timeout: float | None = None) -> bool:
+        with self._lock:
+            state = self._users.get(user_id)
+        return True if state is None else state.idle.wait(timeout)
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+
+    def _unsubscribe(self, subscription: AccountRefreshSubscription) -> None:
+        with self._lock:
+            state = self._users.get(subscription.user_id)
+            if state is None:
+                return
+            state.subscribers.discard(subscription)
+            self._prune_locked(subscription.user_id, state)
+
+    def _run(self, user_id: str) -> None:
+        try:
+            event = self._refresh(user_id)
+        except Exception:
+            logger.exception(
+                "projectx_account_background_refresh_failed",
+                extra={"reason_code": "projectx_account_background_refresh_failed"},
+            )
+            event = {
+                "event": "accounts_refresh_failed",
+                "data": {"code": "projectx_account_background_refresh_failed"},
+            }
+        with self._lock:
+            state = self._users[user_id]
+            state.in_flight = False
+            subscribers = list(state.subscribers)
+            state.idle.set()
+            self._prune_locked(user_id, state)
+        for subscription in subscribers:
+            subscription.deliver(event)
+
+    def _prune_expired_locked(self) -> None:
+        # Users who refreshed once and never subscribed leave no other trigger.
+        for user_id, state in list(self._users.items()):
+            self._prune_locked(user_id, state)
+
+    def _prune_locked(self, user_id: str, state: _UserRefreshState) -> None:
+        # Keep the state while it still throttles, so reconnects cannot bypass it.
+        if not state.subscribers and not state.in_flight and self._clock() >= state.not_before:
+            self._users.pop(user_id, None)
+
+
+def _float_setting(explicit: float | None, *, env_name: str, default: float) -> float:
+    raw = explicit if explicit is not None else os.getenv(env_name, str(default))
+    try:
+        return float(raw)
+    except (TypeError, ValueError):
+        return float(default)
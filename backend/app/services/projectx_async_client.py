@@ -0,0 +1,184 @@
+"""Asyncio facade over ``ProjectXClient`` for fan-out provider reads.
+
+The gateway client is synchronous and thread-safe: its transport pools
+keep-alive connections per host and its access token is cached process-wide.
+``AsyncProjectXClient`` runs those calls on worker threads so independent
+requests (trade backfill chunks, several accounts) can be awaited together,
+while two limits keep the fan-out polite:
+
+* at most ``max_concurrency`` requests are in flight at once, and
+* a token bucket spends at most ``requests_per_minute`` requests per minute,
+  allowing a burst of ``max_concurrency``.
+
+``RequestBudget`` is not bound to a loop or thread, so one bucket can also be
+shared by synchronous callers (see ``projectx_trades``, which keeps one per
+user); pass ``pace_requests=False`` when the wrapped client already draws
+from such a bucket.
+
+The first request runs alone, so a cold token cache results in one login
+rather than one per concurrent request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import os
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any, Protocol, TypeVar
+
+
+_DEFAULT_MAX_CONCURRENCY = 4
+_DEFAULT_REQUESTS_PER_MINUTE = 120
+
+_T = TypeVar("_T")
+
+
+class TradeHistoryClient(Protocol):
+    def fetch_trade_history(
+        self,
+        account_id: int,
+        start: datetime,
+        end: datetime | None = None,
+        *,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> list[dict[str, Any]]: ...
+
+
+class RequestBudget:
+    """Token bucket refilled at ``per_minute / 60`` tokens per second.
+
+    Safe to share across threads and event loops: callers on a loop await
+    ``acquire_async`` and blocking callers use ``acquire``.
+    """
+
+    def __init__(self, *, per_minute: int, burst: int) -> None:
+        self.per_minute = max(1, int(per_minute))
+        self.burst = max(1, int(burst))
+        self.rate = self.per_minute / 60.0
+        self.capacity = float(self.burst)
+        self._tokens = self.capacity
+        self._updated: float | None = None
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            delay = self._take()
+            if delay <= 0.0:
+                return
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        while True:
+            delay = self._take()
+            if delay <= 0.0:
+                return
+            await asyncio.sleep(delay)
+
+    def _take(self) -> float:
+        """Spend one token, or return how long until one is available."""
+
+        with self._lock:
+            now = time.monotonic()
+            if self._updated is not None:
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return 0.0
+            return (1.0 - self._tokens) / self.rate
+
+
+class AsyncProjectXClient:
+    """Awaitable, rate-limited calls into one synchronous ProjectX client.
+
+    Limits are bound to the running event loop on first use; create one
+    instance per loop.
+    """
+
+    def __init__(
+        self,
+        client: TradeHistoryClient,
+        *,
+        max_concurrency: int | None = None,
+        requests_per_minute: int | None = None,
+        pace_requests: bool = True,
+    ) -> None:
+        self.client = client
+        self.max_concurrency = _positive_int_setting(
+            max_concurrency,
+            env_name="PROJECTX_BACKFILL_CONCURRENCY",
+            default=_DEFAULT_MAX_CONCURRENCY,
+        )
+        self.requests_per_minute = requests_per_minute_setting(requests_per_minute)
+        self.pace_requests = pace_requests
+        self._slots: asyncio.Semaphore | None = None
+        self._budget: RequestBudget | None = None
+        self._first_request: asyncio.Lock | None = None
+        self._warmed = False
+
+    async def fetch_trade_history(
+        self,
+        account_id: int,
+        start: datetime,
+        end: datetime | None = None,
+        *,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> list[dict[str, Any]]:
+        return await self.call(
+            self.client.fetch_trade_history,
+            account_id=account_id,
+            start=start,
+            end=end,
+            limit=limit,
+            offset=offset,
+        )
+
+    async def call(self, function: Callable[..., _T], /, *args: Any, **kwargs: Any) -> _T:
+        """Run one blocking client call within the concurrency and rate limits."""
+
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+            if self.pace_requests:
+                self._budget = RequestBudget(
+                    per_minute=self.requests_per_minute, burst=self.max_concurrency
+                )
+            self._first_request = asyncio.Lock()
+        assert self._first_request is not None
+        bound = functools.partial(function, *args, **kwargs)
+        if not self._warmed:
+            async with self._first_request:
+                if not self._warmed:
+                    if self._budget is not None:
+                        await self._budget.acquire_async()
+                    result = await asyncio.to_thread(bound)
+                    self._warmed = True
+                    return result
+        async with self._slots:
+            if self._budget is not None:
+                await self._budget.acquire_async()
+            return await asyncio.to_thread(bound)
+
+
+def requests_per_minute_setting(explicit: int | None = None) -> int:
+    """Provider request budget from ``PROJECTX_BACKFILL_REQUESTS_PER_MINUTE``."""
+
+    return _positive_int_setting(
+        explicit,
+        env_name="PROJECTX_BACKFILL_REQUESTS_PER_MINUTE",
+        default=_DEFAULT_REQUESTS_PER_MINUTE,
+    )
+
+
+def _positive_int_setting(explicit: int | None, *, env_name: str, default: int) -> int:
+    raw: Any = explicit if explicit is not None else os.getenv(env_name, str(default))
+    try:
+        value = int(raw)
+    except (TypeError, ValueError):
+        return int(default)
+    return value if value > 0 else int(default)
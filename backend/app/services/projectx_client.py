@@ -9,7 +9,9 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from threading import Lock
 from typing import Any, Iterator
-from urllib import error, parse, request
+from urllib import parse
+
+from .projectx_transport import ProjectXTransport, get_default_projectx_transport
 
 
 @dataclass
@@ -56,7 +58,11 @@ class ProjectXClientError(RuntimeError):
 
 
 class ProjectXClient:
-    """Thin HTTP wrapper around documented ProjectX Gateway endpoints."""
+    """Thin HTTP wrapper around documented ProjectX Gateway endpoints.
+
+    Requests go through ``transport``, which defaults to the process-wide
+    keep-alive pool shared by every client.
+    """
 
     def __init__(
         self,
@@ -65,11 +71,13 @@ class ProjectXClient:
         username: str,
         api_key: str,
         timeout_seconds: int = 20,
+        transport: ProjectXTransport | None = None,
     ):
         self.base_url = base_url.rstrip("/")
         self.username = username
         self.api_key = api_key
         self.timeout_seconds = timeout_seconds
+        self.transport = transport if transport is not None else get_default_projectx_transport()
 
     @classmethod
     def from_env(cls) -> "ProjectXClient":
@@ -472,48 +480,12 @@ class ProjectXClient:
                 if pnl_value is not None and not _is_finite_number(pnl_value):
                     raise ProjectXClientError("ProjectX Trade/search returned invalid daily P&L data.")
 
-            timestamp = _parse_datetime(
-                _first_value(row, ["creationTimestamp", "timestamp", "createdAt", "updatedAt"])
-            )
-            if timestamp is None:
+            trade = normalize_projectx_trade_row(row, account_id=account_id)
+            if trade is None:
                 if require_valid_collection:
                     raise ProjectXClientError("ProjectX Trade/search returned a trade without a valid timestamp.")
                 continue
-
-            row_account = _safe_int(_first_value(row, ["accountId", "account_id"]))
-            contract_id = _first_value(row, ["contractId", "contract_id", "symbolId", "symbol"])
-            symbol = _first_value(row, ["symbol", "symbolId", "contractSymbol", "contractId"])
-            order_id = _first_value(row, ["orderId", "order_id"])
-            source_trade_id = _first_value(row, ["id", "tradeId", "executionId"])
-            pnl_raw = _first_value(row, ["profitAndLoss", "pnl", "realizedPnl"])
-
-            order_id_text = _string_or_none(order_id)
-            source_trade_id_text = _string_or_none(source_trade_id)
-            if not order_id_text:
-                # Keep dedupe stable even if orderId is omitted.
-                order_id_text = source_trade_id_text or f"fallback-{int(timestamp.timestamp() * 1000)}"
-
-            contract_id_text = _string_or_none(contract_id) or "UNKNOWN"
-            symbol_text = _string_or_none(symbol) or contract_id_text
-
-            normalized.append(
-                {
-                    "account_id": row_account if row_account is not None else int(account_id),
-                    "contract_id": contract_id_text,
-                    "symbol": symbol_text,
-                    "side": _normalize_side(_first_value(row, ["side", "direction", "positionSide"])),
-                    "size": _safe_float(_first_value(row, ["size", "quantity", "qty"])),
-                    "price": _safe_float(_first_value(row, ["price", "fillPrice", "averagePrice"])),
-                    "timestamp": timestamp,
-                    "fees": _safe_float(_first_value(row, ["fees", "commission", "totalFees"])),
-                    "pnl": _safe_float(pnl_raw) if pnl_raw is not None else None,
-                    "order_id": order_id_text,
-                    "source_trade_id": source_trade_id_text,
-                    "status": _string_or_none(_first_value(row, ["status", "tradeStatus", "state"])),
-                    "voided": _is_truthy(_first_value(row, ["voided", "isVoided", "is_voided"])),
-                    "raw_payload": row,
-                }
-            )
+            normalized.append(trade)
 
         normalized.sort(key=lambda trade: trade["timestamp"])
         return normalized
@@ -621,20 +593,16 @@ class ProjectXClient:
             headers["Authorization"] = f"Bearer {self._get_access_token()}"
 
         body = json.dumps(payload).encode("utf-8") if payload is not None else None
-        req = request.Request(url=url, data=body, headers=headers, method=method.upper())
 
         try:
-            with request.urlopen(req, timeout=self.timeout_seconds) as response:
-                raw = response.read().decode("utf-8")
-        except error.HTTPError as exc:
-            raw_error = exc.read().decode("utf-8", errors="replace")
-            detail = _extract_error_message(raw_error) or str(exc.reason)
-            raise ProjectXClientError(
-                f"ProjectX request failed ({exc.code}): {detail}",
-                status_code=exc.code,
-                submission_outcome_unknown=(_is_order_submission_path(path) and 500 <= int(exc.code) <= 599),
-                reason_code=_http_error_reason_code(path=path, status_code=int(exc.code)),
-            ) from exc
+            response = self.transport.send(
+                method.upper(),
+                url,
+                headers=headers,
+                body=body,
+                timeout=self.timeout_seconds,
+                idempotent=not _is_order_submission_path(path),
+            )
         except TimeoutError as exc:
             raise ProjectXClientError(
                 "ProjectX request timed out. Check the ProjectX connection and try again.",
@@ -642,21 +610,25 @@ class ProjectXClient:
                 submission_outcome_unknown=_is_order_submission_path(path),
                 reason_code=PROJECTX_ERROR_NETWORK,
             ) from exc
-        except error.URLError as exc:
-            if isinstance(exc.reason, TimeoutError):
-                raise ProjectXClientError(
-                    "ProjectX request timed out. Check the ProjectX connection and try again.",
-                    status_code=504,
-                    submission_outcome_unknown=_is_order_submission_path(path),
-                    reason_code=PROJECTX_ERROR_NETWORK,
-                ) from exc
+        except OSError as exc:
             raise ProjectXClientError(
-                f"ProjectX network error: {exc.reason}",
+                f"ProjectX network error: {exc}",
                 status_code=502,
                 submission_outcome_unknown=_is_order_submission_path(path),
                 reason_code=PROJECTX_ERROR_NETWORK,
             ) from exc
 
+        if not 200 <= response.status <= 299:
+            raw_error = response.body.decode("utf-8", errors="replace")
+            detail = _extract_error_message(raw_error) or response.reason
+            raise ProjectXClientError(
+                f"ProjectX request failed ({response.status}): {detail}",
+                status_code=response.status,
+                submission_outcome_unknown=(_is_order_submission_path(path) and 500 <= response.status <= 599),
+                reason_code=_http_error_reason_code(path=path, status_code=response.status),
+            )
+
+        raw = response.body.decode("utf-8")
         if raw.strip() == "":
             return {}
 
@@ -744,6 +716,52 @@ def projectx_error_reason_code(exc: ProjectXClientError) -> str:
     return PROJECTX_ERROR_PROVIDER_RESPONSE
 
 
+def normalize_projectx_trade_row(row: dict[str, Any], *, account_id: int) -> dict[str, Any] | None:
+    """Map one ProjectX trade (``Trade/search`` row or user-hub trade) to an event.
+
+    Returns ``None`` when the row has no usable timestamp.
+    """
+
+    timestamp = _parse_datetime(
+        _first_value(row, ["creationTimestamp", "timestamp", "createdAt", "updatedAt"])
+    )
+    if timestamp is None:
+        return None
+
+    row_account = _safe_int(_first_value(row, ["accountId", "account_id"]))
+    contract_id = _first_value(row, ["contractId", "contract_id", "symbolId", "symbol"])
+    symbol = _first_value(row, ["symbol", "symbolId", "contractSymbol", "contractId"])
+    order_id = _first_value(row, ["orderId", "order_id"])
+    source_trade_id = _first_value(row, ["id", "tradeId", "executionId"])
+    pnl_raw = _first_value(row, ["profitAndLoss", "pnl", "realizedPnl"])
+
+    order_id_text = _string_or_none(order_id)
+    source_trade_id_text = _string_or_none(source_trade_id)
+    if not order_id_text:
+        # Keep dedupe stable even if orderId is omitted.
+        order_id_text = source_trade_id_text or f"fallback-{int(timestamp.timestamp() * 1000)}"
+
+    contract_id_text = _string_or_none(contract_id) or "UNKNOWN"
+    symbol_text = _string_or_none(symbol) or contract_id_text
+
+    return {
+        "account_id": row_account if row_account is not None else int(account_id),
+        "contract_id": contract_id_text,
+        "symbol": symbol_text,
+        "side": _normalize_side(_first_value(row, ["side", "direction", "positionSide"])),
+        "size": _safe_float(_first_value(row, ["size", "quantity", "qty"])),
+        "price": _safe_float(_first_value(row, ["price", "fillPrice", "averagePrice"])),
+        "timestamp": timestamp,
+        "fees": _safe_float(_first_value(row, ["fees", "commission", "totalFees"])),
+        "pnl": _safe_float(pnl_raw) if pnl_raw is not None else None,
+        "order_id": order_id_text,
+        "source_trade_id": source_trade_id_text,
+        "status": _string_or_none(_first_value(row, ["status", "tradeStatus", "state"])),
+        "voided": _is_truthy(_first_value(row, ["voided", "isVoided", "is_voided"])),
+        "raw_payload": row,
+    }
+
+
 def _clear_token_cache(cache_key: str | None = None) -> None:
     with _TOKEN_LOCK:
         if cache_key is None:
@@ -6,7 +6,7 @@ import json
 import logging
 import os
 import time
-from typing import Any, Callable, Mapping
+from typing import TYPE_CHECKING, Any, Callable, Mapping
 from urllib.parse import urlencode, urlparse, parse_qsl, urlunparse
 
 import websockets
@@ -14,11 +14,17 @@ import websockets
 from .projectx_client import ProjectXClient
 from .streaming_pnl_tracker import StreamingPnlTracker
 
+if TYPE_CHECKING:
+    from .projectx_trade_stream import StreamingTradeIngestor
+
 logger = logging.getLogger(__name__)
 
 _SIGNALR_RECORD_SEPARATOR = "\x1e"
 _MARKET_SUBSCRIBE_ENV = "PROJECTX_MARKET_HUB_SUBSCRIBE_MESSAGE"
 _USER_SUBSCRIBE_ENV = "PROJECTX_USER_HUB_SUBSCRIBE_MESSAGE"
+_USER_TRADE_TARGET = "GatewayUserTrade"
+_USER_TRADE_SUBSCRIBE_TARGET = "SubscribeTrades"
+_SIGNALR_COMPLETION = 3
 
 
 @dataclass
@@ -121,8 +127,10 @@ class ProjectXHubRunner:
         reconnect_max_seconds: float = 30.0,
         dispatch_failure_threshold: int = 5,
         dispatch_recovery_seconds: float = 30.0,
+        trade_ingestor: StreamingTradeIngestor | None = None,
     ):
         self._tracker = tracker
+        self._trade_ingestor = trade_ingestor
         self._client_factory = client_factory
         self._user_id = user_id.strip() if user_id and user_id.strip() else None
         self._account_id = int(account_id) if account_id is not None else None
@@ -146,6 +154,8 @@ class ProjectXHubRunner:
             tasks.append(asyncio.create_task(self._consume_hub("market", self._market_hub_url)))
         if self._user_hub_url:
             tasks.append(asyncio.create_task(self._consume_hub("user", self._user_hub_url)))
+            if self._trade_ingestor is not None:
+                tasks.append(asyncio.create_task(self._flush_trades_forever(self._trade_ingestor)))
 
         if not tasks:
             logger.info("[hubs] market/user hub URLs are not configured; streaming runner is idle")
@@ -172,13 +182,54 @@ class ProjectXHubRunner:
                     max_size=2 * 1024 * 1024,
                 ) as websocket:
                     await _signalr_handshake(websocket)
-                    for message in _load_subscription_messages(subscribe_env):
+                    messages = _load_subscription_messages(subscribe_env)
+                    for message in messages:
                         await websocket.send(json.dumps(message) + _SIGNALR_RECORD_SEPARATOR)
 
                     backoff_seconds = self._reconnect_base_seconds
-                    async for raw_message in websocket:
-                        for frame in _decode_signalr_frames(raw_message):
-                            self._dispatch_frame(stream_kind, frame)
+                    trade_ingestor = self._trade_ingestor if stream_kind == "user" else None
+                    # The account only counts as streamed once the hub was asked
+                    # for its trades; an invocation with an id waits for its ack.
+                    trade_subscription = (
+                        _trade_subscription(messages, self._account_id)
+                        if trade_ingestor is not None
+                        else None
+                    )
+                    pending_invocation_id: str | None = None
+                    if trade_ingestor is not None and trade_subscription is None:
+                        logger.warning(
+                            "[hubs] no trade subscription configured in %s; account=%s is not marked live",
+                            subscribe_env,
+                            self._account_id,
+                        )
+                    elif trade_ingestor is not None and trade_subscription is not None:
+                        invocation_id = trade_subscription.get("invocationId")
+                        if invocation_id is None:
+                            trade_ingestor.mark_connected()
+                        else:
+                            pending_invocation_id = str(invocation_id)
+                    try:
+                        async for raw_message in websocket:
+                            for frame in _decode_signalr_frames(raw_message):
+                                if (
+                                    trade_ingestor is not None
+                                    and pending_invocation_id is not None
+                                    and frame.get("type") == _SIGNALR_COMPLETION
+                                    and str(frame.get("invocationId")) == pending_invocation_id
+                                ):
+                                    pending_invocation_id = None
+                                    if frame.get("error"):
+                                        logger.warning(
+                                            "[hubs] trade subscription rejected account=%s",
+                                            self._account_id,
+                                        )
+                                    else:
+                                        trade_ingestor.mark_connected()
+                                    continue
+                                self._dispatch_frame(stream_kind, frame)
+                    finally:
+                        if trade_ingestor is not None:
+                            trade_ingestor.mark_disconnected()
             except asyncio.CancelledError:
                 raise
             except Exception as exc:
@@ -212,8 +263,44 @@ class ProjectXHubRunner:
 
         for argument in arguments:
             if isinstance(argument, Mapping):
+                if (
+                    stream_kind == "user"
+                    and self._trade_ingestor is not None
+                    and frame.get("target") == _USER_TRADE_TARGET
+                ):
+                    self._dispatch_trade(self._trade_ingestor, argument)
                 self._dispatch_payload(stream_kind, argument)
 
+    def _dispatch_trade(self, trade_ingestor: StreamingTradeIngestor, payload: Mapping[str, Any]) -> None:
+        circuit = self._dispatch_circuit("trade")
+        if not circuit.allow_dispatch():
+            logger.warning("[hubs] dispatch circuit open; dropping payload kind=trade")
+            return
+        try:
+            trade_ingestor.ingest(payload)
+        except Exception as exc:
+            circuit.record_failure(exc)
+            logger.error(
+                "projectx_hub_dispatch_failed",
+                extra={
+                    "reason_code": "projectx_hub_dispatch_error",
+                    "error_type": type(exc).__name__,
+                    "stream_kind": "trade",
+                    "circuit_state": circuit.snapshot().state,
+                },
+            )
+            return
+        circuit.record_success()
+
+    async def _flush_trades_forever(self, trade_ingestor: StreamingTradeIngestor) -> None:
+        # Database and REST work stays off the loop that reads the websocket.
+        try:
+            while True:
+                await asyncio.sleep(trade_ingestor.flush_interval_seconds)
+                await asyncio.to_thread(trade_ingestor.flush)
+        finally:
+            await asyncio.to_thread(trade_ingestor.flush)
+
     def _dispatch_payload(self, stream_kind: str, payload: Mapping[str, Any]) -> None:
         circuit = self._dispatch_circuit(stream_kind)
         if not circuit.allow_dispatch():
@@ -313,6 +400,28 @@ def _load_subscription_messages(env_name: str) -> list[Mapping[str, Any]]:
     return []
 
 
+def user_hub_trade_subscription(account_id: int | None) -> Mapping[str, Any] | None:
+    """The configured user-hub message that subscribes ``account_id`` to trades."""
+
+    return _trade_subscription(_load_subscription_messages(_USER_SUBSCRIBE_ENV), account_id)
+
+
+def _trade_subscription(
+    messages: list[Mapping[str, Any]], account_id: int | None
+) -> Mapping[str, Any] | None:
+    if account_id is None:
+        return None
+    for message in messages:
+        arguments = message.get("arguments")
+        if (
+            message.get("target") == _USER_TRADE_SUBSCRIBE_TARGET
+            and isinstance(arguments, list)
+            and any(str(argument).strip() == str(account_id) for argument in arguments)
+        ):
+            return message
+    return None
+
+
 def _append_query(url: str, params: Mapping[str, str]) -> str:
     parsed = urlparse(url)
     scheme = parsed.scheme
@@ -10,6 +10,7 @@ from ..db import SessionLocal
 from .instruments import build_point_value_lookup, load_instrument_specs
 from .projectx_hubs import ProjectXHubRunner
 from .projectx_client import ProjectXClient
+from .projectx_trade_stream import StreamingTradeIngestor, trade_stream_ingest_enabled
 from .streaming_pnl_tracker import (
     ClosedPositionLifecycle,
     StreamingPnlTracker,
@@ -100,11 +101,22 @@ def create_streaming_runtime(
         point_value_by_symbol=point_value_lookup,
         on_lifecycle_closed=_persist_closed_lifecycle,
     )
+    trade_ingestor = (
+        StreamingTradeIngestor(
+            session_factory=SessionLocal,
+            client_factory=client_factory,
+            user_id=normalized_user_id,
+            account_id=account_id,
+        )
+        if trade_stream_ingest_enabled(account_id)
+        else None
+    )
     runner = ProjectXHubRunner(
         tracker=tracker,
         client_factory=client_factory,
         user_id=normalized_user_id,
         account_id=account_id,
+        trade_ingestor=trade_ingestor,
     )
     return StreamingRuntime(tracker=tracker, runner=runner)
 
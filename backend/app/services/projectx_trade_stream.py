@@ -0,0 +1,285 @@
+"""Persist ProjectX user-hub trades as they arrive.
+
+Without this, ``projectx_trade_events`` only change when a request triggers a
+``Trade/search`` refresh. ``StreamingTradeIngestor`` receives the hub's
+``GatewayUserTrade`` payloads, upserts them in small batched transactions and
+advances the current trading day's ``ProjectXTradeDaySync`` window, so
+today's P&L and calendar reads stay current without polling. While the stream
+is connected, current-day refreshes are served from the database. "Connected"
+means the hub was sent (and, with an ``invocationId``, acknowledged) a
+``SubscribeTrades`` invocation for the account, not just a websocket handshake.
+
+REST reconciliation still runs, but only:
+
+* when a trading day closes, to mark it complete, and
+* on a gap, when the stream (re)connected after the day's synced window ended
+  and trades may have been missed in between.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from collections.abc import Callable, Mapping
+from datetime import date, datetime, timedelta, timezone
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from .projectx_client import ProjectXClient, normalize_projectx_trade_row
+from .projectx_hubs import user_hub_trade_subscription
+from .projectx_trades import (
+    advance_trade_day_stream_watermark,
+    reconcile_trade_day,
+    set_trade_stream_live,
+    store_trade_events,
+)
+from .trading_day import trading_day_date
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_BATCH_SIZE = 50
+_DEFAULT_FLUSH_INTERVAL_SECONDS = 1.0
+_DEFAULT_RECONCILE_RETRY_SECONDS = 60.0
+# Without new trades the watermark only needs to move often enough to stay
+# inside PROJECTX_TRADE_STREAM_MAX_LAG_SECONDS (30s by default).
+_WATERMARK_HEARTBEAT = timedelta(seconds=10)
+
+
+class StreamingTradeIngestor:
+    """Queue streamed trades for one account and write them on ``flush``.
+
+    ``ingest`` only queues, so it is safe to call from the hub's event loop;
+    ``flush`` does the database and REST work and belongs on a worker thread.
+    """
+
+    def __init__(
+        self,
+        *,
+        session_factory: Callable[[], Session],
+        client_factory: Callable[[], ProjectXClient],
+        user_id: str,
+        account_id: int,
+        batch_size: int | None = None,
+        flush_interval_seconds: float | None = None,
+        reconcile_retry_seconds: float | None = None,
+        now: Callable[[], datetime] | None = None,
+    ) -> None:
+        self.user_id = user_id
+        self.account_id = int(account_id)
+        self.batch_size = max(
+            1,
+            int(_float_setting(batch_size, env_name="PROJECTX_TRADE_STREAM_BATCH_SIZE", default=_DEFAULT_BATCH_SIZE)),
+        )
+        self.flush_interval_seconds = max(
+            0.1,
+            _float_setting(
+                flush_interval_seconds,
+                env_name="PROJECTX_TRADE_STREAM_FLUSH_SECONDS",
+                default=_DEFAULT_FLUSH_INTERVAL_SECONDS,
+            ),
+        )
+        self._reconcile_retry = timedelta(
+            seconds=max(
+                0.0,
+                _float_setting(
+                    reconcile_retry_seconds,
+                    env_name="PROJECTX_TRADE_STREAM_RECONCILE_RETRY_SECONDS",
+                    default=_DEFAULT_RECONCILE_RETRY_SECONDS,
+                ),
+            )
+        )
+        self._session_factory = session_factory
+        self._client_factory = client_factory
+        self._now = now or _utc_now
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending: list[dict[str, Any]] = []
+        self._stream_since: datetime | None = None
+        self._open_day: date | None = None
+        self._days_to_close: set[date] = set()
+        self._next_reconcile_at: datetime | None = None
+        self._watermark_at: datetime | None = None
+
+    @property
+    def is_live(self) -> bool:
+        with self._lock:
+            return self._stream_since is not None
+
+    def ingest(self, payload: Mapping[str, Any]) -> bool:
+        """Queue one hub trade; ``False`` when it is not a trade for this account."""
+
+        row = payload.get("data") if isinstance(payload.get("data"), Mapping) else payload
+        event = normalize_projectx_trade_row(dict(row), account_id=self.account_id)
+        if event is None or int(event["account_id"]) != self.account_id:
+            return False
+        with self._lock:
+            self._pending.append(event)
+        return True
+
+    def mark_connected(self) -> None:
+        """Start a new gap-free stretch; earlier coverage may have missed trades.
+
+        A pending reconcile backoff is kept, so a flapping hub does not turn
+        every reconnect into a REST gap reconciliation.
+        """
+
+        with self._lock:
+            was_live = self._stream_since is not None
+            self._stream_since = self._now()
+            self._watermark_at = None
+        if not was_live:
+            set_trade_stream_live(self.user_id, self.account_id, True)
+
+    def mark_disconnected(self) -> None:
+        with self._lock:
+            was_live = self._stream_since is not None
+            self._stream_since = None
+        if was_live:
+            set_trade_stream_live(self.user_id, self.account_id, False)
+
+    def flush(self) -> int:
+        """Store queued trades, then advance or reconcile the day watermarks.
+
+        Returns the number of trades written. Failures are logged and the
+        trades are queued again for the next flush.
+        """
+
+        with self._flush_lock:
+            now = self._now()
+            with self._lock:
+                events, self._pending = self._pending, []
+                stream_since = self._stream_since
+            today = trading_day_date(now)
+            if self._open_day is not None and self._open_day != today:
+                self._days_to_close.add(self._open_day)
+            self._open_day = today
+            watermark_due = stream_since is not None and (
+                bool(events)
+                or self._watermark_at is None
+                or now - self._watermark_at >= _WATERMARK_HEARTBEAT
+            )
+            if not events and not self._days_to_close and not watermark_due:
+                return 0
+
+            with self._session_factory() as db:
+                stored = self._store(db, events)
+                for trade_day in sorted(self._days_to_close):
+                    if self._reconcile_deferred(now):
+                        break
+                    if not self._reconcile(db, trade_day, now=now, allow_complete=True):
+                        break
+                    self._days_to_close.discard(trade_day)
+                # Trades that failed to store are still queued, so the stream
+                # does not cover up to ``now`` yet.
+                if watermark_due and stored == len(events):
+                    self._advance_or_reconcile(db, today, stream_since=stream_since, now=now)
+            return stored
+
+    def _store(self, db: Session, events: list[dict[str, Any]]) -> int:
+        stored = 0
+        for offset in range(0, len(events), self.batch_size):
+            batch = events[offset : offset + self.batch_size]
+            try:
+                store_trade_events(db, batch, user_id=self.user_id)
+                db.commit()
+            except Exception as exc:
+                db.rollback()
+                with self._lock:
+                    self._pending[:0] = events[offset:]
+                logger.error(
+                    "projectx_trade_stream_store_failed",
+                    extra={
+                        "reason_code": "projectx_trade_stream_store_error",
+                        "error_type": type(exc).__name__,
+                        "pending_count": len(events) - offset,
+                    },
+                )
+                break
+            stored += len(batch)
+        return stored
+
+    def _advance_or_reconcile(
+        self,
+        db: Session,
+        trade_day: date,
+        *,
+        stream_since: datetime,
+        now: datetime,
+    ) -> None:
+        try:
+            advanced = advance_trade_day_stream_watermark(
+                db,
+                user_id=self.user_id,
+                account_id=self.account_id,
+                trade_day=trade_day,
+                stream_since=stream_since,
+                watermark=now,
+            )
+            db.commit()
+        except Exception as exc:
+            db.rollback()
+            logger.error(
+                "projectx_trade_stream_watermark_failed",
+                extra={
+                    "reason_code": "projectx_trade_stream_watermark_error",
+                    "error_type": type(exc).__name__,
+                },
+            )
+            return
+        if advanced:
+            self._watermark_at = now
+            return
+        if self._reconcile_deferred(now):
+            return
+        logger.info(
+            "[trades] stream gap; reconciling account=%s day=%s",
+            self.account_id,
+            trade_day.isoformat(),
+        )
+        self._reconcile(db, trade_day, now=now, allow_complete=False)
+
+    def _reconcile_deferred(self, now: datetime) -> bool:
+        return self._next_reconcile_at is not None and now < self._next_reconcile_at
+
+    def _reconcile(self, db: Session, trade_day: date, *, now: datetime, allow_complete: bool) -> bool:
+        """Run one REST reconciliation; after a failure, wait before the next."""
+
+        try:
+            reconcile_trade_day(
+                db,
+                client_factory=self._client_factory,
+                user_id=self.user_id,
+                account_id=self.account_id,
+                trade_day=trade_day,
+                now=now,
+                allow_complete=allow_complete,
+            )
+        except Exception:
+            # ``reconcile_trade_day`` already logged the provider failure.
+            self._next_reconcile_at = now + self._reconcile_retry
+            return False
+        self._next_reconcile_at = None
+        return True
+
+
+def trade_stream_ingest_enabled(account_id: int) -> bool:
+    """Ingest by default only when the user hub subscribes ``account_id`` to trades."""
+
+    raw = os.getenv("PROJECTX_TRADE_STREAM_INGEST")
+    if raw is None or not raw.strip():
+        return user_hub_trade_subscription(account_id) is not None
+    return raw.strip().lower() not in {"0", "false", "no", "off"}
+
+
+def _float_setting(explicit: float | None, *, env_name: str, default: float) -> float:
+    raw: Any = explicit if explicit is not None else os.getenv(env_name, str(default))
+    try:
+        return float(raw)
+    except (TypeError, ValueError):
+        return float(default)
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import asyncio
 from collections import deque
+from collections.abc import Iterator, Sequence
 import logging
 import math
 import os
-from dataclasses import dataclass
+import queue
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
 from typing import Any, Callable
@@ -16,6 +22,12 @@ from sqlalchemy.orm import Session, load_only
 from ..auth import get_authenticated_user_id
 from ..models import ProjectXTradeDaySync, ProjectXTradeEvent
 from .instruments import build_point_value_lookup, load_instrument_specs
+from .projectx_async_client import (
+    AsyncProjectXClient,
+    RequestBudget,
+    TradeHistoryClient,
+    requests_per_minute_setting,
+)
 from .projectx_client import ProjectXClient, ProjectXClientError, projectx_error_reason_code
 from .projectx_metrics import TradeMetricSample, compute_daily_pnl_calendar, compute_point_payoff_by_basis, compute_trade_summary
 from .trade_event_ranges import trade_event_range_filters
@@ -29,6 +41,9 @@ _DEFAULT_SYNC_CHUNK_DAYS = 90
 _DEFAULT_DAY_SYNC_LIMIT = 1000
 _DEFAULT_YESTERDAY_REFRESH_MINUTES = 180
 _DEFAULT_RECENT_REFRESH_DAYS = 10
+_DEFAULT_BACKFILL_CONCURRENCY = 4
+_DEFAULT_USER_PROVIDER_CONCURRENCY = 4
+_DEFAULT_TRADE_STREAM_MAX_LAG_SECONDS = 30
 _INCREMENTAL_OVERLAP = timedelta(minutes=5)
 _MAX_DAY_SYNC_PAGES = 200
 _MAX_LIFECYCLE_CONTEXT_ROWS = 25000
@@ -50,6 +65,14 @@ class _DayFetchResult:
     truncation_count: int
 
 
+@dataclass(frozen=True)
+class AccountTradeRefreshResult:
+    account_id: int
+    fetched_count: int = 0
+    inserted_count: int = 0
+    error: Exception | None = None
+
+
 @dataclass(frozen=True)
 class TradeExecutionLifecycle:
     entry_timestamp: datetime | None
@@ -110,7 +133,7 @@ def ensure_trade_cache_for_request(
 
 def refresh_account_trades(
     db: Session,
-    client: ProjectXClient,
+    client: TradeHistoryClient,
     account_id: int,
     *,
     user_id: str | None = None,
@@ -139,34 +162,28 @@ def refresh_account_trades(
 
     fetched_count = 0
     inserted_count = 0
+    chunks = _plan_backfill_chunks(windows, chunk_days=chunk_days)
     try:
-        for window_start, window_end in windows:
-            for chunk_start, chunk_end in _iter_time_chunks(
-                window_start,
-                window_end,
-                chunk_days=chunk_days,
-            ):
-                fetch_result = _fetch_trade_day_all_pages(
-                    client,
-                    account_id=account_id,
-                    start=chunk_start,
-                    end=chunk_end,
-                    limit=_read_int_env("PROJECTX_DAY_SYNC_LIMIT", _DEFAULT_DAY_SYNC_LIMIT),
+        for (chunk_start, chunk_end), fetch_result in _fetch_trade_chunks(
+            _limit_user_provider_calls(client, resolved_user_id),
+            account_id=account_id,
+            chunks=chunks,
+            limit=_read_int_env("PROJECTX_DAY_SYNC_LIMIT", _DEFAULT_DAY_SYNC_LIMIT),
+        ):
+            events = fetch_result.events
+            fetched_count += len(events)
+            try:
+                inserted_count += store_trade_events(db, events, user_id=resolved_user_id)
+                db.commit()
+            except IntegrityError:
+                db.rollback()
+                logger.warning(
+                    "[trades] duplicate event ingest skipped account=%s start=%s end=%s",
+                    account_id,
+                    chunk_start.isoformat(),
+                    chunk_end.isoformat(),
                 )
-                events = fetch_result.events
-                fetched_count += len(events)
-                try:
-                    inserted_count += store_trade_events(db, events, user_id=resolved_user_id)
-                    db.commit()
-                except IntegrityError:
-                    db.rollback()
-                    logger.warning(
-                        "[trades] duplicate event ingest skipped account=%s start=%s end=%s",
-                        account_id,
-                        chunk_start.isoformat(),
-                        chunk_end.isoformat(),
-                    )
-                    continue
+                continue
     except Exception:
         db.rollback()
         raise
@@ -177,6 +194,152 @@ def refresh_account_trades(
     }
 
 
+def refresh_accounts_trades(
+    session_factory: Callable[[], Session],
+    client: ProjectXClient,
+    account_ids: Sequence[int],
+    *,
+    user_id: str,
+    start: datetime | None = None,
+    end: datetime | None = None,
+) -> list[AccountTradeRefreshResult]:
+    """Refresh several accounts concurrently through one authenticated client.
+
+    Every account runs ``refresh_account_trades`` in its own session from
+    ``session_factory``, so a failed account rolls back only its own rows and
+    is reported in its result instead of raised. Its trade-history calls
+    share the user's ``PROJECTX_USER_PROVIDER_CONCURRENCY`` cap with every
+    other refresh running for ``user_id``. Results follow the order of
+    ``account_ids``.
+    """
+
+    if not account_ids:
+        return []
+    max_concurrency = _user_provider_concurrency()
+    # One limited client for every account keeps the user's slots and request
+    # budget alive between accounts, so a serial run cannot reset the bucket.
+    limited_client = _limit_user_provider_calls(client, user_id)
+    # Log in once before fanning out so every account reuses the cached token.
+    get_access_token = getattr(client, "get_access_token", None)
+    if callable(get_access_token):
+        get_access_token()
+
+    def refresh_one(account_id: int) -> AccountTradeRefreshResult:
+        try:
+            with session_factory() as db:
+                counts = refresh_account_trades(
+                    db,
+                    limited_client,
+                    account_id,
+                    user_id=user_id,
+                    start=start,
+                    end=end,
+                )
+        except Exception as exc:
+            _log_trade_day_sync_failure(exc, phase="bulk_refresh")
+            return AccountTradeRefreshResult(account_id=account_id, error=exc)
+        return AccountTradeRefreshResult(
+            account_id=account_id,
+            fetched_count=counts["fetched_count"],
+            inserted_count=counts["inserted_count"],
+        )
+
+    worker_count = min(max_concurrency, len(account_ids))
+    if worker_count <= 1:
+        return [refresh_one(account_id) for account_id in account_ids]
+    with ThreadPoolExecutor(
+        max_workers=worker_count, thread_name_prefix="projectx-account-refresh"
+    ) as pool:
+        return list(pool.map(refresh_one, account_ids))
+
+
+# Trade-history calls (``Trade/search``) made for one user are capped across
+# the whole process: single-account, calendar, summary and bulk refreshes and
+# their backfill chunks all hold the same slots and draw from the same
+# ``PROJECTX_BACKFILL_REQUESTS_PER_MINUTE`` budget. Account discovery and
+# order calls are not capped, so they never queue behind a backfill. An entry
+# lives only while some refresh for the user holds it, so the maps stay
+# bounded by the users with work in flight; a changed cap applies once that
+# work drains.
+_USER_PROVIDER_SLOTS_LOCK = threading.Lock()
+_USER_PROVIDER_SLOTS: weakref.WeakValueDictionary[str, threading.BoundedSemaphore] = (
+    weakref.WeakValueDictionary()
+)
+_USER_REQUEST_BUDGETS: weakref.WeakValueDictionary[str, RequestBudget] = weakref.WeakValueDictionary()
+
+
+def _user_provider_concurrency() -> int:
+    return max(
+        1,
+        _read_int_env("PROJECTX_USER_PROVIDER_CONCURRENCY", _DEFAULT_USER_PROVIDER_CONCURRENCY),
+    )
+
+
+def _user_provider_slots(user_id: str) -> threading.BoundedSemaphore:
+    with _USER_PROVIDER_SLOTS_LOCK:
+        slots = _USER_PROVIDER_SLOTS.get(user_id)
+        if slots is None:
+            slots = threading.BoundedSemaphore(_user_provider_concurrency())
+            _USER_PROVIDER_SLOTS[user_id] = slots
+        return slots
+
+
+def _user_request_budget(user_id: str) -> RequestBudget:
+    with _USER_PROVIDER_SLOTS_LOCK:
+        budget = _USER_REQUEST_BUDGETS.get(user_id)
+        if budget is None:
+            budget = RequestBudget(
+                per_minute=requests_per_minute_setting(),
+                burst=_user_provider_concurrency(),
+            )
+            _USER_REQUEST_BUDGETS[user_id] = budget
+        return budget
+
+
+def _limit_user_provider_calls(client: TradeHistoryClient, user_id: str) -> TradeHistoryClient:
+    if isinstance(client, _UserProviderLimitedClient):
+        return client
+    return _UserProviderLimitedClient(
+        client,
+        _user_provider_slots(user_id),
+        _user_request_budget(user_id),
+    )
+
+
+class _UserProviderLimitedClient:
+    """Trade history client that holds one of the user's provider slots per call
+    and spends one token of the user's request budget on it."""
+
+    def __init__(
+        self,
+        client: TradeHistoryClient,
+        slots: threading.BoundedSemaphore,
+        budget: RequestBudget,
+    ) -> None:
+        self._client = client
+        self._slots = slots
+        self._budget = budget
+
+    def fetch_trade_history(
+        self,
+        account_id: int,
+        start: datetime,
+        end: datetime | None = None,
+        *,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> list[dict[str, Any]]:
+        with self._slots:
+            self._budget.acquire()
+            return self._client.fetch_trade_history(
+                account_id=account_id,
+                start=start,
+                end=end,
+                limit=limit,
+                offset=offset,
+            )
+
+
 def has_local_trades(db: Session, account_id: int, *, user_id: str | None = None) -> bool:
     resolved_user_id = _resolve_user_id(user_id)
     existing = (
@@ -717,6 +880,16 @@ def _sync_single_trade_day_if_needed(
         logger.info("[trades] current-day cache read account=%s day=%s source=db", account_id, trade_day.isoformat())
         return
 
+    if trade_day == today and _live_trade_stream_covers_window(
+        sync_row,
+        user_id=user_id,
+        account_id=account_id,
+        window_start=window_start,
+        window_end=window_end,
+    ):
+        logger.info("[trades] current-day stream read account=%s day=%s source=db", account_id, trade_day.isoformat())
+        return
+
     if trade_day == today:
         logger.info("[trades] refresh today account=%s day=%s", account_id, trade_day.isoformat())
         try:
@@ -780,6 +953,132 @@ def _sync_single_trade_day_if_needed(
     )
 
 
+_LIVE_TRADE_STREAMS_LOCK = threading.Lock()
+# Connected ingestors per (user, account); one runner disconnecting leaves the
+# account live while another is still streaming it.
+_LIVE_TRADE_STREAMS: dict[tuple[str, int], int] = {}
+
+
+def set_trade_stream_live(user_id: str, account_id: int, live: bool) -> None:
+    """Count a user hub connecting (``live``) or disconnecting for this account."""
+
+    key = (user_id, int(account_id))
+    with _LIVE_TRADE_STREAMS_LOCK:
+        if live:
+            _LIVE_TRADE_STREAMS[key] = _LIVE_TRADE_STREAMS.get(key, 0) + 1
+            return
+        remaining = _LIVE_TRADE_STREAMS.get(key, 0) - 1
+        if remaining > 0:
+            _LIVE_TRADE_STREAMS[key] = remaining
+        else:
+            _LIVE_TRADE_STREAMS.pop(key, None)
+
+
+def trade_stream_is_live(user_id: str, account_id: int) -> bool:
+    with _LIVE_TRADE_STREAMS_LOCK:
+        return (user_id, int(account_id)) in _LIVE_TRADE_STREAMS
+
+
+def advance_trade_day_stream_watermark(
+    db: Session,
+    *,
+    user_id: str,
+    account_id: int,
+    trade_day: date,
+    stream_since: datetime,
+    watermark: datetime,
+) -> bool:
+    """Extend a day's synced window to ``watermark`` using streamed trades.
+
+    This is only sound when the stream has been connected since the day
+    started, or the stored window already reaches ``stream_since``. Returns
+    ``False`` without changing anything on a gap, so the caller can reconcile
+    over REST.
+    """
+
+    sync_row = _get_trade_day_sync(db, user_id=user_id, account_id=account_id, trade_day=trade_day)
+    day_start, day_end = trading_day_bounds_utc(trade_day)
+    stream_start = _as_utc(stream_since)
+    if stream_start > day_start and (
+        sync_row is None
+        or not _sync_row_covers_window(
+            sync_row,
+            window_start=day_start,
+            window_end=min(stream_start, day_end),
+        )
+    ):
+        return False
+
+    window_end = min(_as_utc(watermark), day_end)
+    if sync_row is not None and sync_row.window_end is not None:
+        window_end = max(window_end, _as_utc(sync_row.window_end))
+    row_count = _count_trade_events_for_day(
+        db,
+        user_id=user_id,
+        account_id=account_id,
+        trade_day=trade_day,
+        window_start=day_start,
+        window_end=window_end,
+    )
+    _upsert_trade_day_sync(
+        db,
+        user_id=user_id,
+        account_id=account_id,
+        trade_day=trade_day,
+        window_start=day_start,
+        window_end=window_end,
+        sync_status=sync_row.sync_status if sync_row is not None else _SYNC_STATUS_PARTIAL,
+        last_synced_at=_as_utc(watermark),
+        row_count=row_count,
+    )
+    return True
+
+
+def reconcile_trade_day(
+    db: Session,
+    *,
+    client_factory: Callable[[], ProjectXClient],
+    user_id: str,
+    account_id: int,
+    trade_day: date,
+    now: datetime,
+    allow_complete: bool,
+) -> None:
+    """Re-fetch one trading day from ``Trade/search`` up to ``now``."""
+
+    day_start, day_end = trading_day_bounds_utc(trade_day)
+    _sync_trade_day_from_provider(
+        db,
+        client_factory=client_factory,
+        user_id=user_id,
+        account_id=account_id,
+        trade_day=trade_day,
+        window_start=day_start,
+        window_end=min(_as_utc(now), day_end),
+        allow_complete=allow_complete,
+    )
+
+
+def _live_trade_stream_covers_window(
+    sync_row: ProjectXTradeDaySync | None,
+    *,
+    user_id: str,
+    account_id: int,
+    window_start: datetime,
+    window_end: datetime,
+) -> bool:
+    if sync_row is None or not trade_stream_is_live(user_id, account_id):
+        return False
+    max_lag = timedelta(
+        seconds=_read_int_env("PROJECTX_TRADE_STREAM_MAX_LAG_SECONDS", _DEFAULT_TRADE_STREAM_MAX_LAG_SECONDS)
+    )
+    return _sync_row_covers_window(
+        sync_row,
+        window_start=window_start,
+        window_end=max(window_start, window_end - max_lag),
+    )
+
+
 def _sync_trade_day_from_provider(
     db: Session,
     *,
@@ -799,7 +1098,7 @@ def _sync_trade_day_from_provider(
 
     try:
         fetch_result = _fetch_trade_day_all_pages(
-            client_factory(),
+            _limit_user_provider_calls(client_factory(), user_id),
             account_id=account_id,
             start=fetch_start,
             end=fetch_end,
@@ -878,74 +1177,286 @@ def _log_trade_day_sync_failure(exc: Exception, *, phase: str) -> None:
 
 
 def _fetch_trade_day_all_pages(
-    client: ProjectXClient,
+    client: TradeHistoryClient,
     *,
     account_id: int,
     start: datetime,
     end: datetime,
     limit: int,
 ) -> _DayFetchResult:
-    page_limit = max(1, int(limit))
-    offset = 0
-    page_count = 0
-    events: list[dict[str, Any]] = []
-    seen_signatures: set[tuple[str, ...]] = set()
-
+    pager = _TradeWindowPager(account_id=account_id, start=start, limit=limit)
     while True:
         page_rows = client.fetch_trade_history(
             account_id=account_id,
             start=start,
             end=end,
-            limit=page_limit,
-            offset=offset,
+            limit=pager.page_limit,
+            offset=pager.offset,
+        )
+        result = pager.accept(page_rows)
+        if result is not None:
+            return result
+
+
+async def _fetch_trade_day_all_pages_async(
+    client: AsyncProjectXClient,
+    *,
+    account_id: int,
+    start: datetime,
+    end: datetime,
+    limit: int,
+) -> _DayFetchResult:
+    pager = _TradeWindowPager(account_id=account_id, start=start, limit=limit)
+    while True:
+        page_rows = await client.fetch_trade_history(
+            account_id=account_id,
+            start=start,
+            end=end,
+            limit=pager.page_limit,
+            offset=pager.offset,
         )
-        page_count += 1
+        result = pager.accept(page_rows)
+        if result is not None:
+            return result
+
+
+@dataclass
+class _TradeWindowPager:
+    """Offset paging state for one trade window; pages must be fed in order."""
+
+    account_id: int
+    start: datetime
+    limit: int
+    offset: int = 0
+    page_count: int = 0
+    events: list[dict[str, Any]] = field(default_factory=list)
+    seen_signatures: set[tuple[str, ...]] = field(default_factory=set)
+
+    @property
+    def page_limit(self) -> int:
+        return max(1, int(self.limit))
+
+    def accept(self, page_rows: list[dict[str, Any]]) -> _DayFetchResult | None:
+        """Record one page; returns the window's result once paging is done."""
+
+        page_limit = self.page_limit
+        self.page_count += 1
         page_size = len(page_rows)
         signature = _trade_page_signature(page_rows)
 
-        if page_size == page_limit and offset > 0 and signature is not None and signature in seen_signatures:
-            logger.warning(
-                "[trades] warning truncation account=%s day=%s count=%s limit=%s, not marking complete",
-                account_id,
-                _as_utc(start).date().isoformat(),
-                page_size,
-                page_limit,
-            )
-            deduped = _dedupe_trade_events(events)
-            return _DayFetchResult(
-                events=deduped,
-                page_count=page_count,
-                is_truncated=True,
-                truncation_count=page_size,
-            )
+        if (
+            page_size == page_limit
+            and self.offset > 0
+            and signature is not None
+            and signature in self.seen_signatures
+        ):
+            return self._truncated(page_size)
 
         if signature is not None:
-            seen_signatures.add(signature)
+            self.seen_signatures.add(signature)
 
-        events.extend(page_rows)
+        self.events.extend(page_rows)
 
         if page_size < page_limit:
-            break
-
-        offset += page_limit
-        if page_count >= _MAX_DAY_SYNC_PAGES:
-            logger.warning(
-                "[trades] warning truncation account=%s day=%s count=%s limit=%s, not marking complete",
-                account_id,
-                _as_utc(start).date().isoformat(),
-                page_size,
-                page_limit,
-            )
-            deduped = _dedupe_trade_events(events)
             return _DayFetchResult(
-                events=deduped,
-                page_count=page_count,
-                is_truncated=True,
-                truncation_count=page_size,
+                events=_dedupe_trade_events(self.events),
+                page_count=self.page_count,
+                is_truncated=False,
+                truncation_count=0,
             )
 
-    deduped = _dedupe_trade_events(events)
-    return _DayFetchResult(events=deduped, page_count=page_count, is_truncated=False, truncation_count=0)
+        self.offset += page_limit
+        if self.page_count >= _MAX_DAY_SYNC_PAGES:
+            return self._truncated(page_size)
+        return None
+
+    def _truncated(self, page_size: int) -> _DayFetchResult:
+        logger.warning(
+            "[trades] warning truncation account=%s day=%s count=%s limit=%s, not marking complete",
+            self.account_id,
+            _as_utc(self.start).date().isoformat(),
+            page_size,
+            self.page_limit,
+        )
+        return _DayFetchResult(
+            events=_dedupe_trade_events(self.events),
+            page_count=self.page_count,
+            is_truncated=True,
+            truncation_count=page_size,
+        )
+
+
+def _plan_backfill_chunks(
+    windows: Sequence[tuple[datetime, datetime]],
+    *,
+    chunk_days: int,
+) -> list[tuple[datetime, datetime]]:
+    """Every fetch chunk of ``windows`` in the order it must be committed."""
+
+    return [
+        chunk
+        for window_start, window_end in windows
+        for chunk in _iter_time_chunks(window_start, window_end, chunk_days=chunk_days)
+    ]
+
+
+def _fetch_trade_chunks(
+    client: TradeHistoryClient,
+    *,
+    account_id: int,
+    chunks: Sequence[tuple[datetime, datetime]],
+    limit: int,
+) -> Iterator[tuple[tuple[datetime, datetime], _DayFetchResult]]:
+    """Yield each chunk's fetch result in chunk order.
+
+    With more than one chunk, a window of up to ``PROJECTX_BACKFILL_CONCURRENCY``
+    chunks is fetched or held ahead of the consumer, so it can commit chunk
+    ``n`` while later chunks are still in flight. The next chunk starts only
+    once the consumer has taken a result. Pages within one chunk stay
+    sequential.
+    """
+
+    concurrency = _read_int_env("PROJECTX_BACKFILL_CONCURRENCY", _DEFAULT_BACKFILL_CONCURRENCY)
+    if concurrency <= 1 or len(chunks) <= 1:
+        for chunk_start, chunk_end in chunks:
+            yield (chunk_start, chunk_end), _fetch_trade_day_all_pages(
+                client,
+                account_id=account_id,
+                start=chunk_start,
+                end=chunk_end,
+                limit=limit,
+            )
+        return
+    yield from _ConcurrentChunkFetch(
+        client,
+        account_id=account_id,
+        chunks=list(chunks),
+        limit=limit,
+        max_concurrency=concurrency,
+    )
+
+
+_CHUNK_FETCH_DONE = object()
+
+
+class _ConcurrentChunkFetch:
+    """Fetch chunks on a private event loop and hand results back in order.
+
+    The loop runs on its own thread so synchronous callers (request handlers,
+    which own the DB session) only ever consume finished results. A chunk
+    holds one of ``max_concurrency`` slots from the moment its fetch starts
+    until the consumer takes its result, which bounds both the requests in
+    flight and the results held in memory. Closing the iterator early, or a
+    failed chunk, cancels every chunk still pending.
+    """
+
+    def __init__(
+        self,
+        client: TradeHistoryClient,
+        *,
+        account_id: int,
+        chunks: list[tuple[datetime, datetime]],
+        limit: int,
+        max_concurrency: int,
+    ) -> None:
+        self._client = client
+        self._account_id = account_id
+        self._chunks = chunks
+        self._limit = limit
+        self._max_concurrency = max_concurrency
+        # Never more than ``max_concurrency`` results plus a terminal item:
+        # a slot is only released after its result has been taken.
+        self._results: queue.Queue[Any] = queue.Queue()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._main: asyncio.Task[None] | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._started = threading.Event()
+
+    def __iter__(self) -> Iterator[tuple[tuple[datetime, datetime], _DayFetchResult]]:
+        thread = threading.Thread(target=self._run, name="projectx-trade-backfill", daemon=True)
+        thread.start()
+        try:
+            for _chunk in self._chunks:
+                item = self._results.get()
+                if item is _CHUNK_FETCH_DONE:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                self._release_slot()
+                yield item
+        finally:
+            self._started.wait()
+            if self._loop is not None and self._main is not None:
+                try:
+                    self._loop.call_soon_threadsafe(self._main.cancel)
+                except RuntimeError:
+                    pass  # The loop already finished every chunk.
+            thread.join()
+
+    def _release_slot(self) -> None:
+        if self._loop is None or self._slots is None:
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._slots.release)
+        except RuntimeError:
+            pass  # The loop already finished every chunk.
+
+    def _run(self) -> None:
+        try:
+            asyncio.run(self._produce())
+        except BaseException as exc:
+            self._results.put(exc)
+        finally:
+            self._started.set()
+            self._results.put(_CHUNK_FETCH_DONE)
+
+    async def _produce(self) -> None:
+        slots = self._slots = asyncio.Semaphore(self._max_concurrency)
+        self._loop = asyncio.get_running_loop()
+        self._main = asyncio.current_task()
+        self._started.set()
+        async_client = AsyncProjectXClient(
+            self._client,
+            max_concurrency=self._max_concurrency,
+            # A user-limited client already paces every call on the user's
+            # budget; a second bucket here would only count them twice.
+            pace_requests=not isinstance(self._client, _UserProviderLimitedClient),
+        )
+        started: asyncio.Queue[tuple[tuple[datetime, datetime], asyncio.Task[_DayFetchResult]]] = (
+            asyncio.Queue()
+        )
+        tasks: list[asyncio.Task[_DayFetchResult]] = []
+
+        async def start_chunks() -> None:
+            for chunk_start, chunk_end in self._chunks:
+                await slots.acquire()
+                task = asyncio.create_task(
+                    _fetch_trade_day_all_pages_async(
+                        async_client,
+                        account_id=self._account_id,
+                        start=chunk_start,
+                        end=chunk_end,
+                        limit=self._limit,
+                    )
+                )
+                tasks.append(task)
+                started.put_nowait(((chunk_start, chunk_end), task))
+
+        starter = asyncio.create_task(start_chunks())
+        try:
+            for _chunk in self._chunks:
+                chunk, task = await started.get()
+                try:
+                    result = await task
+                except Exception as exc:
+                    self._results.put(exc)
+                    return
+                self._results.put((chunk, result))
+        finally:
+            starter.cancel()
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(starter, *tasks, return_exceptions=True)
 
 
 def _trade_page_signature(events: list[dict[str, Any]]) -> tuple[str, ...] | None:
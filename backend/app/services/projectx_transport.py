@@ -0,0 +1,295 @@
+"""HTTP transports behind ``ProjectXClient``.
+
+``urllib.request.urlopen`` opens a new TCP + TLS connection for every call, and
+a trade backfill issues hundreds of sequential ``Trade/search`` pages. The
+default transport keeps HTTP/1.1 connections alive in a small per-host pool that
+every client in the process shares, so consecutive requests to the gateway
+reuse one handshake. Idle connections are evicted before the gateway's own
+keep-alive timeout would close them underneath a request.
+
+Transports only move bytes: they return a ``TransportResponse`` for any HTTP
+status, raise ``TimeoutError`` when a request times out and ``OSError`` for
+every other network failure. Mapping those onto ``ProjectXClientError`` stays in
+the client.
+"""
+
+from __future__ import annotations
+
+import http.client
+import os
+import ssl
+import threading
+import time
+from collections import deque
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Protocol
+from urllib import parse, request
+
+
+_DEFAULT_POOL_SIZE = 8
+_DEFAULT_IDLE_SECONDS = 30.0
+# A reused connection the gateway already closed fails on first use; these are
+# the errors that mean "stale socket" rather than "the gateway is down".
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    BrokenPipeError,
+    ConnectionResetError,
+    ConnectionAbortedError,
+)
+
+
+@dataclass(frozen=True)
+class TransportResponse:
+    status: int
+    reason: str
+    body: bytes
+
+
+class ProjectXTransport(Protocol):
+    def send(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Mapping[str, str],
+        body: bytes | None,
+        timeout: float,
+        idempotent: bool = True,
+    ) -> TransportResponse:
+        """Send one request and return the complete response.
+
+        ``idempotent=False`` marks a request the gateway may already have acted
+        on if it fails midway, such as an order submission. It is never sent
+        over a reused connection, which may have gone stale, and it is never
+        replayed.
+        """
+
+
+@dataclass
+class _IdleConnection:
+    connection: http.client.HTTPConnection
+    idle_since: float
+
+
+@dataclass
+class _HostPool:
+    idle: deque[_IdleConnection] = field(default_factory=deque)
+    opened: int = 0
+    reused: int = 0
+
+
+class PooledHTTPTransport:
+    """Keep-alive transport with a bounded idle pool per scheme, host and port.
+
+    At most ``pool_size`` idle connections are kept per host; concurrent
+    requests beyond that open extra connections that are closed after use
+    instead of waiting. Connections idle for ``idle_seconds`` are closed the
+    next time the pool is touched.
+    """
+
+    def __init__(
+        self,
+        *,
+        pool_size: int | None = None,
+        idle_seconds: float | None = None,
+        ssl_context: ssl.SSLContext | None = None,
+    ) -> None:
+        self.pool_size = max(
+            0,
+            _int_setting(pool_size, env_name="PROJECTX_HTTP_POOL_SIZE", default=_DEFAULT_POOL_SIZE),
+        )
+        self.idle_seconds = max(
+            0.0,
+            _float_setting(
+                idle_seconds, env_name="PROJECTX_HTTP_IDLE_SECONDS", default=_DEFAULT_IDLE_SECONDS
+            ),
+        )
+        self._ssl_context = ssl_context
+        self._lock = threading.Lock()
+        self._pools: dict[tuple[str, str, int], _HostPool] = {}
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Mapping[str, str],
+        body: bytes | None,
+        timeout: float,
+        idempotent: bool = True,
+    ) -> TransportResponse:
+        parts = parse.urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in {"http", "https"} or not parts.hostname:
+            raise OSError(f"unsupported ProjectX URL: {url}")
+        port = parts.port or (443 if scheme == "https" else 80)
+        key = (scheme, parts.hostname.lower(), port)
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+
+        # A pooled socket may have been closed by the gateway while idle; only
+        # requests that can be replayed are allowed to find that out.
+        connection, reused = self._checkout(key, timeout=timeout, fresh=not idempotent)
+        try:
+            response = self._exchange(connection, method, target, headers, body)
+        except _STALE_CONNECTION_ERRORS:
+            connection.close()
+            if not (reused and idempotent):
+                raise
+            connection, _reused = self._checkout(key, timeout=timeout, fresh=True)
+            try:
+                response = self._exchange(connection, method, target, headers, body)
+            except BaseException:
+                connection.close()
+                raise
+        except BaseException:
+            connection.close()
+            raise
+        status, reason, payload, reusable = response
+        if reusable:
+            self._checkin(key, connection)
+        else:
+            connection.close()
+        return TransportResponse(status=status, reason=reason, body=payload)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hosts": len(self._pools),
+                "idle_connections": sum(len(pool.idle) for pool in self._pools.values()),
+                "opened_connections": sum(pool.opened for pool in self._pools.values()),
+                "reused_connections": sum(pool.reused for pool in self._pools.values()),
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            idle = [
+                entry.connection for pool in self._pools.values() for entry in pool.idle
+            ]
+            self._pools.clear()
+        for connection in idle:
+            connection.close()
+
+    def _exchange(
+        self,
+        connection: http.client.HTTPConnection,
+        method: str,
+        target: str,
+        headers: Mapping[str, str],
+        body: bytes | None,
+    ) -> tuple[int, str, bytes, bool]:
+        try:
+            connection.request(method.upper(), target, body=body, headers=dict(headers))
+            response = connection.getresponse()
+            payload = response.read()
+        except http.client.HTTPException as exc:
+            if isinstance(exc, _STALE_CONNECTION_ERRORS):
+                raise
+            raise OSError(f"invalid HTTP response: {exc!r}") from exc
+        return int(response.status), str(response.reason or ""), payload, not response.will_close
+
+    def _checkout(
+        self,
+        key: tuple[str, str, int],
+        *,
+        timeout: float,
+        fresh: bool = False,
+    ) -> tuple[http.client.HTTPConnection, bool]:
+        expired: list[http.client.HTTPConnection] = []
+        connection: http.client.HTTPConnection | None = None
+        now = time.monotonic()
+        with self._lock:
+            pool = self._pools.setdefault(key, _HostPool())
+            live: deque[_IdleConnection] = deque()
+            for entry in pool.idle:
+                if now - entry.idle_since < self.idle_seconds:
+                    live.append(entry)
+                else:
+                    expired.append(entry.connection)
+            pool.idle = live
+            if live and not fresh:
+                connection = live.pop().connection
+                pool.reused += 1
+            else:
+                pool.opened += 1
+        for stale in expired:
+            stale.close()
+        if connection is not None:
+            connection.timeout = timeout
+            if connection.sock is not None:
+                connection.sock.settimeout(timeout)
+            return connection, True
+        return self._connect(key, timeout=timeout), False
+
+    def _checkin(self, key: tuple[str, str, int], connection: http.client.HTTPConnection) -> None:
+        with self._lock:
+            pool = self._pools.setdefault(key, _HostPool())
+            if len(pool.idle) < self.pool_size:
+                pool.idle.append(_IdleConnection(connection=connection, idle_since=time.monotonic()))
+                return
+        connection.close()
+
+    def _connect(self, key: tuple[str, str, int], *, timeout: float) -> http.client.HTTPConnection:
+        scheme, host, port = key
+        proxy = _proxy_for(scheme, host)
+        if scheme == "https":
+            if self._ssl_context is None:
+                self._ssl_context = ssl.create_default_context()
+            if proxy is not None:
+                connection = http.client.HTTPSConnection(
+                    proxy[0], proxy[1], timeout=timeout, context=self._ssl_context
+                )
+                connection.set_tunnel(host, port)
+                return connection
+            return http.client.HTTPSConnection(
+                host, port, timeout=timeout, context=self._ssl_context
+            )
+        if proxy is not None:
+            connection = http.client.HTTPConnection(proxy[0], proxy[1], timeout=timeout)
+            connection.set_tunnel(host, port)
+            return connection
+        return http.client.HTTPConnection(host, port, timeout=timeout)
+
+
+def _proxy_for(scheme: str, host: str) -> tuple[str, int] | None:
+    """The ``HTTP(S)_PROXY`` endpoint ``urlopen`` would have used, if any."""
+
+    proxy_url = request.getproxies().get(scheme)
+    if not proxy_url or request.proxy_bypass(host):
+        return None
+    parts = parse.urlsplit(proxy_url if "://" in proxy_url else f"http://{proxy_url}")
+    if not parts.hostname:
+        return None
+    return parts.hostname, parts.port or 80
+
+
+def _int_setting(explicit: int | None, *, env_name: str, default: int) -> int:
+    raw = explicit if explicit is not None else os.getenv(env_name, str(default))
+    try:
+        return int(raw)
+    except (TypeError, ValueError):
+        return int(default)
+
+
+def _float_setting(explicit: float | None, *, env_name: str, default: float) -> float:
+    raw = explicit if explicit is not None else os.getenv(env_name, str(default))
+    try:
+        return float(raw)
+    except (TypeError, ValueError):
+        return float(default)
+
+
+_DEFAULT_TRANSPORT_LOCK = threading.Lock()
+_DEFAULT_TRANSPORT: PooledHTTPTransport | None = None
+
+
+def get_default_projectx_transport() -> PooledHTTPTransport:
+    """The process-wide pool shared by every ``ProjectXClient``."""
+
+    global _DEFAULT_TRANSPORT
+    with _DEFAULT_TRANSPORT_LOCK:
+        if _DEFAULT_TRANSPORT is None:
+            _DEFAULT_TRANSPORT = PooledHTTPTransport()
+        return _DEFAULT_TRANSPORT
@@ -6,6 +6,7 @@ from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
 from typing import Any, Callable
 
+import pyarrow as pa
 import pytest
 from fastapi import HTTPException
 from sqlalchemy import create_engine
@@ -15,9 +16,10 @@ from sqlalchemy.pool import StaticPool
 os.environ.setdefault("DATABASE_URL", "sqlite+pysqlite:///:memory:")
 
 import app.main as main_module
+import app.services.bot_backtest_sweeps as sweeps_module
 import app.services.bot_backtesting as backtesting_module
 import app.services.bot_service as bot_service_module
-from app.bot_schemas import BotBacktestIn, BotBacktestOut
+from app.bot_schemas import BotBacktestIn, BotBacktestOut, BotBacktestSweepIn
 from app.db import Base
 from app.models import (
     BotBacktest,
@@ -25,6 +27,11 @@ from app.models import (
     InstrumentMetadata,
     ProjectXMarketCandle,
 )
+from app.services.bot_backtest_columns import (
+    decode_result_columns,
+    downsample_records,
+    encode_result_columns,
+)
 from app.services.bot_backtesting import (
     InsufficientBacktestDataError,
     MalformedBacktestDataError,
@@ -32,6 +39,7 @@ from app.services.bot_backtesting import (
     run_backtest,
 )
 from app.services.bot_service import SignalResult
+from app.services.bot_strategy_registry import STRATEGY_REGISTRY
 from app.services.projectx_client import ProjectXClient
 
 
@@ -357,6 +365,93 @@ def test_streamed_backtest_emits_progress_then_result_after_commit(monkeypatch):
     assert body.index('"phase":"complete"') < body.index('"id":99')
 
 
+def test_streamed_backtest_sweep_emits_each_combination_before_result(monkeypatch):
+    class FakeRequest:
+        async def is_disconnected(self) -> bool:
+            return False
+
+    class FakeSession:
+        committed = False
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *_args):
+            return None
+
+        def commit(self):
+            self.committed = True
+
+        def rollback(self):
+            raise AssertionError("successful sweep must not roll back")
+
+    session = FakeSession()
+    monkeypatch.setattr(main_module, "SessionLocal", lambda: session)
+
+    def fake_sweep(*_args, progress_callback, combination_callback, **_kwargs):
+        for index in range(2):
+            combination_callback({"index": index, "rank": None})
+            progress_callback({"phase": "sweeping", "completed": index + 1, "total": 2})
+        return SimpleNamespace(id=7)
+
+    monkeypatch.setattr(main_module, "create_bot_backtest_sweep", fake_sweep)
+    monkeypatch.setattr(
+        main_module,
+        "serialize_bot_backtest_sweep",
+        lambda _row: {"id": 7, "results": []},
+    )
+    response = main_module._stream_trading_bot_backtest_sweep(
+        FakeRequest(),
+        user_id=OWNER_ID,
+        bot_config_id=101,
+        payload=BotBacktestSweepIn(fast_periods=[1], slow_periods=[2, 3]),
+    )
+
+    async def collect() -> str:
+        chunks: list[str] = []
+        async for chunk in response.body_iterator:
+            chunks.append(chunk.decode() if isinstance(chunk, bytes) else chunk)
+        return "".join(chunks)
+
+    body = asyncio.run(collect())
+
+    assert session.committed is True
+    assert body.count("event: combination") == 2
+    assert body.index('"index":1') < body.index("event: result")
+    assert main_module._backtest_active_by_user.get(OWNER_ID) is None
+
+
+def test_queued_job_capacity_is_not_superseded_by_interactive_runs(monkeypatch):
+    monkeypatch.setenv("BACKTEST_MAX_CONCURRENT_GLOBAL", "2")
+    job_lease = main_module._try_acquire_backtest_job_capacity(OWNER_ID)
+    assert job_lease is not None
+    try:
+        assert main_module._try_acquire_backtest_job_capacity(OWNER_ID) is None
+        with pytest.raises(main_module.HTTPException) as exhausted:
+            main_module._acquire_backtest_capacity(OWNER_ID)
+        assert exhausted.value.status_code == 429
+        assert job_lease.is_cancelled() is False
+    finally:
+        job_lease.release()
+    interactive = main_module._acquire_backtest_capacity(OWNER_ID)
+    assert main_module._try_acquire_backtest_job_capacity(OWNER_ID) is None
+    interactive.release()
+
+
+def test_backtest_process_pool_is_skipped_for_in_memory_databases(monkeypatch):
+    monkeypatch.setenv("TOPSIGNAL_BACKTEST_EXECUTOR", "process")
+    monkeypatch.setattr(main_module, "DATABASE_URL", "sqlite+pysqlite:///:memory:")
+    assert main_module._backtest_process_pool() is None
+
+    monkeypatch.setattr(main_module, "DATABASE_URL", "postgresql+psycopg://db/topsignal")
+    monkeypatch.setenv("TOPSIGNAL_BACKTEST_EXECUTOR", "thread")
+    assert main_module._backtest_process_pool() is None
+
+    monkeypatch.setenv("TOPSIGNAL_BACKTEST_EXECUTOR", "fork")
+    with pytest.raises(RuntimeError, match="TOPSIGNAL_BACKTEST_EXECUTOR"):
+        main_module._backtest_process_pool()
+
+
 def test_streamed_backtest_does_not_reserve_capacity_before_worker_starts(monkeypatch):
     class FakeRequest:
         async def is_disconnected(self) -> bool:
@@ -408,6 +503,33 @@ def test_backtest_capacity_supersedes_same_user_and_limits_global(monkeypatch):
             final.release()
 
 
+def test_sweep_workers_take_one_capacity_slot_each(monkeypatch):
+    monkeypatch.setenv("BACKTEST_MAX_CONCURRENT_GLOBAL", "3")
+    monkeypatch.setenv("BACKTEST_MAX_CONCURRENT_PER_USER", "1")
+    monkeypatch.setattr(sweeps_module, "BACKTEST_SWEEP_MAX_WORKERS", 16)
+    other = main_module._acquire_backtest_capacity(OTHER_USER_ID)
+    sweep = main_module._acquire_backtest_capacity(OWNER_ID)
+    late = None
+    try:
+        # Only one of the host's three slots is still free for extra workers.
+        assert sweeps_module._sweep_worker_count(None, 40, sweep.reserve_workers) == 2
+        assert sweeps_module._sweep_worker_count(None, 1, sweep.reserve_workers) == 1
+        with pytest.raises(HTTPException) as exhausted:
+            main_module._acquire_backtest_capacity("33333333-3333-3333-3333-333333333333")
+        assert exhausted.value.status_code == 429
+
+        sweep.release()
+        assert main_module._backtest_active_total == 1
+        assert sweep.reserve_workers(8) == 1
+        late = main_module._acquire_backtest_capacity("33333333-3333-3333-3333-333333333333")
+    finally:
+        other.release()
+        sweep.release()
+        if late is not None:
+            late.release()
+    assert main_module._backtest_active_total == 0
+
+
 def test_backtest_cooperatively_stops_when_superseded():
     bars = [
         _candle(BASE_TIME + timedelta(minutes=5 * index), close_price=100 + index)
@@ -803,6 +925,35 @@ def test_repeated_runs_are_byte_for_byte_deterministic():
     assert first == second
 
 
+def test_sampled_equity_series_keeps_every_bar_in_drawdown_and_restates_forced_close(
+    monkeypatch,
+):
+    monkeypatch.setattr(backtesting_module, "BACKTEST_MAX_SERIES_POINTS", 6)
+    closes = [100.0] * 40
+    closes[17] = 90.0
+    closes[-1] = 105.0
+    bars = [
+        _candle(BASE_TIME + timedelta(minutes=5 * index), close_price=close)
+        for index, close in enumerate(closes)
+    ]
+    evaluator = _scripted_evaluator({BASE_TIME: {"action": "BUY", "price": 100}})
+
+    result = _run(bars, evaluator=evaluator)
+
+    assert len(result["equity_curve"]) == len(result["drawdown_series"]) == 6
+    assert 49_990 not in [point["equity"] for point in result["equity_curve"]]
+    assert result["metrics"]["max_drawdown_dollars"] == 10
+    assert result["metrics"]["max_drawdown_percent"] == 0.02
+    assert result["equity_curve"][-1] == {
+        "timestamp": (BASE_TIME + timedelta(minutes=200)).isoformat(),
+        "equity": 50_005,
+        "realized_pnl": 5,
+        "unrealized_pnl": 0,
+    }
+    assert result["drawdown_series"][-1]["drawdown_dollars"] == 0
+    assert any("deterministically sampled" in warning for warning in result["warnings"])
+
+
 def test_fees_slippage_quantity_and_tick_value_are_applied_to_both_sides():
     bars = [
         _candle(BASE_TIME, close_price=100),
@@ -869,6 +1020,62 @@ def test_long_and_short_reversal_accounting_and_period_breakdowns():
     assert sum(row["net_pnl"] for row in result["monthly_results"]) == 40
 
 
+def test_result_columns_round_trip_engine_results_exactly():
+    bars = [
+        _candle(BASE_TIME, close_price=100),
+        _candle(BASE_TIME + timedelta(minutes=5), open_price=100, close_price=101),
+        _candle(BASE_TIME + timedelta(minutes=10), open_price=102, close_price=101),
+        _candle(BASE_TIME + timedelta(minutes=15), open_price=101, close_price=100),
+    ]
+    evaluator = _scripted_evaluator(
+        {
+            BASE_TIME: {"action": "BUY", "price": 100},
+            BASE_TIME + timedelta(minutes=5): {"action": "SELL", "price": 101},
+        }
+    )
+    result = _run(bars, evaluator=evaluator, tick_size=1, tick_value=10)
+    # A section without one shared key layout and a nullable column must
+    # survive as well as the engine's own homogeneous records.
+    result["daily_results"] = [*result["daily_results"], {"period": "extra"}]
+    result["trades"][0]["mae"] = None
+
+    snapshot, blob = encode_result_columns(result)
+    restored = {**snapshot, **decode_result_columns(blob)}
+
+    assert blob is not None
+    assert "trades" not in snapshot and "equity_curve" not in snapshot
+    assert snapshot["metrics"] == result["metrics"]
+    assert json.dumps(restored, sort_keys=True) == json.dumps(result, sort_keys=True)
+    assert [list(row) for row in restored["trades"]] == [list(row) for row in result["trades"]]
+    assert decode_result_columns(blob, ["trades"]).keys() == {"trades"}
+
+
+def test_downsampled_equity_curve_keeps_endpoints_and_extremes():
+    start = datetime(2024, 1, 2, 14, 30, tzinfo=timezone.utc)
+    equity = [50_000.0 + (index % 37) * 3.5 - index * 0.25 for index in range(1_000)]
+    equity[417] = 49_000.0
+    equity[731] = 51_500.0
+    curve = [
+        {
+            "timestamp": (start + timedelta(minutes=index)).isoformat(),
+            "equity": value,
+            "realized_pnl": 0.0,
+            "unrealized_pnl": value - 50_000.0,
+        }
+        for index, value in enumerate(equity)
+    ]
+
+    _snapshot, blob = encode_result_columns({"equity_curve": curve})
+    sampled = decode_result_columns(blob, max_points=40)["equity_curve"]
+
+    assert len(sampled) <= 40
+    assert sampled[0] == curve[0] and sampled[-1] == curve[-1]
+    assert curve[417] in sampled and curve[731] in sampled
+    assert [row["timestamp"] for row in sampled] == sorted(row["timestamp"] for row in sampled)
+    assert sampled == downsample_records(curve, value_key="equity", max_points=40)
+    assert len(blob) * 4 < len(json.dumps(curve))
+
+
 def test_resting_target_executes_before_a_queued_gap_reversal():
     bars = [
         _candle(BASE_TIME, close_price=100),
@@ -1305,6 +1512,78 @@ def test_topbot_replay_deduplicates_repeated_signal_from_unchanged_slow_stream(m
     assert result["trades"][0]["exit_reason"] == "take_profit"
 
 
+def test_topbot_threshold_rerun_reuses_shared_source_results(monkeypatch):
+    def topbot_config(minimum_score: int) -> BotConfig:
+        return _config(
+            strategy_type="topbot_adaptive",
+            strategy_params={
+                "source_strategies": ["sma_cross"],
+                "minimum_directional_votes": 1,
+                "minimum_score": minimum_score,
+                "minimum_reward_risk": 1.5,
+            },
+            lookback_bars=25,
+        )
+
+    bars = [
+        _candle(
+            BASE_TIME + timedelta(minutes=5 * index),
+            close_price=100 + index % 3,
+            high_price=121 if index == 4 else 103,
+            low_price=98,
+        )
+        for index in range(-25, 10)
+    ]
+    dispatched: list[datetime] = []
+
+    def fake_dispatch(identifier, candles, **_kwargs):
+        assert identifier == "sma_cross"
+        latest = candles[-1]
+        dispatched.append(_utc(latest.candle_timestamp))
+        action = "BUY" if _utc(latest.candle_timestamp) == BASE_TIME else "HOLD"
+        return SignalResult(
+            action=action,
+            reason="scripted source",
+            candle_timestamp=_utc(latest.candle_timestamp),
+            price=float(latest.close_price),
+            raw_payload={"stop_loss": 90.0, "take_profit": 120.0},
+        )
+
+    monkeypatch.setattr(backtesting_module.bot_service_module, "dispatch_strategy_evaluator", fake_dispatch)
+    monkeypatch.setattr(backtesting_module.bot_service_module, "build_bot_market_analysis", lambda **_kwargs: {})
+    monkeypatch.setattr(
+        backtesting_module.bot_service_module,
+        "build_signal_trade_evaluation",
+        lambda **_kwargs: {"total_score": 85},
+    )
+    cache = backtesting_module._TopBotSourceResultCache()
+
+    def replay(minimum_score: int, source_cache) -> dict[str, Any]:
+        return run_backtest(
+            config=topbot_config(minimum_score),
+            candles=bars,
+            start=BASE_TIME,
+            end=BASE_TIME + timedelta(minutes=50),
+            starting_balance=50_000,
+            commission_per_contract=0,
+            slippage_ticks=0,
+            tick_size=1,
+            tick_value=1,
+            topbot_source_cache=source_cache,
+        )
+
+    permissive = replay(70, cache)
+    first_dispatches = len(dispatched)
+    strict = replay(90, cache)
+
+    assert first_dispatches == 10
+    assert len(dispatched) == first_dispatches
+    assert permissive["metrics"]["trade_count"] == 1
+    assert strict["metrics"]["trade_count"] == 0
+    assert strict == replay(90, None)
+    assert len(dispatched) == 2 * first_dispatches
+
+
 def test_topbot_replay_records_missing_auxiliary_stream_as_source_failure():
     config = _config(
         strategy_type="topbot_adaptive",
@@ -2379,6 +2658,105 @@ def test_backtest_route_scopes_bots_and_candles_to_authenticated_user(
     assert db_session.query(BotBacktest).count() == 0
 
 
+def test_saved_backtest_route_expands_only_requested_sections(db_session, monkeypatch):
+    config = _persist_config(db_session, user_id=OWNER_ID)
+    for index in range(6):
+        db_session.add(
+            _candle(
+                BASE_TIME + timedelta(minutes=5 * index),
+                user_id=OWNER_ID,
+                close_price=100 + (index % 3),
+            )
+        )
+    db_session.commit()
+    monkeypatch.setattr(main_module, "get_authenticated_user_id", lambda: OWNER_ID)
+    created = main_module.create_trading_bot_backtest(
+        bot_config_id=config.id,
+        payload=BotBacktestIn(start=BASE_TIME, end=BASE_TIME + timedelta(minutes=30)),
+        db=db_session,
+    )
+    db_session.commit()
+    row = db_session.get(BotBacktest, created["id"])
+
+    assert row.result_columns is not None
+    assert "equity_curve" not in row.result_snapshot
+    full = main_module.get_trading_bot_backtest(
+        bot_config_id=config.id,
+        backtest_id=row.id,
+        include=None,
+        max_points=None,
+        db=db_session,
+    )
+    assert full == created
+    partial = main_module.get_trading_bot_backtest(
+        bot_config_id=config.id,
+        backtest_id=row.id,
+        include="equity_curve",
+        max_points=4,
+        db=db_session,
+    )
+    validated = BotBacktestOut.model_validate(partial)
+    assert validated.trades == []
+    assert validated.omitted_sections == [
+        "drawdown_series",
+        "trades",
+        "daily_results",
+        "monthly_results",
+    ]
+    assert 0 < len(partial["equity_curve"]) <= 4
+    assert partial["equity_curve"][-1] == created["equity_curve"][-1]
+
+    arrow_request = SimpleNamespace(headers={"accept": "application/vnd.apache.arrow.stream"})
+    arrow = main_module.get_trading_bot_backtest(
+        bot_config_id=config.id,
+        backtest_id=row.id,
+        include=None,
+        max_points=4,
+        request=arrow_request,
+        db=db_session,
+    )
+    table = pa.ipc.open_stream(arrow.body).read_all()
+    assert table.schema.metadata[b"section"] == b"equity_curve"
+    assert table.schema.metadata[b"backtest_id"] == str(row.id).encode()
+    assert str(table.schema.field("timestamp").type) == "timestamp[ns, tz=UTC]"
+    assert table.column("equity").to_pylist() == [
+        point["equity"] for point in partial["equity_curve"]
+    ]
+    assert [value.isoformat() for value in table.column("timestamp").to_pylist()] == [
+        point["timestamp"] for point in partial["equity_curve"]
+    ]
+    with pytest.raises(HTTPException) as several:
+        main_module.get_trading_bot_backtest(
+            bot_config_id=config.id,
+            backtest_id=row.id,
+            include="equity_curve,trades",
+            max_points=None,
+            request=arrow_request,
+            db=db_session,
+        )
+    assert several.value.detail == "backtest_arrow_stream_requires_one_section"
+
+    with pytest.raises(HTTPException) as unknown:
+        main_module.get_trading_bot_backtest(
+            bot_config_id=config.id,
+            backtest_id=row.id,
+            include="equity_curve,orders",
+            max_points=None,
+            db=db_session,
+        )
+    assert unknown.value.status_code == 400
+    monkeypatch.setattr(main_module, "get_authenticated_user_id", lambda: OTHER_USER_ID)
+    with pytest.raises(HTTPException) as hidden:
+        main_module.get_trading_bot_backtest(
+            bot_config_id=config.id,
+            backtest_id=row.id,
+            include=None,
+            max_points=None,
+            db=db_session,
+        )
+    assert hidden.value.status_code == 404
+
+
 def test_backtest_input_uses_absent_dates_for_full_history_and_keeps_paired_bounds():
     full_history = BotBacktestIn()
     bounded = BotBacktestIn(
@@ -2789,6 +3167,133 @@ def test_prepared_sma_replay_exactly_matches_legacy_evaluator_path():
     assert optimized == legacy
 
 
+@pytest.mark.parametrize(
+    "strategy_type",
+    [
+        "ema_trend_pullback",
+        "pullback_trap_reversal",
+        "bollinger_mean_reversion",
+        "bollinger_rsi_reversal",
+        "vwap_atr_mean_reversion",
+    ],
+)
+def test_incremental_indicator_replay_exactly_matches_reference_helpers(
+    monkeypatch,
+    strategy_type: str,
+):
+    price = 20_000.0
+    candles = backtesting_module._ClosedCandleList()
+    timestamp = datetime(2026, 7, 5, 22, 0, tzinfo=timezone.utc)
+    for index in range(900):
+        if timestamp.hour == 21:
+            # The CME maintenance hour separates the synthetic trading days.
+            timestamp += timedelta(hours=1)
+        swing = ((index * 7) % 23 - 11) * 0.75 + (4.0 if (index // 40) % 2 else -4.0)
+        close_price = price + swing
+        candles.append(
+            _candle(
+                timestamp,
+                open_price=price,
+                high_price=max(price, close_price) + (index % 5) * 0.25,
+                low_price=min(price, close_price) - (index % 7) * 0.25,
+                close_price=close_price,
+                volume=float(0 if index % 17 == 0 else 50 + (index * 37) % 400),
+            )
+        )
+        price = close_price
+        timestamp += timedelta(minutes=5)
+    config = _config(
+        strategy_type=strategy_type,
+        lookback_bars=60,
+        fast_period=9,
+        slow_period=21,
+    )
+    run_options = {
+        "config": config,
+        "start": _utc(candles[80].candle_timestamp),
+        "tick_size": 0.25,
+        "tick_value": 0.50,
+    }
+
+    evaluator_name = f"evaluate_{strategy_type}"
+    evaluator = getattr(backtesting_module, evaluator_name)
+    signals: list[tuple[str, str, dict[str, Any]]] = []
+
+    def recording_evaluator(*args: Any, **kwargs: Any) -> SignalResult:
+        signal = evaluator(*args, **kwargs)
+        signals.append((signal.action, signal.reason, signal.raw_payload))
+        return signal
+
+    monkeypatch.setattr(backtesting_module, evaluator_name, recording_evaluator)
+    incremental = _run(candles, **run_options)
+    incremental_signals = list(signals)
+    signals.clear()
+    monkeypatch.setattr(backtesting_module, "BACKTEST_INCREMENTAL_INDICATORS", False)
+    reference = _run(candles, **run_options)
+
+    assert len(incremental_signals) == incremental["range"]["bar_count"]
+    assert incremental_signals == signals
+    assert incremental == reference
+
+
+@pytest.mark.parametrize(
+    "strategy_type",
+    sorted(
+        identifier
+        for identifier, definition in STRATEGY_REGISTRY.items()
+        if definition.signal_precompute is not None
+    ),
+)
+def test_signal_precompute_replay_exactly_matches_per_bar_evaluator(
+    monkeypatch,
+    strategy_type: str,
+):
+    definition = STRATEGY_REGISTRY[strategy_type]
+    assert definition.backtesting_supported
+    candles = backtesting_module._ClosedCandleList(
+        _candle(
+            BASE_TIME + timedelta(minutes=5 * index),
+            open_price=100 + ((index * 5) % 17) * 0.25 - 0.25,
+            close_price=100 + ((index * 5) % 17) * 0.25 + (index // 50) * 0.5,
+            volume=float(10 + index % 9),
+        )
+        for index in range(600)
+    )
+    run_options = {
+        "config": _config(
+            strategy_type=strategy_type,
+            fast_period=3,
+            slow_period=7,
+            lookback_bars=12,
+        ),
+        "start": BASE_TIME + timedelta(minutes=60),
+        "commission_per_contract": 0.37,
+        "slippage_ticks": 1,
+        "tick_size": 0.25,
+        "tick_value": 0.50,
+    }
+    evaluator_calls = 0
+    evaluator = getattr(backtesting_module, definition.evaluator.callable_name)
+
+    def counting_evaluator(*args: Any, **kwargs: Any) -> SignalResult:
+        nonlocal evaluator_calls
+        evaluator_calls += 1
+        return evaluator(*args, **kwargs)
+
+    precomputed = _run(candles, **run_options)
+    monkeypatch.setattr(backtesting_module, "BACKTEST_SIGNAL_PRECOMPUTES", False)
+    monkeypatch.setattr(
+        backtesting_module,
+        definition.evaluator.callable_name,
+        counting_evaluator,
+    )
+    reference = _run(candles, **run_options)
+
+    assert evaluator_calls == reference["range"]["bar_count"]
+    assert len(reference["trades"]) > 10
+    assert precomputed == reference
+
+
 def test_incremental_fingerprints_match_legacy_canonical_json_for_unsorted_streams():
     primary = [
         _candle(BASE_TIME + timedelta(minutes=10), close_price=103.25),
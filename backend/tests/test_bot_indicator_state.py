@@ -0,0 +1,129 @@
+import random
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+import app.services.bot_backtesting as backtesting_module
+import app.services.bot_service as bot_service_module
+from app.services.bot_indicator_state import ReplayIndicatorBook
+
+
+BASE_TIME = datetime(2026, 7, 6, 13, 0, tzinfo=timezone.utc)
+
+
+def _random_candles(count: int, *, seed: int) -> list[SimpleNamespace]:
+    generator = random.Random(seed)
+    price = 20_000.0
+    candles: list[SimpleNamespace] = []
+    for index in range(count):
+        open_price = price
+        close_price = round(open_price + generator.choice([-1, 1]) * generator.randint(0, 24) * 0.25, 2)
+        high_price = max(open_price, close_price) + generator.randint(0, 8) * 0.25
+        low_price = min(open_price, close_price) - generator.randint(0, 8) * 0.25
+        candles.append(
+            SimpleNamespace(
+                candle_timestamp=BASE_TIME + timedelta(minutes=15 * index),
+                open_price=open_price,
+                high_price=high_price,
+                low_price=low_price,
+                close_price=close_price,
+                volume=generator.choice([0, generator.randint(1, 900)]),
+                is_partial=False,
+            )
+        )
+        price = close_price
+    return candles
+
+
+def _reference(function, source, *args, **kwargs):
+    return function(list(source), *args, **kwargs)
+
+
+def _sliding_windows(count: int, *, limit: int):
+    for end in range(1, count + 1):
+        yield max(0, end - limit), end
+
+
+# Windows of 150 bars keep more lanes live than the initial lane buffer holds.
+@pytest.mark.parametrize(("period", "limit"), [(1, 40), (3, 40), (14, 40), (14, 150)])
+def test_replay_indicator_book_matches_reference_helpers_on_sliding_windows(
+    period: int, limit: int
+):
+    candles = _random_candles(260, seed=period)
+    book = ReplayIndicatorBook.from_candles(candles)
+    tail_reads = (-1, -2, -4, -(period + 1))
+
+    for start, end in _sliding_windows(len(candles), limit=limit):
+        window = backtesting_module._ClosedCandleList(candles[start:end])
+        book.prime(window, start=start, end=end)
+        closes = bot_service_module._candle_close_values(window)
+        assert list(closes) == [float(candle.close_price) for candle in window]
+
+        expected = {
+            "ema": _reference(bot_service_module._ema_series, closes, period),
+            "rsi": _reference(bot_service_module._rsi_series, closes, period=period),
+            "atr": _reference(bot_service_module._atr_series, window, period=period),
+            "adx": _reference(bot_service_module._adx_series, window, period=period),
+        }
+        actual = {
+            "ema": bot_service_module._ema_series(closes, period),
+            "rsi": bot_service_module._rsi_series(closes, period=period),
+            "atr": bot_service_module._atr_series(window, period=period),
+            "adx": bot_service_module._adx_series(window, period=period),
+        }
+        for name, series in actual.items():
+            assert len(series) == len(expected[name])
+            for position in tail_reads:
+                if -position <= len(series):
+                    assert series[position] == expected[name][position], (name, end, position)
+            assert series[-3:] == expected[name][-3:]
+        assert list(actual["ema"]) == expected["ema"]
+
+        if len(closes) >= period:
+            for index in (-1, -2):
+                if len(closes) + index >= period - 1:
+                    assert bot_service_module._bollinger_band_at(
+                        closes,
+                        index=index,
+                        period=period,
+                        stddev_multiplier=2.0,
+                    ) == bot_service_module._bollinger_band_at(
+                        list(closes),
+                        index=index,
+                        period=period,
+                        stddev_multiplier=2.0,
+                    )
+
+
+def test_anchored_lanes_reuse_their_buffer_across_bars():
+    candles = _random_candles(600, seed=11)
+    book = ReplayIndicatorBook.from_candles(candles)
+    buffers = set()
+
+    for start, end in _sliding_windows(len(candles), limit=150):
+        window = backtesting_module._ClosedCandleList(candles[start:end])
+        book.prime(window, start=start, end=end)
+        series = bot_service_module._ema_series(bot_service_module._candle_close_values(window), 9)
+        assert series[-1] == bot_service_module._ema_series(
+            [float(candle.close_price) for candle in window], 9
+        )[-1]
+        buffers.add(id(book._states[("ema", 9)]._buffer))
+
+    # The buffer doubles a few times to fit 150 live lanes plus the anchors
+    # retained snapshots still read, then is only compacted in place.
+    assert len(buffers) <= 4
+
+
+def test_replay_session_vwap_matches_reference_when_window_cuts_a_session():
+    candles = _random_candles(320, seed=7)
+    book = ReplayIndicatorBook.from_candles(candles)
+
+    for start, end in _sliding_windows(len(candles), limit=120):
+        window = backtesting_module._ClosedCandleList(candles[start:end])
+        book.prime(window, start=start, end=end)
+        keys, values = bot_service_module._session_vwap_values(window)
+        expected_keys, expected_values = bot_service_module._session_vwap_values(list(window))
+        assert keys == expected_keys
+        assert values[-1] == expected_values[-1]
+        assert list(values) == expected_values
@@ -4,10 +4,12 @@ import time
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from threading import Barrier
+from types import SimpleNamespace
 
 import numpy as np
+import pyarrow as pa
 import pytest
-from fastapi import HTTPException
+from fastapi import HTTPException, Response
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
@@ -65,6 +67,11 @@ from app.services.bot_service import (
     update_bot_config,
 )
 from app.services.projectx_client import ProjectXClientError
+from app.services.databento_cache import (
+    DatabentoReplayStore,
+    build_databento_cache,
+    clear_default_databento_cache,
+)
 import app.main as main_module
 import app.services.bot_service as bot_service_module
 
@@ -3846,6 +3853,180 @@ def test_candles_endpoint_returns_local_cache_without_provider_call(monkeypatch)
         engine.dispose()
 
 
+def test_candles_endpoint_serves_databento_history_and_stitches_the_provider_tail(
+    monkeypatch, tmp_path
+):
+    from test_databento_local_cache import _tiny_mnq_archives
+
+    archives, start = _tiny_mnq_archives(tmp_path / "archives", bar_count=12)
+    build_databento_cache(archives, cache_root=tmp_path / "cache", timeframes=("1m", "5m"))
+    monkeypatch.setenv("TOPSIGNAL_DATABENTO_CACHE_DIR", str(tmp_path / "cache"))
+    clear_default_databento_cache()
+    user_id = "00000000-0000-0000-0000-000000000000"
+    monkeypatch.setattr(main_module, "get_authenticated_user_id", lambda: user_id)
+    provider_starts = []
+    tail_row = {
+        "id": 7,
+        "contract_id": "CON.F.US.MNQ.M24",
+        "symbol": "MNQ",
+        "live": False,
+        "unit": "minute",
+        "unit_number": 5,
+        "timestamp": start + timedelta(minutes=10),
+        "open": 1.0,
+        "high": 1.0,
+        "low": 1.0,
+        "close": 1.0,
+        "volume": 1.0,
+        "is_partial": False,
+        "fetched_at": None,
+    }
+
+    def provider_tail(_db, *, start_utc, **_kwargs):
+        provider_starts.append(start_utc)
+        return [{**tail_row, "timestamp": start + timedelta(minutes=5)}, tail_row]
+
+    monkeypatch.setattr(main_module, "_load_projectx_market_candles", provider_tail)
+    store = DatabentoReplayStore(tmp_path / "cache")
+    try:
+        expected = store.load_candles(
+            user_id=user_id,
+            contract_id="CON.F.US.MNQ.M24",
+            root_symbol="MNQ",
+            unit="minute",
+            unit_number=5,
+            start=start,
+            end=start + timedelta(minutes=12),
+            closed_by=start + timedelta(minutes=12),
+        )
+        request = {
+            "contract_id": "CON.F.US.MNQ.M24",
+            "start": start,
+            "unit": "minute",
+            "unit_number": 5,
+            "limit": 500,
+            "refresh": False,
+            "max_points": None,
+            "db": None,
+        }
+
+        history_only = main_module.get_projectx_market_candles(
+            end=start + timedelta(minutes=12), **request
+        )
+        assert provider_starts == []
+        assert [
+            (row["timestamp"], row["open"], row["high"], row["low"], row["close"], row["volume"])
+            for row in history_only
+        ] == [
+            (
+                candle.candle_timestamp,
+                candle.open_price,
+                candle.high_price,
+                candle.low_price,
+                candle.close_price,
+                float(candle.volume),
+            )
+            for candle in expected
+        ]
+        assert {row["symbol"] for row in history_only} == {"MNQ"}
+
+        stitched = main_module.get_projectx_market_candles(
+            end=start + timedelta(minutes=20), **request
+        )
+        # The cache ends after the twelfth minute; only later provider bars
+        # are appended to the two cached five-minute buckets.
+        assert provider_starts == [start + timedelta(minutes=12)]
+        assert [row["timestamp"] for row in stitched] == [
+            start,
+            start + timedelta(minutes=5),
+            start + timedelta(minutes=10),
+        ]
+        assert stitched[-1]["id"] == 7
+        assert stitched[:2] == history_only
+
+        arrow = main_module.get_projectx_market_candles(
+            end=start + timedelta(minutes=20),
+            request=SimpleNamespace(
+                headers={"accept": "application/vnd.apache.arrow.stream, application/json"}
+            ),
+            **request,
+        )
+        assert arrow.media_type == "application/vnd.apache.arrow.stream"
+        table = pa.ipc.open_stream(arrow.body).read_all()
+        assert table.schema.metadata[b"contract_id"] == b"CON.F.US.MNQ.M24"
+        assert table.schema.metadata[b"symbol"] == b"MNQ"
+        assert str(table.schema.field("timestamp").type) == "timestamp[ns, tz=UTC]"
+        assert table.to_pydict() == {
+            field: [row[field] for row in stitched]
+            for field in ("timestamp", "open", "high", "low", "close", "volume", "is_partial")
+        }
+        limited = main_module.get_projectx_market_candles(
+            end=start + timedelta(minutes=20),
+            request=SimpleNamespace(headers={"accept": "application/vnd.apache.arrow.stream"}),
+            **{**request, "limit": 2},
+        )
+        assert pa.ipc.open_stream(limited.body).read_all().column("timestamp").to_pylist() == [
+            row["timestamp"] for row in stitched[-2:]
+        ]
+
+        minutes = main_module.get_projectx_market_candles(
+            end=start + timedelta(minutes=12), **{**request, "unit_number": 1}
+        )
+        downsampled = main_module.get_projectx_market_candles(
+            end=start + timedelta(minutes=12),
+            **{**request, "unit_number": 1, "max_points": 3},
+        )
+        assert len(minutes) == 12
+        assert 1 < len(downsampled) <= 3
+        assert downsampled[0]["timestamp"] == start
+        for field, combine in (("volume", sum), ("high", max), ("low", min)):
+            assert combine(row[field] for row in downsampled) == combine(
+                row[field] for row in minutes
+            )
+
+        # A long provider tail is merged with the same factor as the history
+        # instead of being appended at native resolution.
+        native_tail = [
+            {
+                **tail_row,
+                "unit_number": 1,
+                "timestamp": start + timedelta(minutes=12 + minute),
+                "high": 2.0 + minute,
+                "low": 1.0 - minute,
+                "volume": 2.0,
+            }
+            for minute in range(40)
+        ]
+        monkeypatch.setattr(
+            main_module, "_load_projectx_market_candles", lambda _db, **_kwargs: native_tail
+        )
+        response = Response()
+        merged = main_module.get_projectx_market_candles(
+            end=start + timedelta(minutes=60),
+            response=response,
+            **{**request, "unit_number": 1, "max_points": 8},
+        )
+        assert len(merged) <= 8
+        assert response.headers["X-Candle-Bucket-Factor"] == "8"
+        assert merged[0]["timestamp"] == start
+        assert merged[-1]["close"] == native_tail[-1]["close"]
+        for field, combine in (("volume", sum), ("high", max), ("low", min)):
+            assert combine(row[field] for row in merged) == combine(
+                row[field] for row in [*minutes, *native_tail]
+            )
+        merged_arrow = main_module.get_projectx_market_candles(
+            end=start + timedelta(minutes=60),
+            request=SimpleNamespace(headers={"accept": "application/vnd.apache.arrow.stream"}),
+            **{**request, "unit_number": 1, "max_points": 8},
+        )
+        merged_table = pa.ipc.open_stream(merged_arrow.body).read_all()
+        assert merged_table.schema.metadata[b"bucket_factor"] == b"8"
+        assert merged_table.column("volume").to_pylist() == [row["volume"] for row in merged]
+    finally:
+        store.clear()
+        clear_default_databento_cache()
+
+
 def test_candles_endpoint_fetches_full_history_when_cache_only_has_recent_tail(monkeypatch):
     engine = create_engine(
         "sqlite+pysqlite:///:memory:",
@@ -8,6 +8,7 @@ import re
 import subprocess
 import sys
 from dataclasses import dataclass
+from multiprocessing import resource_tracker, shared_memory
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
 from types import SimpleNamespace
@@ -27,6 +28,9 @@ from databento_dbn import (
     SType,
     Schema,
     SecurityUpdateAction,
+    StatMsg,
+    StatType,
+    StatUpdateAction,
 )
 
 import app.services.databento_cache as databento_cache
@@ -41,12 +45,22 @@ from app.services.databento_cache import (
     build_databento_cache,
     inspect_archive,
     parse_timeframe,
+    verify_databento_cache,
     _Instrument,
     _MappingResolver,
     _build_roll_schedule,
     _contract_key,
+    _merge_contract_codes,
     _resolve_contract_code,
 )
+from app.services.databento_chart_candles import load_databento_chart_history
+from app.services.databento_records import DbnLayoutUnsupportedError, session_ordinals
+from app.services.databento_shared_slices import (
+    SharedSliceRegistry,
+    get_shared_slice_registry,
+    shared_slices_supported,
+)
+from app.services.trading_day import trading_day_date
 
 
 DATASET = "GLBX.MDP3"
@@ -90,9 +104,14 @@ def _definition(
     root_symbol: str,
     *,
     undefined_timestamps: bool = False,
+    listing: tuple[int, str] | None = None,
+    definition_time: datetime | None = None,
+    expiration: datetime | None = None,
 ) -> InstrumentDefMsg:
     instrument_id, raw_symbol, unit_quantity = ROOT_CONTRACTS[root_symbol]
-    definition_time = datetime(2024, 1, 2, tzinfo=timezone.utc)
+    if listing is not None:
+        instrument_id, raw_symbol = listing
+    definition_time = definition_time or datetime(2024, 1, 2, tzinfo=timezone.utc)
     values: dict[str, Any] = {
         "publisher_id": 1,
         "instrument_id": instrument_id,
@@ -110,7 +129,7 @@ def _definition(
     if not undefined_timestamps:
         values.update(
             expiration=_unix_nanos(
-                datetime(2024, 6, 21, 13, 30, tzinfo=timezone.utc)
+                expiration or datetime(2024, 6, 21, 13, 30, tzinfo=timezone.utc)
             ),
             activation=_unix_nanos(datetime(2024, 1, 1, tzinfo=timezone.utc)),
         )
@@ -137,16 +156,36 @@ def _ohlcv(
     )
 
 
+def _statistic(timestamp: datetime, *, instrument_id: int, index: int) -> StatMsg:
+    return StatMsg(
+        publisher_id=1,
+        instrument_id=instrument_id,
+        ts_event=_unix_nanos(timestamp),
+        ts_recv=_unix_nanos(timestamp),
+        ts_ref=0,
+        price=100_000_000_000 + index * 1_000_000_000,
+        quantity=0,
+        stat_type=StatType.SETTLEMENT_PRICE,
+        sequence=index,
+        channel_id=0,
+        update_action=StatUpdateAction.NEW,
+    )
+
+
 def _write_dbn_archive(
     path: Path,
     *,
     root_symbol: str,
     schema_name: str,
-    records: Iterable[InstrumentDefMsg | OHLCVMsg],
+    records: Iterable[InstrumentDefMsg | OHLCVMsg | StatMsg],
     mappings: Iterable[Any] | None = None,
+    job_id: str | None = None,
 ) -> Path:
     materialized = list(records)
-    schema = Schema.DEFINITION if schema_name == "definition" else Schema.OHLCV_1M
+    schema = {
+        "definition": Schema.DEFINITION,
+        "statistics": Schema.STATISTICS,
+    }.get(schema_name, Schema.OHLCV_1M)
     record_times = [
         int(record.ts_recv if schema_name == "definition" else record.ts_event)
         for record in materialized
@@ -167,7 +206,7 @@ def _write_dbn_archive(
     payload = zstandard.ZstdCompressor().compress(uncompressed)
     payload_name = f"tiny.{schema_name}.dbn.zst"
     payload_hash = hashlib.sha256(payload).hexdigest()
-    job_id = f"tiny-{root_symbol.lower()}-{schema_name}"
+    job_id = job_id or f"tiny-{root_symbol.lower()}-{schema_name}"
     metadata_json = {
         "version": 1,
         "job_id": job_id,
@@ -665,6 +704,234 @@ def test_nonaligned_source_start_exposes_first_partial_resampled_bucket(
         store.clear()
 
 
+def test_unbuilt_timeframes_are_resampled_on_demand_like_built_series(
+    tmp_path: Path,
+):
+    # 22:31 UTC is 17:31 New York, so the bars cross the 18:00 session open.
+    archives, raw_start = _tiny_mnq_archives(
+        tmp_path / "archives",
+        bar_count=80,
+        start=datetime(2024, 3, 4, 22, 31, tzinfo=timezone.utc),
+    )
+    build_databento_cache(
+        archives, cache_root=tmp_path / "built", timeframes=("1m", "3m", "10m")
+    )
+    build_databento_cache(archives, cache_root=tmp_path / "lazy", timeframes=("1m",))
+    built = DatabentoReplayStore(tmp_path / "built")
+    lazy = DatabentoReplayStore(tmp_path / "lazy")
+
+    def values(store: DatabentoReplayStore, unit_number: int, offset: int) -> list:
+        end = raw_start + timedelta(minutes=offset + 41)
+        return [
+            (
+                row.candle_timestamp,
+                row.nominal_close_time,
+                row.open_price,
+                row.high_price,
+                row.low_price,
+                row.close_price,
+                row.volume,
+                row.source_instrument_id,
+                row.source_raw_symbol,
+            )
+            for row in store.open_candles(
+                user_id=OWNER_ID,
+                contract_id=CONTRACT_ID,
+                root_symbol="MNQ",
+                unit="minute",
+                unit_number=unit_number,
+                start=raw_start + timedelta(minutes=offset),
+                end=end,
+                closed_by=end,
+            )
+        ]
+
+    try:
+        for unit_number in (3, 10):
+            for offset in (-1, 7, 30):
+                expected = values(built, unit_number, offset)
+                assert expected
+                assert values(lazy, unit_number, offset) == expected
+        misses = lazy.stats()["misses"]
+        assert values(lazy, 3, 7) == values(built, 3, 7)
+        assert lazy.stats()["misses"] == misses
+        assert not list((tmp_path / "lazy").rglob("timeframe=3m"))
+    finally:
+        built.clear()
+        lazy.clear()
+
+
+def test_max_points_downsampling_keeps_true_extremes_from_the_pyramid(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    archives, raw_start = _tiny_mnq_archives(tmp_path / "archives", bar_count=300)
+    result = build_databento_cache(
+        archives, cache_root=tmp_path / "cache", timeframes=("1m",)
+    )
+    entry = json.loads((Path(result.version_dir) / "manifest.json").read_text())[
+        "series"
+    ]["MNQ:1m"]
+    metadata = json.loads(
+        (Path(result.version_dir) / entry["path"] / "metadata.json").read_text()
+    )
+    assert [level["factor"] for level in metadata["pyramid_levels"]] == [
+        2**power for power in range(1, 10)
+    ]
+    store = DatabentoReplayStore(tmp_path / "cache")
+    try:
+        candles = store.open_candles(
+            user_id=OWNER_ID,
+            contract_id=CONTRACT_ID,
+            root_symbol="MNQ",
+            unit="minute",
+            unit_number=1,
+            start=raw_start,
+            end=raw_start + timedelta(minutes=300),
+            closed_by=raw_start + timedelta(minutes=300),
+        )
+        windows = [(0, 300), (3, 300), (5, 261), (17, 18)]
+        pyramid_columns = {
+            (left, right, max_points): candles[left:right].downsampled_columns(max_points)
+            for left, right in windows
+            for max_points in (2, 7, 50, 400)
+        }
+        monkeypatch.setattr(databento_cache._MappedSeries, "pyramid", lambda self: None)
+        for (left, right, max_points), columns in pyramid_columns.items():
+            window = candles[left:right]
+            assert {
+                name: values.tolist() for name, values in columns.items()
+            } == {
+                name: values.tolist()
+                for name, values in window.downsampled_columns(max_points).items()
+            }
+            bars = len(columns["timestamp_ns"])
+            assert bars <= max_points
+            assert columns["timestamp_ns"][0] == window.start_ns[0]
+            assert columns["close_timestamp_ns"][-1] == window.close_ns[-1]
+            assert columns["open_nano"][0] == window.open_nano_values[0]
+            assert columns["close_nano"][-1] == window.close_nano_values[-1]
+            assert int(columns["volume"].sum()) == int(window.volume_values.sum())
+            assert columns["high_nano"].max() == window.high_nano_values.max()
+            assert columns["low_nano"].min() == window.low_nano_values.min()
+            starts = np.searchsorted(window.start_ns, columns["timestamp_ns"])
+            assert np.array_equal(
+                columns["high_nano"],
+                np.maximum.reduceat(window.high_nano_values, starts),
+            )
+            assert np.array_equal(
+                columns["low_nano"],
+                np.minimum.reduceat(window.low_nano_values, starts),
+            )
+    finally:
+        store.clear()
+
+
+# ProjectX names the NQ product ENQ (``CON.F.US.ENQ.U24``) while the cache and
+# Databento outrights use NQ.
+@pytest.mark.parametrize(("root", "product"), [("MNQ", "MNQ"), ("NQ", "ENQ")])
+def test_chart_history_for_an_expiry_stops_where_the_front_month_rolls(
+    tmp_path: Path, root: str, product: str
+):
+    def definition(instrument_id: int, raw_symbol: str, expiration: datetime):
+        definition_time = datetime(2024, 1, 2, tzinfo=timezone.utc)
+        return InstrumentDefMsg(
+            publisher_id=1,
+            instrument_id=instrument_id,
+            ts_event=_unix_nanos(definition_time),
+            ts_recv=_unix_nanos(definition_time),
+            min_price_increment=250_000_000,
+            display_factor=1_000_000_000,
+            raw_symbol=raw_symbol,
+            asset=root,
+            security_type="FUT",
+            instrument_class=InstrumentClass.FUTURE,
+            security_update_action=SecurityUpdateAction.ADD,
+            unit_of_measure_qty=2_000_000_000,
+            expiration=_unix_nanos(expiration),
+            activation=_unix_nanos(datetime(2024, 1, 1, tzinfo=timezone.utc)),
+        )
+
+    def bar(timestamp: datetime, instrument_id: int, price: int, volume: int):
+        return OHLCVMsg(
+            rtype=RType.OHLCV_1M,
+            publisher_id=1,
+            instrument_id=instrument_id,
+            ts_event=_unix_nanos(timestamp),
+            open=price * 1_000_000_000,
+            high=(price + 2) * 1_000_000_000,
+            low=(price - 1) * 1_000_000_000,
+            close=price * 1_000_000_000,
+            volume=volume,
+        )
+
+    # M4 trades at 100 and U4 at 200; U4 outtrades it on Tuesday, so the
+    # continuous series rolls to U4 for Wednesday's session.
+    sessions = [datetime(2024, 3, day, 14, 30, tzinfo=timezone.utc) for day in (4, 5, 6)]
+    volumes = [(100, 10), (10, 100), (10, 100)]
+    archive_dir = tmp_path / "archives"
+    archive_dir.mkdir()
+    archives = (
+        _write_dbn_archive(
+            archive_dir / f"{root.lower()}-definition.zip",
+            root_symbol=root,
+            schema_name="definition",
+            records=[
+                definition(101, f"{root}M4", datetime(2024, 6, 21, 13, 30, tzinfo=timezone.utc)),
+                definition(102, f"{root}U4", datetime(2024, 9, 20, 13, 30, tzinfo=timezone.utc)),
+            ],
+        ),
+        _write_dbn_archive(
+            archive_dir / f"{root.lower()}-ohlcv.zip",
+            root_symbol=root,
+            schema_name="ohlcv-1m",
+            records=sorted(
+                (
+                    bar(session + timedelta(minutes=minute), instrument_id, price, volume)
+                    for session, session_volumes in zip(sessions, volumes)
+                    for minute in range(3)
+                    for instrument_id, price, volume in (
+                        (101, 100, session_volumes[0]),
+                        (102, 200, session_volumes[1]),
+                    )
+                ),
+                key=lambda record: (record.ts_event, record.instrument_id),
+            ),
+        ),
+    )
+    build_databento_cache(archives, cache_root=tmp_path / "cache", timeframes=("1m",))
+    store = DatabentoReplayStore(tmp_path / "cache")
+    window = {
+        "user_id": OWNER_ID,
+        "symbol": None,
+        "live": False,
+        "start": sessions[1],
+        "end": sessions[2] + timedelta(hours=1),
+        "unit": "minute",
+        "unit_number": 1,
+        "limit": 500,
+        "store": store,
+    }
+    try:
+        expiring = load_databento_chart_history(contract_id=f"CON.F.US.{product}.M24", **window)
+        continuous = load_databento_chart_history(contract_id=root, **window)
+        next_expiry = load_databento_chart_history(contract_id=f"CON.F.US.{product}.U24", **window)
+        after_roll = load_databento_chart_history(
+            contract_id=f"CON.F.US.{product}.U24", **{**window, "start": sessions[2]}
+        )
+
+        assert [row["open"] for row in expiring.rows] == [100.0] * 3
+        assert [row["contract_id"] for row in expiring.rows] == [f"CON.F.US.{product}.M24"] * 3
+        assert expiring.covered_until == sessions[2]
+        assert [row["open"] for row in continuous.rows] == [100.0] * 3 + [200.0] * 3
+        assert continuous.covered_until > sessions[2]
+        # The window opens on M4 bars, so the provider serves all of it.
+        assert next_expiry is None
+        assert [row["open"] for row in after_roll.rows] == [200.0] * 3
+        assert after_roll.covered_until == continuous.covered_until
+    finally:
+        store.clear()
+
+
 @pytest.mark.parametrize(
     ("corruption", "message"),
     [
@@ -727,6 +994,101 @@ def test_mmap_series_integrity_is_validated_before_replay(
         store.clear()
 
 
+def test_integrity_ledger_skips_rescans_and_rehashes_only_changed_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    archives, start = _tiny_mnq_archives(tmp_path / "archives")
+    cache_root = tmp_path / "cache"
+    result = build_databento_cache(archives, cache_root=cache_root, timeframes=("1m",))
+    version_dir = Path(result.version_dir)
+    ledger = json.loads((version_dir / "integrity.json").read_text())["files"]
+    manifest = json.loads((cache_root / "current.json").read_text())
+    series_path = manifest["series"]["MNQ:1m"]["path"]
+    assert f"{series_path}/timestamp_ns.npy" in ledger
+    assert "manifest.json" not in ledger
+    assert verify_databento_cache(cache_root).ok
+
+    hashed: list[str] = []
+    blake2b_path = databento_cache._blake2b_path
+    monkeypatch.setattr(
+        databento_cache,
+        "_blake2b_path",
+        lambda path: hashed.append(Path(path).name) or blake2b_path(path),
+    )
+    monkeypatch.setattr(
+        databento_cache,
+        "_array_is_strictly_increasing",
+        lambda _array: pytest.fail("ledgered series must not be rescanned"),
+    )
+    store = DatabentoReplayStore(cache_root)
+    try:
+        candles = store.load_candles(
+            user_id=OWNER_ID,
+            contract_id=CONTRACT_ID,
+            root_symbol="MNQ",
+            unit="minute",
+            unit_number=1,
+            start=start,
+            end=start + timedelta(minutes=6),
+            closed_by=start + timedelta(minutes=6),
+        )
+    finally:
+        store.clear()
+    assert len(candles) == 6
+    assert hashed == []
+
+    # A touched file is re-hashed once and still trusted.
+    volume = version_dir / series_path / "volume.npy"
+    os.utime(volume, ns=(volume.stat().st_atime_ns, volume.stat().st_mtime_ns - 1_000_000_000))
+    assert verify_databento_cache(cache_root).ok
+    assert hashed == ["volume.npy"]
+
+
+def test_deep_verify_rehashes_files_whose_stat_identity_was_preserved(tmp_path: Path):
+    archives, _start = _tiny_mnq_archives(tmp_path / "archives")
+    cache_root = tmp_path / "cache"
+    result = build_databento_cache(archives, cache_root=cache_root, timeframes=("1m",))
+    manifest = json.loads((cache_root / "current.json").read_text())
+    close_path = Path(result.version_dir) / manifest["series"]["MNQ:1m"]["path"] / "close_nano.npy"
+    stat = close_path.stat()
+    values = np.load(close_path, mmap_mode="r+")
+    try:
+        values[0] += 1
+        values.flush()
+    finally:
+        values._mmap.close()
+    del values
+    os.utime(close_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert verify_databento_cache(cache_root).ok
+    deep = verify_databento_cache(cache_root, deep=True)
+    assert not deep.ok
+    assert deep.problems == (
+        f"artifact_changed:{manifest['series']['MNQ:1m']['path']}/close_nano.npy",
+    )
+
+
+def test_unchanged_archives_reuse_their_recorded_content_hash(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    archives, _start = _tiny_mnq_archives(tmp_path / "archives")
+    cache_root = tmp_path / "cache"
+    build_databento_cache(archives, cache_root=cache_root, timeframes=("1m",))
+    hashed: list[Path] = []
+    sha256_path = databento_cache._sha256_path
+    monkeypatch.setattr(
+        databento_cache,
+        "_sha256_path",
+        lambda path: hashed.append(Path(path)) or sha256_path(path),
+    )
+
+    result = build_databento_cache(archives, cache_root=cache_root, timeframes=("1m", "5m"))
+    assert "5m" in result.timeframes
+    assert hashed == []
+    build_databento_cache(archives, cache_root=cache_root, timeframes=("1m",), force=True)
+    assert len(hashed) == len(archives)
+
+
 def test_source_mtime_change_invalidates_slices_and_open_mappings(tmp_path: Path):
     archives, start = _tiny_mnq_archives(tmp_path / "archives")
     cache_root = tmp_path / "cache"
@@ -883,6 +1245,168 @@ print(expected)
     assert completed.returncode == 0, completed.stderr or completed.stdout
 
 
+def _run_backend_script(script: str, *args: str) -> subprocess.CompletedProcess[str]:
+    backend_root = Path(__file__).resolve().parents[1]
+    environment = os.environ.copy()
+    environment["PYTHONPATH"] = os.pathsep.join(
+        value
+        for value in (str(backend_root), environment.get("PYTHONPATH", ""))
+        if value
+    )
+    return subprocess.run(
+        [sys.executable, "-c", script, *args],
+        cwd=backend_root,
+        env=environment,
+        capture_output=True,
+        text=True,
+        timeout=30,
+        check=False,
+    )
+
+
+def _segment_exists(name: str) -> bool:
+    try:
+        segment = shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:
+        return False
+    resource_tracker.unregister(segment._name, "shared_memory")
+    segment.close()
+    return True
+
+
+@pytest.mark.skipif(not shared_slices_supported(), reason="POSIX shared memory only")
+def test_shared_store_workers_attach_resampled_slices_instead_of_aggregating(
+    tiny_cache: TinyCache,
+):
+    script = """
+import json
+import sys
+from datetime import datetime, timedelta
+from app.services.databento_cache import DatabentoReplayStore
+from app.services.databento_shared_slices import get_shared_slice_registry
+
+root, start_text = sys.argv[1:]
+start = datetime.fromisoformat(start_text)
+store = DatabentoReplayStore(root, shared=True)
+sequence = store.open_candles(
+    user_id="11111111-1111-1111-1111-111111111111",
+    contract_id="CON.F.US.MNQ.M24",
+    root_symbol="MNQ",
+    unit="minute",
+    unit_number=3,
+    start=start,
+    end=start + timedelta(minutes=6),
+    closed_by=start + timedelta(minutes=6),
+)
+print(json.dumps({"stats": get_shared_slice_registry().stats(), "high": sequence.high_nano_values.tolist()}))
+del sequence
+store.clear()
+"""
+    private = DatabentoReplayStore(tiny_cache.cache_root, shared=False)
+    store = DatabentoReplayStore(tiny_cache.cache_root, shared=True)
+    registry = get_shared_slice_registry()
+    published = registry.stats()["published"]
+    try:
+        expected = _open(private, tiny_cache, unit_number=3)
+        sequence = _open(store, tiny_cache, unit_number=3)
+        lease = sequence._lease.mapped.shared_lease
+        assert lease is not None
+        assert registry.stats()["published"] == published + 1
+        assert not sequence.high_nano_values.flags.writeable
+        assert sequence.high_nano_values.tolist() == expected.high_nano_values.tolist()
+
+        completed = _run_backend_script(
+            script, str(tiny_cache.cache_root), tiny_cache.start.isoformat()
+        )
+        assert completed.returncode == 0, completed.stderr or completed.stdout
+        worker = json.loads(completed.stdout)
+        assert worker["stats"]["published"] == 0
+        assert worker["stats"]["attached"] == 1
+        assert worker["high"] == expected.high_nano_values.tolist()
+        # The worker's release leaves the segment to the publisher's lease.
+        assert _segment_exists(lease.name)
+
+        name = lease.name
+        del sequence, lease
+        store.clear()
+        gc.collect()
+        assert not _segment_exists(name)
+    finally:
+        store.clear()
+        private.clear()
+
+
+@pytest.mark.skipif(not shared_slices_supported(), reason="POSIX shared memory only")
+def test_shared_slice_leases_of_exited_processes_are_reaped(tmp_path: Path):
+    lock_path = tmp_path / "shared.lock"
+    key = f"test-shared-slice:{tmp_path}"
+    script = """
+import os
+import sys
+from app.services.databento_shared_slices import SharedSliceRegistry
+
+lease = SharedSliceRegistry(sys.argv[1]).acquire(sys.argv[2])
+assert lease is not None
+print(lease.arrays["close"].tolist())
+sys.stdout.flush()
+os._exit(0)
+"""
+    registry = SharedSliceRegistry(lock_path)
+    lease = registry.publish(key, {"close": np.arange(4, dtype=np.int64)})
+    assert lease is not None
+    name = lease.name
+    try:
+        completed = _run_backend_script(script, str(lock_path), key)
+        assert completed.returncode == 0, completed.stderr or completed.stdout
+        assert json.loads(completed.stdout) == [0, 1, 2, 3]
+        assert registry.acquire("missing-shared-slice") is None
+
+        # The worker exited holding its slot; releasing the last live lease
+        # still unlinks the segment.
+        lease.release()
+        assert registry.stats()["segments"] == 0
+        assert not _segment_exists(name)
+    finally:
+        lease.release()
+
+
+@pytest.mark.skipif(
+    not shared_slices_supported() or not Path("/dev/shm").is_dir(),
+    reason="Linux POSIX shared memory only",
+)
+def test_sweep_unlinks_segments_left_only_by_exited_processes(tmp_path: Path):
+    lock_path = tmp_path / "shared.lock"
+    orphan_key = f"test-shared-slice-orphan:{tmp_path}"
+    live_key = f"test-shared-slice-live:{tmp_path}"
+    script = """
+import os
+import sys
+import numpy as np
+from app.services.databento_shared_slices import SharedSliceRegistry
+
+lease = SharedSliceRegistry(sys.argv[1]).publish(sys.argv[2], {"close": np.arange(3)})
+assert lease is not None
+print(lease.name)
+sys.stdout.flush()
+os._exit(0)
+"""
+    registry = SharedSliceRegistry(lock_path)
+    live = registry.publish(live_key, {"close": np.arange(4, dtype=np.int64)})
+    assert live is not None
+    try:
+        completed = _run_backend_script(script, str(lock_path), orphan_key)
+        assert completed.returncode == 0, completed.stderr or completed.stdout
+        orphan = completed.stdout.strip()
+        # Nobody asks for the orphan again, so only the sweep can reap it.
+        assert _segment_exists(orphan)
+
+        assert SharedSliceRegistry(lock_path).sweep_dead_segments() >= 1
+        assert not _segment_exists(orphan)
+        assert _segment_exists(live.name)
+    finally:
+        live.release()
+
+
 def test_same_size_same_mtime_source_edit_invalidates_cache(tmp_path: Path):
     archives, start = _tiny_mnq_archives(tmp_path / "archives")
     cache_root = tmp_path / "cache"
@@ -1194,6 +1718,575 @@ def test_parent_spread_rows_remain_intentionally_excluded(tmp_path: Path):
     assert manifest["series"]["MNQ:1m"]["rows"] == 1
 
 
+def test_parallel_archive_decode_matches_the_serial_build(tmp_path: Path):
+    archive_dir = tmp_path / "archives"
+    archive_dir.mkdir()
+    start = datetime(2024, 3, 4, 14, 30, tzinfo=timezone.utc)
+    archives: list[Path] = []
+    for root_symbol in ("MNQ", "MES"):
+        instrument_id, _raw_symbol, _unit_quantity = ROOT_CONTRACTS[root_symbol]
+        archives.append(
+            _write_dbn_archive(
+                archive_dir / f"{root_symbol.lower()}-definition.zip",
+                root_symbol=root_symbol,
+                schema_name="definition",
+                records=[_definition(root_symbol)],
+            )
+        )
+        archives.append(
+            _write_dbn_archive(
+                archive_dir / f"{root_symbol.lower()}-ohlcv.zip",
+                root_symbol=root_symbol,
+                schema_name="ohlcv-1m",
+                records=[
+                    _ohlcv(
+                        start + timedelta(minutes=index),
+                        instrument_id=instrument_id,
+                        index=index,
+                    )
+                    for index in range(12)
+                ],
+            )
+        )
+
+    serial = build_databento_cache(
+        archives,
+        cache_root=tmp_path / "serial",
+        timeframes=("1m", "5m"),
+        max_workers=1,
+    )
+    parallel = build_databento_cache(
+        archives,
+        cache_root=tmp_path / "parallel",
+        timeframes=("1m", "5m"),
+        max_workers=2,
+    )
+
+    def manifest(result: Any) -> dict[str, Any]:
+        value = json.loads((Path(result.version_dir) / "manifest.json").read_text())
+        value.pop("built_at")
+        value.pop("version_dir")
+        for entry in value["series"].values():
+            entry.pop("path", None)
+        return value
+
+    assert parallel.source_fingerprint == serial.source_fingerprint
+    assert manifest(parallel) == manifest(serial)
+    serial_files = sorted(
+        path.relative_to(serial.version_dir)
+        for path in Path(serial.version_dir).rglob("*.parquet")
+    )
+    assert serial_files == sorted(
+        path.relative_to(parallel.version_dir)
+        for path in Path(parallel.version_dir).rglob("*.parquet")
+    )
+    for relative in serial_files:
+        assert pq.read_table(Path(parallel.version_dir) / relative).equals(
+            pq.read_table(Path(serial.version_dir) / relative)
+        )
+    serial_series = json.loads(
+        (Path(serial.version_dir) / "manifest.json").read_text()
+    )["series"]
+    parallel_series = json.loads(
+        (Path(parallel.version_dir) / "manifest.json").read_text()
+    )["series"]
+    for key, entry in serial_series.items():
+        for name in ARRAY_COLUMNS:
+            assert np.array_equal(
+                np.load(
+                    Path(parallel.version_dir)
+                    / parallel_series[key]["path"]
+                    / f"{name}.npy"
+                ),
+                np.load(Path(serial.version_dir) / entry["path"] / f"{name}.npy"),
+            ), (key, name)
+    # Series are materialized out of order across workers but recorded in
+    # the serial order.
+    assert list(parallel_series) == list(serial_series)
+
+
+def test_over_allocated_series_arrays_are_truncated_in_place(tmp_path: Path):
+    path = tmp_path / "timestamp_ns.npy"
+    array = np.lib.format.open_memmap(path, mode="w+", dtype=np.int64, shape=(1_000_000,))
+    array[:3] = [5, 6, 7]
+    array.flush()
+    del array
+
+    databento_cache._truncate_npy_rows(path, 3)
+
+    loaded = np.load(path)
+    assert loaded.tolist() == [5, 6, 7]
+    with path.open("rb") as handle:
+        np.lib.format.read_magic(handle)
+        np.lib.format.read_array_header_1_0(handle)
+        assert path.stat().st_size == handle.tell() + 3 * 8
+
+
+def test_incremental_build_decodes_only_added_archives(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    archive_dir = tmp_path / "archives"
+    archive_dir.mkdir()
+    start = datetime(2024, 3, 4, 14, 30, tzinfo=timezone.utc)
+    archives: list[Path] = []
+    for root_symbol in ("MES", "MNQ"):
+        instrument_id, _raw_symbol, _unit_quantity = ROOT_CONTRACTS[root_symbol]
+        archives.append(
+            _write_dbn_archive(
+                archive_dir / f"{root_symbol.lower()}-definition.zip",
+                root_symbol=root_symbol,
+                schema_name="definition",
+                records=[_definition(root_symbol)],
+            )
+        )
+        archives.append(
+            _write_dbn_archive(
+                archive_dir / f"{root_symbol.lower()}-ohlcv.zip",
+                root_symbol=root_symbol,
+                schema_name="ohlcv-1m",
+                records=[
+                    _ohlcv(
+                        start + timedelta(minutes=index),
+                        instrument_id=instrument_id,
+                        index=index,
+                    )
+                    for index in range(12)
+                ],
+            )
+        )
+    mes_instrument_id = ROOT_CONTRACTS["MES"][0]
+    # The added MES history sorts before every MNQ archive, so the reused MNQ
+    # partitions are renumbered as well as linked.
+    added = _write_dbn_archive(
+        archive_dir / "mes-ohlcv-next-day.zip",
+        root_symbol="MES",
+        schema_name="ohlcv-1m",
+        records=[
+            _ohlcv(
+                start + timedelta(days=1, minutes=index),
+                instrument_id=mes_instrument_id,
+                index=index,
+            )
+            for index in range(12)
+        ],
+        job_id="tiny-mes-ohlcv-1m-next-day",
+    )
+    cache_root = tmp_path / "incremental"
+    first = build_databento_cache(
+        archives, cache_root=cache_root, timeframes=("1m", "5m"), max_workers=1
+    )
+    assert first.reused_archive_count == 0
+
+    decoded: list[str] = []
+    decode_ohlcv = databento_cache._decode_ohlcv_archive
+
+    def spy(*args: Any) -> Any:
+        decoded.append(args[2].name)
+        return decode_ohlcv(*args)
+
+    monkeypatch.setattr(databento_cache, "_decode_ohlcv_archive", spy)
+    incremental = build_databento_cache(
+        [*archives, added],
+        cache_root=cache_root,
+        timeframes=("1m", "5m"),
+        max_workers=1,
+        incremental=True,
+    )
+    assert decoded == [added.name]
+    assert incremental.reused_archive_count == 2
+    assert incremental.version_dir != first.version_dir
+    monkeypatch.setattr(databento_cache, "_decode_ohlcv_archive", decode_ohlcv)
+    scratch = build_databento_cache(
+        [*archives, added],
+        cache_root=tmp_path / "scratch",
+        timeframes=("1m", "5m"),
+        max_workers=1,
+    )
+
+    def manifest(result: Any) -> dict[str, Any]:
+        value = json.loads((Path(result.version_dir) / "manifest.json").read_text())
+        value.pop("built_at")
+        value.pop("version_dir")
+        value.pop("archives")
+        return value
+
+    assert incremental.source_fingerprint == scratch.source_fingerprint
+    assert manifest(incremental) == manifest(scratch)
+    scratch_files = sorted(
+        path.relative_to(scratch.version_dir)
+        for path in Path(scratch.version_dir).rglob("*.parquet")
+    )
+    assert scratch_files == sorted(
+        path.relative_to(incremental.version_dir)
+        for path in Path(incremental.version_dir).rglob("*.parquet")
+    )
+    for relative in scratch_files:
+        assert pq.read_table(Path(incremental.version_dir) / relative).equals(
+            pq.read_table(Path(scratch.version_dir) / relative)
+        ), relative
+    series = json.loads((Path(scratch.version_dir) / "manifest.json").read_text())[
+        "series"
+    ]
+    for entry in series.values():
+        for name in ARRAY_COLUMNS:
+            assert np.array_equal(
+                np.load(Path(incremental.version_dir) / entry["path"] / f"{name}.npy"),
+                np.load(Path(scratch.version_dir) / entry["path"] / f"{name}.npy"),
+            ), (entry["path"], name)
+    # The prior version stays intact for readers still holding it.
+    assert (Path(first.version_dir) / "manifest.json").is_file()
+
+
+def test_incremental_build_reuses_archives_a_new_listing_and_day_leave_unchanged(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    archive_dir = tmp_path / "archives"
+    archive_dir.mkdir()
+    mnq_instrument_id, mnq_raw_symbol, _unit_quantity = ROOT_CONTRACTS["MNQ"]
+    mes_instrument_id = ROOT_CONTRACTS["MES"][0]
+
+    def session_bars(
+        start: datetime, *, root_symbol: str, instrument_id: int, name: str
+    ) -> Path:
+        return _write_dbn_archive(
+            archive_dir / f"{name}.zip",
+            root_symbol=root_symbol,
+            schema_name="ohlcv-1m",
+            records=[
+                _ohlcv(
+                    start + timedelta(minutes=index),
+                    instrument_id=instrument_id,
+                    index=index,
+                )
+                for index in range(12)
+            ],
+            job_id=f"tiny-{name}",
+        )
+
+    def settlements(start: datetime, *, name: str) -> Path:
+        return _write_dbn_archive(
+            archive_dir / f"{name}.zip",
+            root_symbol="MNQ",
+            schema_name="statistics",
+            records=[
+                _statistic(
+                    start + timedelta(hours=6), instrument_id=mnq_instrument_id, index=0
+                )
+            ],
+            mappings=[
+                SimpleNamespace(
+                    raw_symbol=mnq_raw_symbol,
+                    intervals=[
+                        SimpleNamespace(
+                            start_date=start.date(),
+                            end_date=start.date() + timedelta(days=1),
+                            symbol=str(mnq_instrument_id),
+                        )
+                    ],
+                )
+            ],
+            job_id=f"tiny-{name}",
+        )
+
+    first_day = datetime(2024, 3, 4, 14, 30, tzinfo=timezone.utc)
+    archives = [
+        _write_dbn_archive(
+            archive_dir / f"{root_symbol.lower()}-definition.zip",
+            root_symbol=root_symbol,
+            schema_name="definition",
+            records=[_definition(root_symbol)],
+        )
+        for root_symbol in ("MES", "MNQ")
+    ]
+    archives += [
+        session_bars(
+            first_day,
+            root_symbol="MES",
+            instrument_id=mes_instrument_id,
+            name="mes-ohlcv-0304",
+        ),
+        session_bars(
+            first_day,
+            root_symbol="MNQ",
+            instrument_id=mnq_instrument_id,
+            name="mnq-ohlcv-0304",
+        ),
+        session_bars(
+            first_day + timedelta(days=1),
+            root_symbol="MNQ",
+            instrument_id=mnq_instrument_id,
+            name="mnq-ohlcv-0305",
+        ),
+        settlements(first_day, name="mnq-statistics-0304"),
+    ]
+    # A daily drop lists MNQH5, which sorts before MNQM4 and renumbers its
+    # contract code, next to a new session's bars and settlements.
+    drop_day = datetime(2024, 4, 1, 14, 30, tzinfo=timezone.utc)
+    drop = [
+        _write_dbn_archive(
+            archive_dir / "mnq-definition-0320.zip",
+            root_symbol="MNQ",
+            schema_name="definition",
+            records=[
+                _definition(
+                    "MNQ",
+                    listing=(103, "MNQH5"),
+                    definition_time=datetime(2024, 3, 20, tzinfo=timezone.utc),
+                    expiration=datetime(2025, 3, 21, 13, 30, tzinfo=timezone.utc),
+                )
+            ],
+            job_id="tiny-mnq-definition-0320",
+        ),
+        session_bars(
+            drop_day,
+            root_symbol="MNQ",
+            instrument_id=mnq_instrument_id,
+            name="mnq-ohlcv-0401",
+        ),
+        settlements(drop_day, name="mnq-statistics-0401"),
+    ]
+    cache_root = tmp_path / "incremental"
+    first = build_databento_cache(
+        archives, cache_root=cache_root, timeframes=("1m", "5m"), max_workers=1
+    )
+
+    decoded: list[str] = []
+    copied_rows: dict[str, int] = {}
+    decode_ohlcv = databento_cache._decode_ohlcv_archive
+    decode_statistics = databento_cache._decode_statistics_archive
+    copy_rows = databento_cache._SeriesExtension.copy_rows
+
+    def spy_ohlcv(*args: Any) -> Any:
+        decoded.append(args[2].name)
+        return decode_ohlcv(*args)
+
+    def spy_statistics(*args: Any) -> Any:
+        decoded.append(args[2].name)
+        return decode_statistics(*args)
+
+    def spy_copy(extension: Any, name: str, output: Any, rows: int) -> None:
+        if name == "timestamp_ns":
+            series_dir = extension.directory
+            copied_rows[f"{series_dir.parent.parent.name}/{series_dir.parent.name}"] = rows
+        copy_rows(extension, name, output, rows)
+
+    monkeypatch.setattr(databento_cache, "_decode_ohlcv_archive", spy_ohlcv)
+    monkeypatch.setattr(databento_cache, "_decode_statistics_archive", spy_statistics)
+    monkeypatch.setattr(databento_cache._SeriesExtension, "copy_rows", spy_copy)
+    incremental = build_databento_cache(
+        [*archives, *drop],
+        cache_root=cache_root,
+        timeframes=("1m", "5m"),
+        max_workers=1,
+        incremental=True,
+    )
+    monkeypatch.undo()
+
+    assert decoded == ["mnq-ohlcv-0401.zip", "mnq-statistics-0401.zip"]
+    assert incremental.reused_archive_count == 4
+    # Every series keeps its rows up to the dropped session; MES keeps all.
+    assert copied_rows == {
+        "root=MES/timeframe=1m": 12,
+        "root=MES/timeframe=5m": 3,
+        "root=MNQ/timeframe=1m": 24,
+        "root=MNQ/timeframe=5m": 6,
+    }
+    previous_codes = json.loads(
+        (Path(first.version_dir) / "manifest.json").read_text()
+    )["raw_symbol_codes"]["MNQ"]
+    assert previous_codes == {"MNQM4@2024": 1}
+
+    scratch = build_databento_cache(
+        [*archives, *drop],
+        cache_root=tmp_path / "scratch",
+        timeframes=("1m", "5m"),
+        max_workers=1,
+    )
+
+    def manifest(result: Any) -> dict[str, Any]:
+        value = json.loads((Path(result.version_dir) / "manifest.json").read_text())
+        value.pop("built_at")
+        value.pop("version_dir")
+        value.pop("archives")
+        return value
+
+    assert manifest(incremental) == manifest(scratch)
+    assert manifest(scratch)["raw_symbol_codes"]["MNQ"] == {
+        "MNQH5@2025": 1,
+        "MNQM4@2024": 2,
+    }
+    scratch_files = sorted(
+        path.relative_to(scratch.version_dir)
+        for path in Path(scratch.version_dir).rglob("*.parquet")
+    )
+    assert scratch_files == sorted(
+        path.relative_to(incremental.version_dir)
+        for path in Path(incremental.version_dir).rglob("*.parquet")
+    )
+    for relative in scratch_files:
+        assert pq.read_table(Path(incremental.version_dir) / relative).equals(
+            pq.read_table(Path(scratch.version_dir) / relative)
+        ), relative
+    for entry in manifest(scratch)["series"].values():
+        series_files = sorted(
+            path.relative_to(scratch.version_dir)
+            for path in (Path(scratch.version_dir) / entry["path"]).rglob("*.npy")
+        )
+        assert len(series_files) == len(ARRAY_COLUMNS) + 7
+        for relative in series_files:
+            assert np.array_equal(
+                np.load(Path(incremental.version_dir) / relative),
+                np.load(Path(scratch.version_dir) / relative),
+            ), relative
+
+
+def test_parallel_decode_keeps_the_first_archive_day_resolution():
+    merged: dict[tuple[str, int], tuple[str, int] | None] = {}
+    day = date(2024, 6, 21).toordinal()
+
+    assert _merge_contract_codes(merged, {("MNQM4", day): ("MNQM4@2024", 1)})
+    assert _merge_contract_codes(merged, {("MNQM4", day): ("MNQM4@2024", 1)})
+    # A later archive that resolved the shared day after expiration must be
+    # decoded again from the earlier archive's resolution.
+    assert not _merge_contract_codes(merged, {("MNQM4", day): None})
+    assert merged == {("MNQM4", day): ("MNQM4@2024", 1)}
+
+
+def _spread_interleaved_archives(
+    directory: Path, *, bar_count: int, unordered_at: int | None = None
+) -> list[Path]:
+    directory.mkdir(parents=True, exist_ok=True)
+    # Bars cross the 18:00 New York session rollover and a month boundary.
+    start = datetime(2024, 3, 31, 20, 0, tzinfo=timezone.utc)
+    records = [
+        _ohlcv(
+            start + timedelta(minutes=index),
+            instrument_id=102 if index % 5 == 2 else 101,
+            index=index % 40,
+        )
+        for index in range(bar_count)
+    ]
+    if unordered_at is not None:
+        records[unordered_at] = _ohlcv(start, instrument_id=101, index=0)
+    intervals = {
+        "MNQM4": "101",
+        "MNQM4-MNQU4": "102",
+    }
+    definitions = _write_dbn_archive(
+        directory / "definition.zip",
+        root_symbol="MNQ",
+        schema_name="definition",
+        records=[_definition("MNQ")],
+    )
+    ohlcv = _write_dbn_archive(
+        directory / "ohlcv.zip",
+        root_symbol="MNQ",
+        schema_name="ohlcv-1m",
+        records=records,
+        mappings=[
+            SimpleNamespace(
+                raw_symbol=raw_symbol,
+                intervals=[
+                    SimpleNamespace(
+                        start_date=start.date(),
+                        end_date=start.date() + timedelta(days=3),
+                        symbol=symbol,
+                    )
+                ],
+            )
+            for raw_symbol, symbol in intervals.items()
+        ],
+    )
+    return [definitions, ohlcv]
+
+
+def _force_per_record_decode(monkeypatch: pytest.MonkeyPatch) -> None:
+    def unsupported(_source: Any, *, name: str) -> Any:
+        raise DbnLayoutUnsupportedError(f"unsupported_dbn_layout:{name}")
+
+    monkeypatch.setattr(databento_cache, "read_ohlcv_arrays", unsupported)
+
+
+def test_bulk_ohlcv_decode_matches_the_per_record_path(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    archives = _spread_interleaved_archives(tmp_path / "archives", bar_count=600)
+    monkeypatch.setattr(databento_cache, "PARQUET_BATCH_ROWS", 64)
+    bulk_entries: list[str] = []
+    read_ohlcv_arrays = databento_cache.read_ohlcv_arrays
+
+    def spy(source: Any, *, name: str) -> Any:
+        decoded = read_ohlcv_arrays(source, name=name)
+        bulk_entries.append(name)
+        return decoded
+
+    monkeypatch.setattr(databento_cache, "read_ohlcv_arrays", spy)
+    bulk = build_databento_cache(
+        archives, cache_root=tmp_path / "bulk", timeframes=("1m", "5m")
+    )
+    assert bulk_entries == ["tiny.ohlcv-1m.dbn.zst"]
+    _force_per_record_decode(monkeypatch)
+    per_record = build_databento_cache(
+        archives, cache_root=tmp_path / "per-record", timeframes=("1m", "5m")
+    )
+
+    def manifest(result: Any) -> dict[str, Any]:
+        value = json.loads((Path(result.version_dir) / "manifest.json").read_text())
+        value.pop("built_at")
+        value.pop("version_dir")
+        return value
+
+    assert manifest(bulk) == manifest(per_record)
+    assert manifest(bulk)["parquet_rows"]["ohlcv_1m"] == 480
+    files = sorted(
+        path.relative_to(per_record.version_dir)
+        for path in Path(per_record.version_dir).rglob("*.parquet")
+    )
+    assert files == sorted(
+        path.relative_to(bulk.version_dir)
+        for path in Path(bulk.version_dir).rglob("*.parquet")
+    )
+    for relative in files:
+        assert pq.read_table(Path(bulk.version_dir) / relative).equals(
+            pq.read_table(Path(per_record.version_dir) / relative)
+        ), relative
+
+
+def test_bulk_ohlcv_decode_reports_the_per_record_error(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    archives = _spread_interleaved_archives(
+        tmp_path / "archives", bar_count=50, unordered_at=30
+    )
+    with pytest.raises(DatabentoCacheError) as bulk:
+        build_databento_cache(archives, cache_root=tmp_path / "bulk", timeframes=("1m",))
+    _force_per_record_decode(monkeypatch)
+    with pytest.raises(DatabentoCacheError) as per_record:
+        build_databento_cache(
+            archives, cache_root=tmp_path / "per-record", timeframes=("1m",)
+        )
+
+    assert str(bulk.value) == str(per_record.value)
+    assert str(bulk.value).startswith("databento_rows_not_monotonic:")
+
+
+def test_hourly_session_ordinals_match_trading_day_across_dst():
+    start = datetime(2024, 3, 8, tzinfo=timezone.utc)
+    timestamps = [
+        start + timedelta(minutes=minute, seconds=second)
+        for minute in range(0, 4 * 24 * 60, 7)
+        for second in (0, 59)
+    ]
+
+    ordinals = session_ordinals(
+        np.array([_unix_nanos(value) for value in timestamps], dtype=np.int64)
+    )
+
+    assert ordinals.tolist() == [
+        trading_day_date(value).toordinal() for value in timestamps
+    ]
+
+
 def test_repeated_one_digit_delivery_symbols_keep_distinct_decade_identities():
     assert _contract_key(
         "ESZ1",
@@ -2,9 +2,13 @@ from __future__ import annotations
 
 import hashlib
 import json
+import multiprocessing
 import os
+import threading
+import time
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Iterable
 from zipfile import ZipFile
 
@@ -22,14 +26,28 @@ from databento_dbn import (
 )
 from sqlalchemy import create_engine, event, inspect
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm.attributes import set_committed_value
 
 os.environ.setdefault("DATABASE_URL", "sqlite+pysqlite:///:memory:")
 
+import app.main as main_module
+import app.services.bot_backtest_executor as executor_module
+import app.services.bot_backtest_jobs as jobs_module
+import app.services.bot_backtest_sweeps as sweeps_module
+import app.services.bot_backtest_walk_forward as walk_forward_module
 import app.services.bot_backtesting as backtesting_module
-from app.bot_schemas import BotBacktestIn
+import app.services.databento_ingestion as ingestion_module
+from app.bot_schemas import (
+    BotBacktestIn,
+    BotBacktestJobIn,
+    BotBacktestSweepIn,
+    BotBacktestWalkForwardIn,
+)
 from app.db import Base
 from app.models import (
     BotBacktest,
+    BotBacktestJob,
+    BotBacktestSweep,
     BotConfig,
     DatabentoImportBatch,
     DatabentoImportFile,
@@ -482,6 +500,72 @@ def test_local_cache_matches_relational_replay_for_the_same_dbn_sample(
         store.clear()
 
 
+@pytest.mark.parametrize("bulk", [True, False], ids=["bulk", "per-record"])
+def test_ohlcv_import_decodes_identically_in_bulk_and_per_record(
+    db_session,
+    tmp_path,
+    monkeypatch,
+    bulk,
+):
+    if not bulk:
+        def unsupported(_source, *, name):
+            raise ingestion_module.DbnLayoutUnsupportedError(f"unsupported_dbn_layout:{name}")
+
+        monkeypatch.setattr(ingestion_module, "read_ohlcv_arrays", unsupported)
+    definition_archive = _write_dbn_archive(
+        tmp_path / "definition.zip",
+        job_id="decode-definition",
+        schema_name="definition",
+        records=[
+            _definition(instrument_id=101, raw_symbol="MNQM4"),
+            _definition(
+                instrument_id=201,
+                raw_symbol="MNQM4-MNQU4",
+                instrument_class=InstrumentClass.FUTURE_SPREAD,
+            ),
+        ],
+    )
+    # The bars cross the 18:00 New York (23:00 UTC) session rollover.
+    first_bar = datetime(2024, 3, 4, 22, 45, tzinfo=timezone.utc)
+    ohlcv_archive = _write_dbn_archive(
+        tmp_path / "ohlcv.zip",
+        job_id="decode-ohlcv",
+        schema_name="ohlcv-1m",
+        records=[
+            _ohlcv(
+                first_bar + timedelta(minutes=index),
+                instrument_id=201 if index % 4 == 1 else 101,
+                price_nano=18_000_000_000_000 + index * 250_000_000,
+                volume=index + 1,
+            )
+            for index in range(40)
+        ],
+    )
+
+    results = import_databento_archives(
+        db_session,
+        [ohlcv_archive, definition_archive],
+        commit_batches=True,
+    )
+
+    assert [(result.records_read, result.records_inserted) for result in results] == [
+        (2, 2),
+        (40, 30),
+    ]
+    rows = (
+        db_session.query(DatabentoOhlcv1m)
+        .order_by(DatabentoOhlcv1m.ts_event)
+        .all()
+    )
+    assert {row.instrument_id for row in rows} == {101}
+    assert [row.volume for row in rows] == [
+        index + 1 for index in range(40) if index % 4 != 1
+    ]
+    assert {row.trading_date for row in rows} == {date(2024, 3, 4), date(2024, 3, 5)}
+    for row in rows:
+        assert row.trading_date == trading_day_date(row.ts_event)
+
+
 def test_generated_dbn_rejects_mnq_bars_before_the_exchange_launch(db_session, tmp_path):
     definition_archive = _write_dbn_archive(
         tmp_path / "definition.zip",
@@ -952,3 +1036,744 @@ def test_create_bot_backtest_uses_only_local_cache_and_persists_without_market_t
         session.close()
         Base.metadata.drop_all(bind=engine, tables=list(reversed(persistence_tables)))
         engine.dispose()
+
+
+@pytest.fixture()
+def oscillating_cache_session(tmp_path, monkeypatch):
+    source_start = datetime(2024, 3, 4, 13, 30, tzinfo=timezone.utc)
+    definition_archive = _write_dbn_archive(
+        tmp_path / "definition.zip",
+        job_id="sweep-definition",
+        schema_name="definition",
+        records=[_definition(instrument_id=101, raw_symbol="MNQM4")],
+    )
+    ohlcv_archive = _write_dbn_archive(
+        tmp_path / "ohlcv.zip",
+        job_id="sweep-ohlcv",
+        schema_name="ohlcv-1m",
+        records=[
+            _ohlcv(
+                source_start + timedelta(minutes=index),
+                price_nano=18_000_000_000_000
+                + abs((index % 60) - 30) * 1_000_000_000,
+                volume=10 + index,
+            )
+            for index in range(300)
+        ],
+    )
+    cache_root = tmp_path / "cache"
+    build_databento_cache(
+        [definition_archive, ohlcv_archive],
+        cache_root=cache_root,
+        timeframes=["5m"],
+    )
+    replay_store = DatabentoReplayStore(cache_root, build_missing_timeframes=False)
+    monkeypatch.setattr(backtesting_module, "get_default_databento_cache", lambda: replay_store)
+    monkeypatch.setattr(backtesting_module, "ALLOW_LEGACY_DATABENTO_SQLITE_FIXTURES", False)
+    # Identical replays in earlier tests must not satisfy this one from memory.
+    monkeypatch.setattr(
+        backtesting_module, "_BACKTEST_RESULT_CACHE", backtesting_module._BacktestResultLru()
+    )
+
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    tables = [
+        InstrumentMetadata.__table__,
+        BotConfig.__table__,
+        BotBacktest.__table__,
+        BotBacktestSweep.__table__,
+        BotBacktestJob.__table__,
+    ]
+    Base.metadata.create_all(bind=engine, tables=tables)
+    session = sessionmaker(bind=engine)()
+    session.add(InstrumentMetadata(symbol="MNQ", tick_size=0.25, tick_value=0.50))
+    config = BotConfig(
+        user_id=OWNER_ID,
+        account_id=9001,
+        name="Sweep replay",
+        provider="projectx",
+        enabled=False,
+        execution_mode="dry_run",
+        strategy_type="sma_cross",
+        strategy_params={},
+        contract_id=CONTRACT_ID,
+        symbol="MNQ",
+        timeframe_unit="minute",
+        timeframe_unit_number=5,
+        lookback_bars=25,
+        fast_period=1,
+        slow_period=2,
+        order_size=1,
+        max_contracts=10,
+        max_daily_loss=100_000,
+        max_trades_per_day=100,
+        max_open_position=10,
+        allowed_contracts=[CONTRACT_ID],
+        trading_start_time="00:00",
+        trading_end_time="23:59",
+        cooldown_seconds=0,
+        max_data_staleness_seconds=3_600,
+        allow_market_depth=False,
+    )
+    session.add(config)
+    session.commit()
+    try:
+        yield session, config, source_start + timedelta(hours=6)
+    finally:
+        replay_store.clear()
+        session.close()
+        Base.metadata.drop_all(bind=engine, tables=list(reversed(tables)))
+        engine.dispose()
+
+
+def test_backtest_sweep_ranks_combinations_exactly_like_single_runs(
+    oscillating_cache_session,
+):
+    session, config, captured_now = oscillating_cache_session
+    payload = BotBacktestSweepIn(
+        commission_per_contract=0.5,
+        fast_periods=[1, 2, 3],
+        slow_periods=[2, 4, 6],
+        rank_by="net_pnl",
+    )
+    streamed: list[dict] = []
+
+    sweep = sweeps_module.create_bot_backtest_sweep(
+        session,
+        user_id=OWNER_ID,
+        bot_config_id=int(config.id),
+        payload=payload,
+        now=captured_now,
+        max_workers=1,
+        combination_callback=streamed.append,
+    )
+    session.commit()
+
+    # 3 x 3 periods minus the two pairs with slow <= fast.
+    assert sweep.combination_count == 7
+    assert sweep.failed_count == 0
+    assert len(streamed) == 7
+    assert session.query(BotBacktest).count() == 0
+    results = sweeps_module.serialize_bot_backtest_sweep(sweep)["results"]
+    assert [result["rank"] for result in results] == list(range(1, 8))
+    net = [result["metrics"]["net_pnl"] for result in results]
+    assert net == sorted(net, reverse=True)
+
+    assert any(result["metrics"]["trade_count"] > 0 for result in results)
+    for result in results:
+        config.fast_period = result["fast_period"]
+        config.slow_period = result["slow_period"]
+        single = backtesting_module.create_bot_backtest(
+            session,
+            user_id=OWNER_ID,
+            bot_config_id=int(config.id),
+            payload=BotBacktestIn(commission_per_contract=0.5),
+            now=captured_now,
+        )
+        assert result["input_fingerprint"] == single.input_fingerprint
+        assert result["metrics"] == {
+            key: single.result_snapshot["metrics"][key] for key in result["metrics"]
+        }
+    session.rollback()
+
+
+def test_backtest_sweep_process_pool_matches_in_process_replay(
+    oscillating_cache_session,
+):
+    session, config, captured_now = oscillating_cache_session
+    payload = BotBacktestSweepIn(
+        fast_periods=[1, 2],
+        slow_periods=[3, 5],
+        rank_by="max_drawdown_dollars",
+    )
+
+    inline = sweeps_module.create_bot_backtest_sweep(
+        session,
+        user_id=OWNER_ID,
+        bot_config_id=int(config.id),
+        payload=payload,
+        now=captured_now,
+        max_workers=1,
+    )
+    pooled = sweeps_module.create_bot_backtest_sweep(
+        session,
+        user_id=OWNER_ID,
+        bot_config_id=int(config.id),
+        payload=payload,
+        now=captured_now,
+        max_workers=2,
+    )
+
+    assert pooled.ranked_results == inline.ranked_results
+    assert pooled.assumptions_snapshot == inline.assumptions_snapshot
+    drawdowns = [
+        result["metrics"]["max_drawdown_dollars"] for result in pooled.ranked_results
+    ]
+    assert drawdowns == sorted(drawdowns)
+
+
+def test_superseded_sweep_returns_only_after_its_pooled_replays_stop():
+    superseded = threading.Event()
+
+    class SlowToStopPool:
+        def __init__(self):
+            self.lock = threading.Lock()
+            self.running = 0
+            self.most_running = 0
+
+        def run(self, function, task, *, progress_callback=None, cancellation_callback=None):
+            with self.lock:
+                self.running += 1
+                self.most_running = max(self.most_running, self.running)
+            try:
+                while not cancellation_callback():
+                    time.sleep(0.01)
+                # A worker only notices the cancel at its next check.
+                time.sleep(0.2)
+                raise backtesting_module.BacktestSupersededError("backtest_superseded_by_newer_run")
+            finally:
+                with self.lock:
+                    self.running -= 1
+
+    pool = SlowToStopPool()
+    timer = threading.Timer(0.1, superseded.set)
+    timer.start()
+    try:
+        with pytest.raises(backtesting_module.BacktestSupersededError):
+            sweeps_module._run_sweep_tasks(
+                None,
+                tasks=[object()] * 5,
+                replay_store=object(),
+                max_workers=2,
+                progress_callback=None,
+                combination_callback=None,
+                cancellation_callback=superseded.is_set,
+                process_pool=pool,
+            )
+    finally:
+        timer.cancel()
+
+    # The caller releases the sweep's capacity next, so nothing may still run.
+    assert pool.running == 0
+    assert pool.most_running == 2
+
+
+def test_backtest_sweep_rejects_unknown_params_and_oversized_grids(
+    oscillating_cache_session,
+    monkeypatch,
+):
+    session, config, captured_now = oscillating_cache_session
+
+    with pytest.raises(backtesting_module.BacktestConfigurationError, match="unknown_backtest_sweep"):
+        sweeps_module.create_bot_backtest_sweep(
+            session,
+            user_id=OWNER_ID,
+            bot_config_id=int(config.id),
+            payload=BotBacktestSweepIn(strategy_param_grid={"atr_period": [7, 14]}),
+            now=captured_now,
+        )
+    monkeypatch.setattr(sweeps_module, "BACKTEST_SWEEP_MAX_COMBINATIONS", 3)
+    with pytest.raises(backtesting_module.BacktestConfigurationError, match="too_many_combinations"):
+        sweeps_module.create_bot_backtest_sweep(
+            session,
+            user_id=OWNER_ID,
+            bot_config_id=int(config.id),
+            payload=BotBacktestSweepIn(fast_periods=[1, 2], slow_periods=[3, 4]),
+            now=captured_now,
+        )
+    assert session.query(BotBacktestSweep).count() == 0
+
+
+def test_walk_forward_replays_in_sample_winners_and_stitches_out_of_sample_equity(
+    oscillating_cache_session,
+):
+    session, config, captured_now = oscillating_cache_session
+    payload = BotBacktestWalkForwardIn(
+        commission_per_contract=0.5,
+        fast_periods=[1, 2],
+        slow_periods=[3, 5],
+        rank_by="net_pnl",
+        in_sample_bars=16,
+        out_of_sample_bars=8,
+    )
+    streamed_folds: list[dict] = []
+
+    row = walk_forward_module.create_bot_backtest_walk_forward(
+        session,
+        user_id=OWNER_ID,
+        bot_config_id=int(config.id),
+        payload=payload,
+        now=captured_now,
+        max_workers=2,
+        fold_callback=streamed_folds.append,
+    )
+    session.commit()
+
+    result = backtesting_module.serialize_bot_backtest(row)
+    folds = result["walk_forward"]["folds"]
+    assert len(folds) >= 2
+    assert streamed_folds == folds
+    assert all(fold["error"] is None for fold in folds)
+    for previous, current in zip(folds, folds[1:]):
+        assert previous["out_of_sample"]["end"] <= current["out_of_sample"]["start"]
+    assert result["range"]["start"] == folds[0]["out_of_sample"]["start"]
+    assert result["range"]["bar_count"] == sum(
+        fold["out_of_sample"]["bar_count"] for fold in folds
+    )
+    assert [trade["id"] for trade in result["trades"]] == list(
+        range(1, len(result["trades"]) + 1)
+    )
+
+    fold_net = 0.0
+    for fold in folds:
+        selected = fold["selected"]
+        assert selected["rank"] == 1
+        in_sample = sweeps_module.create_bot_backtest_sweep(
+            session,
+            user_id=OWNER_ID,
+            bot_config_id=int(config.id),
+            payload=BotBacktestSweepIn(
+                commission_per_contract=0.5,
+                start=fold["in_sample"]["start"],
+                end=fold["in_sample"]["end"],
+                fast_periods=[1, 2],
+                slow_periods=[3, 5],
+                rank_by="net_pnl",
+            ),
+            now=captured_now,
+            max_workers=1,
+        )
+        assert in_sample.ranked_results[0] == selected
+
+        config.fast_period = selected["fast_period"]
+        config.slow_period = selected["slow_period"]
+        single = backtesting_module.create_bot_backtest(
+            session,
+            user_id=OWNER_ID,
+            bot_config_id=int(config.id),
+            payload=BotBacktestIn(
+                commission_per_contract=0.5,
+                start=fold["out_of_sample"]["start"],
+                end=fold["out_of_sample"]["end"],
+                force_close_at_end=True,
+            ),
+            now=captured_now,
+        )
+        assert fold["out_of_sample_metrics"] == {
+            key: single.result_snapshot["metrics"][key]
+            for key in fold["out_of_sample_metrics"]
+        }
+        fold_net += single.result_snapshot["metrics"]["net_pnl"]
+    session.rollback()
+
+    starting_balance = float(payload.starting_balance)
+    assert result["trades"]
+    assert result["metrics"]["net_pnl"] == pytest.approx(fold_net)
+    assert result["equity_curve"][-1]["equity"] == pytest.approx(
+        starting_balance + result["metrics"]["net_pnl"]
+    )
+    peak = starting_balance
+    for point in result["drawdown_series"]:
+        peak = max(peak, point["equity"])
+        assert point["drawdown_dollars"] == pytest.approx(peak - point["equity"])
+    assert result["metrics"]["max_drawdown_dollars"] >= max(
+        point["drawdown_dollars"] for point in result["drawdown_series"]
+    )
+
+
+def test_walk_forward_stitched_drawdown_percent_uses_the_stitched_peak():
+    def fold(equities: list[float], *, drawdown_dollars: float, drawdown_percent: float) -> dict:
+        return {
+            "trades": [],
+            "equity_curve": [
+                {
+                    "timestamp": f"2024-03-0{index + 1}T00:00:00+00:00",
+                    "equity": equity,
+                    "realized_pnl": equity - 1_000.0,
+                }
+                for index, equity in enumerate(equities)
+            ],
+            "metrics": {
+                "max_drawdown_dollars": drawdown_dollars,
+                "max_drawdown_percent": drawdown_percent,
+                "exposure_percent": 0.0,
+            },
+            "range": {"start": "2024-03-01", "end": "2024-03-03", "bar_count": len(equities)},
+            "warnings": [],
+            "config_snapshot": {},
+            "assumptions": {},
+        }
+
+    stitched = walk_forward_module._stitch_out_of_sample_results(
+        [
+            fold([1_000.0, 2_000.0], drawdown_dollars=0.0, drawdown_percent=0.0),
+            # 100 below a 1,100 fold peak, but the stitched peak is 2,100.
+            fold([1_100.0, 1_000.0], drawdown_dollars=100.0, drawdown_percent=100 / 1_100 * 100),
+        ],
+        starting_balance=1_000.0,
+    )
+
+    assert stitched["metrics"]["max_drawdown_dollars"] == pytest.approx(100.0)
+    assert stitched["metrics"]["max_drawdown_percent"] == pytest.approx(100 / 2_100 * 100)
+
+
+def test_walk_forward_rejects_windows_shorter_than_one_fold(oscillating_cache_session):
+    session, config, captured_now = oscillating_cache_session
+
+    with pytest.raises(backtesting_module.InsufficientBacktestDataError, match="walk-forward"):
+        walk_forward_module.create_bot_backtest_walk_forward(
+            session,
+            user_id=OWNER_ID,
+            bot_config_id=int(config.id),
+            payload=BotBacktestWalkForwardIn(in_sample_bars=5_000, out_of_sample_bars=10),
+            now=captured_now,
+            max_workers=1,
+        )
+    assert session.query(BotBacktest).count() == 0
+
+
+def test_backtest_process_pool_replays_in_warm_worker_and_relays_errors(
+    oscillating_cache_session,
+    tmp_path,
+    monkeypatch,
+):
+    session, config, _captured_now = oscillating_cache_session
+    database_url = f"sqlite+pysqlite:///{tmp_path / 'worker.sqlite'}"
+    assert executor_module.worker_processes_share_database(database_url)
+    assert not executor_module.worker_processes_share_database("sqlite+pysqlite:///:memory:")
+    worker_engine = create_engine(database_url)
+    tables = [InstrumentMetadata.__table__, BotConfig.__table__, BotBacktest.__table__]
+    Base.metadata.create_all(bind=worker_engine, tables=tables)
+    worker_session = sessionmaker(bind=worker_engine)()
+    worker_session.add(InstrumentMetadata(symbol="MNQ", tick_size=0.25, tick_value=0.50))
+    worker_session.add(
+        BotConfig(**{column.name: getattr(config, column.name) for column in BotConfig.__table__.columns})
+    )
+    worker_session.commit()
+    # Spawned workers read both locations from their inherited environment.
+    monkeypatch.setenv("DATABASE_URL", database_url)
+    monkeypatch.setenv("TOPSIGNAL_DATABENTO_CACHE_DIR", str(tmp_path / "cache"))
+    payload = BotBacktestIn(commission_per_contract=0.5)
+    pool = executor_module.BacktestProcessPool(1)
+    progress: list[dict] = []
+    try:
+        pool.start()
+        with pytest.raises(LookupError, match="bot_config_not_found"):
+            pool.run(
+                executor_module.run_bot_backtest_job,
+                executor_module.BotBacktestReplayRequest(
+                    user_id=OWNER_ID,
+                    bot_config_id=int(config.id) + 1,
+                    payload=payload,
+                ),
+            )
+        values = pool.run(
+            executor_module.run_bot_backtest_job,
+            executor_module.BotBacktestReplayRequest(
+                user_id=OWNER_ID,
+                bot_config_id=int(config.id),
+                payload=payload,
+            ),
+            progress_callback=progress.append,
+            cancellation_callback=lambda: False,
+        )
+    finally:
+        pool.shutdown()
+
+    # The worker never commits; the parent decides whether the row is kept.
+    assert worker_session.query(BotBacktest).count() == 0
+    persisted = executor_module.add_replayed_bot_backtest(session, values)
+    inline = backtesting_module.create_bot_backtest(
+        session,
+        user_id=OWNER_ID,
+        bot_config_id=int(config.id),
+        payload=payload,
+    )
+    session.rollback()
+    assert progress and progress[-1]["completed"] == progress[-1]["total"]
+    assert persisted.input_fingerprint == inline.input_fingerprint
+    assert persisted.result_snapshot["metrics"] == inline.result_snapshot["metrics"]
+    worker_session.close()
+    Base.metadata.drop_all(bind=worker_engine, tables=list(reversed(tables)))
+    worker_engine.dispose()
+
+
+def test_worker_cancellation_reads_the_pipe_before_commit_despite_the_throttle():
+    parent, child = multiprocessing.Pipe(duplex=True)
+    try:
+        is_cancelled = executor_module._WorkerCancellation(child, 7)
+        assert not is_cancelled()
+        parent.send(("cancel", 7))
+        assert not is_cancelled()
+        assert is_cancelled.check_now()
+        assert is_cancelled()
+    finally:
+        parent.close()
+        child.close()
+
+
+def test_pool_backtest_superseded_after_the_worker_finished_is_not_persisted(
+    oscillating_cache_session,
+    monkeypatch,
+):
+    session, config, _captured_now = oscillating_cache_session
+    lease = main_module._BacktestCapacityLease(OWNER_ID)
+    replayed = backtesting_module.create_bot_backtest(
+        session,
+        user_id=OWNER_ID,
+        bot_config_id=int(config.id),
+        payload=BotBacktestIn(),
+    )
+    values = {
+        column.key: getattr(replayed, column.key)
+        for column in BotBacktest.__table__.columns
+        if column.key not in {"id", "created_at"}
+    }
+    session.rollback()
+
+    class SupersededDuringRun:
+        def run(self, function, argument, *, progress_callback=None, cancellation_callback=None):
+            # A newer Run arrives after the worker's last cancellation check.
+            lease.cancel()
+            return dict(values)
+
+    monkeypatch.setattr(main_module, "_backtest_process_pool", lambda: SupersededDuringRun())
+    monkeypatch.setattr(main_module, "legacy_projectx_backtest_fixtures_enabled", lambda _db: False)
+
+    with pytest.raises(backtesting_module.BacktestSupersededError):
+        main_module._run_bot_backtest(
+            session,
+            user_id=OWNER_ID,
+            bot_config_id=int(config.id),
+            payload=BotBacktestIn(),
+            capacity_lease=lease,
+        )
+    assert session.query(BotBacktest).count() == 0
+
+    current = main_module._BacktestCapacityLease(OWNER_ID)
+    monkeypatch.setattr(
+        main_module,
+        "_backtest_process_pool",
+        lambda: SimpleNamespace(run=lambda *_args, **_kwargs: dict(values)),
+    )
+    row = main_module._run_bot_backtest(
+        session,
+        user_id=OWNER_ID,
+        bot_config_id=int(config.id),
+        payload=BotBacktestIn(),
+        capacity_lease=current,
+    )
+    assert session.query(BotBacktest).one() is row
+    assert row.input_fingerprint == values["input_fingerprint"]
+    session.rollback()
+
+
+def test_queued_backtest_jobs_checkpoint_progress_and_serve_results_later(
+    oscillating_cache_session,
+    monkeypatch,
+):
+    session, config, _captured_now = oscillating_cache_session
+    monkeypatch.setattr(main_module, "SessionLocal", sessionmaker(bind=session.get_bind()))
+    monkeypatch.setattr(main_module, "get_authenticated_user_id", lambda: OWNER_ID)
+    monkeypatch.setenv("TOPSIGNAL_BACKTEST_EXECUTOR", "thread")
+    monkeypatch.setattr(jobs_module, "BACKTEST_JOB_CHECKPOINT_SECONDS", 0.0)
+
+    sweep_job = main_module.submit_trading_bot_backtest_job(
+        int(config.id),
+        BotBacktestJobIn(kind="sweep", request={"fast_periods": [1, 2], "slow_periods": [3]}),
+        db=session,
+    )
+    backtest_job = main_module.submit_trading_bot_backtest_job(
+        int(config.id),
+        BotBacktestJobIn(kind="backtest", request={"commission_per_contract": 0.5}),
+        db=session,
+    )
+    cancelled_job = main_module.submit_trading_bot_backtest_job(
+        int(config.id),
+        BotBacktestJobIn(kind="backtest"),
+        db=session,
+    )
+    assert sweep_job["status"] == "queued"
+    cancelled = main_module.cancel_trading_bot_backtest_job(int(config.id), cancelled_job["id"], db=session)
+    assert cancelled["status"] == "cancelled"
+    with pytest.raises(main_module.HTTPException) as not_finished:
+        main_module.get_trading_bot_backtest_job_result(int(config.id), sweep_job["id"], db=session)
+    assert not_finished.value.status_code == 409
+
+    # One user holds one capacity slot at a time, so jobs drain in order.
+    for expected_id in (sweep_job["id"], backtest_job["id"]):
+        claimed = main_module._claim_next_backtest_job()
+        assert claimed is not None and claimed[0] == expected_id
+        assert main_module._claim_next_backtest_job() is None
+        main_module._run_backtest_job(*claimed)
+    assert main_module._claim_next_backtest_job() is None
+    assert main_module._backtest_active_by_user.get(OWNER_ID) is None
+    session.expire_all()
+
+    finished_sweep = main_module.get_trading_bot_backtest_job(int(config.id), sweep_job["id"], db=session)
+    assert finished_sweep["status"] == "succeeded"
+    assert finished_sweep["attempt_count"] == 1
+    assert finished_sweep["progress"]["phase"] == "finalizing"
+    assert finished_sweep["progress"]["percent"] == 100
+    sweep_result = main_module.get_trading_bot_backtest_job_result(int(config.id), sweep_job["id"], db=session)
+    assert sweep_result["id"] == finished_sweep["bot_backtest_sweep_id"]
+    assert sweep_result["combination_count"] == 2
+
+    finished_backtest = main_module.get_trading_bot_backtest_job(int(config.id), backtest_job["id"], db=session)
+    assert finished_backtest["status"] == "succeeded"
+    backtest_result = main_module.get_trading_bot_backtest_job_result(
+        int(config.id), backtest_job["id"], db=session
+    )
+    single = backtesting_module.create_bot_backtest(
+        session,
+        user_id=OWNER_ID,
+        bot_config_id=int(config.id),
+        payload=BotBacktestIn(commission_per_contract=0.5),
+    )
+    assert backtest_result["input_fingerprint"] == single.input_fingerprint
+    assert backtest_result["metrics"] == single.result_snapshot["metrics"]
+    session.rollback()
+
+
+def test_stale_running_backtest_jobs_are_requeued_then_failed(oscillating_cache_session):
+    session, config, _captured_now = oscillating_cache_session
+    row = jobs_module.submit_bot_backtest_job(
+        session,
+        user_id=OWNER_ID,
+        bot_config_id=int(config.id),
+        kind="backtest",
+        request_payload=BotBacktestJobIn().request,
+    )
+    session.commit()
+    started = datetime(2026, 10, 17, 12, 0, tzinfo=timezone.utc)
+    later = started + timedelta(seconds=jobs_module.BACKTEST_JOB_STALE_SECONDS + 1)
+
+    for attempt in range(1, jobs_module.BACKTEST_JOB_MAX_ATTEMPTS + 1):
+        assert jobs_module.claim_bot_backtest_job(session, int(row.id), now=started)
+        assert not jobs_module.claim_bot_backtest_job(session, int(row.id), now=started)
+        assert jobs_module.heartbeat_bot_backtest_jobs(session, [int(row.id)], now=started) == set()
+        assert jobs_module.requeue_stale_bot_backtest_jobs(session, now=started) == 0
+        assert jobs_module.requeue_stale_bot_backtest_jobs(session, now=later) == 1
+        session.refresh(row)
+        assert row.attempt_count == attempt
+    assert row.status == "failed"
+    assert row.error_detail == "backtest_job_interrupted"
+
+
+def test_a_stale_attempt_cannot_complete_a_job_its_replacement_owns(oscillating_cache_session):
+    session, config, _captured_now = oscillating_cache_session
+    row = jobs_module.submit_bot_backtest_job(
+        session,
+        user_id=OWNER_ID,
+        bot_config_id=int(config.id),
+        kind="backtest",
+        request_payload=BotBacktestJobIn().request,
+    )
+    session.commit()
+    started = datetime(2026, 10, 17, 12, 0, tzinfo=timezone.utc)
+    later = started + timedelta(seconds=jobs_module.BACKTEST_JOB_STALE_SECONDS + 1)
+    assert jobs_module.claim_bot_backtest_job(session, int(row.id), now=started)
+    assert jobs_module.requeue_stale_bot_backtest_jobs(session, now=later) == 1
+    assert jobs_module.claim_bot_backtest_job(session, int(row.id), now=later)
+
+    # The first attempt was still replaying; its row is rolled back.
+    assert not jobs_module.complete_bot_backtest_job(session, int(row.id), attempt_count=1)
+    jobs_module.finish_bot_backtest_job(
+        session, int(row.id), status="failed", attempt_count=1, error_status=500
+    )
+    session.refresh(row)
+    assert row.status == "running"
+
+    assert jobs_module.complete_bot_backtest_job(session, int(row.id), attempt_count=2)
+    session.commit()
+    session.refresh(row)
+    assert row.status == "succeeded"
+
+
+def test_cancelling_a_job_the_scheduler_just_claimed_requests_a_stop(oscillating_cache_session):
+    session, config, _captured_now = oscillating_cache_session
+    row = jobs_module.submit_bot_backtest_job(
+        session,
+        user_id=OWNER_ID,
+        bot_config_id=int(config.id),
+        kind="backtest",
+        request_payload=BotBacktestJobIn().request,
+    )
+    session.commit()
+    started = datetime(2026, 10, 17, 12, 0, tzinfo=timezone.utc)
+    assert jobs_module.claim_bot_backtest_job(session, int(row.id), now=started)
+    # The cancel route loaded the row before the scheduler's claim committed.
+    set_committed_value(row, "status", "queued")
+
+    jobs_module.request_bot_backtest_job_cancellation(session, row, now=started)
+    session.commit()
+    session.refresh(row)
+
+    assert row.status == "running"
+    assert row.finished_at is None
+    assert row.cancel_requested_at is not None
+
+
+def test_backtest_results_are_reused_from_the_shared_disk_cache(
+    oscillating_cache_session,
+    tmp_path,
+    monkeypatch,
+):
+    session, config, captured_now = oscillating_cache_session
+    payload = BotBacktestIn(commission_per_contract=0.5)
+    computed = backtesting_module.create_bot_backtest(
+        session,
+        user_id=OWNER_ID,
+        bot_config_id=int(config.id),
+        payload=payload,
+        now=captured_now,
+    )
+    stored = list((tmp_path / "cache" / "backtest-results").rglob("*.json.zst"))
+    assert len(stored) == 1
+
+    # A fresh process has an empty in-memory LRU but shares the cache root.
+    monkeypatch.setattr(backtesting_module, "_BACKTEST_RESULT_CACHE", backtesting_module._BacktestResultLru())
+    monkeypatch.setattr(
+        backtesting_module,
+        "run_backtest",
+        lambda **_kwargs: pytest.fail("disk cache hit must not replay"),
+    )
+    progress: list[dict] = []
+    reused = backtesting_module.create_bot_backtest(
+        session,
+        user_id=OWNER_ID,
+        bot_config_id=int(config.id),
+        payload=payload,
+        now=captured_now,
+        progress_callback=progress.append,
+    )
+    assert reused.result_snapshot == computed.result_snapshot
+    assert reused.input_fingerprint == computed.input_fingerprint
+    assert any(event.get("cache_hit") for event in progress)
+
+    # A torn entry is a miss and is removed rather than raised.
+    stored[0].write_bytes(b"not zstd")
+    monkeypatch.setattr(backtesting_module, "_BACKTEST_RESULT_CACHE", backtesting_module._BacktestResultLru())
+    assert backtesting_module._BACKTEST_RESULT_DISK_CACHE.get(tmp_path / "cache", stored[0].name[:64]) is None
+    assert not stored[0].exists()
+    session.rollback()
+
+
+def test_backtest_result_disk_cache_evicts_least_recently_used_entries(tmp_path):
+    cache = backtesting_module._BacktestResultDiskCache()
+    result = {"metrics": {"net_pnl": 1.0}, "trades": [{"id": index} for index in range(50)]}
+    keys = [hashlib.sha256(str(index).encode()).hexdigest() for index in range(3)]
+    cache.put(tmp_path, keys[0], result)
+    entry_size = cache.path_for(tmp_path, keys[0]).stat().st_size
+    cache.max_bytes = entry_size * 2
+
+    cache.put(tmp_path, keys[1], result)
+    os.utime(cache.path_for(tmp_path, keys[0]), (1, 1))
+    os.utime(cache.path_for(tmp_path, keys[1]), (2, 2))
+    assert cache.get(tmp_path, keys[0]) == result
+    cache.put(tmp_path, keys[2], result)
+
+    assert cache.path_for(tmp_path, keys[0]).exists()
+    assert not cache.path_for(tmp_path, keys[1]).exists()
+    assert cache.get(tmp_path, keys[2]) == result
+    assert not list(tmp_path.rglob("*.tmp"))
+
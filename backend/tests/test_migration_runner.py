@@ -72,7 +72,10 @@ def test_fresh_schema_contains_current_bot_safety_contract():
         "archived_at timestamptz",
         "accounts_archived_not_main_check",
         "'submission_unknown'",
-        "schema-20260729-v5",
+        "schema-20261019-v8",
+        "result_columns bytea",
+        "create table if not exists bot_backtest_jobs",
+        "create table if not exists bot_backtest_sweeps",
         "create table if not exists trade_import_batches",
         "create table if not exists trade_import_previews",
         "create table if not exists expense_suppressions",
@@ -98,13 +101,57 @@ def test_migration_checksums_are_sha256_hex():
     int(checksum, 16)
 
 
-def test_latest_migration_adds_expense_suppressions():
+def test_latest_migration_adds_bot_backtest_result_columns():
     assert (
         migrate_db._migration_files()[-1].name
-        == "20260729_add_expense_suppressions.sql"
+        == "20261019_add_bot_backtest_result_columns.sql"
     )
 
 
+def test_bot_backtest_result_columns_migration_is_additive():
+    migration = (
+        migrate_db.REPO_ROOT
+        / "db"
+        / "migrations"
+        / "20261019_add_bot_backtest_result_columns.sql"
+    ).read_text(encoding="utf-8").lower()
+
+    assert "add column if not exists result_columns bytea" in migration
+    assert "not null" not in migration
+    assert "drop " not in migration
+    assert "update " not in migration
+
+
+def test_bot_backtest_jobs_migration_is_user_scoped_and_non_destructive():
+    migration = (
+        migrate_db.REPO_ROOT
+        / "db"
+        / "migrations"
+        / "20261018_add_bot_backtest_jobs.sql"
+    ).read_text(encoding="utf-8").lower()
+
+    assert "user_id uuid not null" in migration
+    assert "status in ('queued','running','succeeded','failed','cancelled')" in migration
+    assert "references bot_backtest_sweeps(id) on delete set null" in migration
+    assert "drop table" not in migration
+    assert "delete from" not in migration
+
+
+def test_bot_backtest_sweeps_migration_is_user_scoped_and_non_destructive():
+    migration = (
+        migrate_db.REPO_ROOT
+        / "db"
+        / "migrations"
+        / "20261017_add_bot_backtest_sweeps.sql"
+    ).read_text(encoding="utf-8").lower()
+
+    assert "user_id uuid not null" in migration
+    assert "references bot_configs(id) on delete set null" in migration
+    assert "ranked_results jsonb not null" in migration
+    assert "drop table" not in migration
+    assert "delete from" not in migration
+
+
 def test_expense_suppressions_migration_is_user_scoped_and_non_destructive():
     migration = (
         migrate_db.REPO_ROOT
@@ -0,0 +1,117 @@
+import asyncio
+import threading
+
+from app.services.projectx_account_refresher import (
+    REFRESH_IN_FLIGHT,
+    REFRESH_SCHEDULED,
+    REFRESH_THROTTLED,
+    ProjectXAccountRefresher,
+)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_refresher_is_single_flight_and_waits_out_the_jittered_interval():
+    clock = _Clock()
+    release = threading.Event()
+    calls: list[str] = []
+
+    def refresh(user_id):
+        calls.append(user_id)
+        assert release.wait(timeout=5)
+        return {"event": "accounts_refreshed", "data": {"changed_account_ids": []}}
+
+    refresher = ProjectXAccountRefresher(
+        refresh,
+        min_interval_seconds=30,
+        jitter_seconds=10,
+        clock=clock,
+        jitter=lambda: 0.5,
+    )
+
+    assert refresher.request_refresh("user-a") == REFRESH_SCHEDULED
+    assert refresher.request_refresh("user-a") == REFRESH_IN_FLIGHT
+    assert refresher.request_refresh("user-b") == REFRESH_SCHEDULED
+    release.set()
+    assert refresher.wait_idle("user-a", timeout=5)
+    assert refresher.wait_idle("user-b", timeout=5)
+
+    clock.now += 34.9
+    assert refresher.request_refresh("user-a") == REFRESH_THROTTLED
+    clock.now += 0.1
+    assert refresher.request_refresh("user-a") == REFRESH_SCHEDULED
+    assert refresher.wait_idle("user-a", timeout=5)
+    assert sorted(calls) == ["user-a", "user-a", "user-b"]
+
+
+def test_refresher_publishes_results_and_failures_to_the_users_subscribers():
+    outcomes = iter(
+        [
+            {"event": "accounts_refreshed", "data": {"changed_account_ids": [7001]}},
+            RuntimeError("database unavailable"),
+        ]
+    )
+
+    def refresh(_user_id):
+        outcome = next(outcomes)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    refresher = ProjectXAccountRefresher(refresh, min_interval_seconds=0, jitter_seconds=0)
+
+    async def scenario():
+        mine = refresher.subscribe("user-a")
+        other = refresher.subscribe("user-b")
+        try:
+            assert refresher.request_refresh("user-a") == REFRESH_SCHEDULED
+            first = await asyncio.wait_for(mine.queue.get(), timeout=5)
+            assert refresher.request_refresh("user-a") == REFRESH_SCHEDULED
+            second = await asyncio.wait_for(mine.queue.get(), timeout=5)
+            return first, second, other.queue.empty()
+        finally:
+            mine.close()
+            other.close()
+
+    first, second, other_is_empty = asyncio.run(scenario())
+
+    assert first == {"event": "accounts_refreshed", "data": {"changed_account_ids": [7001]}}
+    assert second["event"] == "accounts_refresh_failed"
+    assert other_is_empty
+
+
+def test_refresher_forgets_users_once_their_throttle_expires_without_subscribers():
+    clock = _Clock()
+    refresher = ProjectXAccountRefresher(
+        lambda _user_id: {"event": "accounts_refreshed", "data": {"changed_account_ids": []}},
+        min_interval_seconds=30,
+        jitter_seconds=0,
+        clock=clock,
+    )
+
+    assert refresher.request_refresh("user-a") == REFRESH_SCHEDULED
+    assert refresher.wait_idle("user-a", timeout=5)
+    # Still throttling, so the state is kept.
+    assert set(refresher._users) == {"user-a"}
+
+    clock.now += 30
+    assert refresher.request_refresh("user-b") == REFRESH_SCHEDULED
+    assert refresher.wait_idle("user-b", timeout=5)
+    assert set(refresher._users) == {"user-b"}
+
+    immediate = ProjectXAccountRefresher(
+        lambda _user_id: {"event": "accounts_refreshed", "data": {"changed_account_ids": []}},
+        min_interval_seconds=0,
+        jitter_seconds=0,
+    )
+    assert immediate.request_refresh("user-a") == REFRESH_SCHEDULED
+    assert immediate.wait_idle("user-a", timeout=5)
+    # ``idle`` is set under the lock that the pruning also holds.
+    with immediate._lock:
+        assert immediate._users == {}
@@ -1,10 +1,13 @@
 import io
 import logging
 import os
+import threading
 from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
 
+import pyarrow as pa
 import pytest
-from fastapi import HTTPException, UploadFile
+from fastapi import HTTPException, Response, UploadFile
 from sqlalchemy import create_engine
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import sessionmaker
@@ -24,20 +27,23 @@ from app.main import (
     list_projectx_account_trades,
     list_projectx_accounts,
     preview_topstep_trade_import,
+    refresh_all_projectx_account_trades,
     refresh_projectx_account_trades,
     rename_projectx_account,
     set_projectx_main_account,
     unarchive_topstep_live_account,
     update_projectx_account_trade_data_source,
 )
-from app.models import Account, ProjectXTradeEvent, ProviderCredential
+from app.models import DEFAULT_USER_ID, Account, ProjectXTradeEvent, ProviderCredential
 from app.projectx_schemas import (
     ProjectXAccountArchiveIn,
     ProjectXAccountRenameIn,
     ProjectXAccountTradeDataSourceIn,
     TopstepLiveAccountCreateIn,
 )
+from app.services.projectx_account_refresher import ProjectXAccountRefresher
 from app.services.projectx_accounts import LOCAL_LIVE_ACCOUNT_ID_MIN
+from app.services.projectx_client import ProjectXClientError
 
 
 @pytest.fixture()
@@ -531,6 +537,17 @@ def test_mixed_accounts_keep_normal_live_routes_entirely_local(db_session, monke
     assert len(trades) == 1
     assert summary["trade_count"] == 1
     assert len(calendar_rows) == 1
+    arrow_calendar = get_projectx_account_pnl_calendar(
+        account_id=88061,
+        all_time=True,
+        refresh=False,
+        request=SimpleNamespace(headers={"accept": "application/vnd.apache.arrow.stream"}),
+        db=db_session,
+    )
+    calendar_table = pa.ipc.open_stream(arrow_calendar.body).read_all()
+    assert calendar_table.to_pylist() == [
+        {**row, "date": datetime.fromisoformat(row["date"]).date()} for row in calendar_rows
+    ]
     with pytest.raises(HTTPException) as refresh_exc:
         refresh_projectx_account_trades(account_id=88061, db=db_session)
     assert refresh_exc.value.status_code == 409
@@ -538,6 +555,182 @@ def test_mixed_accounts_keep_normal_live_routes_entirely_local(db_session, monke
     assert provider_calls == []
 
 
+def test_bulk_trade_refresh_covers_projectx_accounts_and_reports_failures(
+    db_session,
+    monkeypatch,
+):
+    db_session.add_all(
+        [
+            Account(
+                provider="projectx",
+                external_id="88070",
+                name="Express Funded",
+                trade_data_source="projectx",
+                account_state="ACTIVE",
+                is_main=True,
+            ),
+            Account(
+                provider="projectx",
+                external_id="88071",
+                name="Combine",
+                trade_data_source="projectx",
+                account_state="LOCKED_OUT",
+            ),
+            Account(
+                provider="projectx",
+                external_id="88072",
+                name="Topstep Live",
+                trade_data_source="csv_import",
+                account_state="ACTIVE",
+            ),
+            Account(
+                provider="projectx",
+                external_id="88073",
+                name="Closed Combine",
+                trade_data_source="projectx",
+                account_state="MISSING",
+            ),
+        ]
+    )
+    db_session.commit()
+    fetched_accounts: list[int] = []
+
+    class StubClient:
+        def fetch_trade_history(self, account_id, start, end=None, *, limit=None, offset=None):
+            fetched_accounts.append(account_id)
+            if account_id == 88071:
+                raise ProjectXClientError("ProjectX network error: reset", status_code=502)
+            if offset:
+                return []
+            return [
+                {
+                    "account_id": account_id,
+                    "contract_id": "CON.F.US.MNQ.H26",
+                    "symbol": "MNQ",
+                    "side": "BUY",
+                    "size": 1.0,
+                    "price": 20500.0,
+                    "timestamp": datetime(2026, 2, 5, 15, 0, tzinfo=timezone.utc),
+                    "fees": 1.4,
+                    "pnl": 45.0,
+                    "order_id": "ORD-1",
+                    "source_trade_id": "SRC-1",
+                    "status": "FILLED",
+                    "raw_payload": {"id": "SRC-1"},
+                }
+            ]
+
+    monkeypatch.setenv("PROJECTX_USER_PROVIDER_CONCURRENCY", "1")
+    monkeypatch.setattr(
+        main_module,
+        "SessionLocal",
+        sessionmaker(bind=db_session.get_bind(), autoflush=False, autocommit=False),
+    )
+    monkeypatch.setattr(
+        main_module,
+        "_projectx_client_for_user",
+        lambda *_args, **_kwargs: StubClient(),
+    )
+
+    payload = refresh_all_projectx_account_trades(
+        start=datetime(2026, 2, 5, tzinfo=timezone.utc),
+        end=datetime(2026, 2, 6, tzinfo=timezone.utc),
+        db=db_session,
+    )
+
+    assert set(fetched_accounts) == {88070, 88071}
+    assert [row.account_id for row in payload.accounts] == [88070, 88071]
+    assert payload.accounts[0].fetched_count == 1
+    assert payload.accounts[0].inserted_count == 1
+    assert payload.accounts[0].error_code is None
+    assert payload.accounts[1].error_code == "projectx_network_error"
+    assert payload.accounts[1].inserted_count == 0
+    assert (payload.fetched_count, payload.inserted_count, payload.failed_count) == (1, 1, 1)
+    assert db_session.query(ProjectXTradeEvent).filter_by(account_id=88070).count() == 1
+
+
+def test_accounts_route_background_refresh_serves_snapshot_and_revalidates_once(
+    db_session,
+    monkeypatch,
+):
+    provider_called = threading.Event()
+    release_provider = threading.Event()
+    provider_calls: list[bool] = []
+
+    class StubClient:
+        def list_accounts(self, *, only_active_accounts=True):
+            provider_calls.append(only_active_accounts)
+            provider_called.set()
+            assert release_provider.wait(timeout=5)
+            return [{"id": 7401, "name": "Express", "balance": 51000.0, "can_trade": True, "is_visible": True}]
+
+    db_session.add(
+        Account(
+            provider="projectx",
+            external_id="7401",
+            name="Express",
+            balance=50000,
+            account_state="ACTIVE",
+            can_trade=True,
+            is_visible=True,
+            is_main=True,
+            last_seen_at=datetime.now(timezone.utc) - timedelta(hours=1),
+        )
+    )
+    db_session.commit()
+    refresher = ProjectXAccountRefresher(
+        main_module._refresh_projectx_accounts_in_background,
+        min_interval_seconds=60,
+        jitter_seconds=0,
+    )
+    monkeypatch.setattr(main_module, "_account_refresher", refresher)
+    monkeypatch.setattr(
+        main_module,
+        "SessionLocal",
+        sessionmaker(bind=db_session.get_bind(), autoflush=False, autocommit=False),
+    )
+    monkeypatch.setattr(
+        main_module,
+        "_projectx_client_for_user",
+        lambda *_args, **_kwargs: StubClient(),
+    )
+
+    first_response = Response()
+    first = list_projectx_accounts(
+        show_inactive=True,
+        background_refresh=True,
+        response=first_response,
+        db=db_session,
+    )
+    assert provider_called.wait(timeout=5)
+    second_response = Response()
+    list_projectx_accounts(
+        show_inactive=True,
+        background_refresh=True,
+        response=second_response,
+        db=db_session,
+    )
+    release_provider.set()
+    assert refresher.wait_idle(DEFAULT_USER_ID, timeout=5)
+    third_response = Response()
+    list_projectx_accounts(
+        show_inactive=True,
+        background_refresh=True,
+        response=third_response,
+        db=db_session,
+    )
+
+    assert first[0]["balance"] == pytest.approx(50000.0)
+    assert first[0]["provider_sync_status"] == "cache_stale"
+    assert first_response.headers["X-Provider-Refresh"] == "scheduled"
+    assert second_response.headers["X-Provider-Refresh"] == "in_flight"
+    assert third_response.headers["X-Provider-Refresh"] == "throttled"
+    assert provider_calls == [False]
+    db_session.expire_all()
+    refreshed = db_session.query(Account).filter_by(external_id="7401").one()
+    assert float(refreshed.balance) == pytest.approx(51000.0)
+
+
 def test_accounts_route_local_snapshot_skips_projectx_for_mixed_accounts(
     db_session,
     monkeypatch,
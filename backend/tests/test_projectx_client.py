@@ -1,6 +1,10 @@
+import asyncio
+import json
+import threading
+import time
 from datetime import datetime, timezone
-from io import BytesIO
-from urllib import error
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
 
 import pytest
 
@@ -14,6 +18,8 @@ from app.services.projectx_client import (
     _extract_error_message,
     _parse_datetime,
 )
+from app.services.projectx_async_client import AsyncProjectXClient
+from app.services.projectx_transport import PooledHTTPTransport, TransportResponse
 
 
 def test_parse_datetime_supports_variable_fraction_precision():
@@ -73,20 +79,47 @@ def test_extract_error_message_falls_back_to_error_code_when_message_missing():
     assert _extract_error_message(payload) == "Error code 40123"
 
 
-def test_request_once_marks_success_false_payloads_as_gateway_errors(monkeypatch):
-    class StubResponse:
-        def __enter__(self):
-            return self
-
-        def __exit__(self, exc_type, exc, tb):
-            return False
-
-        def read(self):
-            return b'{"success": false, "responseStatus": {"message": "Session invalid"}}'
+class FakeTransport:
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.requests = []
+
+    def send(self, method, url, *, headers, body, timeout, idempotent=True):
+        self.requests.append(
+            SimpleNamespace(
+                method=method,
+                url=url,
+                headers=dict(headers),
+                body=body,
+                timeout=timeout,
+                idempotent=idempotent,
+            )
+        )
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+
+def _client(transport):
+    return ProjectXClient(
+        base_url="https://example.test",
+        username="demo",
+        api_key="demo",
+        transport=transport,
+    )
 
-    client = ProjectXClient(base_url="https://example.test", username="demo", api_key="demo")
 
-    monkeypatch.setattr("app.services.projectx_client.request.urlopen", lambda *args, **kwargs: StubResponse())
+def test_request_once_marks_success_false_payloads_as_gateway_errors():
+    client = _client(
+        FakeTransport(
+            TransportResponse(
+                status=200,
+                reason="OK",
+                body=b'{"success": false, "responseStatus": {"message": "Session invalid"}}',
+            )
+        )
+    )
 
     with pytest.raises(ProjectXClientError) as exc_info:
         client._request_once("POST", "/api/Auth/loginKey", payload=None, with_auth=False)
@@ -96,20 +129,16 @@ def test_request_once_marks_success_false_payloads_as_gateway_errors(monkeypatch
     assert str(exc_info.value) == "ProjectX authentication failed: Session invalid"
 
 
-def test_request_once_maps_login_key_error_code_3_to_actionable_message(monkeypatch):
-    class StubResponse:
-        def __enter__(self):
-            return self
-
-        def __exit__(self, exc_type, exc, tb):
-            return False
-
-        def read(self):
-            return b'{"token": null, "success": false, "errorCode": 3, "errorMessage": null}'
-
-    client = ProjectXClient(base_url="https://example.test", username="demo", api_key="demo")
-
-    monkeypatch.setattr("app.services.projectx_client.request.urlopen", lambda *args, **kwargs: StubResponse())
+def test_request_once_maps_login_key_error_code_3_to_actionable_message():
+    client = _client(
+        FakeTransport(
+            TransportResponse(
+                status=200,
+                reason="OK",
+                body=b'{"token": null, "success": false, "errorCode": 3, "errorMessage": null}',
+            )
+        )
+    )
 
     with pytest.raises(ProjectXClientError) as exc_info:
         client._request_once("POST", "/api/Auth/loginKey", payload=None, with_auth=False)
@@ -123,13 +152,8 @@ def test_request_once_maps_login_key_error_code_3_to_actionable_message(monkeypa
     )
 
 
-def test_request_once_maps_timeout_to_gateway_timeout(monkeypatch):
-    client = ProjectXClient(base_url="https://example.test", username="demo", api_key="demo")
-
-    def raise_timeout(*_args, **_kwargs):
-        raise TimeoutError("timed out")
-
-    monkeypatch.setattr("app.services.projectx_client.request.urlopen", raise_timeout)
+def test_request_once_maps_timeout_to_gateway_timeout():
+    client = _client(FakeTransport(TimeoutError("timed out")))
 
     with pytest.raises(ProjectXClientError) as exc_info:
         client._request_once("POST", "/api/Auth/loginKey", payload=None, with_auth=False)
@@ -140,20 +164,15 @@ def test_request_once_maps_timeout_to_gateway_timeout(monkeypatch):
     assert str(exc_info.value) == "ProjectX request timed out. Check the ProjectX connection and try again."
 
 
-def test_request_once_maps_url_timeout_reason_to_gateway_timeout(monkeypatch):
-    client = ProjectXClient(base_url="https://example.test", username="demo", api_key="demo")
-
-    def raise_url_timeout(*_args, **_kwargs):
-        raise error.URLError(TimeoutError("timed out"))
-
-    monkeypatch.setattr("app.services.projectx_client.request.urlopen", raise_url_timeout)
+def test_request_once_maps_connection_failures_to_network_errors():
+    client = _client(FakeTransport(ConnectionRefusedError(111, "Connection refused")))
 
     with pytest.raises(ProjectXClientError) as exc_info:
-        client._request_once("POST", "/api/Auth/loginKey", payload=None, with_auth=False)
+        client._request_once("POST", "/api/Trade/search", payload={}, with_auth=False)
 
-    assert exc_info.value.status_code == 504
+    assert exc_info.value.status_code == 502
     assert exc_info.value.reason_code == PROJECTX_ERROR_NETWORK
-    assert str(exc_info.value) == "ProjectX request timed out. Check the ProjectX connection and try again."
+    assert str(exc_info.value) == "ProjectX network error: [Errno 111] Connection refused"
 
 
 @pytest.mark.parametrize(
@@ -165,30 +184,203 @@ def test_request_once_maps_url_timeout_reason_to_gateway_timeout(monkeypatch):
     ],
 )
 def test_request_once_only_marks_order_submission_5xx_as_ambiguous(
-    monkeypatch,
     path,
     status_code,
     outcome_unknown,
     reason_code,
 ):
-    client = ProjectXClient(base_url="https://example.test", username="demo", api_key="demo")
-
-    def raise_http_error(*_args, **_kwargs):
-        raise error.HTTPError(
-            "https://example.test",
-            status_code,
-            "provider error",
-            hdrs=None,
-            fp=BytesIO(b'{"message":"provider error"}'),
+    transport = FakeTransport(
+        TransportResponse(
+            status=status_code,
+            reason="provider error",
+            body=b'{"message":"provider error"}',
         )
-
-    monkeypatch.setattr("app.services.projectx_client.request.urlopen", raise_http_error)
+    )
+    client = _client(transport)
 
     with pytest.raises(ProjectXClientError) as exc_info:
         client._request_once("POST", path, payload={}, with_auth=False)
 
     assert exc_info.value.submission_outcome_unknown is outcome_unknown
     assert exc_info.value.reason_code == reason_code
+    assert str(exc_info.value) == f"ProjectX request failed ({status_code}): provider error"
+    # Order submissions are never replayed on a fresh connection.
+    assert transport.requests[0].idempotent is (path != "/api/Order/place")
+    assert transport.requests[0].url == f"https://example.test{path}"
+    assert transport.requests[0].timeout == 20
+
+
+def test_async_client_logs_in_alone_then_bounds_concurrent_requests():
+    class SlowClient:
+        def __init__(self):
+            self.lock = threading.Lock()
+            self.in_flight = 0
+            self.max_in_flight = 0
+            self.first_call_in_flight = None
+
+        def fetch_trade_history(self, account_id, start, end=None, *, limit=None, offset=None):
+            with self.lock:
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+                if offset == 0:
+                    self.first_call_in_flight = self.in_flight
+            time.sleep(0.02)
+            with self.lock:
+                self.in_flight -= 1
+            return [{"offset": offset}]
+
+    client = SlowClient()
+    async_client = AsyncProjectXClient(client, max_concurrency=2, requests_per_minute=6000)
+    start = datetime(2026, 2, 5, tzinfo=timezone.utc)
+
+    async def fetch_all():
+        return await asyncio.gather(
+            *(async_client.fetch_trade_history(1, start, offset=offset) for offset in range(6))
+        )
+
+    results = asyncio.run(fetch_all())
+
+    assert results == [[{"offset": offset}] for offset in range(6)]
+    assert client.first_call_in_flight == 1
+    assert client.max_in_flight == 2
+
+
+def test_async_client_request_budget_paces_requests_beyond_the_burst():
+    calls = []
+
+    class CountingClient:
+        def fetch_trade_history(self, account_id, start, end=None, *, limit=None, offset=None):
+            calls.append(time.monotonic())
+            return []
+
+    # 600 requests per minute is one every 0.1s after a burst of two.
+    async_client = AsyncProjectXClient(CountingClient(), max_concurrency=2, requests_per_minute=600)
+    start = datetime(2026, 2, 5, tzinfo=timezone.utc)
+
+    async def fetch_all():
+        await asyncio.gather(*(async_client.fetch_trade_history(1, start) for _ in range(5)))
+
+    began = time.monotonic()
+    asyncio.run(fetch_all())
+
+    assert len(calls) == 5
+    assert calls[-1] - began >= 0.25
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    drop_after_response = False
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length)
+        self.server.peers.append(self.client_address)
+        payload = json.dumps({"success": True, "echo": json.loads(body or b"{}")}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+        if self.server.drop_after_response:
+            # Close without announcing it, like a gateway keep-alive timeout.
+            self.close_connection = True
+
+    def log_message(self, *_args):
+        return
+
+
+@pytest.fixture
+def keep_alive_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    server.daemon_threads = True
+    server.peers = []
+    server.drop_after_response = False
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_pooled_transport_reuses_one_connection_across_clients(keep_alive_server):
+    transport = PooledHTTPTransport(pool_size=2, idle_seconds=30)
+    base_url = f"http://127.0.0.1:{keep_alive_server.server_port}"
+    clients = [
+        ProjectXClient(base_url=base_url, username="demo", api_key="demo", transport=transport)
+        for _ in range(2)
+    ]
+    try:
+        for index in range(3):
+            for client in clients:
+                response = client._request_once(
+                    "POST", "/api/Trade/search", payload={"page": index}, with_auth=False
+                )
+                assert response["echo"] == {"page": index}
+        assert len(keep_alive_server.peers) == 6
+        assert len(set(keep_alive_server.peers)) == 1
+        assert transport.stats() == {
+            "hosts": 1,
+            "idle_connections": 1,
+            "opened_connections": 1,
+            "reused_connections": 5,
+        }
+    finally:
+        transport.close()
+
+
+def test_pooled_transport_evicts_idle_connections(keep_alive_server):
+    transport = PooledHTTPTransport(pool_size=2, idle_seconds=0)
+    url = f"http://127.0.0.1:{keep_alive_server.server_port}/api/Trade/search"
+    try:
+        for _ in range(2):
+            response = transport.send("POST", url, headers={}, body=b"{}", timeout=5)
+            assert response.status == 200
+        assert len(set(keep_alive_server.peers)) == 2
+        assert transport.stats()["reused_connections"] == 0
+    finally:
+        transport.close()
+
+
+def test_pooled_transport_replays_idempotent_requests_after_a_stale_connection(
+    keep_alive_server,
+):
+    keep_alive_server.drop_after_response = True
+    transport = PooledHTTPTransport(pool_size=2, idle_seconds=30)
+    url = f"http://127.0.0.1:{keep_alive_server.server_port}/api/Trade/search"
+    try:
+        assert transport.send("POST", url, headers={}, body=b"{}", timeout=5).status == 200
+        # The server dropped the pooled connection; a read is replayed on a new one.
+        assert transport.send("POST", url, headers={}, body=b"{}", timeout=5).status == 200
+        assert len(keep_alive_server.peers) == 2
+
+    finally:
+        transport.close()
+
+
+def test_pooled_transport_never_sends_order_submissions_over_a_pooled_connection(
+    keep_alive_server,
+):
+    keep_alive_server.drop_after_response = True
+    transport = PooledHTTPTransport(pool_size=2, idle_seconds=30)
+    base_url = f"http://127.0.0.1:{keep_alive_server.server_port}"
+    client = ProjectXClient(base_url=base_url, username="demo", api_key="demo", transport=transport)
+    try:
+        client._request_once("POST", "/api/Trade/search", payload={}, with_auth=False)
+        # The server dropped that connection, but it is still idle in the pool.
+        assert transport.stats()["idle_connections"] == 1
+
+        response = client._request_once(
+            "POST", "/api/Order/place", payload={"accountId": 1}, with_auth=False
+        )
+
+        assert response["echo"] == {"accountId": 1}
+        assert len(set(keep_alive_server.peers)) == 2
+        assert transport.stats()["opened_connections"] == 2
+        assert transport.stats()["reused_connections"] == 0
+    finally:
+        transport.close()
 
 
 def test_fetch_trade_history_retains_voided_rows_for_local_tombstones():
@@ -0,0 +1,390 @@
+import asyncio
+import json
+import os
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+os.environ.setdefault("DATABASE_URL", "sqlite+pysqlite:///:memory:")
+
+from app.db import Base
+from app.models import DEFAULT_USER_ID, ProjectXTradeDaySync, ProjectXTradeEvent
+import app.services.projectx_hubs as projectx_hubs_module
+from app.services.projectx_hubs import ProjectXHubRunner
+from app.services.projectx_trade_stream import StreamingTradeIngestor, trade_stream_ingest_enabled
+from app.services.projectx_trades import ensure_trade_cache_for_request, trade_stream_is_live
+from app.services.streaming_pnl_tracker import StreamingPnlTracker
+from app.services.trading_day import trading_day_bounds_utc, trading_day_date
+
+ACCOUNT_ID = 13032601
+TRADE_DAY = date(2026, 3, 3)
+DAY_START, DAY_END = trading_day_bounds_utc(TRADE_DAY)
+
+
+class _Clock:
+    def __init__(self, now: datetime):
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+class _RecordingClient:
+    def __init__(self):
+        self.calls: list[tuple[datetime, datetime | None]] = []
+
+    def fetch_trade_history(self, account_id, start, end=None, *, limit=None, offset=None):
+        self.calls.append((start, end))
+        return []
+
+
+@pytest.fixture()
+def session_factory(tmp_path):
+    engine = create_engine(
+        f"sqlite+pysqlite:///{(tmp_path / 'trade-stream.sqlite3').as_posix()}",
+        connect_args={"check_same_thread": False},
+    )
+    Base.metadata.create_all(bind=engine, tables=[ProjectXTradeEvent.__table__, ProjectXTradeDaySync.__table__])
+    try:
+        yield sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    finally:
+        engine.dispose()
+
+
+def _hub_trade(trade_id: int, timestamp: datetime, *, account_id: int = ACCOUNT_ID) -> dict[str, object]:
+    return {
+        "id": trade_id,
+        "accountId": account_id,
+        "contractId": "CON.F.US.MNQ.H26",
+        "creationTimestamp": timestamp.isoformat(),
+        "price": 20500.0,
+        "profitAndLoss": 45.0,
+        "fees": 1.4,
+        "side": 0,
+        "size": 1,
+        "voided": False,
+        "orderId": 900 + trade_id,
+    }
+
+
+def _ingestor(session_factory, clock, client) -> StreamingTradeIngestor:
+    return StreamingTradeIngestor(
+        session_factory=session_factory,
+        client_factory=lambda: client,
+        user_id=DEFAULT_USER_ID,
+        account_id=ACCOUNT_ID,
+        batch_size=1,
+        reconcile_retry_seconds=60,
+        now=clock,
+    )
+
+
+def _day_sync(session_factory, trade_day: date = TRADE_DAY) -> ProjectXTradeDaySync:
+    with session_factory() as db:
+        return (
+            db.query(ProjectXTradeDaySync)
+            .filter(ProjectXTradeDaySync.account_id == ACCOUNT_ID)
+            .filter(ProjectXTradeDaySync.trade_date == trade_day)
+            .one()
+        )
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+def test_stream_covering_the_whole_day_stores_trades_and_advances_the_watermark_without_rest(session_factory):
+    clock = _Clock(DAY_START - timedelta(minutes=5))
+    client = _RecordingClient()
+    ingestor = _ingestor(session_factory, clock, client)
+    ingestor.mark_connected()
+    try:
+        clock.now = DAY_START + timedelta(hours=2)
+        assert ingestor.ingest(_hub_trade(1, DAY_START + timedelta(hours=1)))
+        assert ingestor.ingest({"action": 0, "data": _hub_trade(2, DAY_START + timedelta(hours=1, minutes=5))})
+        assert not ingestor.ingest(_hub_trade(3, DAY_START + timedelta(hours=1), account_id=ACCOUNT_ID + 1))
+
+        assert ingestor.flush() == 2
+    finally:
+        ingestor.mark_disconnected()
+
+    with session_factory() as db:
+        stored = db.query(ProjectXTradeEvent.source_trade_id).order_by(ProjectXTradeEvent.source_trade_id).all()
+    assert [row.source_trade_id for row in stored] == ["1", "2"]
+    sync_row = _day_sync(session_factory)
+    assert sync_row.sync_status == "partial"
+    assert _as_utc(sync_row.window_start) == DAY_START
+    assert _as_utc(sync_row.window_end) == clock.now
+    assert sync_row.row_count == 2
+    assert client.calls == []
+
+
+def test_stream_gap_reconciles_over_rest_once_then_the_stream_takes_over(session_factory):
+    clock = _Clock(DAY_START + timedelta(hours=3))
+    client = _RecordingClient()
+    ingestor = _ingestor(session_factory, clock, client)
+    ingestor.mark_connected()
+    try:
+        ingestor.flush()
+        assert client.calls == [(DAY_START, clock.now)]
+
+        clock.now += timedelta(seconds=5)
+        ingestor.ingest(_hub_trade(4, clock.now - timedelta(seconds=1)))
+        assert ingestor.flush() == 1
+    finally:
+        ingestor.mark_disconnected()
+
+    assert len(client.calls) == 1
+    sync_row = _day_sync(session_factory)
+    assert _as_utc(sync_row.window_end) == clock.now
+    assert sync_row.row_count == 1
+
+
+def test_day_close_reconciles_the_finished_day_as_complete(session_factory):
+    clock = _Clock(DAY_START - timedelta(minutes=5))
+    client = _RecordingClient()
+    ingestor = _ingestor(session_factory, clock, client)
+    ingestor.mark_connected()
+    try:
+        clock.now = DAY_END - timedelta(minutes=1)
+        ingestor.flush()
+        assert client.calls == []
+
+        clock.now = DAY_END + timedelta(minutes=1)
+        ingestor.flush()
+    finally:
+        ingestor.mark_disconnected()
+
+    assert client.calls == [(DAY_START, DAY_END)]
+    assert _day_sync(session_factory).sync_status == "complete"
+    next_day = trading_day_date(clock.now)
+    assert _as_utc(_day_sync(session_factory, next_day).window_end) == clock.now
+
+
+def test_current_day_refresh_reads_the_stream_watermark_only_while_connected(session_factory):
+    now = datetime.now(timezone.utc)
+    today = trading_day_date(now)
+    day_start, _day_end = trading_day_bounds_utc(today)
+    clock = _Clock(day_start - timedelta(minutes=5))
+    ingestor = _ingestor(session_factory, clock, _RecordingClient())
+    request_client = _RecordingClient()
+    ingestor.mark_connected()
+    try:
+        clock.now = datetime.now(timezone.utc)
+        ingestor.flush()
+        with session_factory() as db:
+            ensure_trade_cache_for_request(
+                db,
+                user_id=DEFAULT_USER_ID,
+                account_id=ACCOUNT_ID,
+                start=day_start,
+                end=now,
+                refresh=True,
+                client_factory=lambda: request_client,
+            )
+        assert request_client.calls == []
+    finally:
+        ingestor.mark_disconnected()
+
+    with session_factory() as db:
+        ensure_trade_cache_for_request(
+            db,
+            user_id=DEFAULT_USER_ID,
+            account_id=ACCOUNT_ID,
+            start=day_start,
+            end=now,
+            refresh=True,
+            client_factory=lambda: request_client,
+        )
+    assert len(request_client.calls) == 1
+
+
+def test_hub_runner_routes_user_trade_invocations_to_the_ingestor():
+    class RecordingIngestor:
+        flush_interval_seconds = 1.0
+
+        def __init__(self):
+            self.payloads = []
+
+        def ingest(self, payload):
+            self.payloads.append(dict(payload))
+            return True
+
+    ingestor = RecordingIngestor()
+    runner = ProjectXHubRunner(
+        tracker=StreamingPnlTracker(),
+        client_factory=lambda: (_ for _ in ()).throw(AssertionError("unused")),
+        user_id="user-a",
+        account_id=ACCOUNT_ID,
+        market_hub_url="",
+        user_hub_url="wss://example.test/hubs/user",
+        trade_ingestor=ingestor,
+    )
+    trade = _hub_trade(5, DAY_START + timedelta(hours=1))
+
+    runner._dispatch_frame("user", {"type": 1, "target": "GatewayUserTrade", "arguments": [trade]})
+    runner._dispatch_frame("user", {"type": 1, "target": "GatewayUserOrder", "arguments": [{"id": 1}]})
+
+    assert ingestor.payloads == [trade]
+    assert runner.dispatch_health()["trade"]["total_successes"] == 1
+
+
+def test_reconnecting_keeps_the_gap_reconcile_backoff(session_factory):
+    class FailingClient(_RecordingClient):
+        def fetch_trade_history(self, account_id, start, end=None, *, limit=None, offset=None):
+            super().fetch_trade_history(account_id, start, end, limit=limit, offset=offset)
+            raise RuntimeError("gateway unavailable")
+
+    clock = _Clock(DAY_START + timedelta(hours=3))
+    client = FailingClient()
+    ingestor = _ingestor(session_factory, clock, client)
+    try:
+        ingestor.mark_connected()
+        ingestor.flush()
+        assert len(client.calls) == 1
+
+        # A flapping hub reconnects inside the 60s retry window.
+        for _ in range(3):
+            clock.now += timedelta(seconds=5)
+            ingestor.mark_disconnected()
+            ingestor.mark_connected()
+            ingestor.flush()
+        assert len(client.calls) == 1
+
+        clock.now += timedelta(seconds=60)
+        ingestor.flush()
+        assert len(client.calls) == 2
+    finally:
+        ingestor.mark_disconnected()
+
+
+def test_account_stays_live_until_its_last_stream_disconnects(session_factory):
+    clock = _Clock(DAY_START)
+    first = _ingestor(session_factory, clock, _RecordingClient())
+    second = _ingestor(session_factory, clock, _RecordingClient())
+    try:
+        first.mark_connected()
+        first.mark_connected()
+        second.mark_connected()
+        first.mark_disconnected()
+        assert trade_stream_is_live(DEFAULT_USER_ID, ACCOUNT_ID)
+        second.mark_disconnected()
+        assert not trade_stream_is_live(DEFAULT_USER_ID, ACCOUNT_ID)
+    finally:
+        first.mark_disconnected()
+        second.mark_disconnected()
+    assert not trade_stream_is_live(DEFAULT_USER_ID, ACCOUNT_ID)
+
+
+class _ConnectionRecordingIngestor:
+    flush_interval_seconds = 1.0
+
+    def __init__(self):
+        self.events: list[str] = []
+
+    def ingest(self, payload):
+        self.events.append(f"trade:{payload['id']}")
+        return True
+
+    def mark_connected(self):
+        self.events.append("connected")
+
+    def mark_disconnected(self):
+        self.events.append("disconnected")
+
+
+def _run_one_user_hub_connection(monkeypatch, ingestor, frames):
+    """Serve ``frames`` on one user-hub connection and stop at the reconnect."""
+
+    class StubWebsocket:
+        def __init__(self):
+            self.sent: list[str] = []
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *_exc):
+            return False
+
+        async def send(self, message):
+            self.sent.append(message)
+
+        async def __aiter__(self):
+            for frame in frames:
+                yield json.dumps(frame) + "\x1e"
+
+    class StubClient:
+        def get_access_token(self):
+            return "token"
+
+    websocket = StubWebsocket()
+    connections: list[str] = []
+
+    def connect(url, **_kwargs):
+        if connections:
+            raise asyncio.CancelledError()
+        connections.append(url)
+        return websocket
+
+    monkeypatch.setattr(projectx_hubs_module.websockets, "connect", connect)
+    runner = ProjectXHubRunner(
+        tracker=StreamingPnlTracker(),
+        client_factory=StubClient,
+        user_id="user-a",
+        account_id=ACCOUNT_ID,
+        market_hub_url="",
+        user_hub_url="wss://example.test/hubs/user",
+        trade_ingestor=ingestor,
+    )
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(runner._consume_hub("user", "wss://example.test/hubs/user"))
+    return websocket
+
+
+def test_handshake_without_a_trade_subscription_never_marks_the_account_live(monkeypatch):
+    monkeypatch.delenv("PROJECTX_USER_HUB_SUBSCRIBE_MESSAGE", raising=False)
+    ingestor = _ConnectionRecordingIngestor()
+    trade = _hub_trade(7, DAY_START + timedelta(hours=1))
+
+    # The websocket closes without an error and the runner reconnects at
+    # once; the stub refuses that second connection to end the test.
+    _run_one_user_hub_connection(
+        monkeypatch,
+        ingestor,
+        [{"type": 1, "target": "GatewayUserTrade", "arguments": [trade]}],
+    )
+
+    assert "connected" not in ingestor.events
+    assert not trade_stream_ingest_enabled(ACCOUNT_ID)
+
+
+def test_account_is_marked_live_once_its_trade_subscription_is_acknowledged(monkeypatch):
+    subscription = {
+        "type": 1,
+        "invocationId": "trades",
+        "target": "SubscribeTrades",
+        "arguments": [ACCOUNT_ID],
+    }
+    monkeypatch.setenv("PROJECTX_USER_HUB_SUBSCRIBE_MESSAGE", json.dumps([subscription]))
+    ingestor = _ConnectionRecordingIngestor()
+    early = _hub_trade(8, DAY_START + timedelta(hours=1))
+    later = _hub_trade(9, DAY_START + timedelta(hours=2))
+
+    websocket = _run_one_user_hub_connection(
+        monkeypatch,
+        ingestor,
+        [
+            {"type": 1, "target": "GatewayUserTrade", "arguments": [early]},
+            {"type": 3, "invocationId": "trades", "result": None},
+            {"type": 1, "target": "GatewayUserTrade", "arguments": [later]},
+        ],
+    )
+
+    assert json.loads(websocket.sent[1].rstrip("\x1e")) == subscription
+    assert ingestor.events == ["trade:8", "connected", "trade:9", "disconnected"]
+    assert trade_stream_ingest_enabled(ACCOUNT_ID)
+    assert not trade_stream_ingest_enabled(ACCOUNT_ID + 1)
+    monkeypatch.setenv("PROJECTX_TRADE_STREAM_INGEST", "false")
+    assert not trade_stream_ingest_enabled(ACCOUNT_ID)
@@ -1,4 +1,6 @@
 import os
+import threading
+import time
 from datetime import date, datetime, timedelta, timezone
 
 import pytest
@@ -13,11 +15,13 @@ from app.models import DEFAULT_USER_ID, ProjectXTradeDaySync, ProjectXTradeEvent
 from app.services import projectx_trades as projectx_trades_module
 from app.services.projectx_trades import (
     _build_sync_windows,
+    _fetch_trade_chunks,
     _iter_time_chunks,
     _should_refresh_yesterday,
     _single_trading_day_request_date,
     ensure_trade_cache_for_request,
     refresh_account_trades,
+    refresh_accounts_trades,
 )
 from app.services.projectx_client import ProjectXClientError
 from app.services.trading_day import trading_day_bounds_utc
@@ -232,6 +236,142 @@ def test_refresh_account_trades_pages_through_provider_results(monkeypatch):
         engine.dispose()
 
 
+class _OverlappingChunkClient:
+    """Holds chunk 1 until the last chunk is in flight.
+
+    Chunk 0 is the warm-up request that runs alone.
+    """
+
+    def __init__(self, account_id: int, chunks, *, fail_chunk: int | None = None):
+        self.account_id = account_id
+        self.starts = [chunk_start for chunk_start, _chunk_end in chunks]
+        self.fail_chunk = fail_chunk
+        self.last_chunk_started = threading.Event()
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def fetch_trade_history(self, account_id, start, end=None, *, limit=None, offset=None):
+        index = self.starts.index(start)
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if index == len(self.starts) - 1:
+                self.last_chunk_started.set()
+            elif index == 1:
+                assert self.last_chunk_started.wait(timeout=5)
+            if index == self.fail_chunk:
+                raise ProjectXClientError("provider unavailable", status_code=504)
+            return [_event(self.account_id, start + timedelta(hours=1), f"SRC-CHUNK-{index}")]
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+def test_refresh_account_trades_fetches_chunks_concurrently_and_commits_in_order(monkeypatch):
+    monkeypatch.setenv("PROJECTX_SYNC_CHUNK_DAYS", "1")
+    monkeypatch.setenv("PROJECTX_BACKFILL_CONCURRENCY", "3")
+    monkeypatch.setenv("PROJECTX_BACKFILL_REQUESTS_PER_MINUTE", "6000")
+    engine, db = _make_session()
+    stored: list[list[str]] = []
+    store = projectx_trades_module.store_trade_events
+
+    def recording_store(session, events, *, user_id):
+        stored.append([str(event["source_trade_id"]) for event in events])
+        return store(session, events, user_id=user_id)
+
+    monkeypatch.setattr(projectx_trades_module, "store_trade_events", recording_store)
+    try:
+        account_id = 13032507
+        start = _dt(1, 0, 0)
+        end = _dt(4, 12, 0)
+        chunks = _iter_time_chunks(start, end, chunk_days=1)
+        client = _OverlappingChunkClient(account_id, chunks)
+
+        result = refresh_account_trades(
+            db,
+            client,
+            user_id=DEFAULT_USER_ID,
+            account_id=account_id,
+            start=start,
+            end=end,
+        )
+
+        assert len(chunks) == 4
+        assert result == {"fetched_count": 4, "inserted_count": 4}
+        # Chunk 1 only returns once chunk 3 has started.
+        assert 2 <= client.max_in_flight <= 3
+        assert stored == [[f"SRC-CHUNK-{index}"] for index in range(4)]
+    finally:
+        db.close()
+        Base.metadata.drop_all(bind=engine, tables=[ProjectXTradeDaySync.__table__, ProjectXTradeEvent.__table__])
+        engine.dispose()
+
+
+def test_concurrent_backfill_commits_chunks_before_a_failed_chunk_only(monkeypatch):
+    monkeypatch.setenv("PROJECTX_SYNC_CHUNK_DAYS", "1")
+    monkeypatch.setenv("PROJECTX_BACKFILL_CONCURRENCY", "4")
+    monkeypatch.setenv("PROJECTX_BACKFILL_REQUESTS_PER_MINUTE", "6000")
+    engine, db = _make_session()
+    try:
+        account_id = 13032508
+        start = _dt(1, 0, 0)
+        end = _dt(4, 12, 0)
+        chunks = _iter_time_chunks(start, end, chunk_days=1)
+        client = _OverlappingChunkClient(account_id, chunks, fail_chunk=2)
+
+        with pytest.raises(ProjectXClientError, match="provider unavailable"):
+            refresh_account_trades(
+                db,
+                client,
+                user_id=DEFAULT_USER_ID,
+                account_id=account_id,
+                start=start,
+                end=end,
+            )
+
+        stored = {
+            row.source_trade_id
+            for row in db.query(ProjectXTradeEvent).filter(ProjectXTradeEvent.account_id == account_id)
+        }
+        # Chunk 3 was fetched ahead, but nothing after the failure is committed.
+        assert stored == {"SRC-CHUNK-0", "SRC-CHUNK-1"}
+    finally:
+        db.close()
+        Base.metadata.drop_all(bind=engine, tables=[ProjectXTradeDaySync.__table__, ProjectXTradeEvent.__table__])
+        engine.dispose()
+
+
+def test_concurrent_backfill_starts_chunks_only_as_the_consumer_takes_results(monkeypatch):
+    monkeypatch.setenv("PROJECTX_BACKFILL_CONCURRENCY", "2")
+    monkeypatch.setenv("PROJECTX_BACKFILL_REQUESTS_PER_MINUTE", "6000")
+    account_id = 13032509
+    chunks = _iter_time_chunks(_dt(1, 0, 0), _dt(9, 0, 0), chunk_days=1)
+    starts = [chunk_start for chunk_start, _chunk_end in chunks]
+    started: list[int] = []
+    lock = threading.Lock()
+
+    class RecordingClient:
+        def fetch_trade_history(self, account_id, start, end=None, *, limit=None, offset=None):
+            with lock:
+                started.append(starts.index(start))
+            return []
+
+    consumed = 0
+    for _chunk, _result in _fetch_trade_chunks(
+        RecordingClient(), account_id=account_id, chunks=chunks, limit=1000
+    ):
+        consumed += 1
+        # A slow consumer: the fetcher would race ahead here if it could.
+        time.sleep(0.02)
+        with lock:
+            assert len(started) <= consumed + 2
+
+    assert len(chunks) == 8
+    assert sorted(started) == list(range(8))
+
+
 def test_single_trading_day_request_date_returns_day_when_start_end_match():
     day = _single_trading_day_request_date(
         start=_dt(3, 14, 0),
@@ -533,3 +673,156 @@ def test_ensure_trade_cache_refetches_complete_rows_without_window_bounds(monkey
         db.close()
         Base.metadata.drop_all(bind=engine, tables=[ProjectXTradeDaySync.__table__, ProjectXTradeEvent.__table__])
         engine.dispose()
+
+
+def test_refresh_accounts_trades_runs_accounts_concurrently_with_isolated_sessions(tmp_path, monkeypatch):
+    engine = create_engine(
+        f"sqlite+pysqlite:///{(tmp_path / 'bulk-refresh.sqlite3').as_posix()}",
+        connect_args={"check_same_thread": False, "timeout": 10},
+    )
+    Base.metadata.create_all(bind=engine, tables=[ProjectXTradeEvent.__table__, ProjectXTradeDaySync.__table__])
+    SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    monkeypatch.setenv("PROJECTX_USER_PROVIDER_CONCURRENCY", "2")
+    both_accounts_in_flight = threading.Barrier(2)
+
+    class _SharedClient:
+        def __init__(self):
+            self.lock = threading.Lock()
+            self.logins = 0
+            self.in_flight = 0
+            self.max_in_flight = 0
+
+        def get_access_token(self):
+            self.logins += 1
+            return "token"
+
+        def fetch_trade_history(self, account_id, start, end=None, *, limit=None, offset=None):
+            with self.lock:
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            try:
+                if account_id in {101, 102} and not offset:
+                    both_accounts_in_flight.wait(timeout=5)
+                if account_id == 103:
+                    raise ProjectXClientError("ProjectX network error: reset", status_code=502)
+                return [] if offset else [_event(account_id, _dt(5, 15), source_trade_id=f"SRC-{account_id}")]
+            finally:
+                with self.lock:
+                    self.in_flight -= 1
+
+    client = _SharedClient()
+    try:
+        results = refresh_accounts_trades(
+            SessionLocal,
+            client,
+            [101, 102, 103],
+            user_id=DEFAULT_USER_ID,
+            start=_dt(5),
+            end=_dt(6),
+        )
+
+        assert [result.account_id for result in results] == [101, 102, 103]
+        assert [(result.fetched_count, result.inserted_count) for result in results[:2]] == [(1, 1), (1, 1)]
+        assert results[0].error is None and results[1].error is None
+        assert isinstance(results[2].error, ProjectXClientError)
+        assert client.logins == 1
+        assert client.max_in_flight == 2
+        with SessionLocal() as db:
+            stored = db.query(ProjectXTradeEvent.account_id).order_by(ProjectXTradeEvent.account_id).all()
+        assert [row.account_id for row in stored] == [101, 102]
+    finally:
+        engine.dispose()
+
+
+def test_single_account_refreshes_share_the_users_provider_cap(tmp_path, monkeypatch):
+    engine = create_engine(
+        f"sqlite+pysqlite:///{(tmp_path / 'user-cap.sqlite3').as_posix()}",
+        connect_args={"check_same_thread": False, "timeout": 10},
+    )
+    Base.metadata.create_all(bind=engine, tables=[ProjectXTradeEvent.__table__, ProjectXTradeDaySync.__table__])
+    SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    monkeypatch.setenv("PROJECTX_USER_PROVIDER_CONCURRENCY", "1")
+    release = threading.Event()
+    other_user_fetched = threading.Event()
+
+    class _BlockingClient:
+        def __init__(self):
+            self.lock = threading.Lock()
+            self.calls: list[int] = []
+
+        def fetch_trade_history(self, account_id, start, end=None, *, limit=None, offset=None):
+            with self.lock:
+                self.calls.append(account_id)
+            if account_id == 201:
+                assert release.wait(timeout=5)
+            if account_id == 301:
+                other_user_fetched.set()
+            return []
+
+    client = _BlockingClient()
+
+    def refresh(account_id: int, user_id: str) -> None:
+        with SessionLocal() as db:
+            refresh_account_trades(db, client, account_id, user_id=user_id, start=_dt(5), end=_dt(6))
+
+    threads = [
+        threading.Thread(target=refresh, args=(201, "user-a")),
+        threading.Thread(target=refresh, args=(202, "user-a")),
+        threading.Thread(target=refresh, args=(301, "user-b")),
+    ]
+    try:
+        threads[0].start()
+        while client.calls != [201]:
+            time.sleep(0.01)
+        threads[1].start()
+        threads[2].start()
+        assert other_user_fetched.wait(timeout=5)
+        # user-a's second refresh waits for the slot held by its first.
+        assert 202 not in client.calls
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+        assert sorted(client.calls) == [201, 202, 301]
+        # Slots are only kept while a refresh for the user is in flight.
+        assert "user-a" not in projectx_trades_module._USER_PROVIDER_SLOTS
+        assert "user-b" not in projectx_trades_module._USER_PROVIDER_SLOTS
+        assert "user-a" not in projectx_trades_module._USER_REQUEST_BUDGETS
+    finally:
+        release.set()
+        engine.dispose()
+
+
+def test_serial_account_refreshes_draw_from_one_user_request_budget(tmp_path, monkeypatch):
+    engine = create_engine(
+        f"sqlite+pysqlite:///{(tmp_path / 'user-budget.sqlite3').as_posix()}",
+        connect_args={"check_same_thread": False, "timeout": 10},
+    )
+    Base.metadata.create_all(bind=engine, tables=[ProjectXTradeEvent.__table__, ProjectXTradeDaySync.__table__])
+    SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    # One slot runs the accounts one after another, each in a single chunk,
+    # and 600 requests per minute is one every 0.1s after a burst of one.
+    monkeypatch.setenv("PROJECTX_USER_PROVIDER_CONCURRENCY", "1")
+    monkeypatch.setenv("PROJECTX_BACKFILL_REQUESTS_PER_MINUTE", "600")
+    calls: list[float] = []
+
+    class _CountingClient:
+        def fetch_trade_history(self, account_id, start, end=None, *, limit=None, offset=None):
+            calls.append(time.monotonic())
+            return []
+
+    try:
+        began = time.monotonic()
+        results = refresh_accounts_trades(
+            SessionLocal,
+            _CountingClient(),
+            [401, 402, 403, 404],
+            user_id="user-budget",
+            start=_dt(5),
+            end=_dt(6),
+        )
+
+        assert [result.error for result in results] == [None] * 4
+        assert len(calls) == 4
+        assert calls[-1] - began >= 0.25
+    finally:
+        engine.dispose()
@@ -53,6 +53,8 @@ class _Inspector:
     def get_table_names(self):
         tables = [
             "accounts",
+            "bot_backtest_jobs",
+            "bot_backtest_sweeps",
             "bot_backtests",
             "bot_configs",
             "bot_order_attempts",
@@ -218,7 +220,7 @@ def test_readiness_requires_current_migration_ledger(monkeypatch):
 
     assert main_module.readiness(db=db) == {"status": "ready"}
     assert db.rolled_back is False
-    assert {"version": "20260729_add_expense_suppressions.sql"} in db.params
+    assert {"version": "20261019_add_bot_backtest_result_columns.sql"} in db.params
 
 
 def test_readiness_fails_closed_for_pending_migration(monkeypatch):
@@ -302,4 +304,4 @@ def test_readiness_accepts_validated_fresh_schema_baseline(monkeypatch):
     db = _Session()
 
     assert main_module.readiness(db=db) == {"status": "ready"}
-    assert {"version": "schema-20260729-v5"} in db.params
+    assert {"version": "schema-20261019-v8"} in db.params
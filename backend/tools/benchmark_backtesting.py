@@ -83,6 +83,7 @@ class AppApi:
     ProjectXMarketCandle: Any
     SignalResult: Any
     create_bot_backtest: Callable[..., Any]
+    bot_backtest_result: Callable[..., Result]
     run_backtest: Callable[..., Result]
 
 
@@ -139,6 +140,7 @@ def _load_app_api() -> AppApi:
     from app.models import BotBacktest, BotConfig, ProjectXMarketCandle
     from app.services.bot_backtesting import (
         BACKTEST_ENGINE_VERSION,
+        bot_backtest_result,
         create_bot_backtest,
         run_backtest,
     )
@@ -153,6 +155,7 @@ def _load_app_api() -> AppApi:
         ProjectXMarketCandle=ProjectXMarketCandle,
         SignalResult=SignalResult,
         create_bot_backtest=create_bot_backtest,
+        bot_backtest_result=bot_backtest_result,
         run_backtest=run_backtest,
     )
 
@@ -626,7 +629,7 @@ def _sqlite_public_runner(
             payload=payload,
             now=captured_now,
         )
-        return row.result_snapshot
+        return api.bot_backtest_result(row)
 
     def close() -> None:
         event.remove(engine, "before_cursor_execute", counter.before_cursor_execute)
@@ -579,7 +579,7 @@ def _execute_sqlite_persistence_sample(
         session.rollback()
         raise
     finished = time.perf_counter()
-    result = dict(row.result_snapshot)
+    result = api.backtesting_module.bot_backtest_result(row)
     digest_started = time.perf_counter()
     digest = _semantic_digest(result)
     digest_finished = time.perf_counter()
@@ -6,6 +6,7 @@ Examples (run from the repository root):
     backend\.venv\Scripts\python backend\tools\build_databento_cache.py --downloads
     backend\.venv\Scripts\python backend\tools\build_databento_cache.py --timeframe 5m
     backend\.venv\Scripts\python backend\tools\build_databento_cache.py archives... --json
+    backend\.venv\Scripts\python backend\tools\build_databento_cache.py --deep-verify
 
 This tool imports only the filesystem-backed Databento cache service. It does
 not initialize or access SQLAlchemy, Supabase, or any other database.
@@ -44,6 +45,7 @@ KNOWN_JOB_IDS = (
 @dataclass(frozen=True)
 class CacheApi:
     build: Callable[..., Any]
+    verify: Callable[..., Any]
     default_timeframes: Sequence[tuple[str, int]]
     parse_timeframe: Callable[[str], tuple[str, int]]
     timeframe_key: Callable[[str, int], str]
@@ -57,10 +59,12 @@ def _load_cache_api() -> CacheApi:
         build_databento_cache,
         parse_timeframe,
         timeframe_key,
+        verify_databento_cache,
     )
 
     return CacheApi(
         build=build_databento_cache,
+        verify=verify_databento_cache,
         default_timeframes=DEFAULT_TIMEFRAMES,
         parse_timeframe=parse_timeframe,
         timeframe_key=timeframe_key,
@@ -116,6 +120,41 @@ def _parser() -> argparse.ArgumentParser:
         action="store_true",
         help="rebuild the matching immutable cache version from source archives",
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=(
+            "decode only archives whose inputs changed since the current "
+            "version and link the rest of its Parquet partitions"
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        metavar="N",
+        help=(
+            "archive decode and series build processes; otherwise "
+            "TOPSIGNAL_DATABENTO_BUILD_WORKERS "
+            "or up to 8 CPUs"
+        ),
+    )
+    verify = parser.add_mutually_exclusive_group()
+    verify.add_argument(
+        "--verify",
+        action="store_true",
+        help=(
+            "check the current cache against its integrity ledger instead of "
+            "building; only files whose size, mtime or inode changed are re-hashed"
+        ),
+    )
+    verify.add_argument(
+        "--deep-verify",
+        action="store_true",
+        help=(
+            "like --verify, but re-hash every file and source archive and "
+            "re-validate every series row by row"
+        ),
+    )
     parser.add_argument(
         "--json",
         action="store_true",
@@ -188,6 +227,16 @@ def _resolve_timeframes(args: argparse.Namespace, api: CacheApi) -> list[str]:
 
 def _run(args: argparse.Namespace) -> dict[str, Any]:
     api = _load_cache_api()
+    if args.verify or args.deep_verify:
+        if args.archives or args.downloads is not None:
+            raise ValueError("--verify and --deep-verify check the current cache; omit archives")
+        started = time.perf_counter()
+        verified = api.verify(cache_root=args.cache_dir, deep=args.deep_verify)
+        return {
+            "ok": verified.ok,
+            "elapsed_seconds": round(time.perf_counter() - started, 6),
+            "verification": asdict(verified),
+        }
     archives = _resolve_archives(args)
     timeframes = _resolve_timeframes(args, api)
     started = time.perf_counter()
@@ -196,6 +245,8 @@ def _run(args: argparse.Namespace) -> dict[str, Any]:
         cache_root=args.cache_dir,
         timeframes=timeframes,
         force=args.force,
+        max_workers=args.workers,
+        incremental=args.incremental,
     )
     elapsed = time.perf_counter() - started
     return {
@@ -207,7 +258,24 @@ def _run(args: argparse.Namespace) -> dict[str, Any]:
     }
 
 
+def _print_verification(report: dict[str, Any]) -> None:
+    verified = report["verification"]
+    mode = "deep verification" if verified["deep"] else "verification"
+    outcome = "passed" if report["ok"] else "FAILED"
+    print(f"Databento cache {mode} {outcome} in {report['elapsed_seconds']:.3f}s")
+    print(f"  version_dir: {verified['version_dir']}")
+    print(f"  ledgered files: {verified['files_checked']}")
+    print(f"  series: {verified['series_checked']}")
+    if verified["unledgered_files"]:
+        print(f"  files without a ledger record: {verified['unledgered_files']}")
+    for problem in verified["problems"]:
+        print(f"  problem: {problem}")
+
+
 def _print_text(report: dict[str, Any]) -> None:
+    if "verification" in report:
+        _print_verification(report)
+        return
     result = report["result"]
     disposition = "reused" if result["reused"] else "built"
     print(f"Databento cache {disposition} in {report['elapsed_seconds']:.3f}s")
@@ -217,6 +285,8 @@ def _print_text(report: dict[str, Any]) -> None:
     print(f"  roots: {', '.join(result['roots'])}")
     print(f"  timeframes: {', '.join(result['timeframes'])}")
     print(f"  archives: {result['archive_count']}")
+    if result.get("reused_archive_count"):
+        print(f"  reused archive decodes: {result['reused_archive_count']}")
     records = result.get("records_by_schema") or {}
     if records:
         rendered = ", ".join(f"{key}={value:,}" for key, value in records.items())
@@ -244,7 +314,7 @@ def main(argv: Sequence[str] | None = None) -> int:
         print(json.dumps(report, indent=2, sort_keys=True))
     else:
         _print_text(report)
-    return 0
+    return 0 if report["ok"] else 1
 
 
 if __name__ == "__main__":
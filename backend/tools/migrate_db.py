@@ -17,7 +17,7 @@ REPO_ROOT = Path(__file__).resolve().parents[2]
 MIGRATIONS_DIR = REPO_ROOT / "db" / "migrations"
 LEDGER_TABLE = "topsignal_schema_migrations"
 LOCK_NAME = "topsignal-schema-migrations-v1"
-CURRENT_SCHEMA_BASELINE = "schema-20260729-v5"
+CURRENT_SCHEMA_BASELINE = "schema-20261019-v8"
 LEGACY_DATABENTO_TABLE_NAMES = frozenset(
     {
         "databento_import_batches",
@@ -86,7 +86,9 @@ BASELINE_REQUIRED_COLUMNS: dict[str, set[str]] = {
         "account_row_id",
         "account_external_id",
     },
-    "bot_backtests": {"user_id", "input_fingerprint", "result_snapshot"},
+    "bot_backtests": {"user_id", "input_fingerprint", "result_snapshot", "result_columns"},
+    "bot_backtest_sweeps": {"user_id", "rank_by", "ranked_results"},
+    "bot_backtest_jobs": {"user_id", "status", "request_payload", "progress"},
     "bot_runs": {"last_evaluated_at", "last_error"},
     "bot_decisions": {"correlation_id", "idempotency_key"},
     "bot_order_attempts": {"execution_mode", "correlation_id", "idempotency_key"},
@@ -0,0 +1,48 @@
+-- Persist compact, ranked parameter-sweep summaries instead of one full
+-- bot_backtests result snapshot per combination.
+
+create table if not exists bot_backtest_sweeps (
+  id bigserial primary key,
+  user_id uuid not null default '00000000-0000-0000-0000-000000000000',
+  bot_config_id bigint references bot_configs(id) on delete set null,
+  account_id bigint not null,
+  engine_version text not null,
+  strategy_type text not null,
+  contract_id text not null,
+  symbol text,
+  timeframe_unit text not null,
+  timeframe_unit_number integer not null,
+  requested_start timestamptz not null,
+  requested_end timestamptz not null,
+  actual_start timestamptz not null,
+  actual_end timestamptz not null,
+  starting_balance numeric(18,6) not null,
+  commission_per_contract numeric(18,6) not null default 0,
+  slippage_ticks numeric(18,6) not null default 0,
+  tick_size numeric(18,6) not null,
+  tick_value numeric(18,6) not null,
+  bar_count integer not null,
+  rank_by text not null,
+  combination_count integer not null,
+  failed_count integer not null default 0,
+  config_snapshot jsonb not null,
+  assumptions_snapshot jsonb not null,
+  ranked_results jsonb not null,
+  created_at timestamptz not null default now(),
+  constraint bot_backtest_sweeps_requested_range_check check (requested_end > requested_start),
+  constraint bot_backtest_sweeps_actual_range_check check (actual_end >= actual_start),
+  constraint bot_backtest_sweeps_starting_balance_positive_check check (starting_balance > 0),
+  constraint bot_backtest_sweeps_commission_nonnegative_check check (commission_per_contract >= 0),
+  constraint bot_backtest_sweeps_slippage_nonnegative_check check (slippage_ticks >= 0),
+  constraint bot_backtest_sweeps_tick_size_positive_check check (tick_size > 0),
+  constraint bot_backtest_sweeps_tick_value_positive_check check (tick_value > 0),
+  constraint bot_backtest_sweeps_timeframe_positive_check check (timeframe_unit_number > 0),
+  constraint bot_backtest_sweeps_bar_count_positive_check check (bar_count > 0),
+  constraint bot_backtest_sweeps_combination_count_positive_check check (combination_count > 0),
+  constraint bot_backtest_sweeps_failed_count_range_check check (
+    failed_count >= 0 and failed_count < combination_count
+  )
+);
+
+create index if not exists idx_bot_backtest_sweeps_user_config_created
+  on bot_backtest_sweeps (user_id, bot_config_id, created_at desc);
@@ -0,0 +1,34 @@
+-- Durable queue of submitted backtests, sweeps and walk-forward runs so
+-- results can be collected after the submitting request has closed.
+
+create table if not exists bot_backtest_jobs (
+  id bigserial primary key,
+  user_id uuid not null default '00000000-0000-0000-0000-000000000000',
+  bot_config_id bigint not null references bot_configs(id) on delete cascade,
+  kind text not null,
+  status text not null default 'queued',
+  request_payload jsonb not null,
+  progress jsonb,
+  attempt_count integer not null default 0,
+  cancel_requested_at timestamptz,
+  error_status integer,
+  error_detail text,
+  bot_backtest_id bigint references bot_backtests(id) on delete set null,
+  bot_backtest_sweep_id bigint references bot_backtest_sweeps(id) on delete set null,
+  created_at timestamptz not null default now(),
+  started_at timestamptz,
+  heartbeat_at timestamptz,
+  finished_at timestamptz,
+  constraint bot_backtest_jobs_kind_check check (kind in ('backtest','sweep','walk_forward')),
+  constraint bot_backtest_jobs_status_check check (
+    status in ('queued','running','succeeded','failed','cancelled')
+  ),
+  constraint bot_backtest_jobs_attempt_count_nonnegative_check check (attempt_count >= 0),
+  constraint bot_backtest_jobs_finished_at_check check (finished_at is null or finished_at >= created_at)
+);
+
+create index if not exists idx_bot_backtest_jobs_status_created
+  on bot_backtest_jobs (status, created_at);
+
+create index if not exists idx_bot_backtest_jobs_user_config_created
+  on bot_backtest_jobs (user_id, bot_config_id, created_at desc);
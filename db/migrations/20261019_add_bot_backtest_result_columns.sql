@@ -0,0 +1,6 @@
+-- Columnar, zstd-compressed storage for the equity, drawdown, trade and
+-- period series of a persisted backtest. Rows written before this migration
+-- keep their series inline in result_snapshot and leave result_columns null.
+
+alter table bot_backtests
+  add column if not exists result_columns bytea;
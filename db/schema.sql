@@ -17,7 +17,7 @@ create table if not exists topsignal_schema_baselines (
 );
 
 insert into topsignal_schema_baselines (version)
-values ('schema-20260729-v5')
+values ('schema-20261019-v8')
 on conflict (version) do nothing;
 
 
@@ -579,6 +579,7 @@ create table if not exists bot_backtests (
   config_snapshot jsonb not null,
   assumptions_snapshot jsonb not null,
   result_snapshot jsonb not null,
+  result_columns bytea,
   created_at timestamptz not null default now(),
   constraint bot_backtests_requested_range_check check (requested_end > requested_start),
   constraint bot_backtests_actual_range_check check (actual_end >= actual_start),
@@ -598,6 +599,94 @@ create index if not exists idx_bot_backtests_user_created
   on bot_backtests (user_id, created_at desc);
 
 
+-- ============================================
+-- TABLE: bot_backtest_sweeps
+-- Compact ranked summaries of bot parameter-sweep backtests.
+-- ============================================
+create table if not exists bot_backtest_sweeps (
+  id bigserial primary key,
+  user_id uuid not null default '00000000-0000-0000-0000-000000000000',
+  bot_config_id bigint references bot_configs(id) on delete set null,
+  account_id bigint not null,
+  engine_version text not null,
+  strategy_type text not null,
+  contract_id text not null,
+  symbol text,
+  timeframe_unit text not null,
+  timeframe_unit_number integer not null,
+  requested_start timestamptz not null,
+  requested_end timestamptz not null,
+  actual_start timestamptz not null,
+  actual_end timestamptz not null,
+  starting_balance numeric(18,6) not null,
+  commission_per_contract numeric(18,6) not null default 0,
+  slippage_ticks numeric(18,6) not null default 0,
+  tick_size numeric(18,6) not null,
+  tick_value numeric(18,6) not null,
+  bar_count integer not null,
+  rank_by text not null,
+  combination_count integer not null,
+  failed_count integer not null default 0,
+  config_snapshot jsonb not null,
+  assumptions_snapshot jsonb not null,
+  ranked_results jsonb not null,
+  created_at timestamptz not null default now(),
+  constraint bot_backtest_sweeps_requested_range_check check (requested_end > requested_start),
+  constraint bot_backtest_sweeps_actual_range_check check (actual_end >= actual_start),
+  constraint bot_backtest_sweeps_starting_balance_positive_check check (starting_balance > 0),
+  constraint bot_backtest_sweeps_commission_nonnegative_check check (commission_per_contract >= 0),
+  constraint bot_backtest_sweeps_slippage_nonnegative_check check (slippage_ticks >= 0),
+  constraint bot_backtest_sweeps_tick_size_positive_check check (tick_size > 0),
+  constraint bot_backtest_sweeps_tick_value_positive_check check (tick_value > 0),
+  constraint bot_backtest_sweeps_timeframe_positive_check check (timeframe_unit_number > 0),
+  constraint bot_backtest_sweeps_bar_count_positive_check check (bar_count > 0),
+  constraint bot_backtest_sweeps_combination_count_positive_check check (combination_count > 0),
+  constraint bot_backtest_sweeps_failed_count_range_check check (
+    failed_count >= 0 and failed_count < combination_count
+  )
+);
+
+create index if not exists idx_bot_backtest_sweeps_user_config_created
+  on bot_backtest_sweeps (user_id, bot_config_id, created_at desc);
+
+
+-- ============================================
+-- TABLE: bot_backtest_jobs
+-- Durable queue of submitted backtest, sweep and walk-forward runs.
+-- ============================================
+create table if not exists bot_backtest_jobs (
+  id bigserial primary key,
+  user_id uuid not null default '00000000-0000-0000-0000-000000000000',
+  bot_config_id bigint not null references bot_configs(id) on delete cascade,
+  kind text not null,
+  status text not null default 'queued',
+  request_payload jsonb not null,
+  progress jsonb,
+  attempt_count integer not null default 0,
+  cancel_requested_at timestamptz,
+  error_status integer,
+  error_detail text,
+  bot_backtest_id bigint references bot_backtests(id) on delete set null,
+  bot_backtest_sweep_id bigint references bot_backtest_sweeps(id) on delete set null,
+  created_at timestamptz not null default now(),
+  started_at timestamptz,
+  heartbeat_at timestamptz,
+  finished_at timestamptz,
+  constraint bot_backtest_jobs_kind_check check (kind in ('backtest','sweep','walk_forward')),
+  constraint bot_backtest_jobs_status_check check (
+    status in ('queued','running','succeeded','failed','cancelled')
+  ),
+  constraint bot_backtest_jobs_attempt_count_nonnegative_check check (attempt_count >= 0),
+  constraint bot_backtest_jobs_finished_at_check check (finished_at is null or finished_at >= created_at)
+);
+
+create index if not exists idx_bot_backtest_jobs_status_created
+  on bot_backtest_jobs (status, created_at);
+
+create index if not exists idx_bot_backtest_jobs_user_config_created
+  on bot_backtest_jobs (user_id, bot_config_id, created_at desc);
+
+
 -- ============================================
 -- TABLE: bot_runs
 -- Deployment/run records for bot lifecycle control.